@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+import common
+import os
+import random
+import re
+import tempfile
+import time
+
+from pawnlib.config import pawn
+from pawnlib.output import PrintRichTable
+from pawnlib.output.file import PatternMatcher
+from pawnlib.resource.monitor import SSHMonitor
+from pawnlib.typing.constants import const
+
+LINES = int(os.getenv("LINES", 2000000))
+HIT_RATIO = float(os.getenv("HIT_RATIO", 0.05))
+
+NOISE_LINES = [
+    "{ts} host CRON[{pid}]: pam_unix(cron:session): session closed for user root",
+    "{ts} host CRON[{pid}]: (root) CMD (command -v debian-sa1 > /dev/null && debian-sa1 1 1)",
+    "{ts} host sudo:   ubuntu : TTY=pts/0 ; PWD=/home/ubuntu ; USER=root ; COMMAND=/usr/bin/systemctl status",
+    "{ts} host sshd[{pid}]: Received disconnect from {ip} port {port}:11: Bye Bye [preauth]",
+    "{ts} host kernel: [UFW BLOCK] IN=eth0 OUT= SRC={ip} DST=10.0.0.1 LEN=40 PROTO=TCP SPT={port} DPT=23",
+]
+HIT_LINES = [
+    "{ts} host sshd[{pid}]: Failed password for invalid user {user} from {ip} port {port} ssh2",
+    "{ts} host sshd[{pid}]: Failed password for {user} from {ip} port {port} ssh2",
+    "{ts} host sshd[{pid}]: Invalid user {user} from {ip} port {port}",
+    "{ts} host sshd[{pid}]: pam_unix(sshd:auth): authentication failure; logname= uid=0 euid=0 tty=ssh ruser= rhost={ip}  user={user}",
+    "{ts} host sshd[{pid}]: Accepted publickey for {user} from {ip} port {port} ssh2: ED25519 SHA256:abc",
+    "{ts} host systemd-logind[{pid}]: New session {pid} of user {user}.",
+]
+
+
+def write_auth_log(path, lines):
+    random.seed(7)
+    users = ["root", "admin", "ubuntu", "oracle", "deploy", "test"]
+    with open(path, "w") as f:
+        for i in range(lines):
+            template = random.choice(HIT_LINES if random.random() < HIT_RATIO else NOISE_LINES)
+            f.write(template.format(
+                ts=f"Oct 16 {i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}",
+                pid=random.randint(100, 65000),
+                ip=f"{random.randint(1, 223)}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}",
+                port=random.randint(1024, 65535),
+                user=random.choice(users),
+            ) + "\n")
+
+
+def legacy_scan(monitor, lines):
+    """The separate scans done before PatternMatcher: Tail filters, classification, then ip and user."""
+    filters = [re.compile(f) for f in monitor.filters]
+    user_patterns = [r"of user (\w+)"] if monitor.os_type == "ubuntu" else []
+    user_patterns += [r"for (\w+) from", r"for invalid user (\w+) from", r"user=(\w+)", r"user (\w+)"]
+    alerts = []
+    for line in lines:
+        if not any(f.search(line) for f in filters):
+            continue
+        if any(pattern in line for pattern in monitor.failed_patterns):
+            status = "failed"
+        elif any(pattern in line for pattern in monitor.success_patterns):
+            status = "success"
+        else:
+            continue
+        ip_match = re.search(const.PATTERN_IP_ADDRESS_IN_LOG, line)
+        ip = ip_match.group(0) if ip_match else None
+        user = "unknown"
+        for pattern in user_patterns:
+            user_match = re.search(pattern, line)
+            if user_match:
+                user = user_match.group(1)
+                break
+        alerts.append((status, ip, user))
+    return alerts
+
+
+def matcher_scan(monitor, lines):
+    tail_matcher = PatternMatcher(monitor.filters)
+    alerts = []
+    for line in lines:
+        if not tail_matcher.search(line):
+            continue
+        result = monitor.matcher.match(line)
+        if result:
+            status, fields = result
+            alerts.append((status, fields["ip"], fields["user"] or "unknown"))
+    return alerts
+
+
+def main():
+    rows = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        log_path = os.path.join(temp_dir, "auth.log")
+        start = time.perf_counter()
+        write_auth_log(log_path, LINES)
+        pawn.console.log(f"Generated {LINES:,} lines ({os.path.getsize(log_path) / 1024 / 1024:.1f} MB) "
+                         f"in {time.perf_counter() - start:.1f}s, hit ratio={HIT_RATIO}")
+
+        with open(log_path) as f:
+            lines = f.read().splitlines()
+
+        for os_type in ("ubuntu", "centos"):
+            monitor = SSHMonitor(log_path, os_type=os_type)
+            results = {}
+            for name, scan in (("separate scans", legacy_scan), ("PatternMatcher", matcher_scan)):
+                start = time.perf_counter()
+                results[name] = scan(monitor, lines)
+                elapsed = time.perf_counter() - start
+                rows.append({
+                    "os_type": os_type,
+                    "method": name,
+                    "alerts": len(results[name]),
+                    "same result": results[name] == results["separate scans"],
+                    "elapsed": f"{elapsed:.2f}s",
+                    "lines/sec": f"{LINES / elapsed:,.0f}",
+                })
+
+    PrintRichTable(title=f"auth.log matcher benchmark ({LINES:,} lines)", data=rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+import common
+import os
+import re
+import glob
+import random
+import tempfile
+import time
+import tracemalloc
+
+from pawnlib.config import pawn
+from pawnlib.output import PrintRichTable
+from pawnlib.output.secret_scanner import SecretScanner
+from pawnlib.typing.constants import SecretPatternConstants
+
+FILES = int(os.getenv("FILES", 200))
+TOTAL_MB = int(os.getenv("TOTAL_MB", 64))
+BIG_FILE_MB = int(os.getenv("BIG_FILE_MB", 64))
+WORKERS = int(os.getenv("WORKERS", os.cpu_count() or 1))
+
+
+def load_source_text():
+    """Python sources of the installed packages, so the benchmark runs on realistic text."""
+    site_packages = os.path.dirname(os.path.dirname(re.__file__))
+    data = bytearray()
+    for path in glob.iglob(os.path.join(site_packages, "**", "*.py"), recursive=True):
+        with open(path, "rb") as f:
+            data += f.read()
+        if len(data) > 8 * 1024 * 1024:
+            break
+    return bytes(data)
+
+
+def write_tree(directory, source):
+    rng = random.Random(1)
+    file_size = TOTAL_MB * 1024 * 1024 // FILES
+    secrets = [b"AKIA" + b"Z" * 16, b"ghp_" + b"x" * 36, b"API_KEY=" + b"k" * 24]
+    for index in range(FILES):
+        start = rng.randrange(max(len(source) - file_size, 1))
+        data = bytearray(source[start:start + file_size])
+        data[len(data) // 2:len(data) // 2] = b"\n" + rng.choice(secrets) + b"\n"
+        with open(os.path.join(directory, f"file{index}.py"), "wb") as f:
+            f.write(data)
+
+
+def legacy_scan(directory, patterns):
+    """What scan_file did per file: read it as text, then re.findall once per pattern."""
+    results = {}
+    for name in sorted(os.listdir(directory)):
+        path = os.path.join(directory, name)
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            content = f.read()
+        for pattern_name in patterns:
+            for match in re.findall(SecretPatternConstants.get_pattern(pattern_name), content):
+                results.setdefault(path, []).append(match)
+    return results
+
+
+def measure(name, function, size_mb):
+    tracemalloc.start()
+    start = time.perf_counter()
+    results = function()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "method": name,
+        "elapsed": f"{elapsed:.2f}s",
+        "MB/s": f"{size_mb / elapsed:.1f}",
+        "peak memory (this process)": f"{peak / 1024 / 1024:.1f}MB",
+        "files with findings": len(results),
+    }
+
+
+def main():
+    patterns = list(SecretPatternConstants.SECRET_PATTERNS)
+    source = load_source_text()
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        write_tree(directory, source)
+        pawn.console.log(f"Scanning {FILES} files, {TOTAL_MB}MB in total, with {len(patterns)} patterns")
+        rows.append(measure("read + re.findall per pattern", lambda: legacy_scan(directory, patterns), TOTAL_MB))
+        rows.append(measure("SecretScanner (1 process)", lambda: SecretScanner(patterns).scan_directory(directory, workers=1), TOTAL_MB))
+        if WORKERS > 1:
+            rows.append(measure(f"SecretScanner ({WORKERS} processes)", lambda: SecretScanner(patterns).scan_directory(directory, workers=WORKERS), TOTAL_MB))
+    PrintRichTable(title="Directory scan", data=rows)
+
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        with open(os.path.join(directory, "big.log"), "wb") as f:
+            for _ in range(BIG_FILE_MB * 1024 * 1024 // len(source) + 1):
+                f.write(source)
+        pawn.console.log(f"Scanning one {BIG_FILE_MB}MB file")
+        rows.append(measure("read + re.findall per pattern", lambda: legacy_scan(directory, patterns), BIG_FILE_MB))
+        rows.append(measure("SecretScanner (chunked)", lambda: SecretScanner(patterns, max_file_size=0).scan_directory(directory, workers=1), BIG_FILE_MB))
+    PrintRichTable(title="Single big file", data=rows)
+
+
+if __name__ == "__main__":
+    main()
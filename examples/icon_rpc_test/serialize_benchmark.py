@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Compare the throughput of the streaming transaction serializer/hasher in ``icx_signer``
+with the previous deepcopy + nested generator implementation.
+
+    python3 serialize_benchmark.py --count 20000
+"""
+import common
+import argparse
+import hashlib
+import timeit
+from copy import deepcopy
+
+from pawnlib.config import pawn
+from pawnlib.output import PrintRichTable
+from pawnlib.utils import icx_signer
+
+
+def legacy_serialize(params: dict) -> bytes:
+    def encode(data):
+        if isinstance(data, dict):
+            return "{" + ".".join(encode_dict(data)) + "}"
+        elif isinstance(data, list):
+            return "[" + ".".join(encode(item) for item in data) + "]"
+        elif data is None:
+            return "\\0"
+        return str(data).translate(icx_signer.translator)
+
+    def encode_dict(data):
+        for key in sorted(data.keys()):
+            yield key
+            yield encode(data[key])
+
+    copy_tx = deepcopy(params)
+    if params.get("version", hex(2)) == hex(2):
+        copy_tx.pop("tx_hash", None)
+    copy_tx.pop("signature", None)
+    return f"icx_sendTransaction.{'.'.join(encode_dict(copy_tx))}".encode()
+
+
+def legacy_tx_hash(params: dict) -> bytes:
+    return hashlib.sha3_256(legacy_serialize(params)).digest()
+
+
+PAYLOADS = {
+    "transfer": {
+        "version": "0x3", "from": "hx" + "1" * 40, "to": "hx" + "2" * 40, "value": "0xde0b6b3a7640000",
+        "stepLimit": "0x186a0", "timestamp": "0x5f4b3c2d1e0f0", "nid": "0x1", "nonce": "0x1",
+    },
+    "call": {
+        "version": "0x3", "from": "hx" + "1" * 40, "to": "cx0000000000000000000000000000000000000000",
+        "stepLimit": "0x3b9aca00", "timestamp": "0x5f4b3c2d1e0f0", "nid": "0x1", "dataType": "call",
+        "data": {
+            "method": "setDelegation",
+            "params": {"delegations": [{"address": "hx" + f"{i:040x}", "value": hex(10 ** 18 * i)} for i in range(20)]},
+        },
+    },
+    "deploy (256KB)": {
+        "version": "0x3", "from": "hx" + "1" * 40, "to": "cx0000000000000000000000000000000000000000",
+        "stepLimit": "0x77359400", "timestamp": "0x5f4b3c2d1e0f0", "nid": "0x1", "dataType": "deploy",
+        "data": {"contentType": "application/java", "content": "0x" + "ab" * 128 * 1024, "params": {"name": "Token", "decimals": "0x12"}},
+    },
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="icx_signer serializer benchmark")
+    parser.add_argument("--count", type=int, default=20000, help="Iterations for small payloads")
+    args = parser.parse_args()
+
+    rows = []
+    for name, params in PAYLOADS.items():
+        assert icx_signer.get_tx_hash(params) == legacy_tx_hash(params)
+        count = args.count if "deploy" not in name else max(args.count // 200, 10)
+        legacy = timeit.timeit(lambda: legacy_tx_hash(params), number=count)
+        streaming = timeit.timeit(lambda: icx_signer.get_tx_hash(params), number=count)
+        rows.append({
+            "payload": name,
+            "count": count,
+            "legacy (tx/s)": f"{count / legacy:,.0f}",
+            "streaming (tx/s)": f"{count / streaming:,.0f}",
+            "speedup": f"{legacy / streaming:.2f}x",
+        })
+    PrintRichTable("get_tx_hash() throughput", data=rows)
+    pawn.console.log("Outputs are byte-identical.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+import common
+import io
+import os
+import re
+import tempfile
+import time
+from rich.console import Console
+
+from pawnlib.config import pawn
+from pawnlib.config.logging_config import setup_app_logger, remove_rich_tags
+from pawnlib.output import PrintRichTable
+
+RECORDS = int(os.getenv("RECORDS", 20000))
+
+MESSAGES = {
+    "plain": "Block 1000 processed with 25 transactions in 12.5ms",
+    "tagged": "[bold]Block[/bold] 1000 processed [green]OK[/green] with [yellow]25[/yellow] txs",
+    "brackets": "Response [id=1] [status=200] " + "[item] " * 50,
+}
+
+
+def legacy_remove_rich_tags(message):
+    tag_pattern = re.compile(r'\[/?([a-zA-Z0-9 _-]+)\]')
+    valid_tags = {"bold", "green", "yellow", "red", "dim", "italic"}
+    for match in tag_pattern.finditer(message):
+        if match.group(1).strip() in valid_tags:
+            message = message.replace(match.group(0), "", 1)
+    return message
+
+
+def make_logger(log_type, log_path):
+    logger = setup_app_logger(
+        app_name=f"benchmark_{log_type}", log_type=log_type, log_path=log_path, verbose=1,
+    )
+    for handler in logger.handlers:
+        if hasattr(handler, "console"):
+            handler.console = Console(file=io.StringIO(), force_terminal=True, width=200)
+    return logger
+
+
+def run_logger(logger, message, records):
+    start = time.perf_counter()
+    for i in range(records):
+        logger.info(message)
+    for handler in logger.handlers:
+        handler.flush()
+        if hasattr(handler, "console"):
+            handler.console.file.seek(0)
+            handler.console.file.truncate()
+    return time.perf_counter() - start
+
+
+def main():
+    pawn.console.log(f"Logging throughput benchmark, records={RECORDS}")
+    rows = []
+    with tempfile.TemporaryDirectory() as log_path:
+        for log_type in ("console", "file", "both"):
+            logger = make_logger(log_type, log_path)
+            for name, message in MESSAGES.items():
+                elapsed = run_logger(logger, message, RECORDS)
+                rows.append({
+                    "handler": log_type,
+                    "message": name,
+                    "records/sec": f"{RECORDS / elapsed:,.0f}",
+                    "elapsed(s)": f"{elapsed:.3f}",
+                })
+            for handler in list(logger.handlers):
+                handler.close()
+                logger.removeHandler(handler)
+    PrintRichTable(title="Logging throughput", data=rows)
+
+    rows = []
+    for size in (10, 100, 1000):
+        message = "[bold]x[/bold] " * size
+        for name, func in (("legacy", legacy_remove_rich_tags), ("remove_rich_tags", remove_rich_tags)):
+            start = time.perf_counter()
+            for _ in range(100):
+                func(message)
+            elapsed = time.perf_counter() - start
+            rows.append({"tags": size * 2, "impl": name, "per call(ms)": f"{elapsed * 10:.4f}"})
+    PrintRichTable(title="remove_rich_tags scaling", data=rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+import os
+import sys
+parent_dir = os.path.dirname(os.path.abspath(os.path.dirname(__file__)))
+sys.path.insert(0, parent_dir)
+sys.path.insert(0, f"{parent_dir}/../")
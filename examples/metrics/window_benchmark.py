@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+import common
+import os
+import random
+import statistics
+import time
+from collections import deque
+
+from pawnlib.config import pawn
+from pawnlib.output import PrintRichTable
+from pawnlib.metrics import LatencyTracker, RollingWindow, WindowMinMax
+from pawnlib.typing.converter import StackList
+
+UPDATES = int(os.getenv("UPDATES", 20000))
+WINDOW_SIZES = [int(size) for size in os.getenv("WINDOW_SIZES", "100,1000,10000").split(",")]
+
+
+class LegacyStackList:
+    """What StackList did: list.pop(0) on push and a full pass for every statistic."""
+
+    def __init__(self, max_length):
+        self.max_length = max_length
+        self.data = []
+
+    def push(self, item):
+        if len(self.data) == self.max_length:
+            self.data.pop(0)
+        self.data.append(item)
+
+
+def legacy_window(size):
+    window = deque(maxlen=size)
+
+    def update(value):
+        window.append(value)
+        return sum(window) / len(window), min(window), max(window)
+    return window.append, update
+
+
+def primitive_window(size):
+    window, min_max = RollingWindow(size), WindowMinMax(size)
+
+    def update(value):
+        window.append(value)
+        min_max.append(value)
+        return window.mean(), min_max.min(), min_max.max()
+    return update, update
+
+
+def legacy_stack_list(size):
+    stack = LegacyStackList(size)
+
+    def update(value):
+        stack.push(value)
+        return statistics.mean(stack.data), statistics.median(stack.data), max(stack.data), min(stack.data)
+    return stack.push, update
+
+
+def stack_list(size):
+    stack = StackList(size)
+
+    def update(value):
+        stack.push(value)
+        return stack.mean(), stack.median(), stack.max(), stack.min()
+    return stack.push, update
+
+
+def latency_tracker(size):
+    tracker = LatencyTracker(history_size=size)
+
+    def update(value):
+        tracker.add_latency(value)
+        return tracker.get_average_latency(), tracker.get_min_latency(), tracker.get_max_latency()
+    return tracker.add_latency, update
+
+
+def measure(name, factory, values, size, updates):
+    """Fill the window first, then time ``updates`` updates of the full window."""
+    fill, update = factory(size)
+    for value in values[:size]:
+        fill(value)
+    timed = values[size:size + updates]
+    start = time.perf_counter()
+    for value in timed:
+        update(value)
+    elapsed = time.perf_counter() - start
+    return {"method": name, "window": size, "updates": len(timed), "per update": f"{elapsed / len(timed) * 1e6:.2f}us"}
+
+
+def main():
+    rng = random.Random(1)
+    values = [rng.lognormvariate(3, 1) for _ in range(max(WINDOW_SIZES) + UPDATES)]
+    rows = []
+    for size in WINDOW_SIZES:
+        pawn.console.log(f"Window of {size} values, mean/min/max read after each update")
+        # The old StackList sorts the window on every update, so it gets fewer updates on big windows
+        legacy_updates = max(min(UPDATES, UPDATES * 100 // size), 100)
+        rows.append(measure("deque + sum/min/max", legacy_window, values, size, legacy_updates))
+        rows.append(measure("RollingWindow + WindowMinMax", primitive_window, values, size, UPDATES))
+        rows.append(measure("LatencyTracker", latency_tracker, values, size, UPDATES))
+        rows.append(measure("StackList before (pop(0), statistics)", legacy_stack_list, values, size, legacy_updates))
+        rows.append(measure("StackList", stack_list, values, size, UPDATES))
+    PrintRichTable(title="Per-update cost of windowed statistics", data=rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+import common
+import asyncio
+import os
+import time
+import tracemalloc
+
+from pawnlib.config import pawn
+from pawnlib.output import PrintRichTable
+from pawnlib.resource.net import AsyncPortScanner
+
+IP_RANGE = (os.getenv("START_IP", "127.0.0.1"), os.getenv("END_IP", "127.0.0.4"))
+PORT_RANGE = (1, int(os.getenv("END_PORT", 65535)))
+CONCURRENCY = int(os.getenv("CONCURRENCY", 1000))
+
+
+async def materialised_tasks(scanner):
+    """What scan_all() allocated before any probe was sent: one coroutine per (ip, port)."""
+    async def probe(ip, port):
+        pass
+
+    tasks = [probe(ip, port) for ip in list(scanner._generate_ips()) for port in range(scanner.start_port, scanner.end_port + 1)]
+    for task in tasks:
+        task.close()
+    return len(tasks)
+
+
+def measure(name, coroutine_function, scanner):
+    tracemalloc.start()
+    start = time.perf_counter()
+    asyncio.run(coroutine_function(scanner))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "method": name,
+        "elapsed": f"{elapsed:.2f}s",
+        "peak memory": f"{peak / 1024 / 1024:.1f} MB",
+        "open": scanner.stats["open"],
+        "probes/sec": f"{sum(scanner.stats.values()) / elapsed:,.0f}" if sum(scanner.stats.values()) else "-",
+    }
+
+
+def main():
+    pawn.console.log(f"Scanning {IP_RANGE} x {PORT_RANGE}, max_concurrency={CONCURRENCY}")
+    rows = [measure("coroutine list only (legacy)", materialised_tasks, AsyncPortScanner(IP_RANGE, PORT_RANGE))]
+    for syn_scan in (False, True):
+        scanner = AsyncPortScanner(IP_RANGE, PORT_RANGE, max_concurrency=CONCURRENCY, timeout=1, syn_scan=syn_scan)
+        rows.append(measure(f"streaming pool (syn_scan={syn_scan})", lambda s: s.scan(), scanner))
+    PrintRichTable(title="AsyncPortScanner", data=rows)
+
+
+if __name__ == "__main__":
+    main()
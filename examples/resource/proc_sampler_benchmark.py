@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+import common
+import os
+import tempfile
+import time
+
+from pawnlib.config import pawn
+from pawnlib.output import PrintRichTable
+from pawnlib.resource.sampler import ProcSampler
+from pawnlib.resource.server import MemoryStatus
+
+CORES = int(os.getenv("CORES", 64))
+INTERFACES = int(os.getenv("INTERFACES", 8))
+DISKS = int(os.getenv("DISKS", 16))
+TICKS = int(os.getenv("TICKS", 500))
+
+
+def write_fake_proc(proc_path, tick):
+    os.makedirs(os.path.join(proc_path, "net"), exist_ok=True)
+    lines = [f"cpu  {tick * CORES} 0 {tick * CORES} {tick * CORES * 8} 0 0 0 0 0 0"]
+    lines += [f"cpu{core} {tick + core} 0 {tick} {tick * 8} 0 0 0 0 0 0" for core in range(CORES)]
+    lines.append("intr " + " ".join(str(tick) for _ in range(CORES * 64)))
+    lines.append(f"ctxt {tick}\nbtime 1700000000\nprocesses {tick}")
+    with open(os.path.join(proc_path, "stat"), "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+    with open(os.path.join(proc_path, "net", "dev"), "w") as f:
+        f.write("Inter-|   Receive |  Transmit\n face |bytes    packets|bytes    packets\n")
+        f.write(f"    lo: {tick} 1 0 0 0 0 0 0 {tick} 1 0 0 0 0 0 0\n")
+        for index in range(INTERFACES):
+            f.write(f"  eth{index}: {tick * 1000} {tick} 0 0 0 0 0 0 {tick * 500} {tick} 0 0 0 0 0 0\n")
+
+    with open(os.path.join(proc_path, "diskstats"), "w") as f:
+        for index in range(DISKS):
+            f.write(f" 259 {index} nvme{index}n1 {tick} 0 {tick * 8} 0 {tick} 0 {tick * 8} 0 0 0 0 0 0 0 0\n")
+
+    with open(os.path.join(proc_path, "meminfo"), "w") as f:
+        f.write("MemTotal: 16000000 kB\nMemFree: 4000000 kB\nMemAvailable: 8000000 kB\nBuffers: 1 kB\nCached: 1 kB\n")
+    with open(os.path.join(proc_path, "loadavg"), "w") as f:
+        f.write("0.50 0.40 0.30 1/100 1234\n")
+
+
+class LegacySystemMonitor:
+    """The readlines/split implementation SystemMonitor used before ProcSampler."""
+
+    def __init__(self, proc_path):
+        self.proc_path = proc_path
+        self.prev_net_data = self.parse_net_dev()
+        self.prev_cpu_data = self.parse_cpu_stat()
+        self.prev_disk_stats = self.read_disk_stats()
+
+    def read(self, name):
+        with open(os.path.join(self.proc_path, name)) as f:
+            return f.readlines()
+
+    def parse_net_dev(self):
+        data = {}
+        for line in self.read("net/dev")[2:]:
+            parts = line.split()
+            iface = parts[0].strip(':')
+            if iface == "lo" or iface.startswith("sit"):
+                continue
+            data[iface] = {'recv': int(parts[1]), 'sent': int(parts[9]), 'packets_recv': int(parts[2]), 'packets_sent': int(parts[10])}
+        return data
+
+    def parse_cpu_stat(self):
+        for line in self.read("stat"):
+            if line.startswith("cpu "):
+                return list(map(int, line.split()[1:]))
+
+    def read_disk_stats(self):
+        disk_stats = {}
+        for line in self.read("diskstats"):
+            parts = line.split()
+            if any(parts[2].startswith(prefix) for prefix in ["sd", "vd", "nvme"]):
+                disk_stats[parts[2]] = {'read_ios': int(parts[3]), 'read_bytes': int(parts[5]) * 512,
+                                        'write_ios': int(parts[7]), 'write_bytes': int(parts[9]) * 512}
+        return disk_stats
+
+    def tick(self):
+        cpu = self.parse_cpu_stat()
+        diff = [end - start for start, end in zip(self.prev_cpu_data, cpu)]
+        self.prev_cpu_data = cpu
+        net = self.parse_net_dev()
+        net_diff = {iface: {k: v - self.prev_net_data[iface][k] for k, v in curr.items()} for iface, curr in net.items()}
+        self.prev_net_data = net
+        disk = self.read_disk_stats()
+        disk_diff = {name: {k: v - self.prev_disk_stats[name][k] for k, v in curr.items()} for name, curr in disk.items()}
+        self.prev_disk_stats = disk
+        # pawns top called get_memory_status() every tick, which also walked all processes with psutil
+        MemoryStatus(proc_path=self.proc_path).get_memory_status()
+        return diff, net_diff, disk_diff
+
+
+def measure(name, tick_function, proc_path):
+    cpu_time = 0.0
+    for tick in range(1, TICKS + 1):
+        write_fake_proc(proc_path, tick)
+        start = time.process_time()
+        tick_function()
+        cpu_time += time.process_time() - start
+    per_tick = cpu_time / TICKS
+    return {
+        "method": name,
+        "cpu time/tick": f"{per_tick * 1000:.3f}ms",
+        "cpu % at 1s interval": f"{per_tick * 100:.3f}%",
+    }
+
+
+def main():
+    pawn.console.log(f"Sampling a fake procfs with {CORES} cores, {INTERFACES} interfaces and {DISKS} disks, ticks={TICKS}")
+    rows = []
+    with tempfile.TemporaryDirectory() as proc_path:
+        write_fake_proc(proc_path, 0)
+        legacy = LegacySystemMonitor(proc_path)
+        rows.append(measure("readlines + dicts + MemoryStatus", legacy.tick, proc_path))
+
+        for per_core in (False, True):
+            sampler = ProcSampler(proc_path=proc_path, per_core=per_core)
+            sampler.sample()
+
+            def sampler_tick():
+                snapshot = sampler.sample()
+                snapshot.cpu_status(per_core=per_core)
+                snapshot.network_status()
+                snapshot.disk_status()
+
+            rows.append(measure(f"ProcSampler (per_core={per_core})", sampler_tick, proc_path))
+            sampler.close()
+
+    PrintRichTable(title="SystemMonitor sampling cost", data=rows)
+
+
+if __name__ == "__main__":
+    main()
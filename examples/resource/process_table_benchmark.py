@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+import common
+import os
+import time
+
+import psutil
+
+from pawnlib.config import pawn
+from pawnlib.output import PrintRichTable
+from pawnlib.resource.sampler import ProcessTable
+
+TICKS = int(os.getenv("TICKS", 50))
+
+
+def psutil_top(n=5):
+    """The full psutil scan ProcessMonitor did for each of the memory, cpu and io tables."""
+    result = {}
+    for resource, attrs in (("memory", ["pid", "name", "memory_percent"]),
+                            ("cpu", ["pid", "name", "cpu_percent"]),
+                            ("io", ["pid", "name", "io_counters"])):
+        processes = []
+        for proc in psutil.process_iter(attrs=attrs):
+            try:
+                processes.append(proc.info)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+        key = "io_counters" if resource == "io" else f"{resource}_percent"
+        result[resource] = sorted(processes, key=lambda p: (p.get(key) or 0) if resource != "io" else
+                                  (p[key].read_bytes + p[key].write_bytes if p.get(key) else 0), reverse=True)[:n]
+    return result
+
+
+def table_top(table, n=5):
+    table.scan()
+    return {resource: table.top(n, resource=resource) for resource in ProcessTable.RESOURCES}
+
+
+def measure(name, tick_function):
+    tick_function()
+    cpu_time = 0.0
+    for _ in range(TICKS):
+        start = time.process_time()
+        tick_function()
+        cpu_time += time.process_time() - start
+    per_tick = cpu_time / TICKS
+    return {"method": name, "cpu time/tick": f"{per_tick * 1000:.2f}ms", "cpu % at 1s interval": f"{per_tick * 100:.2f}%"}
+
+
+def main():
+    pawn.console.log(f"Top-N of {len(psutil.pids())} processes, ticks={TICKS}")
+    table = ProcessTable(track_io=True)
+    rows = [
+        measure("psutil.process_iter x3", psutil_top),
+        measure("ProcessTable", lambda: table_top(table)),
+    ]
+    table.close()
+    PrintRichTable(title="ProcessMonitor top-N cost", data=rows)
+
+
+if __name__ == "__main__":
+    main()
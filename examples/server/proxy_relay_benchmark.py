@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+import common
+import asyncio
+import multiprocessing
+import os
+import socket
+import time
+
+from pawnlib.config import pawn
+from pawnlib.output import PrintRichTable
+from pawnlib.cli.proxy import EchoWebServer, ProxyRelay
+
+CONNECTIONS = int(os.getenv("CONNECTIONS", 100))
+DURATION = float(os.getenv("DURATION", 5))
+MESSAGE_SIZE = int(os.getenv("MESSAGE_SIZE", 1024))
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def run_in_process(target, *args):
+    """Every server gets its own process, so the measurement is not about sharing the GIL with the clients."""
+    port = free_port()
+    process = multiprocessing.Process(target=target, args=(port, *args), daemon=True)
+    process.start()
+    for _ in range(100):
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return port, process
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"{target.__name__} did not start on port {port}")
+
+
+def echo_backend(port):
+    async def handle(reader, writer):
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                break
+            writer.write(data)
+            await writer.drain()
+        writer.close()
+
+    async def serve():
+        server = await asyncio.start_server(handle, "127.0.0.1", port)
+        await server.serve_forever()
+
+    asyncio.run(serve())
+
+
+async def ping_pong(port):
+    """Every connection sends a message and waits for the echo until DURATION ends."""
+    message = b"x" * MESSAGE_SIZE
+    latencies = []
+    deadline = time.perf_counter() + DURATION
+
+    async def client():
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            writer.write(message)
+            await reader.readexactly(MESSAGE_SIZE)
+            latencies.append(time.perf_counter() - start)
+        writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(CONNECTIONS)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "round trips/sec": f"{len(latencies) / elapsed:,.0f}",
+        "MB/s": f"{len(latencies) * MESSAGE_SIZE * 2 / elapsed / 1024 / 1024:.1f}",
+        "p50": f"{latencies[len(latencies) // 2] * 1000:.2f}ms",
+        "p99": f"{latencies[int(len(latencies) * 0.99)] * 1000:.2f}ms",
+    }
+
+
+def legacy_proxy(port, backend_port):
+    pawn.console.quiet = True
+    EchoWebServer(listen=f"127.0.0.1:{port}", forward=f"127.0.0.1:{backend_port}", buffer_size=4096, delay=0.0001).main_loop()
+
+
+def relay_proxy(port, backend_port, use_splice):
+    pawn.console.quiet = True
+    relay = ProxyRelay(listen=f"127.0.0.1:{port}", forward=f"127.0.0.1:{backend_port}", mode="passthrough", report_interval=0)
+    relay.use_splice = use_splice and relay.use_splice
+    asyncio.run(relay.serve_forever())
+
+
+def main():
+    pawn.console.log(f"connections={CONNECTIONS}, duration={DURATION}s, message_size={MESSAGE_SIZE}")
+    backend_port, _ = run_in_process(echo_backend)
+    targets = [
+        ("direct to backend", lambda: (backend_port, None)),
+        ("EchoWebServer select loop", lambda: run_in_process(legacy_proxy, backend_port)),
+        ("ProxyRelay transports", lambda: run_in_process(relay_proxy, backend_port, False)),
+        ("ProxyRelay splice", lambda: run_in_process(relay_proxy, backend_port, True)),
+    ]
+    rows = []
+    for name, start in targets:
+        port, process = start()
+        rows.append({"target": name, **asyncio.run(ping_pong(port))})
+        if process is not None:
+            process.terminate()
+    PrintRichTable(title="Proxy relay against a local echo backend", data=rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,7 @@ class AsyncTasks:
                  title: str = "Working on async tasks ...",
                  debug: bool = False,
                  status: bool = False,
+                 rate_limiter=None,
                  **kwargs):
         """
         This Class is to run asyncio using aiometer.
@@ -27,6 +28,7 @@ class AsyncTasks:
         :param title: Title of the tasks
         :param status: Status of the tasks
         :param debug: Whether to use debug
+        :param rate_limiter: RateLimiter shared with other tasks or clients, checked before each task.
         :param kwargs:
 
         Example:
@@ -45,6 +47,7 @@ class AsyncTasks:
         self.tasks = []
         self.max_at_once = max_at_once
         self.max_per_second = max_per_second
+        self.rate_limiter = rate_limiter
         self.debug = debug
         self._debug_print(self)
 
@@ -109,7 +112,7 @@ class AsyncTasks:
 
         if tasks_length > 0:
             async with aiometer.amap(
-                    async_fn=lambda fn: fn(),
+                    async_fn=self._run_task,
                     args=self.tasks,
                     max_at_once=self.max_at_once,
                     max_per_second=self.max_per_second,
@@ -123,6 +126,11 @@ class AsyncTasks:
             pawn.console.log(f"ERROR: tasks is null = {self.tasks}")
         return utils.list_from_indexed_dict(result)
 
+    async def _run_task(self, fn):
+        if self.rate_limiter:
+            await self.rate_limiter.acquire_async()
+        return await fn()
+
     def _debug_print(self, *args, **kwargs):
         if self.debug:
             debug_print(*args, **kwargs)
@@ -24,7 +24,7 @@ class NodeInfoFetcher(LoggerMixinVerbose):
 
 
         self.init_logger(logger=logger, verbose=1)
-        self.helper = helper or AsyncIconRpcHelper(logger=self.logger)
+        self.helper = helper or AsyncIconRpcHelper(logger=self.logger, pooled=True, cache=True)
         self.final_result = {}
         self.filter_keys = filter_keys
         self.preps_name_info = {}
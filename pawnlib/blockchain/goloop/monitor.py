@@ -38,7 +38,7 @@ class NodeStatsMonitor(LoggerMixinVerbose):
         """
         self.network_api = network_api
         self.compare_api = compare_api
-        self.helper = helper or AsyncIconRpcHelper(logger=pawn.console, timeout=2, return_with_time=True, retries=1)
+        self.helper = helper or AsyncIconRpcHelper(logger=pawn.console, timeout=2, return_with_time=True, retries=1, pooled=True)
 
         self.interval = interval
         self.log_interval = log_interval
@@ -516,7 +516,8 @@ class ChainMonitor(LoggerMixinVerbose):
             logger=self.logger,
             timeout=2,
             return_with_time=False,
-            retries=1
+            retries=1,
+            pooled=True,
         ) as rpc_helper:
             while True:
                 now = asyncio.get_event_loop().time()
@@ -1,13 +1,51 @@
-from typing import Optional
+from typing import IO, Optional, Union
 # from aiohttp import ClientSession
 import aiohttp
 import asyncio
+import json
 import time
+import warnings
+from urllib.parse import urlsplit
 from pawnlib.config import pawn, LoggerMixinVerbose
 from pawnlib.utils.http import NetworkInfo, AsyncIconRpcHelper, append_http
 from pawnlib.blockchain.goloop.models import PeerEndpoint, PeerInfo
+from pawnlib.metrics.window import LatencyHistogram
 from pawnlib.output import print_var
 
+EXPLORED_PEER_TYPES = ('friends', 'children', 'nephews', 'orphanages')
+
+
+def normalize_peer_address(address: str, default_port: int = 7100) -> str:
+    """
+    Normalize a peer address to ``host:port``, so the same node is not queued twice under different spellings.
+
+    :param address: Peer address or URL, e.g. ``"http://10.0.0.1:9000/api"``, ``"10.0.0.1"`` or ``"[::1]:7100"``.
+    :param default_port: Port used when the address has none.
+    :return: The normalized address, or an empty string if it has no host.
+
+    Example:
+
+        .. code-block:: python
+
+            normalize_peer_address("HTTP://Node.Example.com")
+            # >> 'node.example.com:7100'
+            normalize_peer_address("[::1]:7100")
+            # >> '[::1]:7100'
+    """
+    address = (address or "").strip()
+    if "://" not in address:
+        address = f"//{address}"
+    try:
+        parsed = urlsplit(address)
+        host, port = parsed.hostname, parsed.port
+    except ValueError:
+        return ""
+    if not host:
+        return ""
+    if ":" in host:
+        host = f"[{host}]"
+    return f"{host}:{port or default_port}"
+
 
 def convert_peer_info_to_dict(peer_info_dict: dict) -> dict:
     """
@@ -40,7 +78,7 @@ def convert_peer_info_to_dict(peer_info_dict: dict) -> dict:
 class P2PNetworkParser(LoggerMixinVerbose):
     """
     P2PNetworkParser is a utility to explore and map the P2P network of ICON nodes
-    starting from a given URL. It recursively fetches peer information,
+    starting from a given URL. It crawls the peers breadth-first with a pool of workers,
     collects IP addresses and their associated HX (Hexadecimal) addresses,
     and organizes them into structured data.
     """
@@ -53,7 +91,11 @@ class P2PNetworkParser(LoggerMixinVerbose):
             verbose: int = 0,
             logger=None,
             nid=None,
-            platform="icon"
+            platform="icon",
+            time_budget: Optional[float] = None,
+            max_frontier: int = 10000,
+            output: Optional[Union[str, IO]] = None,
+            rpc_port: int = 9000,
     ):
         """
         Initializes the P2PNetworkParser.
@@ -62,9 +104,9 @@ class P2PNetworkParser(LoggerMixinVerbose):
         :type url: str
         :param max_concurrent: The maximum number of concurrent asynchronous requests to make. Defaults to 10.
         :type max_concurrent: int
-        :param timeout: The timeout for HTTP requests in seconds. Defaults to 5.
+        :param timeout: The timeout for each node in seconds. A node that does not answer in time is abandoned. Defaults to 5.
         :type timeout: int
-        :param max_depth: The maximum recursion depth for exploring the P2P network. Defaults to 5.
+        :param max_depth: The maximum number of hops from the starting node whose peers are explored. Defaults to 5.
         :type max_depth: int
         :param verbose: The verbosity level for logging. Inherited from LoggerMixinVerbose. Defaults to 0 (no debug output).
         :type verbose: int
@@ -74,6 +116,16 @@ class P2PNetworkParser(LoggerMixinVerbose):
         :type nid: Optional[Any]
         :param platform: The blockchain platform type. Defaults to "icon".
         :type platform: str
+        :param time_budget: Stop crawling after this many seconds and keep what was found. Defaults to None (no limit).
+        :type time_budget: Optional[float]
+        :param max_frontier: The maximum number of nodes waiting to be queried. Peers found while it is full are skipped
+                             unless another node reports them later. Defaults to 10000.
+        :type max_frontier: int
+        :param output: A path or a text file object. Each queried node and each peer edge is written to it as a JSON line
+                       while the crawl runs.
+        :type output: Optional[Union[str, IO]]
+        :param rpc_port: The RPC port queried on each peer. Defaults to 9000.
+        :type rpc_port: int
 
 
         Example:
@@ -97,6 +149,13 @@ class P2PNetworkParser(LoggerMixinVerbose):
                     logger=pawn.console
                 )
                 # await parser2.run()
+
+                # Example 3: Stream nodes and edges as JSON lines and stop after 60 seconds
+                parser3 = P2PNetworkParser(url="http://node.example.com:9000", time_budget=60, output="p2p.jsonl")
+                # await parser3.run()
+                # tail -f p2p.jsonl
+                # {"type": "node", "addr": "10.0.0.1:7100", "hx": "hx...", "depth": 1, "latency_ms": 12.3, "peers": 24}
+                # {"type": "edge", "from": "10.0.0.1:7100", "to": "10.0.0.2:7100", "peer_type": "friends", "hx": "hx...", "rtt": 0.02}
         """
         self.init_logger(logger=logger, verbose=verbose)
         self.logger.info("Start P2PNetworkParser")
@@ -113,8 +172,6 @@ class P2PNetworkParser(LoggerMixinVerbose):
         """An aiohttp client session for making HTTP requests."""
         self.rpc_helper: Optional[AsyncIconRpcHelper] = None
         """An AsyncIconRpcHelper instance for simplified RPC calls."""
-        self.semaphore: Optional[asyncio.Semaphore] = None
-        """A semaphore to control the maximum number of concurrent requests."""
 
         self.visited = set()
         """A set of URLs that have already been visited to prevent redundant processing."""
@@ -136,6 +193,15 @@ class P2PNetworkParser(LoggerMixinVerbose):
         """Number of timeout errors encountered."""
         self.platform = platform
         """The blockchain platform type, e.g., "icon"."""
+        self.time_budget = time_budget
+        self.max_frontier = max_frontier
+        self.output = output
+        self.rpc_port = rpc_port
+        self._stream: Optional[IO] = None
+        self.fetch_latency = LatencyHistogram(unit=0.001)
+        """Latency of the peer queries in milliseconds."""
+        self.crawl_stats = {}
+        """Statistics of the last crawl, see :meth:`collect_ips`."""
 
         self.logger.info(f"***** P2PNetworkParser Initialized with max_concurrent={max_concurrent}")
 
@@ -243,207 +309,249 @@ class P2PNetworkParser(LoggerMixinVerbose):
 
     async def initialize_resources(self):
         """
-        Initializes asynchronous resources, including `aiohttp.ClientSession`,
-        `AsyncIconRpcHelper`, and `asyncio.Semaphore`. These resources are
-        created if they do not exist or are closed.
+        Initializes the `AsyncIconRpcHelper`. Unless a `aiohttp.ClientSession` was assigned to
+        `self.session`, the helper uses the shared keep-alive connection pool.
+        The number of concurrent requests is bounded by the `max_concurrent` crawl workers.
         """
-        if not self.session or self.session.closed:
-            self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
-            self.logger.debug("[SESSION INIT] Created new session")
-
         self.rpc_helper = AsyncIconRpcHelper(
-            session=self.session,
+            session=self.session if self.session and not self.session.closed else None,
             logger=None,
             verbose=self.verbose if self.verbose > 1 else -1,
             timeout=self.timeout,
-            max_concurrent=self.max_concurrent,
-            retries=1
+            max_concurrency=self.max_concurrent,
+            retries=1,
+            pooled=True,
         )
+        await self.rpc_helper.initialize()
 
         self.logger.debug("[RPC HELPER INIT] Created single AsyncIconRpcHelper")
-        self.semaphore = asyncio.Semaphore(self.max_concurrent)
-        self.logger.debug(f"[SEMAPHORE INIT] max_concurrent={self.max_concurrent}")
 
     async def close_resources(self):
         """
         Closes the asynchronous resources, specifically the `aiohttp.ClientSession`,
         to ensure proper cleanup.
         """
+        if self.rpc_helper:
+            await self.rpc_helper.close()
         if self.session and not self.session.closed:
             await self.session.close()
             self.logger.debug("[SESSION CLOSED]")
 
+    def _frontier_key(self, address: str) -> str:
+        normalized = normalize_peer_address(address)
+        if not normalized:
+            return ""
+        host = normalized.rsplit(":", 1)[0]
+        return f"{host}:{self.rpc_port}"
+
+    def _enqueue(self, frontier: asyncio.Queue, address: str, depth: int) -> bool:
+        key = self._frontier_key(address)
+        if not key or key in self.visited:
+            return False
+        try:
+            frontier.put_nowait((key, address, depth))
+        except asyncio.QueueFull:
+            self.crawl_stats["frontier_dropped"] += 1
+            return False
+        self.visited.add(key)
+        self.crawl_stats["max_frontier"] = max(self.crawl_stats["max_frontier"], frontier.qsize())
+        return True
+
+    def _emit(self, record: dict):
+        if self._stream:
+            self._stream.write(json.dumps(record) + "\n")
+            if record["type"] == "node":
+                # Every node is visible to readers like `tail -f` while the crawl runs
+                self._stream.flush()
+
+    async def fetch_preps_info(self, query_url: str):
+        """
+        Fetches the P-Reps (or validators on havah) once, to name the discovered HX addresses.
+
+        :param query_url: The RPC URL of a node.
+        :type query_url: str
+        """
+        self.logger.info(f"[PREPS FETCH] Fetching P-Reps info from {query_url}")
+        try:
+            if self.platform == "icon":
+                self.preps_info = await self.rpc_helper.get_preps(url=query_url, return_dict_key="nodeAddress")
+            elif self.platform == "havah":
+                self.preps_info = await self.rpc_helper.get_validator_info(url=query_url, return_dict_key="node")
+            else:
+                self.logger.info(f"Unsupported platform: {self.platform}")
+            self.logger.info(f"[PREPS FETCHED] Total P-Reps: {len(self.preps_info or {})}")
+        except asyncio.TimeoutError:
+            self.timeout_count += 1
+            self.logger.warning(f"[PREPS TIMEOUT] {query_url}")
+        except Exception as e:
+            self.error_count += 1
+            self.logger.error(f"[PREPS ERROR] {query_url} - {e}")
+
     async def collect_ips(self, current_url: str, depth: int = 0):
         """
-        Recursively collects IP addresses of P2P nodes by querying their RPC endpoints.
-        It explores 'friends', 'children', 'nephews', and 'orphanages' connections
-        up to `max_depth`.
+        Crawls the P2P network breadth-first from `current_url` by querying the RPC endpoint of each node once.
+        Peers reported as 'friends', 'children', 'nephews' and 'orphanages' are queued up to `max_depth` hops,
+        de-duplicated by their normalized ``host:rpc_port``, and queried by `max_concurrent` workers.
+        The HX addresses of every answer are mapped with :meth:`_parse_p2p_peers`, so no node is queried twice.
+
+        A node that does not answer within `timeout` seconds is abandoned, and the crawl stops when `time_budget`
+        runs out. The statistics are kept in :attr:`crawl_stats`; abandoned nodes count in `fetch_latency_ms`
+        with the time they were waited for, so the tail percentiles are not understated.
 
-        :param current_url: The URL of the current node to query.
+        :param current_url: The URL of the node to start from.
         :type current_url: str
-        :param depth: The current recursion depth. Defaults to 0.
+        :param depth: The depth of the starting node. Defaults to 0.
         :type depth: int
+        :returns: :attr:`crawl_stats`, e.g. ``{"nodes": 120, "nodes_per_second": 41.2, "fetch_latency_ms": {"p99": 310.5, ...}, ...}``
+        :rtype: dict
         """
-        # 방문 체크는 semaphore 밖에서 (빠른 리턴)
-        self.logger.info(f"[COLLECT_IPS START] URL={current_url}, depth={depth}, visited={len(self.visited)}, ips_found={len(self.ip_set)}")
-        
-        if current_url in self.visited:
-            self.logger.debug(f"[COLLECT_IPS SKIP] Already visited: {current_url}")
-            return
-        
-        if depth > self.max_depth:
-            self.logger.debug(f"[COLLECT_IPS SKIP] Max depth reached: {current_url}")
-            return
-        
-        # semaphore는 실제 네트워크 요청 시에만 사용
-        async with self.semaphore:
-            # 다시 한번 체크 (race condition 방지)
-            if current_url in self.visited:
-                return
-            self.visited.add(current_url)
-
-            ip, _ = self.extract_ip_and_port(current_url)
-            if not ip:
-                self.logger.warning(f"[FORMAT ERROR] Invalid URL: {current_url}")
-                return
+        self.crawl_stats = {
+            "nodes": 0,
+            "failed": 0,
+            "abandoned": 0,
+            "edges": 0,
+            "frontier_dropped": 0,
+            "max_frontier": 0,
+            "unvisited": 0,
+            "budget_exhausted": False,
+        }
+        self.fetch_latency = LatencyHistogram(unit=0.001)
+        frontier = asyncio.Queue(maxsize=self.max_frontier)
+        started = time.monotonic()
+        deadline = started + self.time_budget if self.time_budget else None
+        self._enqueue(frontier, current_url, depth)
+
+        own_stream = isinstance(self.output, str)
+        self._stream = open(self.output, "a", buffering=1) if own_stream else self.output
+        self.logger.info(f"[CRAWL START] URL={current_url}, max_depth={self.max_depth}, workers={self.max_concurrent}, time_budget={self.time_budget}")
+        workers = [asyncio.ensure_future(self._crawl_worker(frontier, deadline)) for _ in range(max(self.max_concurrent, 1))]
+        try:
+            if deadline is None:
+                await frontier.join()
+            else:
+                await asyncio.wait_for(frontier.join(), max(deadline - time.monotonic(), 0))
+        except asyncio.TimeoutError:
+            self.crawl_stats["budget_exhausted"] = True
+            self.logger.warning(f"[CRAWL BUDGET] Stopped after {self.time_budget}s with {frontier.qsize()} nodes left in the frontier")
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            if self._stream:
+                self._stream.flush()
+                if own_stream:
+                    self._stream.close()
+            self._stream = None
+
+        elapsed = time.monotonic() - started
+        self.crawl_stats.update(
+            unvisited=frontier.qsize(),
+            elapsed=round(elapsed, 3),
+            nodes_per_second=round(self.crawl_stats["nodes"] / elapsed, 2) if elapsed else 0,
+            fetch_latency_ms=self.fetch_latency.to_dict(decimal_places=1, percentiles=(50, 95, 99)),
+        )
+        self.logger.info(f"[CRAWL DONE] {self.crawl_stats}")
+        return self.crawl_stats
 
-            query_url = f"http://{ip}:9000"
-            peers_to_explore = []
-            
+    async def _crawl_worker(self, frontier: asyncio.Queue, deadline: Optional[float]):
+        while True:
+            key, address, depth = await frontier.get()
             try:
-                # P-Reps 정보는 한 번만 조회
-                if not self.preps_info:
-                    self.logger.info(f"[PREPS FETCH] Fetching P-Reps info from {query_url}")
-                    try:
-                        if self.platform == "icon":
-                            # AsyncIconRpcHelper가 자체 timeout을 가지고 있으므로 wait_for 제거
-                            self.preps_info = await self.rpc_helper.get_preps(url=query_url, return_dict_key="nodeAddress")
-                        elif self.platform == "havah":
-                            self.preps_info = await self.rpc_helper.get_validator_info(url=query_url, return_dict_key="node")
-                        else:
-                            self.logger.info(f"Unsupported platform: {self.platform}")
-                            
-                        self.logger.info(f"[PREPS FETCHED] Total P-Reps: {len(self.preps_info)}")
-                        
-                    except asyncio.TimeoutError:
-                        self.timeout_count += 1
-                        self.logger.warning(f"[PREPS TIMEOUT] {query_url}")
-                        return
-                    except Exception as e:
-                        self.error_count += 1
-                        self.logger.error(f"[PREPS ERROR] {query_url} - {e}")
-                        return
-
-                # Chain detail 조회 (항상 icon_dex 사용)
-                self.logger.debug(f"[CHAIN DETAIL FETCH] Fetching chain details from {query_url}/admin/chain/icon_dex")
-                try:
-                    detailed_info = await self.rpc_helper.fetch(url=f"{query_url}/admin/chain/icon_dex")
-                except asyncio.TimeoutError:
-                    self.timeout_count += 1
-                    self.logger.warning(f"[CHAIN DETAIL TIMEOUT] {query_url}")
-                    return
-                except Exception as e:
-                    self.error_count += 1
-                    self.logger.error(f"[CHAIN DETAIL ERROR] {query_url} - {e}")
-                    return
-                    
-                self.logger.debug(f"[IP DETAIL RESPONSE] {query_url} - {detailed_info}")
-                if not detailed_info or 'module' not in detailed_info:
-                    self.logger.warning(f"[CHAIN DETAIL ERROR] Invalid response from {query_url}")
-                    return
-
-                p2p_info = detailed_info['module']['network'].get('p2p', {})
-                self_info = p2p_info.get('self', {})
-                if self_info.get('addr'):
-                    self.ip_set.add(self_info['addr'])
-                    self.logger.debug(f"[SELF IP ADDED] {self_info['addr']}")
-
-                peer_counts = {}
-                for peer_type in ['friends', 'children', 'nephews', 'orphanages']:
-                    peers = p2p_info.get(peer_type, [])
-                    peer_counts[peer_type] = len(peers)
-                    for peer in peers:
-                        peer_ip = peer.get('addr', '')
-                        if peer_ip and peer_ip not in self.visited:
-                            self.ip_set.add(peer_ip)
-                            peers_to_explore.append(peer_ip)
-                            self.logger.debug(f"[PEER FOUND] type={peer_type}, ip={peer_ip}")
-
-                self.logger.info(
-                    f"[COLLECT_IPS DONE] {query_url} - "
-                    f"friends={peer_counts.get('friends', 0)}, "
-                    f"children={peer_counts.get('children', 0)}, "
-                    f"nephews={peer_counts.get('nephews', 0)}, "
-                    f"orphanages={peer_counts.get('orphanages', 0)}, "
-                    f"new_peers={len(peers_to_explore)}"
-                )
-
-            except asyncio.TimeoutError:
-                self.timeout_count += 1
-                self.logger.warning(f"[IP TIMEOUT] {query_url} (total timeouts: {self.timeout_count})")
+                await self._visit_node(frontier, key, address, depth, deadline)
             except Exception as e:
                 self.error_count += 1
-                self.logger.error(f"[IP ERROR] {query_url} - {e} (total errors: {self.error_count})")
-        
-        # 재귀 호출은 semaphore 밖에서 실행 (데드락 방지)
-        if peers_to_explore:
-            self.logger.info(f"[RECURSIVE CALL] Exploring {len(peers_to_explore)} new peers at depth {depth + 1}")
-            tasks = [self.collect_ips(peer_ip, depth + 1) for peer_ip in peers_to_explore]
-            # 재귀 호출 - return_exceptions=True로 예외를 결과로 반환
-            await asyncio.gather(*tasks, return_exceptions=True)
+                self.crawl_stats["failed"] += 1
+                self.logger.error(f"[CRAWL ERROR] {address} - {e}")
+            finally:
+                frontier.task_done()
+
+    async def _visit_node(self, frontier: asyncio.Queue, key: str, address: str, depth: int, deadline: Optional[float]):
+        query_url = f"http://{key}"
+        timeout = self.timeout
+        if deadline is not None:
+            timeout = min(timeout, deadline - time.monotonic())
+            if timeout <= 0:
+                return
+
+        started = time.perf_counter()
+        try:
+            detailed_info = await asyncio.wait_for(self.rpc_helper.fetch(url=f"{query_url}/admin/chain/icon_dex"), timeout)
+        except asyncio.TimeoutError:
+            self.timeout_count += 1
+            self.crawl_stats["abandoned"] += 1
+            self.fetch_latency.record((time.perf_counter() - started) * 1000)
+            self.logger.warning(f"[CRAWL TIMEOUT] Abandoned {query_url} after {timeout:.1f}s")
+            return
+        latency_ms = (time.perf_counter() - started) * 1000
+        self.fetch_latency.record(latency_ms)
+
+        if not isinstance(detailed_info, dict) or 'module' not in detailed_info:
+            self.crawl_stats["failed"] += 1
+            self.logger.warning(f"[CRAWL ERROR] Invalid response from {query_url}")
+            return
+
+        p2p_info = detailed_info['module']['network'].get('p2p', {})
+        self_info = p2p_info.get('self', {})
+        node_address = self_info.get('addr') or address
+        if self_info.get('addr'):
+            self.ip_set.add(self_info['addr'])
+            if self._frontier_key(self_info['addr']):
+                self.visited.add(self._frontier_key(self_info['addr']))
+        self._parse_p2p_peers(p2p_info, node_address)
+
+        peer_count = 0
+        for peer_type in EXPLORED_PEER_TYPES:
+            for peer in p2p_info.get(peer_type) or []:
+                peer_address = peer.get('addr', '')
+                if not peer_address:
+                    continue
+                peer_count += 1
+                self._emit({"type": "edge", "from": node_address, "to": peer_address, "peer_type": peer_type, "hx": peer.get('id'), "rtt": peer.get('rtt')})
+                # Peers one hop past max_depth are still queried for their HX addresses, but not explored further
+                if depth <= self.max_depth:
+                    self.ip_set.add(peer_address)
+                    self._enqueue(frontier, peer_address, depth + 1)
+
+        self.crawl_stats["nodes"] += 1
+        self.crawl_stats["edges"] += peer_count
+        self._emit({"type": "node", "addr": node_address, "hx": self_info.get('id'), "depth": depth, "latency_ms": round(latency_ms, 1), "peers": peer_count})
+        self.logger.debug(f"[CRAWL NODE] {query_url} depth={depth}, peers={peer_count}, frontier={frontier.qsize()}, latency={latency_ms:.1f}ms")
 
     async def collect_hx(self, ip: str):
         """
-        Collects HX (Hexadecimal) address information for a given IP address.
-        This involves querying the node's `/admin/chain/{nid}` endpoint to get
-        detailed P2P information and then mapping HX addresses to their IPs
-        using the `add_hx_to_ip` method.
+        Collects HX (Hexadecimal) address information for a given IP address by querying the node's
+        `/admin/chain/icon_dex` endpoint once and mapping its peers with `add_hx_to_ip`.
+
+        .. deprecated::
+            :meth:`collect_ips` maps the HX addresses of every node it queries, so a separate pass is not needed.
 
         :param ip: The IP address of the node to query.
         :type ip: str
         """
-        async with self.semaphore:
-            self.logger.info(f"[COLLECT_HX START] IP={ip} (semaphore acquired)")
-            base_ip, _ = self.extract_ip_and_port(ip)
-            if not base_ip:
-                self.logger.warning(f"[COLLECT_HX SKIP] Invalid IP: {ip}")
-                return
-            query_url = f"http://{base_ip}:9000"
-            try:
-                # Chain detail 조회 (항상 icon_dex 사용)
-                self.logger.debug(f"[HX DETAIL FETCH] Fetching from {query_url}/admin/chain/icon_dex")
-                try:
-                    detailed_info = await self.rpc_helper.fetch(url=f"{query_url}/admin/chain/icon_dex")
-                except asyncio.TimeoutError:
-                    self.timeout_count += 1
-                    self.logger.warning(f"[HX DETAIL TIMEOUT] {query_url}")
-                    return
-                except Exception as e:
-                    self.error_count += 1
-                    self.logger.error(f"[HX DETAIL ERROR] {query_url} - {e}")
-                    return
-                    
-                self.logger.debug(f"[HX DETAIL RESPONSE] {query_url} - {detailed_info}")
-                if not detailed_info or 'module' not in detailed_info:
-                    self.logger.warning(f"[HX DETAIL ERROR] Invalid response from {query_url}")
-                    return
-
-                p2p_info = detailed_info['module']['network'].get('p2p', {})
-                
-                # P2P 정보 파싱 및 매핑
-                hx_count_before = len(self.hx_to_ip)
-                self._parse_p2p_peers(p2p_info, ip)
-                hx_count_after = len(self.hx_to_ip)
-                new_hx_count = hx_count_after - hx_count_before
-                
-                self.logger.info(f"[COLLECT_HX DONE] {ip} - Found {new_hx_count} new HX addresses (total: {hx_count_after})")
-
-            except asyncio.TimeoutError:
-                self.timeout_count += 1
-                self.logger.warning(f"[HX TIMEOUT] {query_url} (total timeouts: {self.timeout_count})")
-            except Exception as e:
-                self.error_count += 1
-                self.logger.error(f"[HX ERROR] {query_url} - {e} (total errors: {self.error_count})")
+        warnings.warn(
+            "collect_hx is deprecated. collect_ips already collects the HX addresses of every node.",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        base_ip, _ = self.extract_ip_and_port(ip)
+        if not base_ip:
+            self.logger.warning(f"[COLLECT_HX SKIP] Invalid IP: {ip}")
+            return
+        query_url = f"http://{base_ip}:{self.rpc_port}"
+        try:
+            detailed_info = await self.rpc_helper.fetch(url=f"{query_url}/admin/chain/icon_dex")
+        except asyncio.TimeoutError:
+            self.timeout_count += 1
+            self.logger.warning(f"[HX DETAIL TIMEOUT] {query_url}")
+            return
+        except Exception as e:
+            self.error_count += 1
+            self.logger.error(f"[HX DETAIL ERROR] {query_url} - {e}")
+            return
+        if not isinstance(detailed_info, dict) or 'module' not in detailed_info:
+            self.logger.warning(f"[HX DETAIL ERROR] Invalid response from {query_url}")
+            return
+        self._parse_p2p_peers(detailed_info['module']['network'].get('p2p', {}), ip)
 
     def _parse_p2p_peers(self, p2p_info: dict, current_ip: str):
         """
@@ -495,17 +603,17 @@ class P2PNetworkParser(LoggerMixinVerbose):
         """
         Executes the main process of parsing the P2P network.
         This involves two main phases:
-        1. **IP Collection**: Recursively traverses the network from the `start_url`
-           to discover all reachable IP addresses of peer nodes up to `max_depth`.
-        2. **HX Collection**: For each discovered IP address, it queries the node
-           to get detailed P2P information, including HX addresses, and populates
-           the `hx_to_ip` mapping.
+        1. **Crawl**: Traverses the network breadth-first from the `start_url` with :meth:`collect_ips`.
+           Each reachable node up to `max_depth` hops is queried once, which yields both the IP addresses
+           of its peers and their HX addresses for the `hx_to_ip` mapping.
+        2. **Mapping**: Builds the reverse `ip_to_hx` mapping and the statistics.
 
         Finally, it cleans up asynchronous resources and returns the collected data.
 
         :returns: A dictionary containing two main mappings:
                   - "ip_to_hx": A dictionary mapping IP addresses to their corresponding HX addresses and peer types.
                   - "hx_to_ip": A dictionary mapping HX addresses to :class:`PeerInfo` objects.
+                  - "statistics": Node counts, with the crawl statistics under "crawl".
         :rtype: dict
 
         Example:
@@ -529,57 +637,30 @@ class P2PNetworkParser(LoggerMixinVerbose):
         await self.initialize_resources()
         self.logger.info("[INIT COMPLETE] Resources initialized")
 
-        # [PHASE 1] IP 수집
+        if not self.preps_info:
+            await self.fetch_preps_info(f"http://{self._frontier_key(self.start_url)}")
+
+        # [PHASE 1] BFS crawl: IPs and HX addresses from one query per node
         self.logger.info("=" * 80)
-        self.logger.info("[PHASE 1 START] Collecting IPs from P2P network")
+        self.logger.info("[PHASE 1 START] Crawling the P2P network")
         self.logger.info(f"[PHASE 1 CONFIG] start_url={self.start_url}, max_depth={self.max_depth}, max_concurrent={self.max_concurrent}")
-        phase1_start = time.time()
-        
-        await self.collect_ips(self.start_url, depth=0)
-        
-        phase1_elapsed = time.time() - phase1_start
-        self.logger.info("=" * 80)
-        self.logger.info("[PHASE 1 COMPLETE] IP Collection Summary:")
-        self.logger.info(f"  - Time elapsed: {phase1_elapsed:.2f}s")
-        self.logger.info(f"  - Total IPs collected: {len(self.ip_set)}")
-        self.logger.info(f"  - Nodes visited: {len(self.visited)}")
-        self.logger.info(f"  - Errors so far: {self.error_count}")
-        self.logger.info(f"  - Timeouts so far: {self.timeout_count}")
 
-        # [PHASE 2] HX 수집
-        self.logger.info("=" * 80)
-        self.logger.info(f"[PHASE 2 START] Collecting HX addresses for {len(self.ip_set)} IPs")
-        phase2_start = time.time()
-        
-        tasks = [self.collect_hx(ip) for ip in self.ip_set]
-        self.logger.info(f"[PHASE 2 TASKS] Created {len(tasks)} tasks, max_concurrent={self.max_concurrent}")
-        
-        # 개별 task의 timeout으로 충분하므로 전체 timeout 제거
-        # return_exceptions=True로 예외를 결과로 반환하여 CancelledError 방지
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        success_count = 0
-        error_count = 0
-        for ip_addr, result in zip(self.ip_set, results):
-            if isinstance(result, Exception):
-                error_count += 1
-                self.logger.error(f"[HX TASK ERROR] {ip_addr} - {result}")
-            else:
-                success_count += 1
-                self.logger.debug(f"[HX TASK SUCCESS] {ip_addr}")
+        crawl_stats = await self.collect_ips(self.start_url, depth=0)
 
-        phase2_elapsed = time.time() - phase2_start
+        latency = crawl_stats["fetch_latency_ms"]
         self.logger.info("=" * 80)
-        self.logger.info("[PHASE 2 COMPLETE] HX Collection Summary:")
-        self.logger.info(f"  - Time elapsed: {phase2_elapsed:.2f}s")
-        self.logger.info(f"  - IPs processed: {len(self.ip_set)}")
-        self.logger.info(f"  - Successful: {success_count}")
-        self.logger.info(f"  - Failed: {error_count}")
+        self.logger.info("[PHASE 1 COMPLETE] Crawl Summary:")
+        self.logger.info(f"  - Time elapsed: {crawl_stats['elapsed']:.2f}s")
+        self.logger.info(f"  - Nodes queried: {crawl_stats['nodes']} ({crawl_stats['nodes_per_second']} nodes/s)")
+        self.logger.info(f"  - Query latency: p50={latency['p50']}ms, p95={latency['p95']}ms, p99={latency['p99']}ms")
+        self.logger.info(f"  - Total IPs collected: {len(self.ip_set)}")
+        self.logger.info(f"  - Abandoned (timeout): {crawl_stats['abandoned']}, failed: {crawl_stats['failed']}")
+        self.logger.info(f"  - Left in frontier: {crawl_stats['unvisited']}, skipped (frontier full): {crawl_stats['frontier_dropped']}")
         self.logger.info(f"  - Total unique HX addresses: {len(self.hx_to_ip)}")
 
-        # [PHASE 3] 데이터 매핑 생성
+        # [PHASE 2] 데이터 매핑 생성
         self.logger.info("=" * 80)
-        self.logger.info("[PHASE 3 START] Building reverse mappings (ip_to_hx)")
+        self.logger.info("[PHASE 2 START] Building reverse mappings (ip_to_hx)")
         
         for hx, peer_info in self.hx_to_ip.items():
             for ip_addr in peer_info.ip_addresses:
@@ -592,7 +673,7 @@ class P2PNetworkParser(LoggerMixinVerbose):
                     'rtt': peer_info.ip_addresses[ip_addr].rtt
                 })
         
-        self.logger.info(f"[PHASE 3 COMPLETE] Mapped {len(self.ip_to_hx)} IPs to HX addresses")
+        self.logger.info(f"[PHASE 2 COMPLETE] Mapped {len(self.ip_to_hx)} IPs to HX addresses")
         
         # 최종 통계
         total_elapsed = time.time() - self.start_time
@@ -656,6 +737,8 @@ class P2PNetworkParser(LoggerMixinVerbose):
         self.logger.info("Performance:")
         self.logger.info(f"  ├─ Total time: {total_elapsed:.2f}s")
         self.logger.info(f"  ├─ IPs per second: {len(self.ip_set) / total_elapsed:.2f}")
+        self.logger.info(f"  ├─ Nodes queried per second: {crawl_stats['nodes_per_second']}")
+        self.logger.info(f"  ├─ Query latency p99: {latency['p99']}ms")
         self.logger.info(f"  ├─ Total errors: {self.error_count}")
         self.logger.info(f"  └─ Total timeouts: {self.timeout_count}")
         self.logger.info("=" * 80)
@@ -676,6 +759,7 @@ class P2PNetworkParser(LoggerMixinVerbose):
                 "validator_count": len(validator_nodes),
                 "citizen_count": len(citizen_nodes),
                 "missing_preps_count": len(missing_preps),
+                "crawl": crawl_stats,
             }
         }
         pawn.console.log(result)
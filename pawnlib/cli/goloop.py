@@ -154,6 +154,8 @@ def get_arguments(parser):
     parser.add_argument('--timeout', type=int, help='timeout  (default: %(default)s)', default=5)
     parser.add_argument('--max-depth', type=int, help='depth  (default: %(default)s)', default=3)
     parser.add_argument('--platform', type=str, help='platform  (default: %(default)s)', default="icon")
+    parser.add_argument('--time-budget', type=float, help='Stop the P2P crawl after this many seconds (default: %(default)s)', default=None)
+    parser.add_argument('--jsonl', type=str, help='Stream the crawled P2P nodes and edges to this JSON lines file (default: %(default)s)', default=None)
 
     return parser
 
@@ -308,7 +310,7 @@ async def main():
                 args.url,
                 max_concurrent=args.max_concurrent,
                 timeout=args.timeout, logger=logger, max_depth=args.max_depth, verbose=args.verbose,
-                platform=args.platform
+                platform=args.platform, time_budget=args.time_budget, output=args.jsonl,
             )
             ip_to_hx_map = await parser.run()
 
@@ -320,6 +322,12 @@ async def main():
             
             pawn.console.log(f"[bold green]Total Peer IPs:[/bold green] {total_peer_ip_count}")
             pawn.console.log(f"[bold green]Total Peer HX addresses:[/bold green] {total_peer_hx_count}")
+            crawl_stats = ip_to_hx_map.get('statistics', {}).get('crawl', {})
+            if crawl_stats:
+                pawn.console.log(
+                    f"[bold green]Crawl:[/bold green] {crawl_stats['nodes']} nodes in {crawl_stats['elapsed']}s "
+                    f"({crawl_stats['nodes_per_second']} nodes/s), query latency p99={crawl_stats['fetch_latency_ms']['p99']}ms"
+                )
             pawn.console.log("")
 
             # 여러 IP를 가진 노드만 출력
@@ -208,6 +208,21 @@ def get_arguments(parser=None):
         default=0,
     )
 
+    wallet_parser.add_argument(
+        '--catchup-threshold',
+        type=int,
+        help='Replay blocks with pipelined RPC fetches when resuming this many blocks (or more) behind the tip. '
+             'Set to 0 to disable catch-up mode.',
+        default=1000,
+    )
+
+    wallet_parser.add_argument(
+        '--catchup-concurrency',
+        type=int,
+        help='Maximum number of concurrent block fetches in catch-up mode.',
+        default=10,
+    )
+
     wallet_parser.add_argument('-n', '--network-name', type=str,  help='network name', default="")
     add_common_arguments(wallet_parser)
 
@@ -313,6 +328,8 @@ def load_environment_settings(args) -> dict:
         'bps_interval': get_setting('bps_interval', 'BPS_INTERVAL', default=0, value_type=int),
         'skip_until': get_setting('skip_until', 'SKIP_UNTIL', default=0, value_type=int),
         'base_dir': get_setting('base_dir', 'BASE_DIR', default="./", value_type=str),
+        'catchup_threshold': get_setting('catchup_threshold', 'CATCHUP_THRESHOLD', default=1000, value_type=int),
+        'catchup_concurrency': get_setting('catchup_concurrency', 'CATCHUP_CONCURRENCY', default=10, value_type=int),
         # 'state_cache_file': os.environ.get('STATE_CACHE_FILE', args.state_cache_file),
         'check_interval': get_setting('check_interval', 'CHECK_INTERVAL', default=10, value_type=int),
         'ignore_decimal': get_setting('ignore_decimal', 'IGNORE_DECIMAL', default=False, value_type=bool),
@@ -472,15 +489,29 @@ class WalletStateTracker:
 
 async def worker(rpc, address: str) -> dict:
     """지갑 전체 데이터 반환"""
+    if rpc.batch_requests:
+        # The calls are coalesced into JSON-RPC batch requests by the helper.
+        return await _fetch_wallet_data(rpc, address)
     async with rpc.semaphore:
-        return {
-            "balance": await rpc.get_balance(address, return_as_hex=False),
-            "stake": await rpc.get_stake(address, return_key="result.stake"),
-            "bond": await rpc.get_bond(address, return_key="result.totalBonded"),
-            "delegation": await rpc.get_delegation(address, return_key="result.totalDelegated"),
-            "reward": await rpc.get_iscore(address, return_key="result.estimatedICX"),
-            "last_updated": todaydate('ms')
-        }
+        return await _fetch_wallet_data(rpc, address)
+
+
+async def _fetch_wallet_data(rpc, address: str) -> dict:
+    balance, stake, bond, delegation, reward = await asyncio.gather(
+        rpc.get_balance(address, return_as_hex=False),
+        rpc.get_stake(address, return_key="result.stake"),
+        rpc.get_bond(address, return_key="result.totalBonded"),
+        rpc.get_delegation(address, return_key="result.totalDelegated"),
+        rpc.get_iscore(address, return_key="result.estimatedICX"),
+    )
+    return {
+        "balance": balance,
+        "stake": stake,
+        "bond": bond,
+        "delegation": delegation,
+        "reward": reward,
+        "last_updated": todaydate('ms')
+    }
 
 
 def deep_filter_ignored(data: Any, ignore_keys: List[str]) -> Any:
@@ -660,7 +691,9 @@ def run_multi_wallet_monitoring(args, logger):
         async with AsyncIconRpcHelper(
                 url=settings['endpoint_url'],
                 max_concurrency=5,
-                logger=logger
+                logger=logger,
+                pooled=True,
+                batch_requests=True,
         ) as rpc:
             await run_continuous_monitoring(
                 rpc=rpc,
@@ -719,6 +752,8 @@ def run_wallet_client_with_websocket(args, logger):
                 bps_interval=settings["bps_interval"],
                 skip_until=settings["skip_until"],
                 base_dir=settings["base_dir"],
+                catchup_threshold=settings["catchup_threshold"],
+                catchup_concurrency=settings["catchup_concurrency"],
             )
             await websocket_client.initialize()
             await websocket_client.run_from_blockheight(blockheight=args.blockheight)
@@ -105,8 +105,9 @@ def get_arguments(parser):
     parser.add_argument('--port-range', type=str, help='Port range (e.g., 20-80)', default="0-65535")
     parser.add_argument('-w', '--worker', type=int, help='Max concurrency worker count', default=10000)
     parser.add_argument('-t', '--timeout', type=float, help='timeout', default=1)
-    parser.add_argument('-b', '--batch-size', type=int, help='timeout', default=1000)
+    parser.add_argument('-b', '--batch-size', type=int, help='Number of results between progress updates', default=1000)
     parser.add_argument('-f', '--fast-scan', action='store_true', help='fast scan mode', default=False)
+    parser.add_argument('--syn-scan', action='store_true', help='Probe with raw SYN packets (requires root)', default=False)
 
     parser.add_argument('--view-type', type=str, choices=['open', 'closed', 'all'], help='Type of results to view (open, closed, all)', default="open")
 
@@ -188,6 +189,7 @@ def main():
             max_concurrency=args.worker,
             batch_size=args.batch_size,
             timeout=args.timeout,
+            syn_scan=args.syn_scan,
         )
         scanner.run_scan(fast_scan=args.fast_scan)
         print("\n\n")
@@ -1,14 +1,17 @@
 #!/usr/bin/env python3
+import asyncio
+import os
 import socket
 import select
 import time
 import sys
 import argparse
+from array import array
 from pawnlib.builder.generator import generate_banner
 from pawnlib.__version__ import __version__ as _version
 from pawnlib.config import pawnlib_config as pawn
 from pawnlib.utils.http import remove_http, ALLOWS_HTTP_METHOD
-from pawnlib.typing import str2bool, is_int, is_valid_ipv4, detect_encoding
+from pawnlib.typing import str2bool, is_int, is_valid_ipv4, detect_encoding, format_network_traffic
 from collections import OrderedDict
 import re
 import ssl
@@ -29,6 +32,14 @@ __epilog__ = (
     "  4. To set a timeout for the proxy connections:\n"
     "     - Sets a timeout of 5 seconds for the proxy connections.\n\n"
     "     `pawns proxy --listen ip_address:port --forward ip_address:port --timeout 5`\n\n"
+    "  5. To choose how the traffic is relayed:\n"
+    "     - inspect (the default) prints the traffic with the select-based reflector, passthrough relays the bytes\n"
+    "       without decoding them (splice on Linux), and inject also rewrites the first request head of each connection.\n\n"
+    "     `pawns proxy --forward https://example.com --mode inject --header 'X-Forwarded-Proto: https'`\n\n"
+    "  6. To forward to an https address with a self-signed certificate:\n"
+    "     - The TLS certificate and hostname of an https forward address are verified in every mode.\n"
+    "       Earlier versions did not verify them; pass -k/--insecure to skip the verification.\n\n"
+    "     `pawns proxy --forward https://10.0.0.1:8443 --insecure`\n\n"
     "For more detailed information on command options, use the -h or --help flag."
 )
 
@@ -42,26 +53,56 @@ def get_parser():
 def get_arguments(parser):
     parser.add_argument("--listen", "-l", type=str, help="Listen  ip_address:port", default="0.0.0.0:8080")
     parser.add_argument("--forward", "-f", type=str, help="Forward ip_address:port", default=None, required=True)
-    parser.add_argument("--buffer-size", type=int, help="buffer size for socket", default=4096)
-    parser.add_argument("--delay", type=float, help="buffer delay for socket", default=0.0001)
+    parser.add_argument("--buffer-size", type=int, help="buffer size for socket (default: 4096 for inspect, 65536 otherwise)", default=None)
+    parser.add_argument("--delay", type=float, help="buffer delay for socket (inspect mode)", default=0.0001)
     parser.add_argument("--timeout", '-t', type=float, help="timeout for socket", default=3)
+    parser.add_argument("--mode", "-m", type=str, choices=["inspect", "passthrough", "inject"], default="inspect",
+                        help="inspect: print the traffic (default), passthrough: relay the bytes as is, "
+                             "inject: rewrite the first request head")
+    parser.add_argument("--header", type=str, action="append", default=[], help="Header set in inject mode, e.g. 'X-Forwarded-Proto: https'")
+    parser.add_argument("--report-interval", type=float, help="seconds between statistics lines, 0 to disable", default=10)
+    parser.add_argument("--insecure", "-k", action="store_true", default=False,
+                        help="Do not verify the TLS certificate of an https forward address")
     return parser
 
 
+def parse_header_args(header_args):
+    headers = {}
+    for header in header_args or []:
+        if ":" not in header:
+            raise argparse.ArgumentTypeError(f"Invalid header: '{header}'. Format should be: 'Name: value'")
+        key, value = header.split(":", 1)
+        headers[key.strip()] = value.strip()
+    return headers
+
+
+def create_client_ssl_context(verify: bool = True) -> ssl.SSLContext:
+    """
+    Create the TLS context for connecting to an https forward address.
+
+    :param verify: Verify the certificate and the hostname of the forward address.
+    """
+    context = ssl.create_default_context()
+    if not verify:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    return context
+
+
 class Forward:
     def __init__(self):
         self._forwarder = None
         self._secure_forwarder = None
 
-    def start(self, host, port, is_ssl=False, hostname="", timeout=10):
+    def start(self, host, port, is_ssl=False, hostname="", timeout=10, verify_ssl=True):
         self._forwarder = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         try:
             self._forwarder.connect((host, port))
             self._forwarder.settimeout(timeout)
 
             if is_ssl:
-                context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
-                self._secure_forwarder = context.wrap_socket(self._forwarder, server_hostname=hostname)
+                context = create_client_ssl_context(verify=verify_ssl)
+                self._secure_forwarder = context.wrap_socket(self._forwarder, server_hostname=hostname or host)
                 return self._secure_forwarder
 
             return self._forwarder
@@ -72,12 +113,11 @@ class Forward:
 
 
 class EchoWebServer:
-    input_list = []
-    channel = {}
-
-    def __init__(self, listen, forward, buffer_size, delay):
+    def __init__(self, listen, forward, buffer_size, delay, verify_ssl=True):
         self.data = None
         self.s = None
+        self.input_list = []
+        self.channel = {}
 
         self.listen = listen
         self.forward = forward
@@ -88,6 +128,7 @@ class EchoWebServer:
         self.f_port = None
 
         self.is_ssl = False
+        self.verify_ssl = verify_ssl
 
         self.buffer_size = buffer_size
         self.delay = delay
@@ -257,7 +298,8 @@ class EchoWebServer:
 
     def on_accept(self):
         try:
-            forward = Forward().start(self.f_host, self.f_port, is_ssl=self.is_ssl, hostname=self.f_hostname)
+            forward = Forward().start(self.f_host, self.f_port, is_ssl=self.is_ssl, hostname=self.f_hostname,
+                                  verify_ssl=self.verify_ssl)
             pawn.console.log(f"[bold red]on_accept [/bold red] forward={forward}")
             clientsock, client_addr = self.server.accept()
             client_ip, client_port = client_addr
@@ -342,6 +384,499 @@ class EchoWebServer:
             return "{}:{}".format(*data)
 
 
+MAX_REQUEST_HEAD = 65536
+
+
+def rewrite_request_head(data: bytes, headers: dict) -> bytes:
+    """
+    Sets ``headers`` in the HTTP request head at the start of ``data``, keeping the rest of the bytes as they are.
+
+    Only the head is split into lines, the body and anything after the first ``\\r\\n\\r\\n`` are not decoded.
+    Responses, non-HTTP data and incomplete heads are returned unchanged.
+
+    :param data: Bytes starting with a request head.
+    :param headers: Headers to set, replacing the existing ones regardless of case.
+    :return: The rewritten bytes.
+
+    Example:
+
+        .. code-block:: python
+
+            rewrite_request_head(b"GET / HTTP/1.1\\r\\nHost: localhost\\r\\n\\r\\n", {"Host": "example.com"})
+            # >> b"GET / HTTP/1.1\\r\\nHost: example.com\\r\\n\\r\\n"
+
+    """
+    end = data.find(b"\r\n\r\n")
+    if end < 0 or not headers:
+        return data
+    lines = data[:end].split(b"\r\n")
+    method = lines[0].split(b" ", 1)[0].decode("latin-1")
+    if method.upper() not in (allowed.upper() for allowed in ALLOWS_HTTP_METHOD):
+        return data
+
+    replacements = {key.lower().encode("latin-1"): f"{key}: {value}".encode("latin-1") for key, value in headers.items() if key and value}
+    replaced = set()
+    head = [lines[0]]
+    for line in lines[1:]:
+        name = line.split(b":", 1)[0].strip().lower()
+        if name in replacements:
+            if name not in replaced:
+                head.append(replacements[name])
+                replaced.add(name)
+        else:
+            head.append(line)
+    head.extend(line for name, line in replacements.items() if name not in replaced)
+    return b"\r\n".join(head) + data[end:]
+
+
+class RelayStats:
+    """
+    Connection counts, throughput and first byte latency of :class:`ProxyRelay`.
+
+    The first byte latency of a connection is the time between reading the first bytes from the client
+    and reading the first bytes of the answer from the forward address, the same in splice and transport mode.
+    The most recent ``latency_samples`` latencies are kept for the percentiles.
+
+    :param latency_samples: Number of latencies kept for the percentiles.
+    """
+
+    def __init__(self, latency_samples: int = 8192):
+        self.active = 0
+        self.total = 0
+        self.failed = 0
+        self.bytes = {"up": 0, "down": 0}
+        self.latencies = array("d", bytes(8 * latency_samples))
+        self._index = 0
+        self._count = 0
+        self._last_report = (time.monotonic(), 0, 0)
+
+    def record(self, direction: str, size: int):
+        self.bytes[direction] += size
+
+    def record_latency(self, latency: float):
+        self.latencies[self._index] = latency
+        self._index = (self._index + 1) % len(self.latencies)
+        if self._count < len(self.latencies):
+            self._count += 1
+
+    def percentile(self, percent: float = 99) -> float:
+        """
+        Returns the ``percent`` percentile of the recent latencies, in seconds.
+        """
+        if not self._count:
+            return 0.0
+        samples = sorted(self.latencies[:self._count])
+        return samples[min(self._count - 1, int(self._count * percent / 100))]
+
+    def report(self) -> dict:
+        """
+        Returns the counters with the bytes/s since the previous report.
+        """
+        now = time.monotonic()
+        last_time, last_up, last_down = self._last_report
+        elapsed = max(now - last_time, 1e-9)
+        up, down = self.bytes["up"], self.bytes["down"]
+        self._last_report = (now, up, down)
+        return {
+            "active": self.active,
+            "total": self.total,
+            "failed": self.failed,
+            "up_bytes_per_sec": (up - last_up) / elapsed,
+            "down_bytes_per_sec": (down - last_down) / elapsed,
+            "p99_first_byte_ms": self.percentile(99) * 1000,
+        }
+
+
+class RelayConnection:
+    """
+    State of one client connection relayed by :class:`ProxyRelay`.
+
+    The connection is finished when both directions are done, or as soon as one of them fails.
+    """
+
+    __slots__ = ("relay", "client", "address", "upstream", "started", "bytes_up", "bytes_down", "open_directions", "done", "on_close",
+                 "request_started", "answered")
+
+    def __init__(self, relay: "ProxyRelay", client: socket.socket, address):
+        self.relay = relay
+        self.client = client
+        self.address = address
+        self.upstream = None
+        self.started = time.monotonic()
+        self.bytes_up = 0
+        self.bytes_down = 0
+        self.open_directions = 2
+        self.done = asyncio.get_running_loop().create_future()
+        self.on_close = []
+        self.request_started = None
+        self.answered = False
+
+    def count(self, direction: str, size: int, started: float):
+        """
+        Counts a relayed chunk that was read at ``started`` (``time.perf_counter``).
+        """
+        if direction == "up":
+            self.bytes_up += size
+            if self.request_started is None:
+                self.request_started = started
+        else:
+            self.bytes_down += size
+            if not self.answered and self.request_started is not None:
+                self.answered = True
+                self.relay.stats.record_latency(started - self.request_started)
+        self.relay.stats.record(direction, size)
+
+    def direction_done(self, error: Exception = None):
+        self.open_directions -= 1
+        if error is not None:
+            pawn.console.debug(f"[red]Relay error {self.address}: {error}")
+        if (self.open_directions <= 0 or error is not None) and not self.done.done():
+            self.done.set_result(error)
+
+    def close(self):
+        for callback in self.on_close:
+            callback()
+        for sock in (self.client, self.upstream):
+            if sock is not None:
+                sock.close()
+
+
+class _RelayProtocol(asyncio.Protocol):
+    """
+    One side of a relayed connection, writing what it receives to the transport of its peer.
+    With ``inject``, the first request head is collected and rewritten before it is written.
+    """
+
+    def __init__(self, conn: RelayConnection, direction: str, inject: dict = None):
+        self.conn = conn
+        self.direction = direction
+        self.inject = inject
+        self.head = bytearray() if inject else None
+        self.transport = None
+        self.peer = None
+        self.eof = False
+
+    def connection_made(self, transport):
+        self.transport = transport
+        if self.peer is None or self.peer.transport is None:
+            # The other side is not connected yet
+            transport.pause_reading()
+
+    def _write(self, data, started):
+        self.peer.transport.write(data)
+        self.conn.count(self.direction, len(data), started)
+
+    def _flush_head(self, started):
+        head, self.head = bytes(self.head), None
+        self.peer.transport.write(rewrite_request_head(head, self.inject))
+        self.conn.count(self.direction, len(head), started)
+
+    def data_received(self, data):
+        started = time.perf_counter()
+        if self.head is None:
+            self._write(data, started)
+            return
+        self.head += data
+        if b"\r\n\r\n" in self.head or len(self.head) >= MAX_REQUEST_HEAD:
+            self._flush_head(started)
+
+    def eof_received(self):
+        if self.head:
+            self._flush_head(time.perf_counter())
+        self.eof = True
+        if self.peer.eof or not self.peer.transport.can_write_eof():
+            return False
+        self.peer.transport.write_eof()
+        return True
+
+    def pause_writing(self):
+        self.peer.transport.pause_reading()
+
+    def resume_writing(self):
+        self.peer.transport.resume_reading()
+
+    def connection_lost(self, exc):
+        if self.peer.transport is not None:
+            self.peer.transport.close()
+        self.conn.direction_done(exc)
+
+
+class _SpliceRelay:
+    """
+    One direction of a relayed connection, moving the bytes from ``source`` to ``destination``
+    through a pipe with ``os.splice`` from the event loop callbacks, without copying them into Python.
+    """
+
+    def __init__(self, conn: RelayConnection, source: socket.socket, destination: socket.socket, direction: str, buffer_size: int):
+        self.conn = conn
+        self.source = source.fileno()
+        self.destination = destination
+        self.direction = direction
+        self.buffer_size = buffer_size
+        self.loop = asyncio.get_running_loop()
+        self.pipe_read, self.pipe_write = os.pipe2(os.O_NONBLOCK | os.O_CLOEXEC)
+        self.flags = os.SPLICE_F_MOVE | os.SPLICE_F_NONBLOCK
+        self.pending = 0
+        self._size = 0
+        self.started = 0.0
+        self.finished = False
+        self.loop.add_reader(self.source, self._on_readable)
+
+    def _flush(self) -> bool:
+        while self.pending:
+            try:
+                self.pending -= os.splice(self.pipe_read, self.destination.fileno(), self.pending, flags=self.flags)
+            except BlockingIOError:
+                return False
+        self.conn.count(self.direction, self._size, self.started)
+        return True
+
+    def _on_readable(self):
+        try:
+            while True:
+                try:
+                    self._size = os.splice(self.source, self.pipe_write, self.buffer_size, flags=self.flags)
+                except BlockingIOError:
+                    return
+                if not self._size:
+                    self.finish()
+                    return
+                self.started = time.perf_counter()
+                self.pending = self._size
+                if not self._flush():
+                    # The destination is full, stop reading until it is writable again
+                    self.loop.remove_reader(self.source)
+                    self.loop.add_writer(self.destination.fileno(), self._on_writable)
+                    return
+        except OSError as e:
+            self.finish(e)
+
+    def _on_writable(self):
+        try:
+            if self._flush():
+                self.loop.remove_writer(self.destination.fileno())
+                self.loop.add_reader(self.source, self._on_readable)
+        except OSError as e:
+            self.finish(e)
+
+    def finish(self, error: Exception = None):
+        if self.finished:
+            return
+        self.finished = True
+        self.loop.remove_reader(self.source)
+        self.loop.remove_writer(self.destination.fileno())
+        os.close(self.pipe_read)
+        os.close(self.pipe_write)
+        try:
+            self.destination.shutdown(socket.SHUT_WR)
+        except OSError:
+            pass
+        self.conn.direction_done(error)
+
+
+class ProxyRelay:
+    """
+    Event-driven TCP forwarding core of the proxy reflector.
+
+    Connections are accepted and relayed from the callbacks of one asyncio loop, without a task or a
+    future per chunk and without decoding the traffic.
+    In ``passthrough`` mode the bytes are moved between the sockets with ``os.splice`` on Linux,
+    without copying them into Python, and through asyncio transports elsewhere.
+    In ``inject`` mode the first request head of each connection is rewritten with ``headers``
+    (``Host`` is set to the forward hostname by default) and the rest is relayed as is.
+
+    :param listen: Listen ip_address:port.
+    :param forward: Forward ip_address:port, or a http(s):// URL.
+    :param buffer_size: Maximum bytes moved by one splice call.
+    :param mode: ``passthrough`` or ``inject``. Defaults to ``inject`` when the forward address has a hostname.
+    :param headers: Headers set in the first request head in ``inject`` mode.
+    :param timeout: Timeout for connecting to the forward address.
+    :param report_interval: Seconds between two log lines of :class:`RelayStats`, 0 to disable.
+    :param verify_ssl: Verify the TLS certificate of an https forward address.
+    :param ssl_context: TLS context for an https forward address, e.g. with a private CA. Overrides ``verify_ssl``.
+
+    Example:
+
+        .. code-block:: python
+
+            from pawnlib.cli.proxy import ProxyRelay
+
+            relay = ProxyRelay(listen="0.0.0.0:8080", forward="https://example.com")
+            asyncio.run(relay.serve_forever())
+
+    """
+
+    MODES = ("passthrough", "inject")
+
+    def __init__(self, listen: str, forward: str, buffer_size: int = 65536, mode: str = None, headers: dict = None,
+                 timeout: float = 3, report_interval: float = 10, verify_ssl: bool = True,
+                 ssl_context: ssl.SSLContext = None):
+        self.listen = listen
+        self.forward = forward
+        self.buffer_size = buffer_size
+        self.timeout = timeout
+        self.report_interval = report_interval
+
+        _parsed_listen = parse_ip_port(listen)
+        self.l_host = _parsed_listen.get('ip_or_domain')
+        self.l_port = _parsed_listen.get('port')
+        _parsed_forward = parse_ip_port(forward)
+        self.f_host = _parsed_forward.get('ip_or_domain')
+        self.f_port = _parsed_forward.get('port')
+        self.f_hostname = _parsed_forward.get('hostname', '')
+        self.is_ssl = _parsed_forward.get('is_ssl', False)
+        self.ssl_context = None
+        if self.is_ssl:
+            self.ssl_context = ssl_context or create_client_ssl_context(verify=verify_ssl)
+        for ipaddr in [self.l_host, self.f_host]:
+            if not is_valid_ipv4(ipaddr):
+                raise ValueError(f"Invalid IP address - '{ipaddr}'")
+
+        self.mode = mode or ("inject" if self.f_hostname else "passthrough")
+        if self.mode not in self.MODES:
+            raise ValueError(f"Invalid mode: {self.mode}. Choose from {', '.join(self.MODES)}.")
+        self.headers = dict(headers or {})
+        if self.f_hostname:
+            self.headers.setdefault("Host", self.f_hostname)
+        self.use_splice = self.mode == "passthrough" and not self.is_ssl and hasattr(os, "splice")
+
+        self.stats = RelayStats()
+        self.server = None
+        self._loop = None
+        self._tasks = set()
+        self._stopped = None
+        self._report_task = None
+
+    async def start(self):
+        """
+        Starts listening and accepting connections in the background.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._stopped = self._loop.create_future()
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server.bind((self.l_host, self.l_port))
+        server.listen(1024)
+        server.setblocking(False)
+        self.server = server
+        self.l_port = server.getsockname()[1]
+        relay = "splice" if self.use_splice else "transport"
+        pawn.console.log(f"Listen {self.l_host}:{self.l_port} => Forward {self.f_hostname}({self.f_host}:{self.f_port}), "
+                         f"mode={self.mode}, relay={relay}")
+        self._loop.add_reader(server.fileno(), self._on_accept)
+        if self.report_interval:
+            self._report_task = asyncio.ensure_future(self._report_loop())
+
+    async def serve_forever(self):
+        if self.server is None:
+            await self.start()
+        try:
+            await self._stopped
+        finally:
+            await self.stop()
+
+    async def stop(self):
+        if self.server is not None and self.server.fileno() >= 0:
+            self._loop.remove_reader(self.server.fileno())
+            self.server.close()
+        for task in [self._report_task, *self._tasks]:
+            if task is not None and not task.done():
+                task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._stopped is not None and not self._stopped.done():
+            self._stopped.set_result(None)
+
+    async def _report_loop(self):
+        while True:
+            await asyncio.sleep(self.report_interval)
+            report = self.stats.report()
+            pawn.console.log(
+                f"connections={report['active']} (total={report['total']}, failed={report['failed']}), "
+                f"up={format_network_traffic(report['up_bytes_per_sec'] * 8, per_second=True)}, "
+                f"down={format_network_traffic(report['down_bytes_per_sec'] * 8, per_second=True)}, "
+                f"p99 first byte={report['p99_first_byte_ms']:.3f}ms"
+            )
+
+    def _on_accept(self):
+        while True:
+            try:
+                client, address = self.server.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                pawn.console.log(f"[red]Error accepting connection: {e}")
+                return
+            task = self._loop.create_task(self._handle(RelayConnection(self, client, address)))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _handle(self, conn: RelayConnection):
+        self.stats.active += 1
+        self.stats.total += 1
+        conn.client.setblocking(False)
+        try:
+            if self.use_splice:
+                connected = await self._open_splice(conn)
+            else:
+                connected = await self._open_transports(conn)
+            if connected:
+                await conn.done
+        except Exception as e:
+            pawn.console.debug(f"[red]Relay error {conn.address}: {e}")
+        finally:
+            self.stats.active -= 1
+            conn.close()
+            pawn.console.debug(f"{conn.address} closed, up={conn.bytes_up}, down={conn.bytes_down}, "
+                               f"duration={time.monotonic() - conn.started:.3f}s")
+
+    def _connect_failed(self, conn: RelayConnection, error: Exception):
+        self.stats.failed += 1
+        pawn.console.log(f"[red][Forward ERROR] Connect to {self.f_host}:{self.f_port} {error}, closing {conn.address}")
+
+    async def _open_splice(self, conn: RelayConnection) -> bool:
+        upstream = conn.upstream = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        upstream.setblocking(False)
+        try:
+            await asyncio.wait_for(self._loop.sock_connect(upstream, (self.f_host, self.f_port)), self.timeout)
+        except (OSError, asyncio.TimeoutError) as e:
+            self._connect_failed(conn, e)
+            return False
+        for sock in (conn.client, upstream):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        directions = [
+            _SpliceRelay(conn, conn.client, upstream, "up", self.buffer_size),
+            _SpliceRelay(conn, upstream, conn.client, "down", self.buffer_size),
+        ]
+        conn.on_close.extend(direction.finish for direction in directions)
+        return True
+
+    async def _open_transports(self, conn: RelayConnection) -> bool:
+        client_side = _RelayProtocol(conn, "up", self.headers if self.mode == "inject" else None)
+        upstream_side = _RelayProtocol(conn, "down")
+        client_side.peer, upstream_side.peer = upstream_side, client_side
+
+        context = self.ssl_context
+        try:
+            await asyncio.wait_for(
+                self._loop.create_connection(lambda: upstream_side, self.f_host, self.f_port,
+                                             ssl=context, server_hostname=(self.f_hostname or None) if context else None),
+                self.timeout
+            )
+        except (OSError, asyncio.TimeoutError) as e:
+            self._connect_failed(conn, e)
+            return False
+        try:
+            await self._loop.connect_accepted_socket(lambda: client_side, conn.client)
+        except BaseException:
+            # The upstream connection is already open and would leak with the client
+            upstream_side.transport.close()
+            raise
+        upstream_side.transport.resume_reading()
+        conn.client = None  # owned by the transport from now on
+        conn.on_close.extend(side.transport.close for side in (client_side, upstream_side))
+        return True
+
+
 def resolve_domain_to_ip(domain):
     try:
         ip = socket.gethostbyname(domain)
@@ -397,14 +932,31 @@ def main():
 
     pawn.console.log(f"args = {args}")
 
-    server = EchoWebServer(
-        listen=args.listen,
-        forward=args.forward,
-        buffer_size=args.buffer_size,
-        delay=args.delay,
-    )
+    if args.mode == "inspect":
+        server = EchoWebServer(
+            listen=args.listen,
+            forward=args.forward,
+            buffer_size=args.buffer_size or 4096,
+            delay=args.delay,
+            verify_ssl=not args.insecure,
+        )
+        run = server.main_loop
+    else:
+        relay = ProxyRelay(
+            listen=args.listen,
+            forward=args.forward,
+            buffer_size=args.buffer_size or 65536,
+            mode=args.mode,
+            headers=parse_header_args(args.header),
+            timeout=args.timeout,
+            report_interval=args.report_interval,
+            verify_ssl=not args.insecure,
+        )
+
+        def run():
+            asyncio.run(relay.serve_forever())
     try:
-        server.main_loop()
+        run()
     except KeyboardInterrupt:
         print("Ctrl C - Stopping server")
         sys.exit(1)
@@ -186,7 +186,10 @@ def main():
 
             path_info = file.check_path(args.source)
             if path_info == "directory":
-                uploader.upload_directory(args.source, s3_prefix=dest_key,  max_workers=args.max_workers)
+                uploader.upload_directory(
+                    args.source, s3_prefix=dest_key, max_workers=args.max_workers,
+                    sync=args.command == 'sync', delete=getattr(args, 'delete', False)
+                )
             elif path_info == "file":
                 pawn.console.log("File upload")
                 uploader.upload_file(args.source,  s3_prefix=dest_key)
@@ -200,7 +203,8 @@ def main():
                 profile_name=args.profile,
                 bucket_name=source_bucket,
                 overwrite=args.overwrite,
-                dry_run=args.dry_run
+                dry_run=args.dry_run,
+                verbose=args.verbose
             )
             downloader.print_config()
 
@@ -209,7 +213,7 @@ def main():
                 downloader.download_file(s3_key=source_key, local_path=dest_key, overwrite=args.overwrite)
             else:
                 pawn.console.rule("Object is Directory")
-                downloader.download_directory(s3_directory=source_key, local_path=args.destination, overwrite=args.overwrite)
+                downloader.download_directory(s3_directory=source_key, local_path=args.destination, overwrite=args.overwrite, max_workers=args.max_workers)
 
     elif args.command == 'ls':
         if args.path:
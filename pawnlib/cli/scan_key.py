@@ -1,10 +1,9 @@
 #!/usr/bin/env python3
 import os
-import asyncio
-from aiofiles import open as aio_open
+import io
+import argparse
 
 from aiohttp import ClientSession
-import aiofiles
 import json
 from dotenv import load_dotenv, find_dotenv
 from pawnlib.config import pawn, setup_logger, setup_app_logger as _setup_app_logger
@@ -21,7 +20,6 @@ from pawnlib.typing import (
 )
 from pawnlib.output import print_var, get_script_path, is_file, get_parent_path
 from pawnlib.typing.constants import SecretPatternConstants
-import re
 from pawnlib.utils.http import AsyncGoloopWebsocket, NetworkInfo
 from pawnlib.docker.compose import DockerComposeBuilder
 from InquirerPy import inquirer
@@ -35,17 +33,18 @@ import logging
 from typing import List, Dict
 from pathlib import Path
 import docker
-import fnmatch
-import tarfile
-from io import BytesIO
-import tempfile
 import platform
+from pawnlib.output.secret_scanner import SecretScanner, IterStream
 
 
 IS_DOCKER = str2bool(os.environ.get("IS_DOCKER"))
 logger = _setup_app_logger()
 # logger = logging.getLogger(__name__)
 
+SCAN_BATCH_SIZE = 32
+DOCKER_CHUNK_SIZE = 1024 * 1024
+MAX_FILE_SIZE = 100 * 1024 * 1024
+
 __description__ = "CLI tool to scan for secret keys and tokens in files or Docker images"
 __epilog__ = (
     "\nUsage examples:\n\n"
@@ -91,7 +90,9 @@ def get_arguments(parser=None):
         help="File patterns to exclude (e.g., '*.pyc', '*.log')"
     )
 
-    file_parser.add_argument("--max-concurrency", type=int, default=100, help="Max number of files to open simultaneously")
+    file_parser.add_argument("--max-concurrency", type=int, default=100, help="Max number of files queued to the workers at once")
+    file_parser.add_argument("--workers", "-w", type=int, default=None, help="Number of scanning processes (default: number of CPUs)")
+    file_parser.add_argument("--max-file-size-mb", type=int, default=100, help="Skip files bigger than this size in MB, 0 scans every file (default: 100)")
 
 
     # 도커 이미지 스캔 모드
@@ -109,7 +110,8 @@ def get_arguments(parser=None):
         choices=list(SecretPatternConstants.SECRET_PATTERNS.keys()) + ["all"],
         help="Patterns to scan for (default: all)"
     )
-    docker_parser.add_argument("--max-concurrency", type=int, default=100, help="Max number of files to open simultaneously")
+    docker_parser.add_argument("--max-concurrency", type=int, default=100, help=argparse.SUPPRESS)
+    docker_parser.add_argument("--max-file-size-mb", type=int, default=100, help="Skip files bigger than this size in MB, 0 scans every file (default: 100)")
 
     return parser
 
@@ -298,48 +300,9 @@ def merge_environment_settings(args):
 #                 logger.warning(f"Failed to read {file_path}: {e}")
 #     return results
 
-SEM = asyncio.Semaphore(100)  # 동시에 최대 100개만 열기
-
-async def scan_file(file_path: Path, patterns: list, concurrency=asyncio.Semaphore) -> list:
-    """단일 파일을 스캔하는 코루틴"""
-    results = []
-    async with concurrency:  # 이 블록 안에서만 동시에 열 수 있는 파일 개수가 100개 이내로 제한됨
-        try:
-            async with aiofiles.open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                content = await f.read()
-                for pattern in patterns:
-                    # 단순 예시: 정규식으로 매칭
-                    matches = re.findall(pattern, content)
-                    for match in matches:
-                        results.append({
-                            "file_path": str(file_path),
-                            "pattern": pattern,
-                            "match": match
-                        })
-        except Exception as e:
-            # 필요 시 로깅 처리
-            logger.exception(f"Failed to read {file_path}: {e}")
-    return results
-
-
-async def scan_file(file_path: Path, patterns: List[str]) -> List[Dict]:
-    """파일을 비동기적으로 스캔하여 민감한 패턴을 탐지."""
-    results = []
-    try:
-        async with aio_open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-            content = await f.read()
-            for pattern_name in patterns:
-                pattern = SecretPatternConstants.get_pattern(pattern_name)
-                matches = re.findall(pattern, content)
-                for match in matches:
-                    results.append({
-                        "type": pattern_name,
-                        "match": match,
-                        "description": SecretPatternConstants.get_description(pattern_name)
-                    })
-    except Exception as e:
-        logger.exception(f"Failed to read {file_path}: {e}")
-    return results
+def scan_file(file_path: Path, patterns: List[str]) -> List[Dict]:
+    """Scan a single file for the given secret patterns."""
+    return SecretScanner(patterns).scan_path(str(file_path))
 
 # async def scan_file(file_path: Path, patterns: List[str]) -> List[Dict]:
 #     results = []
@@ -360,28 +323,33 @@ async def scan_file(file_path: Path, patterns: List[str]) -> List[Dict]:
 #         logger.exception(f"Failed to read {file_path}: {e}")
 #     return results
 
-async def scan_files(directory: str, patterns: List[str], exclude_patterns: List[str], concurrency: int) -> Dict[str, List[Dict]]:
-    results = {}
-    dir_path = Path(directory)
-    if not dir_path.exists():
-        logger.error(f"Directory '{directory}' does not exist.")
-        return results
-
-    semaphore = asyncio.Semaphore(concurrency)
-
-    tasks = []
-    for file_path in dir_path.rglob("*"):
-        if file_path.is_file() and not any(fnmatch.fnmatch(file_path.relative_to(dir_path).as_posix(), p) for p in exclude_patterns):
-            tasks.append(scan_file(file_path, patterns, semaphore))
-
-    scan_results = await asyncio.gather(*tasks)
-    for result in scan_results:
-        if result:
-            results[str(result[0]["file_path"])] = result
+def scan_files(directory: str, patterns: List[str], exclude_patterns: List[str], concurrency: int = 100,
+               workers: Optional[int] = None, max_file_size: Optional[int] = MAX_FILE_SIZE) -> Dict[str, List[Dict]]:
+    """
+    Scan the files under a directory on a process pool.
+
+    :param directory: Directory to scan.
+    :param patterns: Names of the secret patterns.
+    :param exclude_patterns: fnmatch patterns of paths to skip.
+    :param concurrency: Maximum number of files queued to the workers at once.
+    :param workers: Number of worker processes. Default is the number of CPUs.
+    :param max_file_size: Skip files bigger than this many bytes, 0 scans every file.
+    :return: Dict of file path to findings.
+    """
+    scanner = SecretScanner(patterns, max_file_size=max_file_size)
+    logger.info(f"Start scanning files in '{directory}' with exclude patterns: {', '.join(exclude_patterns)}")
+    results = scanner.scan_directory(
+        directory,
+        exclude_patterns=exclude_patterns,
+        workers=workers,
+        batch_size=SCAN_BATCH_SIZE,
+        max_pending=max(1, concurrency // SCAN_BATCH_SIZE),
+    )
+    logger.info(f"Scanned {scanner.stats['files']} files ({scanner.stats['bytes']:,} bytes), skipped "
+                f"{scanner.stats['skipped_binary']} binary and {scanner.stats['skipped_size']} oversized files, {scanner.stats['errors']} errors")
     return results
 
 
-
 def get_docker_client():
     """도커 클라이언트를 생성하며, MacOS와 Linux 환경을 고려."""
     # 환경 변수 확인
@@ -412,66 +380,26 @@ def get_docker_client():
     raise Exception("Could not connect to Docker daemon. Ensure Docker is running and accessible.")
 
 
-async def scan_docker_image(image_name: str, patterns: List[str], concurrency: int) -> Dict[str, List[Dict]]:
+def scan_docker_image(image_name: str, patterns: List[str], max_file_size: Optional[int] = MAX_FILE_SIZE) -> Dict[str, List[Dict]]:
+    """
+    Scan every layer of a Docker image. The output of ``docker image save`` is read as a tar stream and
+    each layer member is scanned as it arrives, so nothing is extracted and no container is started.
+
+    :param image_name: Docker image to scan.
+    :param patterns: Names of the secret patterns.
+    :param max_file_size: Skip files bigger than this many bytes, 0 scans every file.
+    :return: Dict of location (``image::layer::path``) to findings.
+    """
     results = {}
     client = docker.from_env()
+    scanner = SecretScanner(patterns, max_file_size=max_file_size)
 
     try:
-        client.images.get(image_name)  # 이미지 존재 확인
+        image = client.images.get(image_name)
         logger.info(f"Starting scan for Docker image: {image_name}")
-
-        container = client.containers.run(image_name, "sleep 3600", detach=True)
-        try:
-            # 스캔할 경로 목록
-            paths_to_scan = ["/etc", "/usr", "/var"]  # 필요하다면 "/app" 등 추가
-
-            semaphore = asyncio.Semaphore(concurrency)
-            all_tasks = []
-
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-
-                for path in paths_to_scan:
-                    try:
-                        # tar 아카이브 추출
-                        tar_stream, _ = container.get_archive(path)
-                        tar_content = b"".join(tar_stream)
-
-                        # tarfile 열기
-                        with tarfile.open(fileobj=BytesIO(tar_content)) as tar:
-                            tar.extractall(path=temp_path)
-
-                            # tar 안의 모든 파일 멤버를 순회
-                            for member in tar.getmembers():
-                                if member.isfile():
-                                    extracted_file = temp_path / member.name
-                                    if extracted_file.exists():
-                                        # 파일 스캔을 위한 코루틴 태스크를 만들고 예약
-                                        all_tasks.append(scan_file(extracted_file, patterns, semaphore))
-                    except Exception as e:
-                        logger.warning(f"Failed to scan '{path}' in {image_name}: {e}")
-
-                # 모든 파일 스캔 태스크를 병렬 실행
-                scan_results = await asyncio.gather(*all_tasks, return_exceptions=True)
-                for file_result in scan_results:
-                    if isinstance(file_result, Exception):
-                        continue
-                    if file_result:
-                        # file_result는 하나의 파일에 대한 매칭 결과 리스트
-                        # 각 item에 file_path, pattern, match 등이 들어있음
-                        for item in file_result:
-                            # docker_path를 굳이 만들려면,
-                            # 어떤 경로에서 추출된 파일인지 추적해야 함
-                            # 여기선 간단히 로컬 경로(extracted_file) 사용
-                            # 필요하면 "path + '/' + member.name" 로 구성
-                            fp = item["file_path"]
-                            if fp not in results:
-                                results[fp] = []
-                            results[fp].append(item)
-        finally:
-            container.stop()
-            container.remove()
-            logger.info(f"Cleaned up container for {image_name}")
+        stream = io.BufferedReader(IterStream(image.save(chunk_size=DOCKER_CHUNK_SIZE)), buffer_size=DOCKER_CHUNK_SIZE)
+        results = scanner.scan_archive(stream, source=image_name)
+        logger.info(f"Scanned {scanner.stats['files']} files ({scanner.stats['bytes']:,} bytes) in {image_name}")
     except docker.errors.ImageNotFound:
         logger.error(f"Image '{image_name}' not found.")
     except Exception as e:
@@ -489,7 +417,7 @@ def print_results(results: Dict[str, List[Dict]]):
         logger.info(f"\nLocation: {location}")
         for secret in secrets:
             logger.info(f"- Type: {secret['type']}  | Location: {location}")
-            logger.info(f"  Match: {secret['match']}")
+            logger.info(f"  Match: {secret['match']}  | Line: {secret.get('line')}")
             logger.info(f"  Description: {secret['description']}")
 
 
@@ -531,11 +459,9 @@ def main():
 
     # 모드에 따른 스캔 실행
     if args.mode == "files":
-        # results = scan_files(args.directory, patterns, args.exclude)
-        results = asyncio.run(scan_files(args.directory, patterns, args.exclude, args.max_concurrency))
+        results = scan_files(args.directory, patterns, args.exclude, args.max_concurrency, workers=args.workers, max_file_size=args.max_file_size_mb * 1024 * 1024)
     elif args.mode == "docker":
-        # results = scan_docker_image(args.image, patterns)
-        results = asyncio.run(scan_docker_image(args.image, patterns, args.max_concurrency))
+        results = scan_docker_image(args.image, patterns, max_file_size=args.max_file_size_mb * 1024 * 1024)
     else:
         parser.error(f"Unknown mode: {args.mode}")
 
@@ -12,6 +12,7 @@ from rich.table import Table
 from rich.panel import Panel
 
 from pawnlib.resource.server import DiskPerformanceTester, FileSystemTester, get_platform_info, DiskUsage, get_cpu_load, get_iowait
+from pawnlib.resource.diskio import IO_MODES
 
 __description__ = "This command is used to measure server performance and verify specifications."
 
@@ -24,6 +25,9 @@ __epilog__ = (
     "  2. Measure filesystem performance:\n\n"
     "     -  Measure the filesystem performance 5 times with 2,000 files.\n\n"
     "     `pawns server fs server fs -i 5 --count 2000` \n\n"
+    "  3. Measure disk IOPS and latency percentiles like fio:\n\n"
+    "     - 4KB random reads and writes with O_DIRECT, 16 I/Os in flight, 30 seconds per job.\n\n"
+    "     `pawns server disk --rw randread randwrite --block-size-kb 4 --iodepth 16 --runtime 30 -w disk.json`\n\n"
     "For more detailed command usage and options, refer to the help documentation by running 'pawns server --help'."
 )
 
@@ -56,6 +60,13 @@ def get_arguments(parser):
     parser.add_argument('-n', '--num-threads', type=int, default=1, help='Number of parallel threads')
     parser.add_argument('--count', type=int, default=1000, help='Number of file')
     parser.add_argument('--io-pattern', type=str, choices=['sequential', 'random'], default='sequential', help='I/O pattern: sequential or random')
+    parser.add_argument('--rw', type=str, nargs='+', choices=IO_MODES, default=None,
+                        help='Run fio-style jobs with O_DIRECT and latency percentiles instead of the speed test, e.g. --rw randread randwrite')
+    parser.add_argument('--iodepth', type=int, default=None, help='Number of I/Os in flight for --rw jobs (default: --num-threads)')
+    parser.add_argument('--rwmixread', type=int, default=70, help='Percentage of reads for --rw rw/randrw (default: %(default)s)')
+    parser.add_argument('--runtime', type=float, default=10, help='Duration of each --rw job in seconds (default: %(default)s)')
+    parser.add_argument('--no-direct', action='store_true', help='Use buffered I/O instead of O_DIRECT for --rw jobs')
+    parser.add_argument('--sync', action='store_true', help='Open the file with O_DSYNC for --rw jobs')
     parser.add_argument(
         '-w', '--write-file',
         type=str,
@@ -114,6 +125,18 @@ def run_disk_performance_test(args):
         io_pattern=args.io_pattern,
         verbose=args.verbose > 1,
     )
+    if args.rw:
+        test_results = disk_tester.run_io_jobs(
+            rw_modes=args.rw,
+            queue_depth=args.iodepth,
+            rwmixread=args.rwmixread,
+            runtime=args.runtime,
+            direct=not args.no_direct,
+            sync=args.sync,
+        )
+        test_results["resource_usages"] = get_cpu_load()
+        return test_results
+
     disk_tester.console.log(f'Measuring write and read speed for {args.file_size_mb}MB with {args.block_size_kb}KB block size, {args.iterations} iterations, {args.num_threads} threads, {args.io_pattern} I/O pattern...')
     test_results = disk_tester.run_parallel_tests()
     test_results["resource_usages"] = get_cpu_load()
@@ -165,7 +188,24 @@ def display_system_info(system_info):
 def display_performance_results(disk_performance_result=None, filesystem_performance_result=None):
     tree = Tree("[bold blue]📊 Performance Results[/bold blue]")
 
-    if disk_performance_result:
+    if disk_performance_result and "jobs" in disk_performance_result:
+        disk_perf_tree = tree.add("[bold yellow]💽 Disk Performance[/bold yellow]")
+        for job in disk_performance_result["jobs"]:
+            job_tree = disk_perf_tree.add(f"[bold]{job['name']}[/bold] (bs={job['block_size_kb']}KB, iodepth={job['queue_depth']}, direct={job['direct']})")
+            for direction in ("read", "write"):
+                stats = job[direction]
+                if stats["ios"]:
+                    latency = stats["latency_us"]
+                    job_tree.add(
+                        f"{direction}: {stats['iops']:,} IOPS, {stats['bandwidth_mb']} MB/s, latency(us) "
+                        f"p50={latency['p50']} p95={latency['p95']} p99={latency['p99']} p99.9={latency['p99.9']} max={latency['max']}"
+                    )
+
+        resource_usages_tree = disk_perf_tree.add("[bold magenta]🔧 Resource Usages[/bold magenta]")
+        for period, load in disk_performance_result['resource_usages'].items():
+            resource_usages_tree.add(f"{period}: {load}")
+
+    elif disk_performance_result:
         disk_perf_tree = tree.add("[bold yellow]💽 Disk Performance[/bold yellow]")
         disk_perf_tree.add(f"Write Speeds (MB/s): {disk_performance_result['write_speeds']}")
         disk_perf_tree.add(f"Average Write Speed (MB/s): {disk_performance_result['average_write_speed']}")
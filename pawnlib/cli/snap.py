@@ -67,6 +67,9 @@ def get_arguments(parser):
     parser.add_argument('-o', '--output-path', help='Directory for indexed files (default: ./)', default=None)
     parser.add_argument('-p', '--prefix', help='Prefix (e.g., http://PREFIX/)', default=None)
     parser.add_argument('-m', '--check-method', help='Validation method.', choices=['hash', 'size'], default=None)
+    parser.add_argument('--hash-mode', help='Bytes to hash: file tail, sampled chunks or the full file (default: tail)', choices=['tail', 'sampled', 'full'], default=None)
+    parser.add_argument('--hash-algorithm', help='Hash algorithm, e.g. xxh3_64, xxh3_128, sha256 (default: xxh3_64)', default=None)
+    parser.add_argument('--no-hash-cache', action='store_true', help='Re-hash every file, ignoring the checksum cache.', default=None)
     parser.add_argument('--exclude-files', action='append', help='Files to exclude (default: ["restore"])', default=None)
     parser.add_argument('-v', '--verbose', action='count', help='Increase verbosity.', default=0)
     parser.add_argument('-q', '--quiet', action='count', help='Suppress output.', default=0)
@@ -249,6 +252,9 @@ def main():
         'dir': './data',
         'output_path': './',
         'check_method': 'hash',
+        'hash_mode': 'tail',
+        'hash_algorithm': 'xxh3_64',
+        'no_hash_cache': False,
         'exclude_files': ['restore'],
         'verbose': 0,
         'quiet': 0,
@@ -271,6 +277,9 @@ def main():
         prefix=config_args.prefix,
         checksum_filename=config_args.checksum_file,
         exclude_files=config_args.exclude_files,
+        hash_mode=config_args.hash_mode,
+        hash_algorithm=config_args.hash_algorithm,
+        use_cache=not config_args.no_hash_cache,
     )
 
     pawn.set(file_indexer=file_indexer)
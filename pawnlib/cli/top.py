@@ -4,8 +4,8 @@ from pawnlib.__version__ import __version__ as _version
 from pawnlib.config import pawn, pconf
 from pawnlib.typing import StackList, list_to_oneline_string, str2bool, shorten_text, get_procfs_path
 from pawnlib.resource import (
-    SystemMonitor, get_cpu_load, get_interface_ips, get_platform_info,
-    get_mem_info, get_netstat_count, get_hostname, ProcessMonitor
+    SystemMonitor, get_interface_ips, get_platform_info,
+    get_mem_info, get_hostname, ProcessMonitor
 )
 from pawnlib.models.response import CriticalText
 from pawnlib.resource.net import ProcNetMonitor
@@ -167,7 +167,7 @@ def main():
     print_banner()
     system_info = get_platform_info()
     hostname = shorten_text(get_hostname(), width=20, placeholder='...')
-    system_monitor = SystemMonitor(interval=args.interval, proc_path=PROCFS_PATH)
+    system_monitor = SystemMonitor(interval=args.interval, proc_path=PROCFS_PATH, background=True)
     table_title = f"🐰 {hostname} <{system_info.get('model')},  {system_info.get('cores')} cores, {get_mem_info().get('mem_total')} GB> 🐰"
 
     if args.command == "proc_net":
@@ -353,15 +353,14 @@ def get_resources_status(system_monitor: SystemMonitor = None, args=None):
         args = pconf().args
 
     if args.command == "net":
-        netstat = get_netstat_count(proc_path=PROCFS_PATH)
         data = {
             "time": todaydate("time_sec"),
         }
-        data.update(netstat.get('COUNT'))
+        data.update(system_monitor.sampler.read_tcp_states())
         time.sleep(args.interval)
 
     elif args.command == "mem":
-        memory = system_monitor.get_memory_status()
+        memory = system_monitor.get_memory_status(include_top_processes=False)
         memory_unit = memory.get('unit')
         data = {
             "time": todaydate("time_sec"),
@@ -411,9 +410,8 @@ def get_resources_status(system_monitor: SystemMonitor = None, args=None):
         time.sleep(args.interval)
 
     else:
-        memory = system_monitor.get_memory_status()
         network, cpu, disk = system_monitor.collect_system_status()
-        memory_unit = memory.get('unit')
+        snapshot = system_monitor.last_snapshot
 
         data = {
             "time": todaydate("time_sec"),
@@ -421,7 +419,7 @@ def get_resources_status(system_monitor: SystemMonitor = None, args=None):
             "net_out": f"{network['Total'].get('sent'):.2f}M",
             "pk_in": f"{network['Total'].get('packets_recv')}",
             "pk_out": f"{network['Total'].get('packets_sent')}",
-            "load": f"{get_cpu_load()['1min']}",
+            "load": f"{snapshot.load.get('1min', 0)}",
             "usr": f"{cpu.get('usr')}%",
             "sys": f"{cpu.get('sys')}%",
             "i/o": f"{cpu.get('io_wait'):.2f}",
@@ -430,7 +428,7 @@ def get_resources_status(system_monitor: SystemMonitor = None, args=None):
             # "mem_total": f"{memory.get('total'):.1f}{memory_unit}",
             # "mem_free": f"{memory.get('free'):.1f}{memory_unit}",
             # "cached": f"{memory.get('cached'):.1f}{memory_unit}",
-            "mem_%": f"{memory.get('percent'):.1f}%",
+            "mem_%": f"{snapshot.memory_percent:.1f}%",
         }
     return data
 
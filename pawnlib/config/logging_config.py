@@ -9,6 +9,7 @@ from rich.console import Console
 from rich.traceback import Traceback
 from datetime import datetime
 from contextlib import contextmanager
+from functools import lru_cache
 
 try:
     from typing import Literal, Union, Optional, Dict, List, Tuple
@@ -577,36 +578,9 @@ class ConsoleLoggerAdapter:
         :param message: The log message.
         :return: The message with non-rich-tag '[' escaped.
         """
-        result = ''
-        i = 0
-        length = len(message)
-
-        while i < length:
-            if message[i] == '[':
-                # Possible start of a tag
-                tag_match = re.match(r'\[/?([a-zA-Z0-9 _-]+)\]', message[i:])
-                if tag_match:
-                    tag_content = tag_match.group(1)
-                    # Check if all parts of the tag are valid
-                    tag_parts = tag_content.split()
-                    if all(part in VALID_RICH_TAGS for part in tag_parts):
-                        # It's a valid rich tag, copy it as is
-                        tag_text = tag_match.group(0)
-                        result += tag_text
-                        i += len(tag_text)
-                    else:
-                        # Not a valid rich tag, escape the '['
-                        result += r'\['
-                        i += 1
-                else:
-                    # Not a tag, escape the '['
-                    result += r'\['
-                    i += 1
-            else:
-                result += message[i]
-                i += 1
-
-        return result
+        if "[" not in message:
+            return message
+        return _BRACKET_OR_TAG_PATTERN.sub(_escape_invalid_tag, message)
 
     def _should_log(self, level_name: str) -> bool:
         """
@@ -714,6 +688,43 @@ class ConsoleLoggerAdapter:
             return type(logger).__name__
 
 
+_RICH_TAG_PATTERN = re.compile(r'\[/?([a-zA-Z0-9 _-]+)\]')
+_BRACKET_OR_TAG_PATTERN = re.compile(r'\[(?:/?([a-zA-Z0-9 _-]+)\])?')
+_BRACKETED_TEXT_PATTERN = re.compile(r'\[.*?\]')
+
+
+@lru_cache(maxsize=1024)
+def _is_valid_rich_tag(tag_content: str) -> bool:
+    """
+    Checks if the given tag content is valid based on predefined valid tags.
+    Results are cached, since the same few tags appear in most messages.
+
+    :param tag_content: The content of the tag to validate.
+    :type tag_content: str
+    :return: True if the tag is valid, False otherwise.
+    :rtype: bool
+    """
+    return all(part in VALID_RICH_TAGS for part in tag_content.split())
+
+
+def _strip_valid_tag(match) -> str:
+    return "" if _is_valid_rich_tag(match.group(1)) else match.group(0)
+
+
+def _escape_invalid_tag(match) -> str:
+    tag_content = match.group(1)
+    if tag_content is not None and _is_valid_rich_tag(tag_content):
+        return match.group(0)
+    return "\\[" + match.group(0)[1:]
+
+
+def _escape_bracketed_text(match) -> str:
+    text = match.group(0)
+    if _RICH_TAG_PATTERN.match(text):
+        return text  # Valid tag
+    return text.replace('[', r'\[')
+
+
 def escape_non_tag_brackets(message: str) -> str:
     """
     Escape '[' and ']' that are not part of a valid Rich tag.
@@ -721,15 +732,9 @@ def escape_non_tag_brackets(message: str) -> str:
     :param message: The log message.
     :return: The message with non-tag brackets escaped.
     """
-    def replace_bracket(match):
-        text = match.group(0)
-        if re.match(r'\[/?([a-zA-Z0-9 _-]+)\]', text):
-            return text  # Valid tag
-        else:
-            # return text.replace('[', r'\[').replace(']', r'\]')
-            return text.replace('[', r'\[')
-
-    return re.sub(r'\[.*?\]', replace_bracket, message)
+    if "[" not in message:
+        return message
+    return _BRACKETED_TEXT_PATTERN.sub(_escape_bracketed_text, message)
 
 
 class BaseFormatter(logging.Formatter):
@@ -817,16 +822,19 @@ class BaseFormatter(logging.Formatter):
         """
         try:
             original_message = record.getMessage()
-            clean_message = remove_rich_tags(original_message)
-
-            record_copy = logging.makeLogRecord(record.__dict__)
-            record_copy.msg = clean_message
-            record_copy.args = ()
-
+            if "[" not in original_message and not self.log_level_short:
+                # Nothing to clean, so the record can be formatted without a copy.
+                return super().format(record)
+            # Swap the fields in place and restore them afterwards instead of copying the whole record.
+            msg, args, levelname = record.msg, record.args, record.levelname
+            record.msg = remove_rich_tags(original_message)
+            record.args = ()
             if self.log_level_short:
-                record_copy.levelname = LOG_LEVEL_SHORT.get(record.levelname.upper(), record.levelname)
-
-            return super().format(record_copy)
+                record.levelname = LOG_LEVEL_SHORT.get(levelname.upper(), levelname)
+            try:
+                return super().format(record)
+            finally:
+                record.msg, record.args, record.levelname = msg, args, levelname
         except Exception as e:
             return f"Logging error: {e}"
 
@@ -979,35 +987,9 @@ def remove_rich_tags(message: str) -> str:
             print(clean_message)
             # Output: "This is a bold and [invalid]invalid[/invalid] tag example."
     """
-    tag_re = re.compile(r'\[/?([a-zA-Z0-9 _-]+)\]')
-
-    def is_valid_tag(tag_content: str) -> bool:
-        """
-        Checks if the given tag content is valid based on predefined valid tags.
-
-        :param tag_content: The content of the tag to validate.
-        :type tag_content: str
-        :return: True if the tag is valid, False otherwise.
-        :rtype: bool
-        """
-        tag_parts = tag_content.strip().split()
-        return all(part in VALID_RICH_TAGS for part in tag_parts)
-
-    result = ''
-    pos = 0
-    while pos < len(message):
-        match = tag_re.match(message, pos)
-        if match:
-            tag_content = match.group(1)
-            if is_valid_tag(tag_content):
-                pos = match.end()  # Skip valid tags
-            else:
-                result += match.group(0)  # Keep invalid tags
-                pos = match.end()
-        else:
-            result += message[pos]
-            pos += 1
-    return result
+    if "[" not in message:
+        return message
+    return _RICH_TAG_PATTERN.sub(_strip_valid_tag, message)
 
 
 class AppOrEnabledFilter(logging.Filter):
@@ -13,3 +13,15 @@ from .tracker import (
     RateLimiter,
     calculate_reset_percentage,
 )
+from .window import (
+    RollingWindow,
+    WindowMinMax,
+    LatencyHistogram,
+    RateCounter,
+)
+from .limiter import (
+    TokenBucket,
+    SlidingWindowCounter,
+    MemoryLimiterBackend,
+    FileLimiterBackend,
+)
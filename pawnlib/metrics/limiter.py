@@ -0,0 +1,396 @@
+import os
+import math
+import time
+import struct
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict, deque
+from typing import Callable, Hashable, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:
+    # Only FileLimiterBackend needs flock, the in-memory limiters work everywhere
+    fcntl = None
+
+State = Tuple[float, float, float]
+
+
+class TokenBucket:
+    """
+    Token bucket: ``rate`` tokens per ``period`` are added up to ``capacity``, and every call takes ``cost`` tokens.
+    A full bucket allows a burst of ``capacity`` calls.
+
+    The state is ``(tokens, updated, 0.0)``.
+
+    :param rate: Number of calls allowed per period.
+    :param period: Length of the period in seconds.
+    :param capacity: Maximum burst. Default is ``rate``.
+    """
+
+    name = "token_bucket"
+
+    def __init__(self, rate: float, period: float = 1.0, capacity: Optional[float] = None):
+        if rate <= 0 or period <= 0:
+            raise ValueError("rate and period must be positive")
+        self.rate = rate
+        self.period = period
+        self.capacity = rate if capacity is None else capacity
+        self.fill_rate = rate / period
+
+    def reserve(self, state: Optional[State], now: float, cost: float) -> Tuple[State, float]:
+        """
+        Take ``cost`` tokens if they are available.
+
+        :return: The new state and 0, or the new state and the seconds to wait until the tokens are available.
+        """
+        if state is None:
+            tokens = self.capacity
+        else:
+            tokens, updated, _ = state
+            tokens = min(self.capacity, tokens + max(now - updated, 0) * self.fill_rate)
+        if tokens >= cost:
+            return (tokens - cost, now, 0.0), 0.0
+        return (tokens, now, 0.0), (cost - tokens) / self.fill_rate
+
+
+class SlidingWindowCounter:
+    """
+    Sliding window counter: the calls of the previous fixed window are weighted by how much of it still overlaps
+    the sliding window, and added to the calls of the current one. It keeps two counters instead of one timestamp
+    per call, and allows at most ``rate`` calls in any ``period``, up to the error of the weighting.
+
+    The state is ``(window_start, current_count, previous_count)``.
+
+    :param rate: Number of calls allowed per period.
+    :param period: Length of the window in seconds.
+    """
+
+    name = "sliding_window"
+
+    def __init__(self, rate: float, period: float = 1.0, capacity: Optional[float] = None):
+        if rate <= 0 or period <= 0:
+            raise ValueError("rate and period must be positive")
+        self.rate = rate
+        self.period = period
+        self.capacity = rate
+
+    def reserve(self, state: Optional[State], now: float, cost: float) -> Tuple[State, float]:
+        window_start = math.floor(now / self.period) * self.period
+        if state is None:
+            current, previous = 0.0, 0.0
+        else:
+            start, current, previous = state
+            if window_start != start:
+                previous = current if window_start - start == self.period else 0.0
+                current = 0.0
+        weight = 1 - (now - window_start) / self.period
+        if previous * weight + current + cost <= self.rate:
+            return (window_start, current + cost, previous), 0.0
+
+        state = (window_start, current, previous)
+        room = self.rate - current - cost
+        if previous and room >= 0:
+            wait = (weight - room / previous) * self.period
+        else:
+            wait = window_start + self.period - now
+        return state, max(wait, 1e-6)
+
+
+ALGORITHMS = {
+    TokenBucket.name: TokenBucket,
+    SlidingWindowCounter.name: SlidingWindowCounter,
+}
+
+
+class MemoryLimiterBackend:
+    """
+    Keeps the limiter states in this process. Keys beyond ``max_keys`` evict the least recently used one.
+
+    :param max_keys: Maximum number of keys.
+    """
+
+    blocking = False
+
+    def __init__(self, max_keys: int = 10000):
+        self.max_keys = max_keys
+        self.states: "OrderedDict[Hashable, State]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def update(self, key: Hashable, function: Callable[[Optional[State]], Tuple[State, float]]) -> float:
+        with self._lock:
+            state, result = function(self.states.get(key))
+            self.states[key] = state
+            self.states.move_to_end(key)
+            if len(self.states) > self.max_keys:
+                self.states.popitem(last=False)
+            return result
+
+
+class FileLimiterBackend:
+    """
+    Keeps the limiter states in small files under ``directory``, one per key, locked with ``flock``,
+    so worker processes on one machine enforce a combined rate. The clock must be the same for all of them,
+    e.g. ``time.monotonic`` or ``time.time``.
+
+    :param directory: Directory of the state files, e.g. on ``/dev/shm``. It is created if missing.
+    :param max_open_files: Maximum number of state files kept open.
+
+    Example:
+
+        .. code-block:: python
+
+            from pawnlib.metrics.limiter import RateLimiter, FileLimiterBackend
+
+            # In every worker process
+            limiter = RateLimiter(100, 1, backend=FileLimiterBackend("/dev/shm/pawnlib-rpc-limit"))
+            limiter.acquire(key="node1.example.com")
+    """
+
+    STATE = struct.Struct("ddd")
+    # flock can wait for another process, so coroutines update it in an executor
+    blocking = True
+
+    def __init__(self, directory: str, max_open_files: int = 256):
+        if fcntl is None:
+            raise NotImplementedError("FileLimiterBackend requires fcntl.flock, which is not available on this platform")
+        self.directory = directory
+        self.max_open_files = max_open_files
+        os.makedirs(directory, exist_ok=True)
+        # key -> [fd, lock of the threads of this process, number of users]
+        self._files: "OrderedDict[Hashable, list]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _path(self, key: Hashable) -> str:
+        return os.path.join(self.directory, hashlib.sha1(repr(key).encode()).hexdigest()[:20])
+
+    def _open(self, key: Hashable) -> list:
+        entry = self._files.get(key)
+        if entry is None:
+            entry = self._files[key] = [os.open(self._path(key), os.O_RDWR | os.O_CREAT, 0o600), threading.Lock(), 0]
+            for old_key in list(self._files):
+                if len(self._files) <= self.max_open_files:
+                    break
+                if not self._files[old_key][2] and old_key != key:
+                    os.close(self._files.pop(old_key)[0])
+        else:
+            self._files.move_to_end(key)
+        entry[2] += 1
+        return entry
+
+    def update(self, key: Hashable, function: Callable[[Optional[State]], Tuple[State, float]]) -> float:
+        # Only opening the file is serialized; waiting for the lock of one key does not hold up the others
+        with self._lock:
+            entry = self._open(key)
+        fd, key_lock = entry[0], entry[1]
+        try:
+            with key_lock:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                try:
+                    data = os.pread(fd, self.STATE.size, 0)
+                    state, result = function(self.STATE.unpack(data) if len(data) == self.STATE.size else None)
+                    os.pwrite(fd, self.STATE.pack(*state), 0)
+                    return result
+                finally:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            with self._lock:
+                entry[2] -= 1
+
+    def close(self):
+        with self._lock:
+            while self._files:
+                os.close(self._files.popitem()[1][0])
+
+
+class RateLimiter:
+    """
+    A class to enforce rate limits on operations.
+
+    This class allows ``max_calls`` calls per ``time_period`` with a token bucket or a sliding window counter, which
+    use O(1) memory per key whatever the rate is. Waiting callers are served in FIFO order per key, from threads
+    with :meth:`acquire` and from coroutines with :meth:`acquire_async`. Each key, e.g. a host or a wallet address,
+    has its own limit, and with a :class:`FileLimiterBackend` the limit is shared by the processes on one machine.
+
+    :param max_calls: The maximum number of calls allowed within the time period.
+    :type max_calls: int
+    :param time_period: The time period (in seconds) for rate limiting.
+    :type time_period: float or int
+    :param burst: The number of calls allowed at once with ``token_bucket``. Default is ``max_calls``.
+    :type burst: int, optional
+    :param algorithm: ``sliding_window`` or ``token_bucket``.
+    :type algorithm: str
+    :param backend: Where the states are kept. Default is a :class:`MemoryLimiterBackend`.
+    :param clock: Function returning the current time in seconds.
+
+    Example:
+        .. code-block:: python
+
+            # Initialize a rate limiter allowing 5 calls per 10 seconds
+            rate_limiter = RateLimiter(max_calls=5, time_period=10)
+
+            # Check if calls are allowed
+            for i in range(10):
+                if rate_limiter.is_allowed():
+                    print(f"Call {i + 1}: Allowed")
+                else:
+                    print(f"Call {i + 1}: Rate limit exceeded")
+                time.sleep(1)  # Simulate time delay between calls
+
+            # 20 requests per second per host with bursts of 5, waiting for a free slot
+            limiter = RateLimiter(20, 1, burst=5, algorithm="token_bucket")
+            limiter.acquire(key="node1.example.com")
+            await limiter.acquire_async(key="node2.example.com")
+            async with limiter:
+                ...
+    """
+
+    def __init__(self, max_calls, time_period, burst=None, algorithm="sliding_window", backend=None, clock=time.time):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Invalid algorithm '{algorithm}', expected one of {list(ALGORITHMS)}")
+        self.max_calls = max_calls
+        self.time_period = time_period
+        self.algorithm = ALGORITHMS[algorithm](max_calls, time_period, burst)
+        self.backend = backend or MemoryLimiterBackend()
+        self.clock = clock
+        self._condition = threading.Condition()
+        self._queues = {}
+        self._lock = threading.Lock()
+        self._async_locks = {}
+        self._async_waiters = {}
+
+    def _reserve(self, key, cost) -> float:
+        if cost > self.algorithm.capacity:
+            raise ValueError(f"cost {cost} is more than the capacity {self.algorithm.capacity}")
+        now = self.clock()
+        return self.backend.update(key, lambda state: self.algorithm.reserve(state, now, cost))
+
+    def try_acquire(self, key=None, cost=1) -> bool:
+        """
+        Take ``cost`` calls without waiting. Fails while other callers are waiting for the same key.
+
+        :param key: The bucket, e.g. a host.
+        :param cost: Number of calls.
+        :return: True if the calls are allowed; False otherwise.
+        """
+        with self._condition:
+            if self._queues.get(key):
+                return False
+        if self._async_waiters.get(key):
+            return False
+        return self._reserve(key, cost) <= 0
+
+    def is_allowed(self, key=None):
+        """
+        Checks if a new call is allowed under the rate limit, and counts it if it is.
+
+        :return: True if the call is allowed; False otherwise.
+        :rtype: bool
+
+        Example:
+            .. code-block:: python
+
+                if rate_limiter.is_allowed():
+                    print("Call allowed")
+                else:
+                    print("Rate limit exceeded")
+        """
+        return self.try_acquire(key)
+
+    def acquire(self, key=None, cost=1, timeout=None) -> bool:
+        """
+        Block until ``cost`` calls are allowed. Callers of the same key are served in the order they arrived.
+
+        :param key: The bucket, e.g. a host.
+        :param cost: Number of calls.
+        :param timeout: Maximum seconds to wait.
+        :return: True if the calls were taken; False on timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        ticket = object()
+        with self._condition:
+            queue = self._queues.setdefault(key, deque())
+            queue.append(ticket)
+        try:
+            with self._condition:
+                while queue[0] is not ticket:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._condition.wait(remaining)
+            # First in line: the backend is called without the condition, so other keys are not held up by it
+            while True:
+                wait = self._reserve(key, cost)
+                if wait <= 0:
+                    return True
+                if deadline is not None and time.monotonic() + wait > deadline:
+                    return False
+                time.sleep(wait)
+        finally:
+            with self._condition:
+                queue.remove(ticket)
+                if not queue:
+                    del self._queues[key]
+                self._condition.notify_all()
+
+    async def acquire_async(self, key=None, cost=1, timeout=None) -> bool:
+        """
+        Wait without blocking the event loop until ``cost`` calls are allowed. Coroutines of the same key are served
+        in the order they arrived.
+
+        :param key: The bucket, e.g. a host.
+        :param cost: Number of calls.
+        :param timeout: Maximum seconds to wait.
+        :return: True if the calls were taken; False on timeout.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        # The locks belong to one event loop each, and the limiter can be shared by threads running their own loops
+        with self._lock:
+            lock = self._async_locks.get((loop, key))
+            if lock is None:
+                lock = self._async_locks[(loop, key)] = asyncio.Lock()
+            self._async_waiters[key] = self._async_waiters.get(key, 0) + 1
+        try:
+            try:
+                if deadline is None:
+                    await lock.acquire()
+                else:
+                    await asyncio.wait_for(lock.acquire(), max(deadline - loop.time(), 0))
+            except asyncio.TimeoutError:
+                return False
+            try:
+                while True:
+                    if self.backend.blocking:
+                        wait = await loop.run_in_executor(None, self._reserve, key, cost)
+                    else:
+                        wait = self._reserve(key, cost)
+                    if wait <= 0:
+                        return True
+                    if deadline is not None and loop.time() + wait > deadline:
+                        return False
+                    await asyncio.sleep(wait)
+            finally:
+                lock.release()
+        finally:
+            with self._lock:
+                waiters = self._async_waiters.pop(key) - 1
+                if waiters:
+                    self._async_waiters[key] = waiters
+                if not lock.locked() and not getattr(lock, "_waiters", None):
+                    self._async_locks.pop((loop, key), None)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    async def __aenter__(self):
+        await self.acquire_async()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
@@ -2,6 +2,9 @@ from collections import deque
 import time
 import re
 
+from pawnlib.metrics.window import RollingWindow, WindowMinMax, LatencyHistogram, RateCounter
+from pawnlib.metrics.limiter import RateLimiter
+
 
 class TPSCalculator:
     """
@@ -49,7 +52,7 @@ class TPSCalculator:
         """
         self.previous_height = None
         self.previous_time = None
-        self.tps_history = deque(maxlen=history_size)
+        self.tps_history = RollingWindow(history_size)
         self.call_count = 0  # To track the number of API calls
         self.sleep_time = sleep_time
         self.variable_time = variable_time
@@ -123,7 +126,7 @@ class TPSCalculator:
         :return: The average TPS.
         :rtype: float
         """
-        return sum(self.tps_history) / len(self.tps_history) if self.tps_history else 0
+        return self.tps_history.mean()
 
     def processed_tx(self):
         """
@@ -194,8 +197,8 @@ class SyncSpeedTracker:
         :type history_size: int
         """
         self.history_size = history_size
-        self.block_differences = deque(maxlen=history_size)
-        self.time_differences = deque(maxlen=history_size)
+        self.block_differences = RollingWindow(history_size)
+        self.time_differences = RollingWindow(history_size)
         self.previous_height = None
         self.previous_time = None
 
@@ -229,8 +232,8 @@ class SyncSpeedTracker:
         if not self.block_differences or not self.time_differences:
             return None  # Insufficient data
 
-        total_blocks = sum(self.block_differences)
-        total_time = sum(self.time_differences)
+        total_blocks = self.block_differences.sum()
+        total_time = self.time_differences.sum()
 
         if total_time > 0:
             return total_blocks / total_time  # Blocks per second
@@ -269,7 +272,7 @@ class BlockDifferenceTracker:
         :param history_size: Number of recent block differences to track.
         :type history_size: int
         """
-        self.differences = deque(maxlen=history_size)
+        self.differences = RollingWindow(history_size)
 
     def add_difference(self, block_difference):
         """
@@ -287,19 +290,20 @@ class BlockDifferenceTracker:
         :return: The average of the tracked block differences.
         :rtype: float
         """
-        if not self.differences:
-            return 0
-        return sum(self.differences) / len(self.differences)
+        return self.differences.mean()
 
 
 class LatencyTracker:
     """
     A class to track and analyze latency measurements.
 
-    This class stores latency values and provides methods to calculate average, minimum, and maximum latencies.
+    This class stores latency values and provides methods to calculate average, minimum, maximum and percentile latencies.
+    Every statistic is kept up to date on each measurement, so reading one does not scan the history.
 
     :param history_size: The number of recent latency measurements to track.
     :type history_size: int
+    :param precision: The resolution of the percentiles, in the unit of the latencies.
+    :type precision: float
 
     Example:
         .. code-block:: python
@@ -315,20 +319,26 @@ class LatencyTracker:
             avg_latency = latency_tracker.get_average_latency()
             min_latency = latency_tracker.get_min_latency()
             max_latency = latency_tracker.get_max_latency()
+            p99_latency = latency_tracker.get_percentile_latency(99)
 
             print(f"Average Latency: {avg_latency} ms")
             print(f"Min Latency: {min_latency} ms")
             print(f"Max Latency: {max_latency} ms")
+            print(f"P99 Latency: {p99_latency} ms")
     """
 
-    def __init__(self, history_size=100):
+    def __init__(self, history_size=100, precision=0.001):
         """
         Initializes the LatencyTracker.
 
         :param history_size: The number of recent latency measurements to track.
         :type history_size: int
+        :param precision: The resolution of the percentiles, in the unit of the latencies.
+        :type precision: float
         """
-        self.latencies = deque(maxlen=history_size)
+        self.latencies = RollingWindow(history_size)
+        self.min_max = WindowMinMax(history_size)
+        self.histogram = LatencyHistogram(unit=precision)
 
     def add_latency(self, latency):
         """
@@ -337,7 +347,11 @@ class LatencyTracker:
         :param latency: The measured latency in milliseconds.
         :type latency: float
         """
-        self.latencies.append(latency)
+        evicted = self.latencies.append(latency)
+        if evicted is not None:
+            self.histogram.remove(evicted)
+        self.histogram.record(latency)
+        self.min_max.append(latency)
 
     def get_average_latency(self):
         """
@@ -346,7 +360,7 @@ class LatencyTracker:
         :return: The average latency in milliseconds.
         :rtype: float
         """
-        return sum(self.latencies) / len(self.latencies) if self.latencies else 0
+        return self.latencies.mean()
 
     def get_min_latency(self):
         """
@@ -355,7 +369,7 @@ class LatencyTracker:
         :return: The minimum latency in milliseconds, or None if no data is available.
         :rtype: float or None
         """
-        return min(self.latencies) if self.latencies else None
+        return self.min_max.min()
 
     def get_max_latency(self):
         """
@@ -364,7 +378,29 @@ class LatencyTracker:
         :return: The maximum latency in milliseconds, or None if no data is available.
         :rtype: float or None
         """
-        return max(self.latencies) if self.latencies else None
+        return self.min_max.max()
+
+    def get_percentile_latency(self, percentile):
+        """
+        Returns the latency below which the given percentage of the tracked measurements fall.
+
+        The value is exact up to ``precision`` for small latencies and within 0.8% for bigger ones.
+
+        :param percentile: The percentile from 0 to 100, e.g. 99.
+        :type percentile: float
+        :return: The latency in milliseconds, or None if no data is available.
+        :rtype: float or None
+        """
+        return self.histogram.percentile(percentile) if self.latencies else None
+
+    def get_stdev_latency(self):
+        """
+        Returns the standard deviation of the tracked latencies.
+
+        :return: The standard deviation in milliseconds.
+        :rtype: float
+        """
+        return self.latencies.stdev()
 
 
 class ErrorRateTracker:
@@ -426,10 +462,12 @@ class ThroughputTracker:
     A class to track and calculate throughput (requests per second).
 
     This class records timestamps of requests and calculates the throughput
-    over a configurable history size.
+    over a configurable history size, or over a sliding time window when ``window_seconds`` is given.
 
     :param history_size: The number of recent timestamps to track.
     :type history_size: int
+    :param window_seconds: If set, count requests in time buckets over this many seconds instead of keeping timestamps.
+    :type window_seconds: float, optional
 
     Example:
         .. code-block:: python
@@ -445,16 +483,24 @@ class ThroughputTracker:
             # Get the current throughput
             throughput = throughput_tracker.get_throughput()
             print(f"Throughput: {throughput} requests/second")
+
+            # Requests per second over the last minute, in 1 second buckets
+            throughput_tracker = ThroughputTracker(window_seconds=60)
     """
 
-    def __init__(self, history_size=100):
+    def __init__(self, history_size=100, window_seconds=None):
         """
         Initializes the ThroughputTracker.
 
         :param history_size: The number of recent timestamps to track.
         :type history_size: int
+        :param window_seconds: If set, count requests in time buckets over this many seconds instead of keeping timestamps.
+        :type window_seconds: float, optional
         """
         self.timestamps = deque(maxlen=history_size)
+        self.rate_counter = None
+        if window_seconds:
+            self.rate_counter = RateCounter(window=window_seconds, buckets=max(int(window_seconds), 1), clock=time.time)
 
     def record_request(self, timestamp=None):
         """
@@ -463,7 +509,10 @@ class ThroughputTracker:
         :param timestamp: The timestamp of the request. Defaults to the current time.
         :type timestamp: float, optional
         """
-        self.timestamps.append(timestamp or time.time())
+        if self.rate_counter is not None:
+            self.rate_counter.add(now=timestamp)
+        else:
+            self.timestamps.append(timestamp or time.time())
 
     def get_throughput(self):
         """
@@ -472,6 +521,8 @@ class ThroughputTracker:
         :return: The calculated throughput. Returns 0 if insufficient data.
         :rtype: float
         """
+        if self.rate_counter is not None:
+            return self.rate_counter.rate()
         if len(self.timestamps) < 2:
             return 0
         duration = self.timestamps[-1] - self.timestamps[0]
@@ -748,7 +799,7 @@ class RollingAverageCalculator:
         :type window_size: int
         """
         self.window_size = window_size
-        self.values = deque(maxlen=window_size)
+        self.values = RollingWindow(window_size)
 
     def add_value(self, value):
         """
@@ -773,7 +824,7 @@ class RollingAverageCalculator:
                 average = avg_calculator.get_average()
                 print(f"Rolling Average: {average}")
         """
-        return sum(self.values) / len(self.values) if self.values else 0
+        return self.values.mean()
 
 
 class ThresholdNotifier:
@@ -831,78 +882,6 @@ class ThresholdNotifier:
             self.alert_callback(value)
 
 
-class RateLimiter:
-    """
-    A class to enforce rate limits on operations.
-
-    This class ensures that a maximum number of calls can be made within a specified time period.
-    If the limit is exceeded, further calls are not allowed until the time window resets.
-
-    :param max_calls: The maximum number of calls allowed within the time period.
-    :type max_calls: int
-    :param time_period: The time period (in seconds) for rate limiting.
-    :type time_period: float or int
-
-    Example:
-        .. code-block:: python
-
-            # Initialize a rate limiter allowing 5 calls per 10 seconds
-            rate_limiter = RateLimiter(max_calls=5, time_period=10)
-
-            # Check if calls are allowed
-            for i in range(10):
-                if rate_limiter.is_allowed():
-                    print(f"Call {i + 1}: Allowed")
-                else:
-                    print(f"Call {i + 1}: Rate limit exceeded")
-                time.sleep(1)  # Simulate time delay between calls
-    """
-
-    def __init__(self, max_calls, time_period):
-        """
-        Initializes the RateLimiter.
-
-        :param max_calls: The maximum number of calls allowed within the time period.
-        :type max_calls: int
-        :param time_period: The time period (in seconds) for rate limiting.
-        :type time_period: float or int
-        """
-        self.max_calls = max_calls
-        self.time_period = time_period
-        self.calls = deque()
-
-    def is_allowed(self):
-        """
-        Checks if a new call is allowed under the rate limit.
-
-        Removes expired calls from the queue based on the current time and time period,
-        then determines if another call can be made.
-
-        :return: True if the call is allowed; False otherwise.
-        :rtype: bool
-
-        Example:
-            .. code-block:: python
-
-                if rate_limiter.is_allowed():
-                    print("Call allowed")
-                else:
-                    print("Rate limit exceeded")
-        """
-        current_time = time.time()
-
-        # Remove timestamps outside of the current time window
-        while self.calls and self.calls[0] < current_time - self.time_period:
-            self.calls.popleft()
-
-        # Check if we can allow another call
-        if len(self.calls) < self.max_calls:
-            self.calls.append(current_time)
-            return True
-
-        return False
-
-
 def calculate_reset_percentage(data):
     match = re.search(r'height=(\d+) resolved=(\d+) unresolved=(\d+)', data)
 
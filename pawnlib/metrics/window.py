@@ -0,0 +1,494 @@
+import math
+import time
+from array import array
+from collections import deque
+
+
+class RollingWindow:
+    """
+    Fixed-size ring buffer of numbers with a running sum and sum of squares.
+
+    Appending is O(1) and so are ``sum``, ``mean``, ``variance`` and ``stdev``. The running sums are
+    recomputed from the buffer once per lap, so floating point drift never builds up.
+
+    :param size: Maximum number of values in the window.
+
+    Example:
+
+        .. code-block:: python
+
+            from pawnlib.metrics.window import RollingWindow
+
+            window = RollingWindow(size=3)
+            for value in (10, 20, 30, 40):
+                window.append(value)
+            window.mean()
+            # >> 30.0
+            list(window)
+            # >> [20, 30, 40]
+    """
+
+    def __init__(self, size: int):
+        if size < 1:
+            raise ValueError(f"size must be at least 1, got {size}")
+        self.size = size
+        self._values = [0] * size
+        self._start = 0
+        self._length = 0
+        self._appends = 0
+        self.total = 0
+        self.total_squares = 0
+
+    def append(self, value):
+        """
+        Add a value, dropping the oldest one when the window is full.
+
+        :param value: The new value.
+        :return: The dropped value, or None if the window was not full.
+        """
+        evicted = None
+        if self._length == self.size:
+            evicted = self._values[self._start]
+            self._values[self._start] = value
+            self._start = (self._start + 1) % self.size
+            self.total += value - evicted
+            self.total_squares += value * value - evicted * evicted
+        else:
+            self._values[(self._start + self._length) % self.size] = value
+            self._length += 1
+            self.total += value
+            self.total_squares += value * value
+
+        self._appends += 1
+        if self._appends >= self.size:
+            self._appends = 0
+            self._resync()
+        return evicted
+
+    def _resync(self):
+        values = list(self)
+        if isinstance(self.total, float) or isinstance(self.total_squares, float):
+            self.total = math.fsum(values)
+            self.total_squares = math.fsum(value * value for value in values)
+        else:
+            self.total = sum(values)
+            self.total_squares = sum(value * value for value in values)
+
+    def sum(self):
+        return self.total
+
+    def mean(self) -> float:
+        return self.total / self._length if self._length else 0
+
+    def variance(self) -> float:
+        """Population variance of the values in the window."""
+        if self._length < 2:
+            return 0.0
+        mean = self.total / self._length
+        return max(self.total_squares / self._length - mean * mean, 0.0)
+
+    def stdev(self) -> float:
+        """Population standard deviation of the values in the window."""
+        return math.sqrt(self.variance())
+
+    @property
+    def is_full(self) -> bool:
+        return self._length == self.size
+
+    @property
+    def first(self):
+        return self[0] if self._length else None
+
+    @property
+    def last(self):
+        return self[-1] if self._length else None
+
+    def clear(self):
+        self._start = 0
+        self._length = 0
+        self._appends = 0
+        self.total = 0
+        self.total_squares = 0
+
+    def __len__(self):
+        return self._length
+
+    def __bool__(self):
+        return self._length > 0
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("RollingWindow index out of range")
+        return self._values[(self._start + index) % self.size]
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield self._values[(self._start + index) % self.size]
+
+    def __repr__(self):
+        return f"<RollingWindow size={self.size}> {list(self)}"
+
+
+class WindowMinMax:
+    """
+    Minimum and maximum of the last ``size`` values with monotonic deques.
+
+    Each value enters and leaves each deque at most once, so ``append`` is amortized O(1) and
+    ``min``/``max`` are O(1), instead of scanning the window.
+
+    :param size: Number of recent values covered.
+
+    Example:
+
+        .. code-block:: python
+
+            from pawnlib.metrics.window import WindowMinMax
+
+            window = WindowMinMax(size=3)
+            for value in (5, 1, 4, 3):
+                window.append(value)
+            window.min(), window.max()
+            # >> (1, 4)
+    """
+
+    def __init__(self, size: int):
+        if size < 1:
+            raise ValueError(f"size must be at least 1, got {size}")
+        self.size = size
+        self._count = 0
+        self._minimums = deque()
+        self._maximums = deque()
+
+    def append(self, value):
+        index = self._count
+        self._count += 1
+        oldest = index - self.size
+
+        minimums = self._minimums
+        while minimums and minimums[-1][1] >= value:
+            minimums.pop()
+        minimums.append((index, value))
+        if minimums[0][0] <= oldest:
+            minimums.popleft()
+
+        maximums = self._maximums
+        while maximums and maximums[-1][1] <= value:
+            maximums.pop()
+        maximums.append((index, value))
+        if maximums[0][0] <= oldest:
+            maximums.popleft()
+
+    def min(self):
+        return self._minimums[0][1] if self._minimums else None
+
+    def max(self):
+        return self._maximums[0][1] if self._maximums else None
+
+    def clear(self):
+        self._count = 0
+        self._minimums.clear()
+        self._maximums.clear()
+
+
+class LatencyHistogram:
+    """
+    Fixed-size log-linear histogram in the style of HdrHistogram, usable as a quantile sketch.
+
+    Values are counted in integer multiples of ``unit``. Values below ``2 ** (sub_bucket_bits + 1)`` units are
+    counted exactly. Bigger values share a bucket with values that differ by less than ``2 ** -sub_bucket_bits``
+    (0.8% with the default 7 bits), so recording is O(1) and the memory does not grow with the number of samples.
+    Values can be removed again, which turns the histogram into a windowed sketch when it is paired with a
+    :class:`RollingWindow`.
+
+    :param sub_bucket_bits: Precision of the buckets.
+    :param unit: Resolution of the recorded values, e.g. 0.001 to keep three decimal places of a float.
+
+    Example:
+
+        .. code-block:: python
+
+            from pawnlib.metrics.window import LatencyHistogram
+
+            histogram = LatencyHistogram()
+            for latency_ns in (120000, 95000, 2300000):
+                histogram.record(latency_ns)
+            histogram.percentile(99)
+            # >> 2300000
+
+            histogram = LatencyHistogram(unit=0.001)
+            histogram.record(12.5)
+            histogram.percentile(50)
+            # >> 12.5
+    """
+
+    def __init__(self, sub_bucket_bits: int = 7, unit: float = 1):
+        self.sub_bucket_bits = sub_bucket_bits
+        self.unit = unit
+        self.counts = array("Q", bytes(8 * ((66 - sub_bucket_bits) << sub_bucket_bits)))
+        self.count = 0
+        self.total = 0
+        self._min = 0
+        self._max = 0
+        self._low_index = len(self.counts)
+        self._high_index = -1
+        self._exact_bounds = True
+
+    def _to_units(self, value) -> int:
+        if self.unit == 1:
+            return max(int(value), 0)
+        return max(int(round(value / self.unit)), 0)
+
+    def _from_units(self, value: int):
+        return value if self.unit == 1 else value * self.unit
+
+    def bucket_index(self, value: int) -> int:
+        shift = max(value.bit_length() - self.sub_bucket_bits - 1, 0)
+        return (shift << self.sub_bucket_bits) + (value >> shift)
+
+    def bucket_upper_bound(self, index: int) -> int:
+        shift = max((index >> self.sub_bucket_bits) - 1, 0)
+        return ((index - (shift << self.sub_bucket_bits) + 1) << shift) - 1
+
+    def record(self, value):
+        """
+        Record one value, e.g. a latency in nanoseconds. Negative values are counted as 0.
+
+        :param value: The value.
+        """
+        value = self._to_units(value)
+        index = self.bucket_index(value)
+        self.counts[index] += 1
+        if index < self._low_index:
+            self._low_index = index
+        if index > self._high_index:
+            self._high_index = index
+        if self._exact_bounds:
+            if not self.count or value < self._min:
+                self._min = value
+            if value > self._max:
+                self._max = value
+        self.count += 1
+        self.total += value
+
+    def remove(self, value):
+        """
+        Remove a value that was recorded before. ``min`` and ``max`` are bucket bounds afterwards.
+
+        :param value: The value.
+        """
+        value = self._to_units(value)
+        index = self.bucket_index(value)
+        if not self.counts[index]:
+            raise ValueError(f"{value} was not recorded")
+        self.counts[index] -= 1
+        self.count -= 1
+        self.total -= value
+        self._exact_bounds = False
+
+    def merge(self, other: "LatencyHistogram"):
+        """
+        Add the values of another histogram with the same precision and unit.
+
+        :param other: LatencyHistogram
+        """
+        if other.sub_bucket_bits != self.sub_bucket_bits or other.unit != self.unit:
+            raise ValueError("Cannot merge histograms with different sub_bucket_bits or unit")
+        if not other.count:
+            return
+        for index in range(other._low_index, other._high_index + 1):
+            count = other.counts[index]
+            if count:
+                self.counts[index] += count
+        if self._exact_bounds and other._exact_bounds:
+            self._min = other._min if not self.count else min(self._min, other._min)
+            self._max = max(self._max, other._max)
+        else:
+            self._exact_bounds = False
+        self._low_index = min(self._low_index, other._low_index)
+        self._high_index = max(self._high_index, other._high_index)
+        self.count += other.count
+        self.total += other.total
+
+    @property
+    def min(self):
+        if not self.count:
+            return 0
+        if self._exact_bounds:
+            return self._from_units(self._min)
+        index = self._low_index
+        while not self.counts[index]:
+            index += 1
+        self._low_index = index
+        return self._from_units(self.bucket_upper_bound(index - 1) + 1 if index else 0)
+
+    @property
+    def max(self):
+        if not self.count:
+            return 0
+        if self._exact_bounds:
+            return self._from_units(self._max)
+        index = self._high_index
+        while not self.counts[index]:
+            index -= 1
+        self._high_index = index
+        return self._from_units(self.bucket_upper_bound(index))
+
+    def percentile(self, percentile: float):
+        """
+        Return the highest value equivalent to the given percentile, or 0 if nothing was recorded.
+
+        The buckets are walked in place from the nearer end and the walk stops at the target bucket.
+
+        :param percentile: Percentile from 0 to 100.
+        """
+        if not self.count:
+            return 0
+        counts = self.counts
+        target = max(math.ceil(percentile / 100 * self.count), 1)
+        if target <= self.count // 2:
+            index = self._low_index
+            cumulative = counts[index]
+            while cumulative < target:
+                index += 1
+                cumulative += counts[index]
+        else:
+            # Values above the target bucket may add up to at most count - target
+            index = self._high_index
+            above = 0
+            limit = self.count - target
+            while above + counts[index] <= limit:
+                above += counts[index]
+                index -= 1
+        value = self._from_units(self.bucket_upper_bound(index))
+        return min(value, self.max)
+
+    def quantile(self, quantile: float):
+        """Same as :meth:`percentile` with a quantile from 0 to 1."""
+        return self.percentile(quantile * 100)
+
+    @property
+    def mean(self) -> float:
+        return self._from_units(self.total) / self.count if self.count else 0.0
+
+    def clear(self):
+        self.counts = array("Q", bytes(len(self.counts) * 8))
+        self.count = 0
+        self.total = 0
+        self._min = 0
+        self._max = 0
+        self._low_index = len(self.counts)
+        self._high_index = -1
+        self._exact_bounds = True
+
+    def to_dict(self, scale: float = 1.0, decimal_places: int = 2, percentiles=(50, 95, 99, 99.9)) -> dict:
+        """
+        Return min, mean, max and the percentiles, each divided by ``scale``.
+
+        :param scale: Divisor of the values, e.g. 1000 for nanoseconds to microseconds.
+        :param decimal_places: Number of decimal places.
+        :param percentiles: Percentiles to include.
+        """
+        result = {
+            "min": round(self.min / scale, decimal_places),
+            "mean": round(self.mean / scale, decimal_places),
+            "max": round(self.max / scale, decimal_places),
+        }
+        for percentile in percentiles:
+            result[f"p{percentile:g}"] = round(self.percentile(percentile) / scale, decimal_places)
+        return result
+
+
+class RateCounter:
+    """
+    Counts events over a sliding time window split into fixed buckets.
+
+    Adding events and reading the rate are O(1): only the buckets that expired since the last call are
+    cleared, and at most ``buckets`` of them, however long the counter was idle.
+
+    :param window: Length of the window in seconds.
+    :param buckets: Number of buckets; the window slides by ``window / buckets`` seconds.
+    :param clock: Function returning the current time in seconds.
+
+    Example:
+
+        .. code-block:: python
+
+            from pawnlib.metrics.window import RateCounter
+
+            counter = RateCounter(window=10, buckets=10)
+            counter.add(5, now=100.0)
+            counter.add(5, now=104.0)
+            counter.rate(now=105.0)
+            # >> 2.0
+            counter.count(now=112.0)
+            # >> 5
+    """
+
+    def __init__(self, window: float = 60, buckets: int = 60, clock=time.monotonic):
+        if window <= 0 or buckets < 1:
+            raise ValueError("window must be positive and buckets at least 1")
+        self.window = window
+        self.buckets = buckets
+        self.bucket_width = window / buckets
+        self.clock = clock
+        self._counts = [0] * buckets
+        self._current = None
+        self.started = None
+        self.total = 0
+
+    def _advance(self, now):
+        bucket = int(now // self.bucket_width)
+        if self._current is None:
+            self._current = bucket
+            return
+        steps = bucket - self._current
+        if steps <= 0:
+            return
+        if steps >= self.buckets:
+            self._counts = [0] * self.buckets
+            self.total = 0
+        else:
+            for step in range(1, steps + 1):
+                index = (self._current + step) % self.buckets
+                self.total -= self._counts[index]
+                self._counts[index] = 0
+        self._current = bucket
+
+    def add(self, count=1, now=None):
+        """
+        Count events.
+
+        :param count: Number of events.
+        :param now: Current time. Default is ``clock()``.
+        """
+        now = self.clock() if now is None else now
+        self._advance(now)
+        if self.started is None:
+            self.started = now
+        self._counts[self._current % self.buckets] += count
+        self.total += count
+
+    def count(self, now=None):
+        """Return the number of events in the window."""
+        self._advance(self.clock() if now is None else now)
+        return self.total
+
+    def rate(self, now=None) -> float:
+        """
+        Return the events per second in the window. Until a full window has passed, the rate is taken over
+        the time since the first event, but over at least one bucket.
+        """
+        now = self.clock() if now is None else now
+        total = self.count(now)
+        if self.started is None:
+            return 0.0
+        elapsed = min(max(now - self.started, self.bucket_width), self.window)
+        return total / elapsed
+
+    def clear(self):
+        self._counts = [0] * self.buckets
+        self._current = None
+        self.started = None
+        self.total = 0
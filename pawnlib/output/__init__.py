@@ -1,5 +1,6 @@
 from .file import (
     NullByteRemover,
+    PatternMatcher,
     Tail,
     check_file_overwrite,
     get_file_path,
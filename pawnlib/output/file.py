@@ -7,13 +7,16 @@ import glob
 import yaml
 import time
 import re
+import ctypes
+import ctypes.util
+import select
+import struct
 from typing import Union, Any, List, Callable
 from pawnlib.config.globalconfig import pawnlib_config as pawn
 from pawnlib.output import color_print
 from pawnlib.typing import converter
 from rich.prompt import Confirm
 import asyncio
-import aiofiles
 import logging
 
 from pawnlib.config.logging_config import setup_logger
@@ -145,20 +148,400 @@ class NullByteRemover:
             print("-" * 40)
 
 
+class InotifyWatcher:
+    """
+    Minimal Linux inotify binding through ctypes.
+
+    The file descriptor is non-blocking, so it can be passed to ``select`` or ``loop.add_reader``
+    and drained with :meth:`read_events`.
+
+    Example:
+
+        .. code-block:: python
+
+            if InotifyWatcher.is_supported():
+                watcher = InotifyWatcher()
+                watcher.add_watch("/var/log/auth.log", InotifyWatcher.FILE_EVENTS)
+                for wd, mask, name in watcher.read_events():
+                    print(wd, mask, name)
+    """
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+
+    FILE_EVENTS = IN_MODIFY | IN_ATTRIB | IN_DELETE_SELF | IN_MOVE_SELF
+    DIRECTORY_EVENTS = IN_CREATE | IN_MOVED_TO
+
+    _EVENT_HEADER = struct.Struct("iIII")
+    _libc = None
+
+    def __init__(self):
+        libc = self._load_libc()
+        self.fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+
+    @classmethod
+    def _load_libc(cls):
+        if cls._libc is None:
+            cls._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        return cls._libc
+
+    @classmethod
+    def is_supported(cls):
+        if not sys.platform.startswith("linux"):
+            return False
+        try:
+            return hasattr(cls._load_libc(), "inotify_init1")
+        except OSError:
+            return False
+
+    def add_watch(self, path, mask):
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error), path)
+        return wd
+
+    def remove_watch(self, wd):
+        self._libc.inotify_rm_watch(self.fd, wd)
+
+    def read_events(self):
+        """Return the pending ``(wd, mask, name)`` events without blocking."""
+        events = []
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                return events
+            position = 0
+            while position < len(data):
+                wd, mask, _, length = self._EVENT_HEADER.unpack_from(data, position)
+                position += self._EVENT_HEADER.size
+                name = data[position:position + length].rstrip(b"\0").decode(errors="replace")
+                position += length
+                events.append((wd, mask, name))
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class TailFollower:
+    """
+    Follows a single file for :class:`Tail`.
+
+    Data is read in ``read_size`` chunks and split into lines here. ``offset`` is the position
+    right after the last complete line handed out, which is what gets persisted. The file is
+    checked for truncation with ``fstat`` once per wakeup and for rotation only when inotify
+    reports IN_MOVE_SELF/IN_DELETE_SELF (or, without inotify, when the file is idle).
+    """
+
+    def __init__(self, path, read_size=1024 * 1024, use_inotify=True, encoding="utf-8"):
+        self.path = path
+        self.read_size = read_size
+        self.encoding = encoding
+        self.file = None
+        self.inode = None
+        self.offset = 0
+        self.pending = b""
+        self.rotated = False
+        self.created = False
+        self.watcher = InotifyWatcher() if use_inotify and InotifyWatcher.is_supported() else None
+        self.file_wd = None
+        self.directory_wd = None
+        if self.watcher:
+            self.directory_wd = self.watcher.add_watch(os.path.dirname(os.path.abspath(path)), InotifyWatcher.DIRECTORY_EVENTS)
+
+    @property
+    def fileno(self):
+        return self.watcher.fd if self.watcher else None
+
+    def open(self, from_beginning=False, resume=None):
+        """
+        Open the file and position it.
+
+        :param from_beginning: Start at offset 0 instead of the end of the file.
+        :param resume: ``{"inode": ..., "offset": ...}`` saved by a previous run. Used when the inode matches.
+        :return: True if the file was opened.
+        """
+        try:
+            file = open(self.path, "rb")
+        except FileNotFoundError:
+            return False
+        stat = os.fstat(file.fileno())
+        if resume and resume.get("inode") == stat.st_ino and resume.get("offset", 0) <= stat.st_size:
+            offset = resume["offset"]
+        elif from_beginning:
+            offset = 0
+        else:
+            offset = stat.st_size
+        file.seek(offset)
+
+        self.close_file()
+        self.file, self.inode, self.offset, self.pending = file, stat.st_ino, offset, b""
+        self.rotated = self.created = False
+        if self.watcher:
+            self.file_wd = self.watcher.add_watch(self.path, InotifyWatcher.FILE_EVENTS)
+        return True
+
+    def handle_events(self):
+        """Drain inotify events and remember rotation or re-creation of the file."""
+        name = os.path.basename(self.path)
+        for wd, mask, event_name in self.watcher.read_events():
+            if wd == self.file_wd and mask & (InotifyWatcher.IN_MOVE_SELF | InotifyWatcher.IN_DELETE_SELF):
+                self.rotated = True
+            elif wd == self.directory_wd and event_name == name:
+                self.created = True
+
+    def check_truncated(self):
+        if self.file and os.fstat(self.file.fileno()).st_size < self.file.tell():
+            self.file.seek(0)
+            self.offset, self.pending = 0, b""
+            return True
+        return False
+
+    def check_rotated(self):
+        """Polling fallback: compare the inode of the path with the open file."""
+        try:
+            self.rotated = os.stat(self.path).st_ino != self.inode
+        except FileNotFoundError:
+            self.rotated = True
+        return self.rotated
+
+    def read_lines(self):
+        """Read one chunk and return the complete lines in it."""
+        data = self.file.read(self.read_size)
+        if not data:
+            return []
+        if self.pending:
+            data = self.pending + data
+        lines = data.split(b"\n")
+        self.pending = lines.pop()
+        self.offset = self.file.tell() - len(self.pending)
+        return [line.decode(self.encoding, errors="replace") for line in lines]
+
+    def close_file(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+        if self.watcher and self.file_wd is not None:
+            self.watcher.remove_watch(self.file_wd)
+            self.file_wd = None
+
+    def close(self):
+        self.close_file()
+        if self.watcher:
+            self.watcher.close()
+            self.watcher = None
+
+
+class PatternMatcher:
+    """
+    Matches log lines against many patterns at once.
+
+    All category patterns are compiled into a single alternation without capturing groups, which keeps the
+    first-character scan of the ``re`` engine, so non-matching lines are rejected with one search instead
+    of one search per pattern. The patterns of each field are compiled into one alternation as well and
+    only scanned for lines that matched a category.
+
+    Categories are ordered by priority: when a line matches several categories the first one wins,
+    the same as checking the categories one after another.
+    Field patterns are also listed by priority and the value is their first capturing group, or the
+    whole match if they have none. The combined field alternation finds the best matching priority it can see
+    in one scan; since its matches do not overlap, only the patterns ranked above that one are searched again.
+
+    :param patterns: List of patterns, where each pattern is its own category, or a dict of category to patterns.
+    :type patterns: Union[List[str], dict]
+    :param fields: Dict of field name to a pattern or a list of patterns ordered by priority.
+    :type fields: dict
+    :param literal: Escape the category patterns and match them as plain substrings.
+    :type literal: bool
+    :param flags: Regex flags used for all patterns.
+    :type flags: int
+
+    Example:
+
+        .. code-block:: python
+
+            from pawnlib.output.file import PatternMatcher
+
+            matcher = PatternMatcher(
+                {"failed": ["Failed password", "Invalid user"], "success": ["Accepted"]},
+                fields={"ip": r"\\b(?:[0-9]{1,3}\\.){3}[0-9]{1,3}\\b", "user": [r"for (\\w+) from", r"user (\\w+)"]},
+                literal=True
+            )
+            matcher.search("sshd[1]: Failed password for root from 10.0.0.1 port 22")
+            # >> <re.Match object; span=(9, 24), match='Failed password'>
+            matcher.match("sshd[1]: Failed password for root from 10.0.0.1 port 22")
+            # >> ('failed', {'ip': '10.0.0.1', 'user': 'root'})
+
+    """
+
+    def __init__(self, patterns: Union[List[str], dict], fields: dict = None, literal: bool = False, flags: int = 0):
+        if not isinstance(patterns, dict):
+            patterns = {pattern: [pattern] for pattern in patterns}
+        self.categories = list(patterns)
+        category_patterns = [
+            [re.escape(pattern) if literal else pattern for pattern in patterns[category]]
+            for category in self.categories
+        ]
+
+        all_patterns = [pattern for group in category_patterns for pattern in group]
+        self.gate = self._compile_alternation(all_patterns, flags)
+        self._category_gates = [self._compile_alternation(group, flags) for group in category_patterns]
+        self._category_selector, self._category_groups = self._compile_selector(
+            [(priority, pattern) for priority, group in enumerate(category_patterns) for pattern in group], flags, outer_group=True
+        )
+
+        self.fields = {}
+        for name, values in (fields or {}).items():
+            values = [values] if isinstance(values, str) else list(values)
+            regex, groups = self._compile_selector(list(enumerate(values)), flags)
+            self.fields[name] = (regex, groups, [re.compile(value, flags) for value in values])
+
+    @staticmethod
+    def _compile_alternation(patterns, flags):
+        if not patterns:
+            return None
+        return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), flags)
+
+    @staticmethod
+    def _compile_selector(patterns, flags, outer_group=False):
+        """
+        Compiles ``(priority, pattern)`` pairs into one alternation and returns it with a dict of
+        every group index to ``(priority, value_group)``, which tells from ``match.lastindex`` which pattern matched.
+        Unless ``outer_group`` is set, only patterns without a group get a capturing group, a group in front
+        of every alternative would turn off the first-character scan of the ``re`` engine.
+        """
+        alternatives = []
+        groups = {}
+        group_index = 1
+        for priority, pattern in patterns:
+            inner_groups = re.compile(pattern, flags).groups
+            value_group = group_index + 1 if outer_group and inner_groups else group_index
+            if outer_group or not inner_groups:
+                pattern, inner_groups = f"({pattern})", inner_groups + 1
+            for index in range(group_index, group_index + inner_groups):
+                groups[index] = (priority, value_group)
+            alternatives.append(f"(?:{pattern})")
+            group_index += inner_groups
+        return (re.compile("|".join(alternatives), flags) if alternatives else None), groups
+
+    def search(self, line: str):
+        """
+        Returns the leftmost match of any category pattern, or None.
+        """
+        return self.gate.search(line) if self.gate else None
+
+    def match(self, line: str):
+        """
+        Classifies the line and extracts its fields.
+
+        :param line: Log line.
+        :return: Tuple of (category, fields) or None when no category pattern matches.
+        """
+        category = self.classify(line)
+        if category is None:
+            return None
+        return category, self.extract(line)
+
+    def classify(self, line: str):
+        """
+        Returns the category of the line, or None.
+        """
+        gate_match = self.search(line)
+        if gate_match is None:
+            return None
+        selected = self._category_selector.match(line, gate_match.start())
+        priority = self._category_groups[selected.lastindex][0]
+        # Only the categories with a higher priority than the leftmost one need another look
+        for higher in range(priority):
+            if self._category_gates[higher] and self._category_gates[higher].search(line):
+                return self.categories[higher]
+        return self.categories[priority]
+
+    def matching_categories(self, line: str) -> List[str]:
+        """
+        Returns every category the line matches, ordered by priority.
+        """
+        if self.search(line) is None:
+            return []
+        return [category for category, gate in zip(self.categories, self._category_gates) if gate and gate.search(line)]
+
+    def match_all(self, line: str):
+        """
+        Like :meth:`match`, but returns every category the line matches, for callers that fall back
+        to a lower priority category. The fields are extracted once.
+
+        :param line: Log line.
+        :return: Tuple of (categories ordered by priority, fields) or None when no category pattern matches.
+        """
+        categories = self.matching_categories(line)
+        if not categories:
+            return None
+        return categories, self.extract(line)
+
+    def extract(self, line: str) -> dict:
+        """
+        Extracts the fields from a line regardless of its category.
+
+        Each field is the leftmost match of its highest priority pattern that matches anywhere in the line,
+        the same as searching the patterns one after another.
+        """
+        fields = {}
+        for name, (regex, groups, patterns) in self.fields.items():
+            fields[name] = None
+            candidate = regex.search(line) if regex else None
+            if candidate is None:
+                continue
+            # A match of a higher priority pattern can overlap the candidate, so search those patterns separately
+            last = groups[candidate.lastindex][0] if candidate.lastindex else len(patterns) - 1
+            for pattern in patterns[:last + 1]:
+                match = pattern.search(line)
+                if match:
+                    fields[name] = match.group(1 if pattern.groups else 0)
+                    break
+        return fields
+
+
 class Tail:
     """
     Tail class for monitoring log files with support for both synchronous and asynchronous modes.
 
+    On Linux the followers sleep on inotify instead of polling, read new data in large chunks
+    and only check for rotation when the file is moved or deleted, or for truncation when it shrinks.
+
     :param log_file_paths: Paths to the log files to monitor.
     :type log_file_paths: Union[str, List[str]]
-    :param filters: List of regex patterns to filter log lines.
-    :type filters: List[str]
+    :param filters: List of regex patterns to filter log lines, compiled into one :class:`PatternMatcher`.
+                    A prepared :class:`PatternMatcher` can be passed as well. None passes every line to the callback,
+                    for callbacks that match the lines themselves.
+    :type filters: Union[List[str], PatternMatcher, None]
     :param callback: Function to call with processed log lines.
     :type callback: Callable[[str], Union[None, asyncio.coroutine]]
     :param async_mode: Whether to operate in asynchronous mode.
     :type async_mode: bool
     :param formatter: Function to format log lines before processing.
     :type formatter: Callable[[str], str]
+    :param batch: If True, the callback receives a list of the matching lines of each read instead of one line per call.
+    :type batch: bool
+    :param offset_file: JSON file where the position of each log file is stored after every processed batch.
+                        A restart resumes from the stored offset if the file was not rotated meanwhile.
+    :type offset_file: str
+    :param from_beginning: Start from the beginning of the files instead of the end when there is no stored offset.
+    :type from_beginning: bool
+    :param use_inotify: Use inotify when available. Otherwise the files are polled every ``poll_interval`` seconds.
+    :type use_inotify: bool
+    :param read_size: Bytes read per chunk.
+    :type read_size: int
 
     Example:
 
@@ -186,25 +569,53 @@ class Tail:
 
             tail.follow()
 
+            # Batched callback with offsets persisted across restarts
+            async def process_log_lines(lines: List[str]):
+                pass
+
+            tail = Tail(log_file_paths=["/var/log/auth.log"],
+                         filters=["Failed", "Accepted"],
+                         callback=process_log_lines,
+                         async_mode=True,
+                         batch=True,
+                         offset_file="/var/lib/pawns/auth.offset")
+
+            tail.follow()
+
     """
 
     def __init__(self,
                  log_file_paths: Union[str, List[str]],
-                 filters: List[str],
+                 filters: Union[List[str], PatternMatcher, None],
                  callback: Callable[[str], Any],
                  async_mode: bool = False,
                  formatter: Callable[[str], str] = None,
                  enable_logging: bool = True,
                  logger=None,
                  verbose: int = 0,
+                 batch: bool = False,
+                 offset_file: str = None,
+                 from_beginning: bool = False,
+                 use_inotify: bool = True,
+                 poll_interval: float = 0.1,
+                 read_size: int = 1024 * 1024,
                  ):
 
         self.log_file_paths = [log_file_paths] if isinstance(log_file_paths, str) else log_file_paths
-        self.filters = [re.compile(f) for f in filters]
+        if filters is None or isinstance(filters, PatternMatcher):
+            self.matcher = filters
+        else:
+            self.matcher = PatternMatcher(filters)
         self.callback = callback
         self.async_mode = async_mode
         self.formatter = formatter
         self.verbose = verbose
+        self.batch = batch
+        self.offset_file = offset_file
+        self.from_beginning = from_beginning
+        self.use_inotify = use_inotify
+        self.poll_interval = poll_interval
+        self.read_size = read_size
         # if enable_logging:
         #     logging.basicConfig(level=logging.INFO)
         # else:
@@ -215,11 +626,76 @@ class Tail:
         self.file_inodes = {}
         # self.logger.info("Start Info")
         self.max_retries = 5
+        self.offsets = self._load_offsets()
+        self._stopped = False
+        self._wakeups = []
 
     def _get_inode(self, file_path):
         """Get the inode of the file."""
         return os.stat(file_path).st_ino
 
+    def _load_offsets(self):
+        if not self.offset_file or not os.path.exists(self.offset_file):
+            return {}
+        try:
+            with open(self.offset_file, "r") as f:
+                return json.load(f)
+        except (ValueError, OSError) as e:
+            self.logger.warning(f"Ignoring unreadable offset file '{self.offset_file}': {e}")
+            return {}
+
+    def _save_offset(self, follower):
+        self.file_inodes[follower.path] = follower.inode
+        if not self.offset_file:
+            return
+        self.offsets[follower.path] = {"inode": follower.inode, "offset": follower.offset}
+        temp_path = f"{self.offset_file}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(self.offsets, f)
+        os.replace(temp_path, self.offset_file)
+
+    def _open_follower(self, follower, rotated=False):
+        opened = follower.open(
+            from_beginning=self.from_beginning or rotated,
+            resume=None if rotated else self.offsets.get(follower.path),
+        )
+        if opened:
+            self.file_inodes[follower.path] = follower.inode
+            self.logger.debug(f"Started monitoring on file: {follower.path} (offset={follower.offset})")
+        return opened
+
+    def _refresh_follower(self, follower, idle):
+        """
+        Handle truncation and rotation after a wakeup.
+
+        :param idle: True if the last read returned no data. Rotation is only acted upon once the old file is drained.
+        """
+        if follower.watcher:
+            follower.handle_events()
+        if follower.file is None:
+            if (follower.created or not follower.watcher) and self._open_follower(follower, rotated=True):
+                self.logger.info(f"Log file {follower.path} created. Opened new file.")
+            return
+        if follower.check_truncated():
+            self.logger.info(f"Log file {follower.path} truncated. Reading from the beginning.")
+        if idle and (follower.rotated or (not follower.watcher and follower.check_rotated())):
+            self.logger.info(f"Log file {follower.path} rotated. Reopening new file.")
+            follower.close_file()
+            self._open_follower(follower, rotated=True)
+
+    @staticmethod
+    def _is_waiting(follower):
+        """True if there is nothing to read until the next wakeup."""
+        if follower.file is None:
+            return True
+        return not follower.rotated and follower.file.tell() >= os.fstat(follower.file.fileno()).st_size
+
+    def stop(self):
+        """Stop following after the current batch."""
+        self._stopped = True
+        for loop, wakeup in self._wakeups:
+            loop.call_soon_threadsafe(wakeup.set)
+
     async def _handle_retry(self, file_path, retry_count):
         """
         Handle the retry logic with backoff for when the file is not found.
@@ -236,85 +712,120 @@ class Tail:
         retry_count = 0
         self.logger.info(f"Starting async follow on {file_path}")
 
-        while retry_count <= self.max_retries:
-            try:
-                # Check if the file exists
-                # if not os.path.exists(file_path):
-                #     self.logger.warning(f"Log file {file_path} not found. Waiting for it to be created... ")
-                #     retry_count += 1
-                #     backoff_time = min(2 ** retry_count, 60)  # Exponential backoff with a max of 60 seconds
-                #     self.logger.warning(f"---- backoff_time -> {backoff_time}")
-                #     await asyncio.sleep(backoff_time)
-                #     continue
-                if not os.path.exists(file_path):
-                    retry_count = await self._handle_retry(file_path, retry_count)
+        while not os.path.exists(file_path):
+            if retry_count >= self.max_retries:
+                return
+            retry_count = await self._handle_retry(file_path, retry_count)
+
+        follower = TailFollower(file_path, read_size=self.read_size, use_inotify=self.use_inotify)
+        loop = asyncio.get_running_loop()
+        wakeup = asyncio.Event()
+
+        def on_inotify_event():
+            # Drain the descriptor right away, the reader callback is level-triggered
+            follower.handle_events()
+            wakeup.set()
+
+        if follower.watcher:
+            loop.add_reader(follower.fileno, on_inotify_event)
+        self._wakeups.append((loop, wakeup))
+        try:
+            self._open_follower(follower)
+            while not self._stopped:
+                lines = follower.read_lines() if follower.file else []
+                if lines:
+                    await self._dispatch_lines(lines, file_path)
+                    self._save_offset(follower)
                     continue
 
-                async with aiofiles.open(file_path, mode='r') as file:
-                    # Move to the end of the file
-                    await file.seek(0, os.SEEK_END)
-                    self.file_inodes[file_path] = self._get_inode(file_path)
-                    self.logger.debug(f"Started async monitoring on file: {file_path}")
-
-                    while True:
-                        # Check for file rotation by comparing inode numbers
-                        current_inode = self._get_inode(file_path)
-                        if self.file_inodes[file_path] != current_inode:
-                            self.file_inodes[file_path] = current_inode
-                            self.logger.info(f"Log file {file_path} rotated. Reopening new file.")
-                            break  # Exit loop to reopen the new file
-
-                        # Read new lines
-                        line = await file.readline()
-                        if not line:
-                            await asyncio.sleep(0.1)
-                            continue
-
-                        # Process each line
-                        await self._process_line(line, file_path)
-
-                    retry_count = 0  # Reset retry count after successful file access
-
-            except FileNotFoundError:
-                retry_count = await self._handle_retry(file_path, retry_count)
-            except Exception as e:
-                self.logger.error(f"Error occurred while asynchronously monitoring file {file_path}: {e}")
-                break
-
-
-    def _follow_sync(self, file_path: str):
-        while True:
-            try:
-                if not os.path.exists(file_path):
-                    self.logger.warning(f"Log file {file_path} not found. Waiting for it to be created...")
-                    time.sleep(1)  # Wait for the file to be recreated
+                wakeup.clear()
+                self._refresh_follower(follower, idle=True)
+                if not self._is_waiting(follower):
+                    continue
+                if follower.watcher:
+                    try:
+                        await asyncio.wait_for(wakeup.wait(), timeout=1)
+                    except asyncio.TimeoutError:
+                        pass
+                else:
+                    await asyncio.sleep(self.poll_interval)
+        except Exception as e:
+            self.logger.error(f"Error occurred while asynchronously monitoring file {file_path}: {e}")
+        finally:
+            self._wakeups.remove((loop, wakeup))
+            if follower.watcher:
+                loop.remove_reader(follower.fileno)
+            follower.close()
+
+    def _follow_sync(self, file_path: Union[str, List[str]]):
+        file_paths = [file_path] if isinstance(file_path, str) else file_path
+        followers = [TailFollower(path, read_size=self.read_size, use_inotify=self.use_inotify) for path in file_paths]
+        try:
+            for follower in followers:
+                if not self._open_follower(follower):
+                    self.logger.warning(f"Log file {follower.path} not found. Waiting for it to be created...")
+
+            while not self._stopped:
+                has_data = False
+                for follower in followers:
+                    lines = follower.read_lines() if follower.file else []
+                    if lines:
+                        has_data = True
+                        self._dispatch_lines_sync(lines, follower.path)
+                        self._save_offset(follower)
+                if has_data:
                     continue
 
-                with open(file_path, "r") as file:
-                    file.seek(0, os.SEEK_END)
-                    self.file_inodes[file_path] = self._get_inode(file_path)
-                    self.logger.debug(f"Started synchronous monitoring on file: {file_path}")
-
-                    while True:
-                        current_inode = self._get_inode(file_path)
-                        if self.file_inodes[file_path] != current_inode:
-                            self.file_inodes[file_path] = current_inode
-                            self.logger.info(f"Log file {file_path} rotated. Reopening new file.")
-                            break  # Exit the loop to reopen the file
-
-                        line = file.readline()
-                        if not line:
-                            time.sleep(0.1)
-                            continue
+                for follower in followers:
+                    self._refresh_follower(follower, idle=True)
+                if not all(self._is_waiting(follower) for follower in followers):
+                    continue
+                watched = [follower.fileno for follower in followers if follower.watcher]
+                if len(watched) == len(followers):
+                    select.select(watched, [], [], 1)
+                else:
+                    time.sleep(self.poll_interval)
+        except Exception as e:
+            self.logger.error(f"Error occurred while synchronously monitoring file {file_paths}: {e}")
+        finally:
+            for follower in followers:
+                follower.close()
+
+    async def _dispatch_lines(self, lines: List[str], file_path: str):
+        if not self.batch:
+            for line in lines:
+                await self._process_line(line, file_path)
+            return
+
+        batch = self._filter_lines(lines)
+        if batch:
+            try:
+                result = self.callback(batch)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                self.logger.error(f"Error occurred while executing callback on {len(batch)} lines from {file_path}: {e}")
 
-                        self._process_line_sync(line, file_path)
+    def _dispatch_lines_sync(self, lines: List[str], file_path: str):
+        if not self.batch:
+            for line in lines:
+                self._process_line_sync(line, file_path)
+            return
 
-            except FileNotFoundError:
-                self.logger.error(f"Error monitoring file {file_path}: File not found. Retrying...")
-                time.sleep(1)  # Retry after a delay if the file is not found
+        batch = self._filter_lines(lines)
+        if batch:
+            try:
+                self.callback(batch)
             except Exception as e:
-                self.logger.error(f"Error occurred while synchronously monitoring file {file_path}: {e}")
-                break
+                self.logger.error(f"Error occurred while executing callback on {len(batch)} lines from {file_path}: {e}")
+
+    def _filter_lines(self, lines: List[str]) -> List[str]:
+        batch = []
+        for line in lines:
+            line = line.strip()
+            if self._should_process(line):
+                batch.append(self.formatter(line) if self.formatter else line)
+        return batch
 
     async def _process_line(self, line: str, file_path: str):
         line = line.strip()
@@ -349,7 +860,7 @@ class Tail:
                 self.logger.error(f"Error occurred while executing callback on line from {file_path}: {e}")
 
     def _should_process(self, line: str) -> bool:
-        return any(f.search(line) for f in self.filters)
+        return self.matcher is None or self.matcher.search(line) is not None
 
     async def follow_async(self):
         """ Asynchronous follow method """
@@ -371,9 +882,8 @@ class Tail:
                 # Handle if no loop is running (as in the case with `asyncio.run()`)
                 asyncio.run(self.follow_async())
         else:
-            # Synchronous mode: directly call the sync methods
-            for path in self.log_file_paths:
-                self._follow_sync(path)
+            # Synchronous mode: follow every file in one loop
+            self._follow_sync(self.log_file_paths)
 
 
 def check_path(path, detailed=False):
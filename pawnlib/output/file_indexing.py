@@ -1,11 +1,12 @@
 import os
+import time
 import xxhash
+import hashlib
 import asyncio
-import aiofiles
 import json
 import datetime
 import re
-from itertools import zip_longest
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from tqdm import tqdm
 import logging
 import argparse
@@ -18,9 +19,155 @@ from pawnlib.typing.converter import get_file_detail
 
 logger = logging.getLogger(__name__)
 
+HASH_MODES = ("tail", "sampled", "full")
+
+
+def new_hasher(algorithm="xxh3_64"):
+    """
+    Create a hash object by name. ``xxh*`` names come from xxhash, everything else from hashlib.
+
+    :param algorithm: e.g. "xxh3_64", "xxh3_128", "sha256".
+    :return: A hash object with ``update`` and ``hexdigest``.
+    """
+    if algorithm.startswith("xxh"):
+        return getattr(xxhash, algorithm)()
+    return hashlib.new(algorithm)
+
+
+def calculate_file_checksum(file_path, hash_mode="tail", algorithm="xxh3_64", read_size=10240, sample_count=16, buffer_size=4 * 1024 * 1024):
+    """
+    Calculate the checksum of a file.
+
+    This is a plain module-level function so it can run on a thread or a process pool.
+
+    :param file_path: Path of the file.
+    :param hash_mode: Which bytes are hashed.
+
+        - ``tail``: the last ``read_size`` bytes (the original FileIndexer checksum).
+        - ``sampled``: ``sample_count`` chunks of ``read_size`` bytes spread evenly over the file, plus its size.
+        - ``full``: the whole file, read with ``buffer_size`` buffers.
+
+    :param algorithm: Hash algorithm name, see :func:`new_hasher`.
+    :param read_size: Bytes per chunk for ``tail`` and ``sampled``.
+    :param sample_count: Number of chunks for ``sampled``, at least 1. A single chunk is read from the start of the file.
+    :param buffer_size: Read buffer size for ``full``.
+    :return: The hex digest.
+
+    Example:
+
+        .. code-block:: python
+
+            calculate_file_checksum("data/db/000123.sst", hash_mode="full", algorithm="xxh3_128")
+    """
+    hasher = new_hasher(algorithm)
+    with open(file_path, "rb", buffering=0) as f:
+        file_size = os.fstat(f.fileno()).st_size
+        if hash_mode == "tail":
+            f.seek(max(0, file_size - read_size))
+            hasher.update(f.read())
+        elif hash_mode == "sampled":
+            if sample_count < 1:
+                raise ValueError(f"Invalid sample_count {sample_count}, expected at least 1")
+            hasher.update(str(file_size).encode())
+            if file_size <= read_size * sample_count:
+                hasher.update(f.read())
+            else:
+                step = (file_size - read_size) // (sample_count - 1) if sample_count > 1 else 0
+                for i in range(sample_count):
+                    f.seek(i * step)
+                    hasher.update(f.read(read_size))
+        elif hash_mode == "full":
+            buffer = bytearray(buffer_size)
+            view = memoryview(buffer)
+            while True:
+                length = f.readinto(buffer)
+                if not length:
+                    break
+                hasher.update(view[:length])
+        else:
+            raise ValueError(f"Invalid hash_mode '{hash_mode}', expected one of {HASH_MODES}")
+    return hasher.hexdigest()
+
+
+class ChecksumCache:
+    """
+    Sidecar cache of file checksums keyed by (device, inode, size, mtime_ns).
+
+    A file whose stat key did not change is not hashed again. Entries that were not looked up
+    during a run are dropped on :meth:`save`, so the cache never outgrows the tree.
+
+    :param path: Path of the JSON cache file. If None, the cache lives in memory only.
+
+    Example:
+
+        .. code-block:: python
+
+            cache = ChecksumCache("./.checksum_cache.json")
+            stat = os.stat("data/db/000123.sst")
+            checksum = cache.get(stat, "full", "xxh3_64")
+            if checksum is None:
+                checksum = calculate_file_checksum("data/db/000123.sst", hash_mode="full")
+                cache.set(stat, "full", "xxh3_64", checksum)
+            cache.save()
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.entries = {}
+        self.used = {}
+        self.hits = 0
+        self.misses = 0
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r") as f:
+                    self.entries = json.load(f)
+            except (ValueError, OSError) as e:
+                logger.warning(f"Ignoring unreadable checksum cache '{path}': {e}")
+
+    @staticmethod
+    def make_key(stat, hash_mode, algorithm):
+        return f"{stat.st_dev}:{stat.st_ino}:{stat.st_size}:{stat.st_mtime_ns}:{hash_mode}:{algorithm}"
+
+    def get(self, stat, hash_mode, algorithm):
+        key = self.make_key(stat, hash_mode, algorithm)
+        checksum = self.entries.get(key)
+        if checksum is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.used[key] = checksum
+        return checksum
+
+    def set(self, stat, hash_mode, algorithm, checksum):
+        self.used[self.make_key(stat, hash_mode, algorithm)] = checksum
+
+    def save(self):
+        if not self.path:
+            return
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(self.used, f)
+        os.replace(temp_path, self.path)
+
+
 class FileIndexer:
     def __init__(self, base_dir="./", output_dir="./", prefix=None, worker=20, debug=False,
-                 check_method="hash", checksum_filename="checksum.json", index_filename="file_list.txt",  exclude_files=None, exclude_extensions=None):
+                 check_method="hash", checksum_filename="checksum.json", index_filename="file_list.txt",  exclude_files=None, exclude_extensions=None,
+                 hash_mode="tail", hash_algorithm="xxh3_64", hash_workers=None, executor_type="thread",
+                 use_cache=True, cache_filename=".checksum_cache.json", precount=False):
+        """
+        :param hash_mode: Checksum mode, one of "tail", "sampled" or "full". See :func:`calculate_file_checksum`.
+        :param hash_algorithm: Hash algorithm name, e.g. "xxh3_64", "xxh3_128" or "sha256".
+        :param hash_workers: Size of the hashing pool. Defaults to ``worker``.
+        :param executor_type: "thread" or "process". Use "process" when hashing is CPU bound.
+        :param use_cache: Reuse checksums of files whose (inode, size, mtime_ns) did not change.
+                          Disable to force re-reading every file, e.g. to detect bit rot.
+        :param cache_filename: Name of the sidecar cache file in ``output_dir``.
+        :param precount: Count the files before indexing to show the total and the remaining time.
+                         This walks the tree twice, so it is off by default and the progress shows a running count.
+        """
+        if hash_mode not in HASH_MODES:
+            raise ValueError(f"Invalid hash_mode '{hash_mode}', expected one of {HASH_MODES}")
         self.base_dir = base_dir
         self.output_dir = output_dir
         self.prefix = prefix
@@ -32,30 +179,83 @@ class FileIndexer:
         if self.exclude_files:
             self.exclude_files.append(checksum_filename)
             self.exclude_files.append(index_filename)
+            self.exclude_files.append(cache_filename)
 
         self.exclude_extensions = exclude_extensions or ["sock"]
-        self.indexed_files = {}
+        self.indexed_count = 0
         self.result = {"status": "OK", "errors": {}}
         self.index_filename = os.path.join(output_dir, index_filename)
         self.checksum_filename = os.path.join(output_dir, checksum_filename)
         self.file_list = []
         self.total_file_count = 0
+        self.precount = precount
+
+        self.hash_mode = hash_mode
+        self.hash_algorithm = hash_algorithm
+        self.hash_workers = hash_workers or worker
+        self.executor_type = executor_type
+        self.executor = None
+        self.use_cache = use_cache
+        self.cache_filename = os.path.join(output_dir, cache_filename)
+        self.cache = None
+
+    def start_executor(self):
+        if self.executor is None:
+            executor_class = ProcessPoolExecutor if self.executor_type == "process" else ThreadPoolExecutor
+            self.executor = executor_class(max_workers=self.hash_workers)
+        if self.cache is None:
+            self.cache = ChecksumCache(self.cache_filename if self.use_cache else None)
+
+    def stop_executor(self):
+        if self.executor:
+            self.executor.shutdown()
+            self.executor = None
+        if self.cache:
+            if self.use_cache:
+                self.cache.save()
+                logger.info(f"Checksum cache: {self.cache.hits} hits, {self.cache.misses} misses")
+            self.cache = None
+
+    def iter_files(self):
+        """
+        Yield the files under the base directory with ``os.scandir``, excluding files and extensions as defined.
+
+        Entries are sorted per directory and walked depth-first (files of a directory before its
+        subdirectories), so the order is deterministic while only one directory listing is held
+        in memory at a time. Symlinked directories are not followed, like ``os.walk``.
+        """
+        stack = [self.base_dir]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = sorted(it, key=lambda entry: entry.name)
+            except OSError as e:
+                logger.warning(f"Cannot read directory {directory}: {e}")
+                continue
+
+            subdirectories = []
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append(entry.path)
+                elif entry.is_file() and self.is_excluded(entry.path):
+                    yield entry.path
+            stack.extend(reversed(subdirectories))
+
+    def count_files(self):
+        """
+        Count the files that :meth:`iter_files` yields without keeping their paths.
+        """
+        return sum(1 for _ in self.iter_files())
 
     def list_files_recursive(self):
         """
         Recursively list files in the base directory, excluding files and extensions as defined.
+        The whole list is kept in memory; :meth:`process_files` uses :meth:`iter_files` instead.
         """
-        all_files = []
-        for root, _, files in os.walk(self.base_dir):
-            for file in files:
-                full_path = os.path.join(root, file)
-                if self.is_excluded(full_path):
-                    all_files.append(full_path)
-
-        self.file_list = all_files
+        self.file_list = list(self.iter_files())
         self.total_file_count = len(self.file_list)
-        self.sliced_file_list = zip_longest(*[iter(self.file_list)] * self.worker, fillvalue=None)
-
+        return self.file_list
 
     def is_excluded(self, file_path):
         """
@@ -73,51 +273,51 @@ class FileIndexer:
             return False
         return True
 
-    async def async_executor(self, file_list, progress, task_id):
-        """
-        Execute file parsing tasks asynchronously.
+    async def parse_file(self, file_path):
         """
-        tasks = [
-            asyncio.create_task(self.parse_file(file, progress, task_id))
-            for file in file_list if file
-        ]
-        await asyncio.gather(*tasks)
+        Calculate the checksum of a single file.
 
-    async def parse_file(self, file_path, progress, task_id):
+        :return: ``(relative_path, index_line, checksum_meta)``
         """
-        Parse a single file, calculate its checksum, and save to output.
-        """
-        checksum = await self.calculate_checksum(file_path)
-        file_size = await self.get_file_size(file_path)
+        file_size, checksum = await self.hash_file(file_path)
         relative_path = os.path.relpath(file_path, self.base_dir)
         download_url = f"{self.prefix}/{relative_path}" if self.prefix else relative_path
 
-        self.indexed_files[relative_path] = {
+        meta = {
             "file_size": file_size,
             "checksum": checksum,
         }
-
-        async with aiofiles.open(self.index_filename, mode='a') as f:
-            await f.write(f"{download_url}\n\tout={relative_path}\n")
+        if self.hash_mode != "tail" or self.hash_algorithm != "xxh3_64":
+            meta.update(hash_mode=self.hash_mode, algorithm=self.hash_algorithm)
 
         if self.debug:
             logger.debug(f"[Processed] {file_path} | Size: {file_size} | Checksum: {checksum}")
+        return relative_path, f"{download_url}\n\tout={relative_path}\n", meta
 
-        # Update progress
-        progress.update(task_id, advance=1)
-        progress.update(task_id, description=f"[bold blue]Processed {progress.tasks[task_id].completed}/{self.total_file_count} files")
+    async def hash_file(self, file_path, hash_mode=None, algorithm=None, use_cache=None):
+        """
+        Return ``(file_size, checksum)`` of a file, hashing it on the executor unless the cache has it.
+
+        :param use_cache: Look the checksum up in the cache. Defaults to ``self.use_cache``;
+                          False always reads the file, e.g. when verifying it.
+        """
+        hash_mode = hash_mode or self.hash_mode
+        algorithm = algorithm or self.hash_algorithm
+        use_cache = self.use_cache if use_cache is None else use_cache
+        self.start_executor()
+        stat = os.stat(file_path)
+        checksum = self.cache.get(stat, hash_mode, algorithm) if use_cache else None
+        if checksum is None:
+            loop = asyncio.get_running_loop()
+            checksum = await loop.run_in_executor(self.executor, calculate_file_checksum, file_path, hash_mode, algorithm)
+            self.cache.set(stat, hash_mode, algorithm, checksum)
+        return stat.st_size, checksum
 
     async def calculate_checksum(self, file_path, read_size=10240):
         """
-        Calculate the checksum of the last `read_size` bytes of a file asynchronously.
+        Calculate the checksum of a file with the indexer's hash mode and algorithm.
         """
-        async with aiofiles.open(file_path, "rb") as f:
-            await f.seek(0, 2)
-            file_size = await f.tell()
-            start_position = max(0, file_size - read_size)
-            await f.seek(start_position)
-            content = await f.read()
-            return xxhash.xxh3_64_hexdigest(content)
+        return (await self.hash_file(file_path))[1]
 
     async def get_file_size(self, file_path):
         """
@@ -127,9 +327,95 @@ class FileIndexer:
 
     async def process_files(self):
         """
-        Process all files asynchronously in batches, with `rich` progress tracking.
+        Index all files through a streaming pipeline, with `rich` progress tracking.
+
+        A walker feeds a bounded queue, ``worker`` tasks hash the files, and a single writer keeps
+        the index and checksum files open and appends results in walk order. Results that finish
+        early wait in a reorder buffer; a worker does not start a file that is more than
+        ``worker * 4`` files ahead of the next one to write, so one slow file cannot make the
+        buffer grow and memory stays flat regardless of the number of files.
+
+        The progress shows the processed and discovered files, or a bar against the total with ``precount``.
         """
         console = Console()
+        window_size = self.worker * 4
+        work_queue = asyncio.Queue(maxsize=window_size)
+        result_queue = asyncio.Queue(maxsize=window_size)
+        # Bounds the reorder buffer of the writer to window_size results
+        window = asyncio.Condition()
+        total = self.count_files() if self.precount else None
+        self.total_file_count = 0
+        self.indexed_count = 0
+        state = {"completed": False, "next_sequence": 0}
+
+        def update_progress(progress, task_id, completed):
+            if total is None:
+                description = f"Processed {completed} files ({self.total_file_count} found)"
+            else:
+                description = f"Processed {completed}/{total} files"
+            progress.update(task_id, completed=completed, total=total, description=description)
+
+        async def walker():
+            for sequence, file_path in enumerate(self.iter_files()):
+                self.total_file_count += 1
+                await work_queue.put((sequence, file_path))
+            for _ in range(self.worker):
+                await work_queue.put(None)
+
+        async def worker():
+            while True:
+                item = await work_queue.get()
+                if item is None:
+                    break
+                sequence, file_path = item
+                async with window:
+                    await window.wait_for(lambda: sequence < state["next_sequence"] + window_size)
+                try:
+                    result = await self.parse_file(file_path)
+                except OSError as e:
+                    logger.warning(f"Skipping {file_path}: {e}")
+                    result = None
+                await result_queue.put((sequence, result))
+
+        async def writer(progress, task_id):
+            pending = {}
+            next_sequence = 0
+            last_refresh = 0
+            checksum_temp = f"{self.checksum_filename}.tmp"
+            with open(self.index_filename, "w", buffering=1024 * 1024) as index_file, \
+                    open(checksum_temp, "w", buffering=1024 * 1024) as checksum_file:
+                checksum_file.write("{")
+                while True:
+                    item = await result_queue.get()
+                    if item is None:
+                        break
+                    pending[item[0]] = item[1]
+                    while next_sequence in pending:
+                        result = pending.pop(next_sequence)
+                        next_sequence += 1
+                        if result is None:
+                            continue
+                        relative_path, index_line, meta = result
+                        index_file.write(index_line)
+                        checksum_file.write(f'{"," if self.indexed_count else ""}\n{json.dumps(relative_path)}: {json.dumps(meta)}')
+                        self.indexed_count += 1
+                    if next_sequence != state["next_sequence"]:
+                        async with window:
+                            state["next_sequence"] = next_sequence
+                            window.notify_all()
+
+                    now = time.monotonic()
+                    if now - last_refresh >= 0.2:
+                        last_refresh = now
+                        update_progress(progress, task_id, next_sequence)
+                checksum_file.write("\n}\n")
+            if not state["completed"]:
+                # Keep the previous checksum file if indexing was interrupted
+                os.remove(checksum_temp)
+                return
+            os.replace(checksum_temp, self.checksum_filename)
+            update_progress(progress, task_id, next_sequence)
+
         with Progress(
                 "[bold blue]{task.description}",
                 BarColumn(bar_width=None),  # Fill the screen width
@@ -139,9 +425,20 @@ class FileIndexer:
                 TimeRemainingColumn(),
                 console=console,
         ) as progress:
-            task_id = progress.add_task(f"Processed 0/{self.total_file_count} files", total=self.total_file_count)
-            for file_batch in self.sliced_file_list:
-                await self.async_executor(file_batch, progress, task_id)
+            task_id = progress.add_task("Processed 0 files", total=total)
+            writer_task = asyncio.create_task(writer(progress, task_id))
+            workers = [asyncio.create_task(worker()) for _ in range(self.worker)]
+            walker_task = asyncio.create_task(walker())
+            try:
+                # A failing worker stops the whole pipeline instead of leaving a gap the writer waits for
+                await asyncio.gather(walker_task, *workers)
+                state["completed"] = True
+            finally:
+                for task in [walker_task, *workers]:
+                    task.cancel()
+                if not writer_task.done():
+                    await result_queue.put(None)
+                await writer_task
 
     def save_json(self, filename, data):
         """
@@ -168,6 +465,10 @@ class FileIndexer:
     async def check(self):
         """
         Verify files based on previously generated checksums.
+
+        Each entry is re-hashed with the mode and algorithm recorded in the checksum file
+        (tail/xxh3_64 for files written by older versions), ``hash_workers`` files at a time.
+        The checksum cache is bypassed, so files that changed in place are detected.
         """
         indexed_data = self.load_json(self.checksum_filename)
         if not indexed_data:
@@ -175,32 +476,57 @@ class FileIndexer:
             self.result["status"] = "FAIL"
             return self.result
 
-        for file_name, meta in tqdm(indexed_data.items(), desc="Validating files"):
-            full_path = os.path.join(self.base_dir, file_name)
-            if not os.path.exists(full_path):
-                logger.warning(f"File missing: {file_name}")
-                self.result["errors"][file_name] = {"error": "File missing"}
-                self.result["status"] = "FAIL"
-                continue
-
-            file_size = await self.get_file_size(full_path)
-            if file_size != meta.get("file_size"):
-                logger.warning(f"Size mismatch: {file_name} (expected: {meta.get('file_size')}, found: {file_size})")
-                self.result["errors"][file_name] = {"error": "Size mismatch"}
-                self.result["status"] = "FAIL"
-                continue
-
-            if self.check_method == "hash":
-                checksum = await self.calculate_checksum(full_path)
-                if checksum != meta.get("checksum"):
-                    logger.warning(f"Checksum mismatch: {file_name} (expected: {meta.get('checksum')}, found: {checksum})")
-                    self.result["errors"][file_name] = {"error": "Checksum mismatch"}
-                    self.result["status"] = "FAIL"
+        queue = asyncio.Queue(maxsize=self.hash_workers * 2)
+        pbar = tqdm(total=len(indexed_data), desc="Validating files")
+
+        async def worker():
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                try:
+                    await self.verify_file(*item)
+                except Exception as e:
+                    self.add_check_error(item[0], f"Failed to verify: {e}")
+                pbar.update(1)
+
+        self.start_executor()
+        try:
+            workers = [asyncio.create_task(worker()) for _ in range(self.hash_workers)]
+            for file_name, meta in indexed_data.items():
+                await queue.put((file_name, meta))
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            pbar.close()
+            self.stop_executor()
 
         if self.result["status"] == "OK":
             logger.info("All files validated successfully.")
         return self.result
 
+    def add_check_error(self, file_name, error, message=None):
+        logger.warning(message or f"{error}: {file_name}")
+        self.result["errors"][file_name] = {"error": error}
+        self.result["status"] = "FAIL"
+
+    async def verify_file(self, file_name, meta):
+        full_path = os.path.join(self.base_dir, file_name)
+        if not os.path.exists(full_path):
+            self.add_check_error(file_name, "File missing")
+            return
+
+        file_size = await self.get_file_size(full_path)
+        if file_size != meta.get("file_size"):
+            self.add_check_error(file_name, "Size mismatch", f"Size mismatch: {file_name} (expected: {meta.get('file_size')}, found: {file_size})")
+            return
+
+        if self.check_method == "hash":
+            _, checksum = await self.hash_file(full_path, meta.get("hash_mode", "tail"), meta.get("algorithm", "xxh3_64"), use_cache=False)
+            if checksum != meta.get("checksum"):
+                self.add_check_error(file_name, "Checksum mismatch", f"Checksum mismatch: {file_name} (expected: {meta.get('checksum')}, found: {checksum})")
+
     @staticmethod
     def pretty_file_info(filename=None):
         file_info = get_file_detail(filename)
@@ -211,14 +537,16 @@ class FileIndexer:
         Main method to execute file indexing.
         """
         os.makedirs(self.output_dir, exist_ok=True)
-        self.list_files_recursive()
         if os.path.exists(self.index_filename):
             os.remove(self.index_filename)
-        await self.process_files()
+        self.start_executor()
+        try:
+            await self.process_files()
+        finally:
+            self.stop_executor()
 
         logger.info(f"INDEX saved to {self.pretty_file_info(self.index_filename)}")
-
-        self.save_json(self.checksum_filename, self.indexed_files)
+        logger.info(f"JSON saved to {self.pretty_file_info(self.checksum_filename)}")
 
 
 def main():
@@ -230,6 +558,11 @@ def main():
     parser.add_argument("--debug", action="store_true", help="Enable debug logging.")
     parser.add_argument("--check", action="store_true", help="Validate files based on checksum.")
     parser.add_argument("--check-method", choices=["hash", "size_only"], default="hash", help="Method to validate files.")
+    parser.add_argument("--hash-mode", choices=HASH_MODES, default="tail", help="Bytes to hash: file tail, sampled chunks or the full file.")
+    parser.add_argument("--hash-algorithm", default="xxh3_64", help="Hash algorithm, e.g. xxh3_64, xxh3_128, sha256.")
+    parser.add_argument("--executor", choices=["thread", "process"], default="thread", help="Pool used for hashing.")
+    parser.add_argument("--no-cache", action="store_true", help="Re-hash every file, ignoring the checksum cache.")
+    parser.add_argument("--precount", action="store_true", help="Count the files first to show the total and the remaining time.")
     args = parser.parse_args()
 
     if args.debug:
@@ -242,6 +575,11 @@ def main():
         worker=args.worker,
         debug=args.debug,
         check_method=args.check_method,
+        hash_mode=args.hash_mode,
+        hash_algorithm=args.hash_algorithm,
+        executor_type=args.executor,
+        use_cache=not args.no_cache,
+        precount=args.precount,
     )
 
     if args.check:
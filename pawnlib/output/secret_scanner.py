@@ -0,0 +1,510 @@
+import io
+import os
+import re
+import fnmatch
+import logging
+import tarfile
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+from pawnlib.typing.constants import SecretPatternConstants
+
+logger = logging.getLogger(__name__)
+
+TOKEN_RUN_CHARS = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+TOKEN_RUN_LENGTH = 24
+TOKEN_RUN_TAIL = 40  # A discord token continues up to 35 bytes after its first run
+CONTEXT_SIZE = 256  # Bytes kept in front of the next chunk, so \b and lookaheads see the real neighbours
+TAR_BLOCK_SIZE = 512
+
+_TOKEN_RUN_TABLE = bytes(0x41 if char in TOKEN_RUN_CHARS else 0x2E for char in range(256))
+_TOKEN_RUN_NEEDLE = b"A" * TOKEN_RUN_LENGTH
+
+_worker_scanner = None
+
+
+class PeekedStream(io.RawIOBase):
+    """
+    A read-only stream that returns ``head`` before the rest of ``stream``.
+    Used to look at the first bytes of a non-seekable stream without losing them.
+
+    :param head: The bytes already read from the stream.
+    :param stream: The stream to continue with.
+    """
+
+    def __init__(self, head: bytes, stream):
+        super().__init__()
+        self.head = head
+        self.stream = stream
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            data, self.head = self.head + self.stream.read(), b""
+            return data
+        if self.head:
+            data, self.head = self.head[:size], self.head[size:]
+            if len(data) < size:
+                data += self.stream.read(size - len(data))
+            return data
+        return self.stream.read(size)
+
+    def readinto(self, buffer):
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+class IterStream(io.RawIOBase):
+    """
+    A read-only stream over an iterable of byte chunks, e.g. the generator returned by ``docker image save``.
+
+    :param iterable: Iterable of bytes.
+
+    Example:
+
+        .. code-block:: python
+
+            stream = io.BufferedReader(IterStream(image.save()), buffer_size=1024 * 1024)
+            SecretScanner().scan_archive(stream, source="my-app:latest")
+    """
+
+    def __init__(self, iterable: Iterable[bytes]):
+        super().__init__()
+        self._iterator = iter(iterable)
+        self._pending = memoryview(b"")
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self._pending:
+            try:
+                self._pending = memoryview(next(self._iterator))
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def is_archive_header(head: bytes) -> bool:
+    """
+    Check if the first bytes of a stream look like a tar or a gzip compressed file.
+
+    :param head: At least the first 512 bytes of the stream.
+    :return: True if the stream can be opened with ``tarfile``.
+    """
+    return head[257:262] == b"ustar" or head[:2] == b"\x1f\x8b"
+
+
+def _batched(iterable, size):
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _init_worker(scanner):
+    global _worker_scanner
+    _worker_scanner = scanner
+
+
+def _scan_batch(paths):
+    _worker_scanner.reset_stats()
+    findings = [_worker_scanner.scan_path(path) for path in paths]
+    return findings, _worker_scanner.stats
+
+
+class SecretScanner:
+    """
+    Scans files, streams and tar archives for secret keys and tokens in a single pass.
+
+    Each pattern is only run where it can match:
+
+    - Patterns with known prefixes (``SecretPatternConstants.SECRET_PREFIXES``) are matched at the
+      occurrences of their literals, which are found with a plain substring search.
+    - Patterns that need a long run of token characters (``SECRET_TOKEN_RUN_PATTERNS``) share one
+      ``bytes.translate`` pass that finds those runs, and only search around them.
+    - Patterns with a required literal (``SECRET_LITERALS``) are only searched on the lines that contain it.
+
+    Matches are the same as a ``finditer`` over the whole file for each pattern, as long as a match
+    is shorter than ``overlap``. Files are read in chunks of ``chunk_size`` that overlap by ``overlap``
+    bytes, so memory use does not depend on the file size. Files with a NUL byte in their first
+    ``binary_check_size`` bytes and files bigger than ``max_file_size`` are skipped.
+
+    :param patterns: Names of ``SecretPatternConstants.SECRET_PATTERNS``, or a dict of name to regex. Default is all.
+    :param chunk_size: Bytes read per chunk.
+    :param overlap: Bytes shared by two consecutive chunks; the maximum length of a match.
+    :param max_file_size: Skip files bigger than this. 0 or None scans every file.
+    :param binary_check_size: Bytes checked for a NUL byte. 0 or None disables the check.
+    :param archive_depth: How deep tar archives inside a tar archive are opened, e.g. the layers of an image.
+
+    Example:
+
+        .. code-block:: python
+
+            from pawnlib.output.secret_scanner import SecretScanner
+
+            scanner = SecretScanner(["aws_access_key", "github_pat"])
+            results = scanner.scan_directory("./src", exclude_patterns=["*.pyc", ".git"], workers=4)
+            # >> {'src/settings.py': [{'file_path': 'src/settings.py', 'type': 'aws_access_key', 'match': 'AKIA...',
+            #                          'description': 'AWS Access Key ID', 'line': 12, 'offset': 301}]}
+
+            with open("image.tar", "rb") as f:
+                results = scanner.scan_archive(f, source="my-app:latest")
+
+    """
+
+    def __init__(
+            self,
+            patterns: Union[List[str], Dict[str, str], None] = None,
+            chunk_size: int = 1024 * 1024,
+            overlap: int = 64 * 1024,
+            max_file_size: Optional[int] = 100 * 1024 * 1024,
+            binary_check_size: Optional[int] = 8192,
+            archive_depth: int = 1,
+    ):
+        if overlap < 1 or chunk_size <= overlap:
+            raise ValueError(f"chunk_size ({chunk_size}) must be bigger than overlap ({overlap}) and overlap must be positive")
+        if patterns is None or patterns == ["all"]:
+            patterns = list(SecretPatternConstants.SECRET_PATTERNS)
+        if not isinstance(patterns, dict):
+            patterns = {name: SecretPatternConstants.get_pattern(name) for name in patterns}
+
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+        self.max_file_size = max_file_size
+        self.binary_check_size = binary_check_size
+        self.archive_depth = archive_depth
+        self.descriptions = {}
+        self._specs = []
+        for name, pattern in patterns.items():
+            if not pattern:
+                raise ValueError(f"Unknown secret pattern '{name}'")
+            self.descriptions[name] = SecretPatternConstants.get_description(name)
+            if name in SecretPatternConstants.SECRET_PREFIXES and name in SecretPatternConstants.SECRET_PATTERNS:
+                kind, literals = "prefix", SecretPatternConstants.SECRET_PREFIXES[name]
+            elif name in SecretPatternConstants.SECRET_TOKEN_RUN_PATTERNS and name in SecretPatternConstants.SECRET_PATTERNS:
+                kind, literals = "token_run", ()
+            elif name in SecretPatternConstants.SECRET_LITERALS and name in SecretPatternConstants.SECRET_PATTERNS:
+                kind, literals = "literal", SecretPatternConstants.SECRET_LITERALS[name]
+            else:
+                kind, literals = "full", ()
+            self._specs.append((name, re.compile(pattern.encode()), kind, tuple(literal.encode() for literal in literals)))
+        self.stats = {}
+        self.reset_stats()
+
+    @property
+    def patterns(self) -> List[str]:
+        return [spec[0] for spec in self._specs]
+
+    def reset_stats(self):
+        self.stats = {"files": 0, "bytes": 0, "skipped_binary": 0, "skipped_size": 0, "errors": 0}
+
+    def _merge_stats(self, stats):
+        for key, value in stats.items():
+            self.stats[key] += value
+
+    def scan_bytes(self, data: bytes, source: str = "") -> List[dict]:
+        """
+        Scan a bytes object.
+
+        :param data: The content to scan.
+        :param source: Value of ``file_path`` in the findings.
+        :return: List of findings.
+        """
+        return self.scan_stream(io.BytesIO(data), source=source)
+
+    def scan_stream(self, stream, source: str = "") -> List[dict]:
+        """
+        Scan a binary stream chunk by chunk. Only ``stream.read(size)`` is used, so pipes and tar members work.
+
+        :param stream: A binary stream.
+        :param source: Value of ``file_path`` in the findings.
+        :return: List of findings ordered by offset.
+        """
+        findings = []
+        last_end = {}
+        buffer = b""
+        base = 0  # Offset of buffer[0] in the stream
+        start = 0  # Offset in the buffer where new matches may start
+        line = 1
+        first = True
+        while True:
+            data = stream.read(self.chunk_size)
+            if first:
+                first = False
+                if self.binary_check_size and b"\0" in data[:self.binary_check_size]:
+                    self.stats["skipped_binary"] += 1
+                    return findings
+                self.stats["files"] += 1
+            if data:
+                self.stats["bytes"] += len(data)
+                buffer += data
+                limit = len(buffer) - self.overlap
+                if limit <= start:
+                    continue
+            else:
+                limit = len(buffer)
+
+            line = self._scan_buffer(buffer, base, start, limit, last_end, line, source, findings)
+            if not data:
+                return findings
+
+            keep = max(limit - CONTEXT_SIZE, 0)
+            buffer = buffer[keep:]
+            base += keep
+            start = limit - keep
+
+    def _scan_buffer(self, buffer, base, start, limit, last_end, line, source, findings):
+        found = []
+        token_runs = None
+        for name, regex, kind, literals in self._specs:
+            pos = max(start, last_end.get(name, 0) - base)
+            if pos >= limit:
+                continue
+            if kind == "prefix":
+                matches = self._match_prefixes(buffer, regex, literals, pos, limit)
+            elif kind == "token_run":
+                if token_runs is None:
+                    token_runs = self._find_token_runs(buffer, start)
+                matches = self._match_token_runs(buffer, regex, token_runs, pos)
+            elif kind == "literal":
+                matches = self._match_literal_lines(buffer, regex, literals, pos)
+            else:
+                matches = regex.finditer(buffer, pos)
+
+            for match in matches:
+                if match.start() >= limit:
+                    break
+                found.append((match.start(), name, match))
+                last_end[name] = base + match.end()
+
+        found.sort(key=lambda item: item[0])
+        cursor = start
+        for offset, name, match in found:
+            line += buffer.count(b"\n", cursor, offset)
+            cursor = offset
+            findings.append({
+                "file_path": source,
+                "type": name,
+                "match": match.group().decode("utf-8", "replace"),
+                "description": self.descriptions[name],
+                "line": line,
+                "offset": base + offset,
+            })
+        return line + buffer.count(b"\n", cursor, limit)
+
+    @staticmethod
+    def _match_prefixes(buffer, regex, literals, pos, limit) -> Iterator[re.Match]:
+        positions = []
+        for literal in literals:
+            end = limit + len(literal) - 1
+            index = buffer.find(literal, pos, end)
+            while index >= 0:
+                positions.append(index)
+                index = buffer.find(literal, index + 1, end)
+        if len(literals) > 1:
+            positions.sort()
+
+        cursor = pos
+        for index in positions:
+            if index < cursor:
+                continue
+            match = regex.match(buffer, index)
+            if match:
+                cursor = max(match.end(), index + 1)
+                yield match
+
+    @staticmethod
+    def _match_literal_lines(buffer, regex, literals, pos) -> Iterator[re.Match]:
+        positions = []
+        for literal in literals:
+            index = buffer.find(literal, pos)
+            while index >= 0:
+                positions.append(index)
+                index = buffer.find(literal, index + 1)
+        if len(literals) > 1:
+            positions.sort()
+
+        cursor = pos
+        for index in positions:
+            if index < cursor:
+                continue
+            line_start = buffer.rfind(b"\n", 0, index) + 1
+            line_end = buffer.find(b"\n", index)
+            line_end = len(buffer) if line_end < 0 else line_end + 1
+            for match in regex.finditer(buffer, max(line_start, cursor), line_end):
+                cursor = max(match.end(), match.start() + 1)
+                yield match
+            cursor = max(cursor, line_end)
+
+    @staticmethod
+    def _find_token_runs(buffer, start) -> List[tuple]:
+        """
+        Return ``(start, end)`` windows around every run of at least ``TOKEN_RUN_LENGTH`` token characters.
+        A window ends one byte after the first non-token character that follows the tail, so neither a
+        match nor ``\\b`` is cut at the window end.
+        """
+        mapped = buffer.translate(_TOKEN_RUN_TABLE)
+        windows = []
+        index = mapped.find(_TOKEN_RUN_NEEDLE, start)
+        while index >= 0:
+            run_start = max(mapped.rfind(b".", start, index) + 1, start)
+            run_end = mapped.find(b".", index + TOKEN_RUN_LENGTH)
+            if run_end < 0:
+                windows.append((run_start, len(mapped)))
+                break
+            window_end = mapped.find(b".", run_end + TOKEN_RUN_TAIL)
+            windows.append((run_start, len(mapped) if window_end < 0 else window_end + 1))
+            index = mapped.find(_TOKEN_RUN_NEEDLE, run_end)
+        return windows
+
+    @staticmethod
+    def _match_token_runs(buffer, regex, windows, pos) -> Iterator[re.Match]:
+        for window_start, window_end in windows:
+            if window_end <= pos:
+                continue
+            for match in regex.finditer(buffer, max(window_start, pos), window_end):
+                pos = max(match.end(), match.start() + 1)
+                yield match
+
+    def scan_path(self, path: str) -> List[dict]:
+        """
+        Scan one file. Unreadable, binary and oversized files return no findings and are counted in ``stats``.
+
+        :param path: Path of the file.
+        :return: List of findings.
+        """
+        try:
+            if self.max_file_size and os.stat(path).st_size > self.max_file_size:
+                self.stats["skipped_size"] += 1
+                return []
+            with open(path, "rb") as f:
+                return self.scan_stream(f, source=str(path))
+        except OSError as e:
+            self.stats["errors"] += 1
+            logger.warning(f"Failed to read {path}: {e}")
+            return []
+
+    @staticmethod
+    def iter_files(directory: str, exclude_patterns: Optional[List[str]] = None) -> Iterator[str]:
+        """
+        Yield the files under ``directory`` without listing the whole tree first.
+        A file or directory is excluded when its path relative to ``directory`` matches one of ``exclude_patterns``.
+
+        :param directory: Directory to walk.
+        :param exclude_patterns: fnmatch patterns, e.g. ``["*.pyc", ".git"]``.
+        """
+        exclude_patterns = exclude_patterns or []
+
+        def is_excluded(root, name):
+            relative_path = os.path.relpath(os.path.join(root, name), directory).replace(os.sep, "/")
+            return any(fnmatch.fnmatch(relative_path, pattern) for pattern in exclude_patterns)
+
+        for root, directories, files in os.walk(directory):
+            directories[:] = [name for name in directories if not is_excluded(root, name)]
+            for name in files:
+                if not is_excluded(root, name):
+                    yield os.path.join(root, name)
+
+    def scan_paths(self, paths: Iterable[str], workers: Optional[int] = None, batch_size: int = 32, max_pending: Optional[int] = None) -> Dict[str, List[dict]]:
+        """
+        Scan files on a process pool. Paths are consumed lazily and at most ``max_pending`` batches are queued at once.
+
+        :param paths: Iterable of file paths.
+        :param workers: Number of worker processes. Default is the number of CPUs; 1 scans in this process.
+        :param batch_size: Number of files sent to a worker at once.
+        :param max_pending: Maximum number of batches queued. Default is ``workers * 4``.
+        :return: Dict of file path to findings, only for files with findings.
+        """
+        workers = workers or os.cpu_count() or 1
+        results = {}
+
+        def collect(file_findings):
+            if file_findings:
+                results[file_findings[0]["file_path"]] = file_findings
+
+        if workers <= 1:
+            for path in paths:
+                collect(self.scan_path(path))
+            return results
+
+        max_pending = max_pending or workers * 4
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self,)) as executor:
+            pending = set()
+            for batch in _batched(paths, batch_size):
+                pending.add(executor.submit(_scan_batch, batch))
+                if len(pending) < max_pending:
+                    continue
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    batch_findings, stats = future.result()
+                    self._merge_stats(stats)
+                    for file_findings in batch_findings:
+                        collect(file_findings)
+
+            for future in pending:
+                batch_findings, stats = future.result()
+                self._merge_stats(stats)
+                for file_findings in batch_findings:
+                    collect(file_findings)
+        return results
+
+    def scan_directory(self, directory: str, exclude_patterns: Optional[List[str]] = None, workers: Optional[int] = None, **kwargs) -> Dict[str, List[dict]]:
+        """
+        Scan every file under a directory, see :meth:`iter_files` and :meth:`scan_paths`.
+
+        :param directory: Directory to scan.
+        :param exclude_patterns: fnmatch patterns of paths to skip.
+        :param workers: Number of worker processes.
+        :return: Dict of file path to findings, only for files with findings.
+        """
+        if not os.path.isdir(directory):
+            logger.error(f"Directory '{directory}' does not exist.")
+            return {}
+        return self.scan_paths(self.iter_files(directory, exclude_patterns), workers=workers, **kwargs)
+
+    def scan_archive(self, fileobj, source: str = "") -> Dict[str, List[dict]]:
+        """
+        Scan a tar archive as a stream, member by member, without extracting it.
+        Members that are archives themselves (e.g. the layers of ``docker image save``) are scanned the
+        same way, up to ``archive_depth``. Whiteout files of image layers are skipped.
+
+        :param fileobj: A binary stream of a tar archive, optionally gzip, bz2 or xz compressed.
+        :param source: Prefix of the locations, e.g. the image name.
+        :return: Dict of location (``source::member[::member]``) to findings.
+        """
+        results = {}
+        self._scan_archive(fileobj, source, 0, results)
+        return results
+
+    def _scan_archive(self, fileobj, source, depth, results):
+        with tarfile.open(fileobj=fileobj, mode="r|*") as archive:
+            for member in archive:
+                if not member.isfile() or os.path.basename(member.name).startswith(".wh."):
+                    continue
+                location = f"{source}::{member.name}" if source else member.name
+                stream = archive.extractfile(member)
+                head = stream.read(TAR_BLOCK_SIZE)
+                if depth < self.archive_depth and is_archive_header(head):
+                    try:
+                        self._scan_archive(PeekedStream(head, stream), location, depth + 1, results)
+                    except tarfile.TarError as e:
+                        self.stats["errors"] += 1
+                        logger.warning(f"Failed to read archive {location}: {e}")
+                    continue
+                if self.max_file_size and member.size > self.max_file_size:
+                    self.stats["skipped_size"] += 1
+                    continue
+                findings = self.scan_stream(PeekedStream(head, stream), source=location)
+                if findings:
+                    results[location] = findings
@@ -38,3 +38,13 @@ from .server import (
     MemoryStatus,
     ProcessMonitor
 )
+
+from .diskio import (
+    DiskIOJob,
+)
+
+from .sampler import (
+    ProcSampler,
+    ProcSnapshot,
+    ProcessTable,
+)
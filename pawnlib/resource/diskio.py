@@ -0,0 +1,362 @@
+import os
+import json
+import math
+import mmap
+import time
+import errno
+import fcntl
+import random
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from pawnlib.config import pawn
+
+IO_MODES = ("read", "write", "randread", "randwrite", "rw", "randrw")
+DIRECT_ALIGNMENT = 4096
+LAYOUT_BLOCK_SIZE = 1024 * 1024
+PERCENTILES = (50, 95, 99, 99.9)
+
+
+class LatencyHistogram:
+    """
+    Fixed-size log-linear histogram in the style of HdrHistogram.
+
+    Values below ``2 ** (sub_bucket_bits + 1)`` are counted exactly. Bigger values share a bucket with values
+    that differ by less than ``2 ** -sub_bucket_bits`` (0.8% with the default 7 bits), so recording is O(1)
+    and the memory does not grow with the number of samples.
+
+    :param sub_bucket_bits: Precision of the buckets.
+
+    Example:
+
+        .. code-block:: python
+
+            from pawnlib.resource.diskio import LatencyHistogram
+
+            histogram = LatencyHistogram()
+            for latency_ns in (120000, 95000, 2300000):
+                histogram.record(latency_ns)
+            histogram.percentile(99)
+            # >> 2300000
+    """
+
+    def __init__(self, sub_bucket_bits: int = 7):
+        self.sub_bucket_bits = sub_bucket_bits
+        self.counts = array("Q", bytes(8 * ((66 - sub_bucket_bits) << sub_bucket_bits)))
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def bucket_index(self, value: int) -> int:
+        shift = max(value.bit_length() - self.sub_bucket_bits - 1, 0)
+        return (shift << self.sub_bucket_bits) + (value >> shift)
+
+    def bucket_upper_bound(self, index: int) -> int:
+        shift = max((index >> self.sub_bucket_bits) - 1, 0)
+        return ((index - (shift << self.sub_bucket_bits) + 1) << shift) - 1
+
+    def record(self, value: int):
+        """
+        Record one value, e.g. a latency in nanoseconds. Negative values are counted as 0.
+
+        :param value: Integer value.
+        """
+        value = max(int(value), 0)
+        self.counts[self.bucket_index(value)] += 1
+        if not self.count or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    def merge(self, other: "LatencyHistogram"):
+        """
+        Add the values of another histogram with the same precision.
+
+        :param other: LatencyHistogram
+        """
+        if other.sub_bucket_bits != self.sub_bucket_bits:
+            raise ValueError("Cannot merge histograms with different sub_bucket_bits")
+        if not other.count:
+            return
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+        self.min = other.min if not self.count else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    def percentile(self, percentile: float) -> int:
+        """
+        Return the highest value equivalent to the given percentile, or 0 if nothing was recorded.
+
+        :param percentile: Percentile from 0 to 100.
+        """
+        if not self.count:
+            return 0
+        target = max(math.ceil(percentile / 100 * self.count), 1)
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self.bucket_upper_bound(index), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def to_dict(self, scale: float = 1.0, decimal_places: int = 2) -> dict:
+        """
+        Return min, mean, max and the percentiles of ``PERCENTILES``, each divided by ``scale``.
+
+        :param scale: Divisor of the values, e.g. 1000 for nanoseconds to microseconds.
+        :param decimal_places: Number of decimal places.
+        """
+        result = {
+            "min": round(self.min / scale, decimal_places),
+            "mean": round(self.mean / scale, decimal_places),
+            "max": round(self.max / scale, decimal_places),
+        }
+        for percentile in PERCENTILES:
+            result[f"p{percentile:g}"] = round(self.percentile(percentile) / scale, decimal_places)
+        return result
+
+
+class DiskIOJob:
+    """
+    A fio-style disk benchmark job.
+
+    The job runs for ``runtime`` seconds on a file that is preallocated and filled once, with ``queue_depth``
+    threads that each keep one I/O in flight. Every I/O uses a page-aligned buffer and ``O_DIRECT``, so reads
+    come from the disk and not from the page cache. Random modes pick a uniformly random block of the whole
+    file for every I/O; sequential modes give each thread its own region of the file.
+
+    When the filesystem rejects ``O_DIRECT`` (e.g. tmpfs) the job falls back to buffered I/O and reports
+    ``"direct": false``.
+
+    :param file_path: Path of the test file. An existing file of at least ``file_size_mb`` is reused.
+    :param file_size_mb: Size of the test file in MB.
+    :param rw: One of ``IO_MODES``: read, write, randread, randwrite, rw or randrw.
+    :param block_size_kb: Size of each I/O in KB. A multiple of 4 with ``direct``.
+    :param queue_depth: Number of I/Os in flight, one per thread.
+    :param rwmixread: Percentage of reads for the rw and randrw modes.
+    :param runtime: Duration of the job in seconds.
+    :param io_limit_mb: Stop after this many MB were transferred, even if ``runtime`` did not pass.
+    :param direct: Use ``O_DIRECT``.
+    :param sync: Open the file with ``O_DSYNC``, so every write waits for stable storage.
+    :param name: Name of the job in the results. Default is ``rw``.
+    :param seed: Seed of the random offsets.
+    :param console: Console object for logging.
+
+    Example:
+
+        .. code-block:: python
+
+            from pawnlib.resource.diskio import DiskIOJob
+
+            job = DiskIOJob("/data/testfile", file_size_mb=4096, rw="randwrite", block_size_kb=4, queue_depth=16, runtime=30)
+            result = job.run()
+            # >> {'name': 'randwrite', ..., 'write': {'ios': 215034, 'iops': 7167.8, 'bandwidth_mb': 28.0,
+            #        'latency_us': {'min': 310.0, 'mean': 2231.4, 'max': 41983.0, 'p50': 1892.0, 'p95': 4215.0, 'p99': 8159.0, 'p99.9': 19455.0}}}
+            print(job.to_json())
+            job.cleanup()
+    """
+
+    def __init__(self, file_path: str, file_size_mb: int = 1024, rw: str = "randread", block_size_kb: int = 4, queue_depth: int = 1,
+                 rwmixread: int = 70, runtime: float = 10, io_limit_mb: Optional[int] = None, direct: bool = True, sync: bool = False,
+                 name: Optional[str] = None, seed: Optional[int] = None, console=None):
+        if rw not in IO_MODES:
+            raise ValueError(f"Invalid rw '{rw}', expected one of {IO_MODES}")
+        if not 0 <= rwmixread <= 100:
+            raise ValueError(f"rwmixread must be between 0 and 100, got {rwmixread}")
+        if queue_depth < 1 or block_size_kb < 1:
+            raise ValueError("queue_depth and block_size_kb must be positive")
+        if direct and (block_size_kb * 1024) % DIRECT_ALIGNMENT:
+            raise ValueError(f"block_size_kb must be a multiple of {DIRECT_ALIGNMENT // 1024} with direct I/O")
+
+        self.file_path = file_path
+        self.file_size = file_size_mb * 1024 * 1024
+        self.rw = rw
+        self.block_size = block_size_kb * 1024
+        self.blocks = self.file_size // self.block_size
+        if self.blocks < queue_depth:
+            raise ValueError(f"The file of {file_size_mb}MB has fewer blocks than queue_depth ({queue_depth})")
+        self.queue_depth = queue_depth
+        self.rwmixread = rwmixread
+        if rw in ("read", "randread"):
+            self.rwmixread = 100
+        elif rw in ("write", "randwrite"):
+            self.rwmixread = 0
+        self.runtime = runtime
+        self.io_limit = io_limit_mb * 1024 * 1024 if io_limit_mb else None
+        self.direct = direct
+        self.sync = sync
+        self.name = name or rw
+        self.seed = random.randrange(2 ** 32) if seed is None else seed
+        self.console = console or pawn.console
+        self.results = {}
+
+    @property
+    def is_random(self) -> bool:
+        return self.rw.startswith("rand")
+
+    def prepare(self):
+        """
+        Preallocate the test file and fill it with random data, unless it already has the size.
+        Unwritten extents would be read as zeros without touching the disk.
+        """
+        if os.path.exists(self.file_path) and os.path.getsize(self.file_path) >= self.file_size:
+            return
+        data = os.urandom(LAYOUT_BLOCK_SIZE)
+        fd = os.open(self.file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            if hasattr(os, "posix_fallocate"):
+                try:
+                    os.posix_fallocate(fd, 0, self.file_size)
+                except OSError:
+                    pass
+            written = 0
+            while written < self.file_size:
+                written += os.write(fd, data[:min(LAYOUT_BLOCK_SIZE, self.file_size - written)])
+            os.fsync(fd)
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+    def open(self):
+        """
+        Open the test file for the job and return ``(fd, direct)``, where ``direct`` tells if ``O_DIRECT`` is in effect.
+        """
+        flags = os.O_RDWR
+        if self.sync:
+            flags |= getattr(os, "O_DSYNC", os.O_SYNC)
+        if self.direct and hasattr(os, "O_DIRECT"):
+            try:
+                return os.open(self.file_path, flags | os.O_DIRECT), True
+            except OSError as e:
+                if e.errno != errno.EINVAL:
+                    raise
+                self.console.log(f"[yellow]O_DIRECT is not supported for {self.file_path}, falling back to buffered I/O")
+        fd = os.open(self.file_path, flags)
+        if self.direct and hasattr(fcntl, "F_NOCACHE"):
+            fcntl.fcntl(fd, fcntl.F_NOCACHE, 1)
+            return fd, True
+        return fd, False
+
+    def _worker(self, index, fd, deadline, io_budget):
+        rng = random.Random(self.seed + index)
+        buffer = mmap.mmap(-1, self.block_size)
+        buffer.write(os.urandom(self.block_size))
+        read_histogram = LatencyHistogram()
+        write_histogram = LatencyHistogram()
+        region = self.blocks // self.queue_depth
+        region_start = index * region
+        block_size = self.block_size
+        blocks = self.blocks
+        is_random = self.is_random
+        rwmixread = self.rwmixread
+        clock = time.perf_counter_ns
+        preadv = os.preadv
+        pwrite = os.pwrite
+
+        ios = 0
+        now = clock()
+        try:
+            while now < deadline and (io_budget is None or ios < io_budget):
+                if is_random:
+                    offset = rng.randrange(blocks) * block_size
+                else:
+                    offset = (region_start + ios % region) * block_size
+                if rwmixread == 100 or (rwmixread and rng.random() * 100 < rwmixread):
+                    start = clock()
+                    preadv(fd, [buffer], offset)
+                    now = clock()
+                    read_histogram.record(now - start)
+                else:
+                    start = clock()
+                    pwrite(fd, buffer, offset)
+                    now = clock()
+                    write_histogram.record(now - start)
+                ios += 1
+        finally:
+            buffer.close()
+        return read_histogram, write_histogram
+
+    def run(self) -> dict:
+        """
+        Prepare the file, run the job and return the results.
+
+        :return: Dict with the job settings and, for ``read`` and ``write``, the number of I/Os, IOPS,
+                 bandwidth in MB/s and the latency percentiles in microseconds.
+        """
+        self.prepare()
+        fd, direct = self.open()
+        io_budget = None
+        if self.io_limit:
+            io_budget = max(self.io_limit // self.block_size // self.queue_depth, 1)
+        try:
+            started = time.perf_counter_ns()
+            deadline = started + int(self.runtime * 1e9)
+            with ThreadPoolExecutor(max_workers=self.queue_depth) as executor:
+                futures = [executor.submit(self._worker, index, fd, deadline, io_budget) for index in range(self.queue_depth)]
+                histograms = [future.result() for future in futures]
+            elapsed = (time.perf_counter_ns() - started) / 1e9
+        finally:
+            os.close(fd)
+
+        read_histogram, write_histogram = LatencyHistogram(), LatencyHistogram()
+        for read, write in histograms:
+            read_histogram.merge(read)
+            write_histogram.merge(write)
+
+        self.results = {
+            "name": self.name,
+            "rw": self.rw,
+            "block_size_kb": self.block_size // 1024,
+            "queue_depth": self.queue_depth,
+            "rwmixread": self.rwmixread,
+            "direct": direct,
+            "sync": self.sync,
+            "file_size_mb": self.file_size // 1024 // 1024,
+            "runtime": round(elapsed, 3),
+            "read": self._summarize(read_histogram, elapsed),
+            "write": self._summarize(write_histogram, elapsed),
+        }
+        return self.results
+
+    def _summarize(self, histogram, elapsed):
+        total_bytes = histogram.count * self.block_size
+        return {
+            "ios": histogram.count,
+            "bytes": total_bytes,
+            "iops": round(histogram.count / elapsed, 1) if elapsed else 0,
+            "bandwidth_mb": round(total_bytes / 1024 / 1024 / elapsed, 2) if elapsed else 0,
+            "latency_us": histogram.to_dict(scale=1000),
+        }
+
+    def summary(self) -> str:
+        """Return a one-line summary of the results, like the status line of fio."""
+        parts = [f"{self.name}: bs={self.block_size // 1024}k qd={self.queue_depth} direct={self.results.get('direct')}"]
+        for direction in ("read", "write"):
+            stats = self.results.get(direction)
+            if stats and stats["ios"]:
+                latency = stats["latency_us"]
+                parts.append(
+                    f"{direction} {stats['iops']:,} IOPS {stats['bandwidth_mb']} MB/s "
+                    f"lat(us) p50={latency['p50']} p99={latency['p99']} p99.9={latency['p99.9']}"
+                )
+        return ", ".join(parts)
+
+    def to_json(self, indent: int = 4) -> str:
+        return json.dumps(self.results, indent=indent)
+
+    def cleanup(self):
+        if os.path.exists(self.file_path):
+            os.remove(self.file_path)
+
@@ -1,8 +1,7 @@
-from pawnlib.output.file import Tail, is_file
+from pawnlib.output.file import Tail, PatternMatcher, is_file
 from pawnlib.utils.notify import send_slack
 from datetime import datetime
 from pawnlib.typing.constants import const
-import re
 import platform
 import subprocess
 from typing import List, Union, Optional
@@ -78,7 +77,6 @@ class SSHMonitor:
                 "New session",
                 "session opened"
             ]
-            self.filters = self.failed_patterns + self.success_patterns + ["systemd-logind"]
         else:  # centos 또는 기타
             self.failed_patterns = [
                 "Failed",
@@ -88,35 +86,34 @@ class SSHMonitor:
             self.success_patterns = [
                 "Accepted"
             ]
-            self.filters = ["Failed", "Accepted", "Invalid"]
+        # 로그에 표시되는 필터 (matcher의 분류 패턴과 동일)
+        self.filters = self.failed_patterns + self.success_patterns
 
-    def extract_ip(self, line):
-        """로그 라인에서 IP 주소를 추출합니다."""
-        match = re.search(const.PATTERN_IP_ADDRESS_IN_LOG, line)
-        return match.group(0) if match else None
-
-    def extract_user(self, line):
-        """로그 라인에서 사용자명을 추출합니다."""
-        if self.os_type == "ubuntu":
-            # Ubuntu systemd-logind 패턴: "New session c56 of user ubuntu"
-            user_match = re.search(r"of user (\w+)", line)
-            if user_match:
-                return user_match.group(1)
-        
-        # 공통 SSH 로그 패턴들
-        patterns = [
+        # 공통 SSH 로그 사용자 패턴 (우선순위 순)
+        self.user_patterns = [
             r"for (\w+) from",  # "Failed password for user from IP"
             r"for invalid user (\w+) from",  # "Failed password for invalid user admin from IP"
             r"user=(\w+)",  # "authentication failure ... user=root"
             r"user (\w+)",  # "Accepted password for user ubuntu"
         ]
-        
-        for pattern in patterns:
-            user_match = re.search(pattern, line)
-            if user_match:
-                return user_match.group(1)
-                
-        return "unknown"
+        if self.os_type == "ubuntu":
+            # Ubuntu systemd-logind 패턴: "New session c56 of user ubuntu"
+            self.user_patterns.insert(0, r"of user (\w+)")
+
+        # 분류와 IP/사용자 추출을 한 번의 스캔으로 처리
+        self.matcher = PatternMatcher(
+            {"failed": self.failed_patterns, "success": self.success_patterns},
+            fields={"ip": const.PATTERN_IP_ADDRESS_IN_LOG, "user": self.user_patterns},
+            literal=True
+        )
+
+    def extract_ip(self, line):
+        """로그 라인에서 IP 주소를 추출합니다."""
+        return self.matcher.extract(line)["ip"]
+
+    def extract_user(self, line):
+        """로그 라인에서 사용자명을 추출합니다."""
+        return self.matcher.extract(line)["user"] or "unknown"
 
     def increment_attempts(self, ip, status):
         """Increments the failed or success count for a given IP address."""
@@ -143,10 +140,12 @@ class SSHMonitor:
         """로그인 성공 패턴을 확인합니다."""
         return any(pattern in line for pattern in self.success_patterns)
 
-    async def create_alert_message(self, line, status):
+    async def create_alert_message(self, line, status, fields=None):
         """Slack 알림 메시지를 생성하고 전송합니다."""
-        ip = self.extract_ip(line)
-        user = self.extract_user(line)
+        if fields is None:
+            fields = self.matcher.extract(line)
+        ip = fields["ip"]
+        user = fields["user"] or "unknown"
         
         # IP가 없는 경우 (Ubuntu systemd-logind 로그 등) 사용자 기반으로 추적
         tracking_key = ip if ip else user
@@ -192,10 +191,15 @@ class SSHMonitor:
     #         await self.create_alert_message(line, status="success")
     async def process_line(self, line):
         """로그 라인을 처리하고 필요시 알림을 전송합니다."""
-        if self._is_failed_login(line) and self.should_alert("failed"):
-            await self.create_alert_message(line, status="failed")
-        elif self._is_successful_login(line) and self.should_alert("success"):
-            await self.create_alert_message(line, status="success")
+        result = self.matcher.match_all(line)
+        if result is None:
+            return
+        # A line can match both categories; when the failed alert is suppressed, fall through to success
+        categories, fields = result
+        for status in categories:
+            if self.should_alert(status):
+                await self.create_alert_message(line, status=status, fields=fields)
+                return
 
     #
     # async def monitor_file(self, log_file):
@@ -214,10 +218,13 @@ class SSHMonitor:
     #     tasks = [self.monitor_file(log_file) for log_file in self.log_file_path]
     #     await asyncio.gather(*tasks)
 
+    async def process_lines(self, lines):
+        """Tail이 한 번에 읽은 로그 라인들을 처리합니다."""
+        for line in lines:
+            await self.process_line(line)
+
     async def monitor_ssh(self):
         """비동기 SSH 로그 모니터링을 수행합니다."""
-        async def event_handler(line):
-            await self.process_line(line)
 
         # 파일 존재 확인
         for _file in self.log_file_path:
@@ -226,6 +233,8 @@ class SSHMonitor:
 
         self.logger.info(f"Monitoring {self.os_type.upper()} logs with filters: {self.filters}")
         
-        tail = Tail(self.log_file_path, self.filters, event_handler, async_mode=True, logger=self.logger, verbose=self.verbose)
+        # Tail does not filter, so match_all in process_line is the only scan of each line.
+        # The lines of each read arrive in one batch instead of one callback per line.
+        tail = Tail(self.log_file_path, None, self.process_lines, async_mode=True, batch=True, logger=self.logger, verbose=self.verbose)
         await tail.follow_async()
 
@@ -1,10 +1,18 @@
 import re
+import os
+import errno
+import random
+import struct
+import math
+import heapq
+import operator
+from array import array
 from pawnlib.config.globalconfig import pawnlib_config as pawn
 import socket
 import time
 import asyncio
 import requests
-from typing import Dict, Optional, Union
+from typing import Callable, Dict, Iterable, Iterator, Optional, Union
 from concurrent.futures import ThreadPoolExecutor
 from timeit import default_timer
 from pawnlib.utils import http, timing
@@ -44,10 +52,181 @@ _DEFAULT_IP_SERVICES: List[str] = [
 
 prev_getaddrinfo = socket.getaddrinfo
 
+class RateRing:
+    """
+    Fixed-size ring of the most recent rates with an O(1) running average.
+
+    :param size: Number of rates to keep.
+
+    Example:
+
+        .. code-block:: python
+
+            ring = RateRing(size=3)
+            for rate in (1, 2, 3, 4):
+                ring.append(rate)
+            ring.average
+            # >> 3.0
+
+    """
+
+    __slots__ = ("values", "size", "index", "count", "total")
+
+    def __init__(self, size: int = 200):
+        if size < 1:
+            raise ValueError(f"size must be greater than 0, got {size}")
+        self.values = array("d", bytes(8 * size))
+        self.size = size
+        self.index = 0
+        self.count = 0
+        self.total = 0.0
+
+    def append(self, value: float):
+        if self.count == self.size:
+            self.total -= self.values[self.index]
+        else:
+            self.count += 1
+        self.values[self.index] = value
+        self.total += value
+        self.index += 1
+        if self.index == self.size:
+            self.index = 0
+            # Drop the floating point drift of the running total once per lap
+            self.total = math.fsum(self.values)
+
+    @property
+    def average(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def __len__(self):
+        return self.count
+
+
+class ProcNetCounters:
+    """
+    Aggregates the cumulative per-process byte counters of :class:`ProcNetMonitor` into rates.
+
+    Each :meth:`update` receives one row per pid, ``(pid, comm, tcp_sent, tcp_recv, udp_sent, udp_recv)``,
+    as read in bulk from the eBPF map. The rows are grouped by pid or name, the rates are the deltas
+    since the previous update and the averages are kept in a :class:`RateRing` per counter.
+
+    :param group_by: How to group processes ("pid" or "name").
+    :param proc_filter: List of process names to keep.
+    :param history_size: Number of rates used for the averages.
+
+    Example:
+
+        .. code-block:: python
+
+            counters = ProcNetCounters()
+            counters.update([(1234, "nginx", 1000, 2000, 0, 0)], now=0)
+            counters.update([(1234, "nginx", 3000, 2000, 0, 0)], now=1)
+            counters.top(1)
+            # >> [{'pid': 1234, 'comm': 'nginx', 'bytes_sent': 3000, 'tcp_sent_rate': 2000.0, ...}]
+
+    """
+
+    COLUMNS = ("tcp_sent", "tcp_recv", "udp_sent", "udp_recv")
+    RATE_KEYS = tuple(f"{column}_rate" for column in COLUMNS)
+    AVERAGE_KEYS = ("tcp_avg_sent_rate", "tcp_avg_recv_rate", "udp_avg_sent_rate", "udp_avg_recv_rate")
+
+    def __init__(self, group_by: str = "pid", proc_filter: Optional[List[str]] = None, history_size: int = 200):
+        self.group_by = group_by
+        self.proc_filter = set(proc_filter) if proc_filter else None
+        self.history_size = history_size
+        self.process_network: Dict[Union[int, str], dict] = {}
+        self.previous_counts: Dict[Union[int, str], tuple] = {}
+        self.rate_history: Dict[Union[int, str], Tuple[RateRing, ...]] = {}
+        self.last_update_time = None
+        self.lock = threading.Lock()
+
+    def _new_info(self, pid: int, comm: str) -> dict:
+        info = {"pid": pid, "comm": comm, "bytes_sent": 0, "bytes_recv": 0, "send_rate": 0.0, "recv_rate": 0.0}
+        for column, rate_key, average_key in zip(self.COLUMNS, self.RATE_KEYS, self.AVERAGE_KEYS):
+            info[column] = 0
+            info[rate_key] = 0.0
+            info[average_key] = 0.0
+        return info
+
+    def update(self, rows, now: float = None):
+        """
+        Replaces the counters with ``rows`` and updates the rates.
+
+        :param rows: Iterable of ``(pid, comm, tcp_sent, tcp_recv, udp_sent, udp_recv)`` cumulative counters.
+        :param now: Monotonic time of the rows.
+        """
+        now = time.monotonic() if now is None else now
+        totals = {}
+        names = {}
+        for pid, comm, *counters in rows:
+            if self.proc_filter and comm not in self.proc_filter:
+                continue
+            group = comm if self.group_by == "name" else pid
+            current = totals.get(group)
+            if current is None:
+                totals[group] = counters
+                names[group] = (pid, comm)
+            else:
+                totals[group] = list(map(operator.add, current, counters))
+
+        elapsed = now - self.last_update_time if self.last_update_time is not None else 0.0
+        with self.lock:
+            for group in self.process_network.keys() - totals.keys():
+                del self.process_network[group]
+                self.previous_counts.pop(group, None)
+                self.rate_history.pop(group, None)
+
+            for group, counters in totals.items():
+                info = self.process_network.get(group)
+                if info is None:
+                    info = self.process_network[group] = self._new_info(*names[group])
+                else:
+                    info["comm"] = names[group][1]
+                tcp_sent, tcp_recv, udp_sent, udp_recv = counters
+                info.update(zip(self.COLUMNS, counters))
+                info["bytes_sent"] = tcp_sent + udp_sent
+                info["bytes_recv"] = tcp_recv + udp_recv
+
+                previous = self.previous_counts.get(group)
+                if previous is not None and elapsed > 0:
+                    rings = self.rate_history.get(group)
+                    if rings is None:
+                        rings = self.rate_history[group] = tuple(RateRing(self.history_size) for _ in self.COLUMNS)
+                    # A pid that exited and came back restarts its counters from zero
+                    rates = [max(value, 0) / elapsed for value in map(operator.sub, counters, previous)]
+                    for rate, ring, rate_key, average_key in zip(rates, rings, self.RATE_KEYS, self.AVERAGE_KEYS):
+                        ring.append(rate)
+                        info[rate_key] = rate
+                        info[average_key] = ring.average
+                    info["send_rate"] = rates[0] + rates[2]
+                    info["recv_rate"] = rates[1] + rates[3]
+                self.previous_counts[group] = tuple(counters)
+            self.last_update_time = now
+
+    def snapshot(self) -> Dict[Union[int, str], dict]:
+        """
+        Returns a copy of the current table that is safe to hand to another thread.
+        """
+        with self.lock:
+            return {group: dict(info) for group, info in self.process_network.items()}
+
+    def top(self, n: int) -> List[dict]:
+        """
+        Returns copies of the top ``n`` groups by ``bytes_sent + bytes_recv``.
+        """
+        with self.lock:
+            entries = heapq.nlargest(n, self.process_network.values(), key=lambda info: info["bytes_sent"] + info["bytes_recv"])
+            return [dict(info) for info in entries]
+
+
 class ProcNetMonitor:
     """
     ProcNetMonitor monitors network usage of processes using eBPF.
 
+    The bytes are summed per pid and protocol inside a BPF hash map, which is read in bulk once per refresh,
+    so the cost in Python does not depend on the packet rate. Per-packet perf events are only submitted
+    when an ``event_callback`` is given.
+
     :param top_n: The top N processes to display in the table.
     :param refresh_rate: The data refresh rate (refreshes per second).
     :param group_by: How to group processes ("pid" or "name").
@@ -56,9 +235,11 @@ class ProcNetMonitor:
     :param pid_filter: List of PIDs to monitor. Only these PIDs will be tracked.
     :param proc_filter: List of process names to monitor. Only these processes will be tracked.
     :param min_bytes_threshold: Minimum number of bytes to consider for monitoring.
-    :param callback: A user-defined function to be called when data is updated.
+    :param callback: A user-defined function called with a snapshot of the table on every refresh.
     :param exit_signal: A string used as the termination signal. When this string is detected,
                         the monitoring process will stop and the program will exit. Default is "EXIT".
+    :param event_callback: A user-defined function called with every send/recv event (pid, comm, bytes, event_type).
+    :param history_size: Number of refreshes used for the average rates.
 
     Example:
 
@@ -97,6 +278,10 @@ class ProcNetMonitor:
         monitor = ProcNetMonitor(refresh_rate=1, exit_signal="EXIT", callback=handle_exit)
         monitor.run()
 
+        # Example 5: Receive every event as well
+        monitor = ProcNetMonitor(event_callback=lambda event: print(event["pid"], event["bytes"]))
+        monitor.run()
+
     """
 
     EVENT_TCP_SEND = 1
@@ -104,9 +289,12 @@ class ProcNetMonitor:
     EVENT_UDP_SEND = 3
     EVENT_UDP_RECV = 4
 
+    MAX_PROCESSES = 10240
+    PRUNE_INTERVAL = 10
+
     def __init__(self, top_n=10, refresh_rate=2, group_by="pid", unit="Mbps",
                  protocols=None, pid_filter=None, proc_filter=None, min_bytes_threshold=0, callback=None,
-                 exit_signal="EXIT"
+                 exit_signal="EXIT", event_callback=None, history_size=200
                  ):
         """
         Initialize the ProcNetMonitor class.
@@ -119,9 +307,11 @@ class ProcNetMonitor:
         :param pid_filter: List of PIDs to monitor. Only these PIDs will be tracked.
         :param proc_filter: List of process names to monitor. Only these processes will be tracked.
         :param min_bytes_threshold: Minimum number of bytes to consider for monitoring.
-        :param callback: A user-defined function to be called when data is updated.
+        :param callback: A user-defined function called with a snapshot of the table on every refresh.
         :param exit_signal: A string used as the termination signal. When this string is detected,
                             the monitoring process will stop and the program will exit. Default is "EXIT".
+        :param event_callback: A user-defined function called with every send/recv event.
+        :param history_size: Number of refreshes used for the average rates.
         """
 
         if not BPF:
@@ -136,13 +326,16 @@ class ProcNetMonitor:
         self.proc_filter = proc_filter  # Monitor specific process names only
         self.min_bytes_threshold = min_bytes_threshold  # Minimum bytes threshold
         self.callback = callback  # User-defined callback function
+        self.event_callback = event_callback
         self.exit_signal = exit_signal
         self.is_running = True
-        self.process_network = {}
-        self.previous_counts = {}
-        self.last_update_time = time.time()
+        self.counters = ProcNetCounters(group_by=group_by, proc_filter=proc_filter, history_size=history_size)
+        self.process_network = self.counters.process_network
         self.bpf = None
         self.console = pawn.console
+        self._batch_lookup = True
+        self._last_prune = time.monotonic()
+        self._comm_cache: Dict[bytes, str] = {}
 
         self.exit_event = threading.Event()  # Event to signal exit
         self.callback_queue = queue.Queue()  # Queue for callback functions
@@ -151,6 +344,10 @@ class ProcNetMonitor:
         self._initialize_bcc()
         self.setup_signal_handlers()
 
+    @property
+    def last_update_time(self):
+        return self.counters.last_update_time
+
     def setup_signal_handlers(self):
         """
         Set up signal handlers to perform cleanup on script termination.
@@ -163,7 +360,8 @@ class ProcNetMonitor:
         Initialize the eBPF program.
         """
         try:
-            self.bpf = BPF(text=self._get_bpf_program())
+            cflags = ["-DDETAIL_EVENTS"] if self.event_callback else []
+            self.bpf = BPF(text=self._get_bpf_program(), cflags=cflags)
             if "tcp" in self.protocols:
                 self.bpf.attach_kprobe(event="tcp_sendmsg", fn_name="trace_tcp_send")
                 self.bpf.attach_kprobe(event="tcp_recvmsg", fn_name="trace_tcp_recv")
@@ -171,7 +369,8 @@ class ProcNetMonitor:
                 self.bpf.attach_kprobe(event="udp_sendmsg", fn_name="trace_udp_send")
                 self.bpf.attach_kprobe(event="udp_recvmsg", fn_name="trace_udp_recv")
 
-            self.bpf["events"].open_perf_buffer(self._handle_event)
+            if self.event_callback:
+                self.bpf["events"].open_perf_buffer(self._handle_event)
         except ImportError as e:
             self.console.print(f"[Error] bcc module not found: {e}", style="bold red")
             self.bpf = None
@@ -183,67 +382,83 @@ class ProcNetMonitor:
         """
         Return the eBPF program.
         """
-        return """
+        if self.pid_filter:
+            pid_filter = "if (" + " && ".join(f"pid != {int(pid)}" for pid in self.pid_filter) + ") { return 0; }"
+        else:
+            pid_filter = ""
+        program = """
         #include <uapi/linux/ptrace.h>
         #include <linux/sched.h>
-        
+
         struct sock {};
         struct msghdr {};
-    
+
         #define EVENT_TCP_SEND 1
         #define EVENT_TCP_RECV 2
         #define EVENT_UDP_SEND 3
         #define EVENT_UDP_RECV 4
-    
+
         struct net_data_t {
             u32 pid;
             u64 bytes;
             char comm[TASK_COMM_LEN];
             u32 event_type; // Event type: 1 (TCP Send), 2 (TCP Recv), etc.
         };
-    
+
+        // Cumulative bytes per pid, indexed by event_type - 1
+        struct net_counter_t {
+            u64 bytes[4];
+            char comm[TASK_COMM_LEN];
+        };
+
+        BPF_HASH(counters, u32, struct net_counter_t, MAX_PROCESSES);
         BPF_PERF_OUTPUT(events);
-    
-        int trace_tcp_send(struct pt_regs *ctx, struct sock *sk, struct msghdr *msg, size_t size) {
+
+        static inline int count_bytes(struct pt_regs *ctx, size_t size, u32 event_type) {
+            u32 pid = bpf_get_current_pid_tgid() >> 32;
+            PID_FILTER
+            if (size < MIN_BYTES) {
+                return 0;
+            }
+
+            struct net_counter_t zero = {};
+            struct net_counter_t *counter = counters.lookup_or_try_init(&pid, &zero);
+            if (counter) {
+                bpf_get_current_comm(&counter->comm, sizeof(counter->comm));
+                __sync_fetch_and_add(&counter->bytes[event_type - 1], size);
+            }
+
+        #ifdef DETAIL_EVENTS
             struct net_data_t data = {};
-            data.pid = bpf_get_current_pid_tgid() >> 32;
+            data.pid = pid;
             data.bytes = size;
-            data.event_type = EVENT_TCP_SEND;
+            data.event_type = event_type;
             bpf_get_current_comm(&data.comm, sizeof(data.comm));
             events.perf_submit(ctx, &data, sizeof(data));
+        #endif
             return 0;
         }
-    
+
+        int trace_tcp_send(struct pt_regs *ctx, struct sock *sk, struct msghdr *msg, size_t size) {
+            return count_bytes(ctx, size, EVENT_TCP_SEND);
+        }
+
         int trace_tcp_recv(struct pt_regs *ctx, struct sock *sk, struct msghdr *msg, size_t size) {
-            struct net_data_t data = {};
-            data.pid = bpf_get_current_pid_tgid() >> 32;
-            data.bytes = size;
-            data.event_type = EVENT_TCP_RECV;
-            bpf_get_current_comm(&data.comm, sizeof(data.comm));
-            events.perf_submit(ctx, &data, sizeof(data));
-            return 0;
+            return count_bytes(ctx, size, EVENT_TCP_RECV);
         }
-    
+
         int trace_udp_send(struct pt_regs *ctx, struct sock *sk, struct msghdr *msg, size_t size) {
-            struct net_data_t data = {};
-            data.pid = bpf_get_current_pid_tgid() >> 32;
-            data.bytes = size;
-            data.event_type = EVENT_UDP_SEND;
-            bpf_get_current_comm(&data.comm, sizeof(data.comm));
-            events.perf_submit(ctx, &data, sizeof(data));
-            return 0;
+            return count_bytes(ctx, size, EVENT_UDP_SEND);
         }
-    
+
         int trace_udp_recv(struct pt_regs *ctx, struct sock *sk, struct msghdr *msg, size_t size) {
-            struct net_data_t data = {};
-            data.pid = bpf_get_current_pid_tgid() >> 32;
-            data.bytes = size;
-            data.event_type = EVENT_UDP_RECV;
-            bpf_get_current_comm(&data.comm, sizeof(data.comm));
-            events.perf_submit(ctx, &data, sizeof(data));
-            return 0;
+            return count_bytes(ctx, size, EVENT_UDP_RECV);
         }
         """
+        return (program
+                .replace("PID_FILTER", pid_filter)
+                .replace("MIN_BYTES", str(int(self.min_bytes_threshold or 0)))
+                .replace("MAX_PROCESSES", str(self.MAX_PROCESSES)))
 
     @staticmethod
     def get_process_cmdline(pid):
@@ -257,143 +472,82 @@ class ProcNetMonitor:
         except Exception as e:
             return f"<Error reading cmdline: {e}>"
 
+    def _decode_comm(self, comm: bytes) -> str:
+        name = self._comm_cache.get(comm)
+        if name is None:
+            if len(self._comm_cache) > self.MAX_PROCESSES:
+                self._comm_cache.clear()
+            name = self._comm_cache[comm] = comm.decode(errors="replace").strip()
+        return name
+
     def _handle_event(self, cpu, data, size):
         """
-        Handle eBPF events.
+        Handle the optional per-event perf buffer. The counters are already aggregated in the BPF map.
         """
         event = self.bpf["events"].event(data)
-        bytes_count = event.bytes
-        event_type = event.event_type
-        proc_name = event.comm.decode().strip()
-
-        if self.group_by == "name":
-            group_by = proc_name
-        elif self.group_by == "pid":
-            group_by = event.pid
-        else:
-            group_by = event.pid
-
-        # cmdline = self.get_process_cmdline(pid)
-
-        if self.pid_filter and event.pid not in self.pid_filter:
-            return
-        if self.proc_filter and proc_name not in self.proc_filter:
-            return
-        if bytes_count < self.min_bytes_threshold:
-            return
-
-        if group_by not in self.process_network:
-            self.process_network[group_by] = {
-                'pid': event.pid,
-                'comm': event.comm.decode().strip(),
-                # 'cmdline': cmdline,
-                'bytes_sent': 0,
-                'bytes_recv': 0,
-                'tcp_sent': 0,
-                'tcp_recv': 0,
-                'tcp_sent_rate': 0.0,
-                'tcp_recv_rate': 0.0,
-                'udp_sent': 0,
-                'udp_recv': 0,
-                'udp_sent_rate': 0.0,
-                'udp_recv_rate': 0.0,
-                'send_rate': 0.0,
-                'recv_rate': 0.0,
-            }
-
-        if event_type == self.EVENT_TCP_SEND:
-            self.process_network[group_by]['tcp_sent'] += bytes_count
-        elif event_type == self.EVENT_TCP_RECV:
-            self.process_network[group_by]['tcp_recv'] += bytes_count
-        elif event_type == self.EVENT_UDP_SEND:
-            self.process_network[group_by]['udp_sent'] += bytes_count
-        elif event_type == self.EVENT_UDP_RECV:
-            self.process_network[group_by]['udp_recv'] += bytes_count
-
-        # Bytes sent/received for rate calculations
-        if event_type in {self.EVENT_TCP_SEND, self.EVENT_UDP_SEND}:
-            self.process_network[group_by]['bytes_sent'] += bytes_count
-        elif event_type in {self.EVENT_TCP_RECV, self.EVENT_UDP_RECV}:
-            self.process_network[group_by]['bytes_recv'] += bytes_count
+        self.event_callback({
+            "pid": event.pid,
+            "comm": self._decode_comm(event.comm),
+            "bytes": event.bytes,
+            "event_type": event.event_type,
+        })
+
+    def _read_counters(self) -> List[tuple]:
+        """
+        Read the whole BPF counter map, with a single batch lookup where the kernel supports it.
+        """
+        table = self.bpf["counters"]
+        items = None
+        if self._batch_lookup:
+            try:
+                items = list(table.items_lookup_batch())
+            except Exception:
+                self._batch_lookup = False
+        if items is None:
+            items = table.items()
+        return [(key.value, self._decode_comm(value.comm), *value.bytes) for key, value in items]
 
-        if self.callback:
-            # result = self.callback(self.process_network)
-            # if result == "EXIT":
-            #     self.exit_event.set()
-            self.callback_queue.put(self.process_network.copy())
+    def _prune_exited(self, rows: List[tuple]):
+        """
+        Delete the counters of processes that exited, so the map does not fill up.
+        """
+        table = self.bpf["counters"]
+        for pid, *_ in rows:
+            if not os.path.exists(f"/proc/{pid}"):
+                try:
+                    del table[table.Key(pid)]
+                except KeyError:
+                    pass
 
     def _update_rates(self):
         """
-        Update transmission rates for each process and protocol.
-        Add average rates based on historical data for all protocols.
+        Read the counters from the BPF map and update the rates and the average rates.
+        A snapshot of the table is queued for the callback once per refresh.
         """
-        current_time = time.time()
-
-        # Initialize history buffer for rate calculations
-        if not hasattr(self, 'rate_history'):
-            self.rate_history = {
-                pid: {
-                    proto: {'sent_rate': [], 'recv_rate': []} for proto in self.protocols
-                }
-                for pid in self.process_network
-            }
+        rows = self._read_counters()
+        self.counters.update(rows)
 
-        for pid, info in self.process_network.items():
-            if pid not in self.previous_counts:
-                # Initialize `previous_counts` and `rate_history` for a new PID
-                self.previous_counts[pid] = {
-                    'time': current_time,
-                    'bytes_sent': info['bytes_sent'],
-                    'bytes_recv': info['bytes_recv'],
-                    **{f'{proto}_sent': info.get(f'{proto}_sent', 0) for proto in self.protocols},
-                    **{f'{proto}_recv': info.get(f'{proto}_recv', 0) for proto in self.protocols},
-                }
-                self.rate_history[pid] = {
-                    proto: {'sent_rate': [], 'recv_rate': []} for proto in self.protocols
-                }
-                continue
+        now = time.monotonic()
+        if now - self._last_prune >= self.PRUNE_INTERVAL:
+            self._last_prune = now
+            self._prune_exited(rows)
 
-            prev = self.previous_counts[pid]
-            time_diff = current_time - prev['time']
-
-            if time_diff > 0:
-                info['send_rate'] = (info['bytes_sent'] - prev['bytes_sent']) / time_diff
-                info['recv_rate'] = (info['bytes_recv'] - prev['bytes_recv']) / time_diff
-
-                # Calculate current protocol-specific rates and update history
-                for proto in self.protocols:
-                    sent_key, recv_key = f'{proto}_sent', f'{proto}_recv'
-                    info[f'{proto}_sent_rate'] = (info.get(sent_key, 0) - prev.get(sent_key, 0)) / time_diff
-                    info[f'{proto}_recv_rate'] = (info.get(recv_key, 0) - prev.get(recv_key, 0)) / time_diff
-
-                    # Update rate history for the protocol
-                    self.rate_history[pid][proto]['sent_rate'].append(info[f'{proto}_sent_rate'])
-                    self.rate_history[pid][proto]['recv_rate'].append(info[f'{proto}_recv_rate'])
-
-                    # Limit history size to avoid excessive memory usage
-                    max_history_size = 200
-                    if len(self.rate_history[pid][proto]['sent_rate']) > max_history_size:
-                        self.rate_history[pid][proto]['sent_rate'].pop(0)
-                    if len(self.rate_history[pid][proto]['recv_rate']) > max_history_size:
-                        self.rate_history[pid][proto]['recv_rate'].pop(0)
-
-                    # Calculate average rates for the protocol
-                    info[f'{proto}_avg_sent_rate'] = (
-                            sum(self.rate_history[pid][proto]['sent_rate']) / len(self.rate_history[pid][proto]['sent_rate'])
-                    )
-                    info[f'{proto}_avg_recv_rate'] = (
-                            sum(self.rate_history[pid][proto]['recv_rate']) / len(self.rate_history[pid][proto]['recv_rate'])
-                    )
-
-            self.previous_counts[pid] = {
-                'time': current_time,
-                'bytes_sent': info['bytes_sent'],
-                'bytes_recv': info['bytes_recv'],
-                **{f'{proto}_sent': info.get(f'{proto}_sent', 0) for proto in self.protocols},
-                **{f'{proto}_recv': info.get(f'{proto}_recv', 0) for proto in self.protocols},
-            }
+        if self.callback:
+            self.callback_queue.put(self.counters.snapshot())
 
-        self.last_update_time = current_time
+    def _wait_next_refresh(self):
+        """
+        Wait for the next refresh, delivering the perf events in the meantime if they are enabled.
+        """
+        deadline = time.monotonic() + 1 / self.refresh_rate
+        while self.is_running:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if self.event_callback:
+                self.bpf.perf_buffer_poll(timeout=max(int(remaining * 1000), 1))
+            elif self.exit_event.wait(remaining):
+                break
 
     def generate_title(self):
         """
@@ -436,29 +590,18 @@ class ProcNetMonitor:
             table.add_column(f"{proto.upper()} Sent(AVG)", justify="right", style="yellow")
             table.add_column(f"{proto.upper()} Recv(AVG)", justify="right", style="yellow")
 
-        # Sort processes by the sum of all protocol rates
-        sorted_pids = sorted(
-            self.process_network.keys(),
-            key=lambda pid: sum(
-                self.process_network[pid].get(f"{proto}_sent", 0) + self.process_network[pid].get(f"{proto}_recv", 0)
-                for proto in self.protocols
-            ),
-            reverse=True
-        )[:self.top_n]
-
-        for pid in sorted_pids:
-            info = self.process_network[pid]
+        # Only the probes of the selected protocols are attached, so the total bytes are the sort key
+        for info in self.counters.top(self.top_n):
 
             # Basic process details
             row = [
-                # str(pid),
                 f"{info['comm']}",
                 f"{format_size(info['bytes_sent'])}",
                 f"{format_size(info['bytes_recv'])}",
             ]
 
             if self.group_by == "pid":
-                row.insert(0, str(pid))
+                row.insert(0, str(info['pid']))
 
             # Add protocol-specific details
             for proto in self.protocols:
@@ -484,34 +627,6 @@ class ProcNetMonitor:
                 self.exit_event.set()
                 break
 
-    # def run(self):
-        # """
-        # Run the NetworkMonitor (utilize data via callbacks or external logic).
-        # """
-        # if not self.bpf:
-        #     self.console.print("[Error] BPF not initialized. Exiting.", style="bold red")
-        #     return
-        #
-        # self.console.print("Starting NetworkMonitor...", style="bold green")
-        # try:
-        #     # while not self.exit_event.is_set():
-        #     while self.is_running:
-        #
-        #         self.bpf.perf_buffer_poll(timeout=1000)
-        #         self._update_rates()
-        #         self._process_callbacks()
-        #         time.sleep(1 / self.refresh_rate)
-        #
-        # except SystemExit:
-        #     self.console.print("[bold yellow]Exiting NetworkMonitor...[/bold yellow]")
-        #     # self.is_running = False
-        # except KeyboardInterrupt:
-        #     self.console.print("Stopping NetworkMonitor.", style="bold yellow")
-        #
-        # finally:
-        #     self.is_running = False
-        #     self.console.print("[bold red]NetworkMonitor stopped.[/bold red]")
-
     def run(self):
         """
         ProcNetMonitor를 실행합니다. `is_running`이 `True`인 동안 루프를 계속합니다.
@@ -523,10 +638,9 @@ class ProcNetMonitor:
         self.console.print("Starting NetworkMonitor...", style="bold green")
         try:
             while self.is_running:
-                self.bpf.perf_buffer_poll(timeout=1000)
                 self._update_rates()
                 self._process_callbacks()
-                time.sleep(1 / self.refresh_rate)
+                self._wait_next_refresh()
         except SystemExit:
             self.console.print("[bold yellow]Exiting NetworkMonitor...[/bold yellow]")
         except KeyboardInterrupt:
@@ -547,23 +661,22 @@ class ProcNetMonitor:
         with Live(self._generate_table(), refresh_per_second=self.refresh_rate, console=self.console) as live:
             try:
                 while self.is_running:
-                    self.bpf.perf_buffer_poll(timeout=1000)
                     self._update_rates()
                     self._process_callbacks()
                     live.update(self._generate_table())
-                    time.sleep(1 / self.refresh_rate)
+                    self._wait_next_refresh()
             except KeyboardInterrupt:
                 self.console.print("Stopping NetworkMonitor.", style="bold yellow")
 
     def update_data(self):
         """
-        Poll eBPF events and update the process_network data.
+        Read the BPF counters and update the process_network data.
         """
         if not self.bpf:
             raise RuntimeError("BPF is not initialized.")
 
-        # eBPF 이벤트 폴링
-        self.bpf.perf_buffer_poll(timeout=1000)
+        if self.event_callback:
+            self.bpf.perf_buffer_poll(timeout=0)
 
         # 네트워크 전송/수신 속도 갱신
         self._update_rates()
@@ -588,16 +701,7 @@ class ProcNetMonitor:
         :param n: Number of top processes to retrieve. Defaults to self.top_n.
         :return: List of top N processes sorted by (bytes_sent + bytes_recv).
         """
-        n = n or self.top_n
-        with threading.Lock():
-            sorted_pids = sorted(
-                self.process_network.keys(),
-                key=lambda pid: self.process_network[pid]['bytes_sent'] + self.process_network[pid]['bytes_recv'],
-                reverse=True
-            )
-            top_pids = sorted_pids[:n]
-            top_processes = [self.process_network[pid] for pid in top_pids]
-        return top_processes
+        return self.counters.top(n or self.top_n)
 
     def _handle_signal(self, sig, frame):
         """
@@ -815,13 +919,37 @@ class FindFastestRegion:
         pawn.console.log(f"Fastest Region={self.results[0]['region']}, time={self.results[0]['run_time']} sec")
 
 
+def _inet_checksum(data: bytes) -> int:
+    if len(data) % 2:
+        data += b"\0"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
 class AsyncPortScanner:
     """
     Asynchronous Port Scanner class.
 
+    The (ip, port) targets are generated lazily and consumed by a fixed pool of workers, so the memory
+    does not grow with the size of the range. The number of connections in flight adapts to the
+    observed timeouts, between ``min_concurrency`` and ``max_concurrency``, and never exceeds the soft
+    limit of open files. The open ports are kept in one bitmap per host, the closed ports are the rest of the range.
+
+    With ``syn_scan=True`` and root privileges, the ports are probed with raw SYN packets instead of
+    full connections, without using a file descriptor per probe.
+
     :param ip_range: Tuple of start and end IP addresses to scan.
     :param port_range: Tuple of start and end ports to scan. Default is all ports (0, 65535).
     :param max_concurrency: Maximum number of concurrent scans. Default is 30.
+    :param timeout: Timeout of a probe in seconds.
+    :param ping_timeout: Timeout of the connections of :meth:`ping_host`.
+    :param fast_scan_ports: Ports used to find the hosts that are up in fast scan mode.
+    :param batch_size: Number of results between two updates of the progress bar.
+    :param min_concurrency: Lower bound of the adaptive concurrency. Defaults to a quarter of ``max_concurrency``.
+    :param adaptive: Lower the concurrency when most probes time out, and raise it again when they don't.
+    :param syn_scan: Use raw SYN packets when running as root, falling back to connections otherwise.
 
     Example:
 
@@ -829,173 +957,474 @@ class AsyncPortScanner:
 
             scanner = AsyncPortScanner(("192.168.0.1", "192.168.0.255"), (1, 1024), 50)
             asyncio.run(scanner.scan_all())
+            scanner.get_results(include_closed=False)
+            # >> {'192.168.0.1': {'open': [22, 80]}, ...}
     """
 
+    OPEN = "open"
+    CLOSED = "closed"
+    TIMEOUT = "timeout"
+    ERROR = "error"
+
+    FD_RESERVE = 64
+    ADJUST_WINDOW = 256
+
     def __init__(self, ip_range: Tuple[str, str], port_range: Tuple[int, int] = (0, 65535),
-                 max_concurrency: int = 30, timeout=1, ping_timeout=0.05, fast_scan_ports: List[int] = [22, 80, 443], batch_size=50000):
+                 max_concurrency: int = 30, timeout=1, ping_timeout=0.05, fast_scan_ports: List[int] = [22, 80, 443], batch_size=50000,
+                 min_concurrency: int = None, adaptive: bool = True, syn_scan: bool = False):
         self.start_ip, self.end_ip = ip_range
         self.start_port, self.end_port = port_range
-        self.scan_results = {}
-        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.start_ip_int = self.ip_to_int(self.start_ip)
+        self.end_ip_int = self.ip_to_int(self.end_ip)
+        if self.end_ip_int < self.start_ip_int:
+            raise ValueError(f"Invalid ip_range: {self.start_ip} is greater than {self.end_ip}")
+        if not 0 <= self.start_port <= self.end_port <= 65535:
+            raise ValueError(f"Invalid port_range: {port_range}")
+        self.port_count = self.end_port - self.start_port + 1
+
+        self.max_concurrency = self._limit_concurrency(max_concurrency)
+        self.min_concurrency = max(1, min(min_concurrency or self.max_concurrency // 4, self.max_concurrency))
+        self.concurrency = self.max_concurrency
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.adaptive = adaptive
         self.timeout = timeout
         self.ping_timeout = ping_timeout
         self.fast_scan_ports = fast_scan_ports
         self.batch_size = batch_size
+        self.syn_scan = syn_scan
+
+        self.stats = {self.OPEN: 0, self.CLOSED: 0, self.TIMEOUT: 0, self.ERROR: 0}
+        self._open_ports: Dict[int, bytearray] = {}
+        self._scanned: Dict[int, int] = {}
+        self._active = 0
+        self._slots = None
+        self._window = 0
+        self._window_timeouts = 0
+
+    def _limit_concurrency(self, max_concurrency: int) -> int:
+        from pawnlib.resource.server import get_rlimit_nofile
+        soft = get_rlimit_nofile()["soft"]
+        if soft > 0 and max_concurrency > soft - self.FD_RESERVE:
+            limit = max(soft - self.FD_RESERVE, 1)
+            pawn.console.debug(f"max_concurrency={max_concurrency} exceeds the open file limit ({soft}), using {limit}")
+            return limit
+        return max(max_concurrency, 1)
+
+    def _record(self, status: str):
+        """
+        Count the result and adjust the concurrency once per window of results.
+        """
+        self.stats[status] += 1
+        if not self.adaptive:
+            return
+        self._window += 1
+        if status == self.TIMEOUT:
+            self._window_timeouts += 1
+        if self._window < self.ADJUST_WINDOW:
+            return
+
+        timeout_ratio = self._window_timeouts / self._window
+        if timeout_ratio > 0.5:
+            self.concurrency = max(self.min_concurrency, int(self.concurrency * 0.75))
+        elif timeout_ratio < 0.1 and self.concurrency < self.max_concurrency:
+            self.concurrency = min(self.max_concurrency, self.concurrency + max(1, self.concurrency // 10))
+        self._window = self._window_timeouts = 0
+
+    def _on_fd_exhausted(self):
+        limit = max(self.min_concurrency, self._active - 1)
+        if limit < self.max_concurrency:
+            pawn.console.log(f"[yellow]Too many open files, lowering max_concurrency {self.max_concurrency} -> {limit}")
+            self.max_concurrency = limit
+            self.concurrency = min(self.concurrency, limit)
+
+    async def _acquire(self):
+        async with self._slots:
+            await self._slots.wait_for(lambda: self._active < self.concurrency)
+            self._active += 1
+
+    async def _release(self):
+        async with self._slots:
+            self._active -= 1
+            # Wake up more than one worker when the concurrency was raised
+            self._slots.notify(max(1, self.concurrency - self._active))
+
+    async def _probe(self, ip: str, port: int, timeout: float = None) -> str:
+        """
+        Connect to ``ip:port`` once and close the socket, returning open, closed, timeout or error.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        except OSError as e:
+            if e.errno == errno.EMFILE:
+                self._on_fd_exhausted()
+            pawn.console.debug(f"Error scanning {ip}:{port} - {e}")
+            return self.ERROR
+        sock.setblocking(False)
+        try:
+            await asyncio.wait_for(loop.sock_connect(sock, (ip, port)), timeout=timeout or self.timeout)
+            return self.OPEN
+        except asyncio.TimeoutError:
+            return self.TIMEOUT
+        except ConnectionRefusedError:
+            return self.CLOSED
+        except OSError as e:
+            if e.errno == errno.EMFILE:
+                self._on_fd_exhausted()
+            pawn.console.debug(f"Error scanning {ip}:{port} - {e}")
+            return self.ERROR
+        finally:
+            sock.close()
+
+    async def _run_pool(self, targets: Iterable[Tuple[int, int]], on_result: Callable, timeout: float = None):
+        """
+        Probe ``targets`` with ``max_concurrency`` workers, at most ``concurrency`` at a time.
+        """
+        targets = iter(targets)
+        self._slots = asyncio.Condition()
+
+        async def worker():
+            # Every worker pulls from the same generator, which only runs between two awaits
+            for ip_int, port in targets:
+                await self._acquire()
+                try:
+                    status = await self._probe(self.int_to_ip(ip_int), port, timeout)
+                finally:
+                    await self._release()
+                self._record(status)
+                on_result(ip_int, port, status)
+
+        await asyncio.gather(*(worker() for _ in range(self.max_concurrency)))
+
+    @staticmethod
+    def _source_address(ip: str) -> str:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.connect((ip, 9))
+            return sock.getsockname()[0]
+
+    @staticmethod
+    def _build_syn(source: bytes, destination: bytes, source_port: int, port: int, sequence: int) -> bytes:
+        header = struct.pack("!HHIIBBHHH", source_port, port, sequence, 0, 5 << 4, 0x02, 64240, 0, 0)
+        pseudo_header = source + destination + struct.pack("!BBH", 0, socket.IPPROTO_TCP, len(header))
+        return header[:16] + struct.pack("!H", _inet_checksum(pseudo_header + header)) + header[18:]
+
+    @staticmethod
+    def _parse_syn_reply(packet: bytes, source_port: int, sequence: int) -> Optional[Tuple[int, int, bool]]:
+        """
+        Returns ``(ip_int, port, is_open)`` for a SYN-ACK or RST answering one of our probes.
+        """
+        header_length = (packet[0] & 0x0F) * 4
+        if len(packet) < header_length + 14 or packet[9] != socket.IPPROTO_TCP:
+            return None
+        port, destination_port, _, ack = struct.unpack_from("!HHII", packet, header_length)
+        if destination_port != source_port or ack != (sequence + 1) & 0xFFFFFFFF:
+            return None
+        flags = packet[header_length + 13]
+        ip_int = int.from_bytes(packet[12:16], "big")
+        if flags & 0x12 == 0x12:
+            return ip_int, port, True
+        if flags & 0x04:
+            return ip_int, port, False
+        return None
+
+    def _open_raw_socket(self) -> Optional[socket.socket]:
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_TCP)
+        except (PermissionError, OSError) as e:
+            pawn.console.log(f"[yellow]SYN scan needs root privileges ({e}), falling back to TCP connect scan")
+            return None
+        sock.setblocking(False)
+        # The raw socket sees every TCP packet of the host, not only the replies
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+        return sock
+
+    async def _run_syn_scan(self, sock: socket.socket, targets: Iterable[Tuple[int, int]], on_result: Callable):
+        """
+        Send raw SYN packets for ``targets``, keeping at most ``concurrency`` unanswered probes.
+        The kernel resets the half-open connections by itself, since no socket owns them.
+        """
+        loop = asyncio.get_running_loop()
+        source = socket.inet_aton(self._source_address(self.int_to_ip(self.start_ip_int)))
+        source_port = random.randint(32768, 60999)
+        sequence = random.getrandbits(32)
+        pending: Dict[Tuple[int, int], float] = {}
+        wakeup = asyncio.Event()
+
+        def on_readable():
+            while True:
+                try:
+                    packet = sock.recv(65535)
+                except (BlockingIOError, InterruptedError):
+                    break
+                reply = self._parse_syn_reply(packet, source_port, sequence)
+                if reply is None:
+                    continue
+                ip_int, port, is_open = reply
+                if pending.pop((ip_int, port), None) is not None:
+                    status = self.OPEN if is_open else self.CLOSED
+                    self._record(status)
+                    on_result(ip_int, port, status)
+                    wakeup.set()
+
+        targets = iter(targets)
+        target = next(targets, None)
+        loop.add_reader(sock.fileno(), on_readable)
+        try:
+            while target is not None or pending:
+                now = loop.time()
+                # Probes are inserted in send order, so the expired ones are at the front
+                while pending:
+                    key, sent = next(iter(pending.items()))
+                    if now - sent < self.timeout:
+                        break
+                    del pending[key]
+                    self._record(self.TIMEOUT)
+                    on_result(*key, self.TIMEOUT)
+
+                while target is not None and len(pending) < self.concurrency:
+                    ip_int, port = target
+                    destination = ip_int.to_bytes(4, "big")
+                    try:
+                        sock.sendto(self._build_syn(source, destination, source_port, port, sequence), (self.int_to_ip(ip_int), 0))
+                    except BlockingIOError:
+                        break
+                    except OSError as e:
+                        pawn.console.debug(f"Error scanning {self.int_to_ip(ip_int)}:{port} - {e}")
+                        self._record(self.ERROR)
+                        on_result(ip_int, port, self.ERROR)
+                    else:
+                        pending[target] = loop.time()
+                    target = next(targets, None)
+
+                wakeup.clear()
+                if pending:
+                    wait = self.timeout - (loop.time() - next(iter(pending.values())))
+                else:
+                    wait = 0.01
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=max(wait, 0.001))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            loop.remove_reader(sock.fileno())
+            sock.close()
+
+    async def _probe_targets(self, targets: Iterable[Tuple[int, int]], on_result: Callable, timeout: float = None):
+        sock = self._open_raw_socket() if self.syn_scan else None
+        if sock is not None:
+            await self._run_syn_scan(sock, targets, on_result)
+        else:
+            await self._run_pool(targets, on_result, timeout)
+
+    def _iter_targets(self, ip_ints: Iterable[int], ports: Iterable[int] = None) -> Iterator[Tuple[int, int]]:
+        ports = ports or range(self.start_port, self.end_port + 1)
+        for ip_int in ip_ints:
+            for port in ports:
+                yield ip_int, port
+
+    def _store(self, ip_int: int, port: int, is_open: bool):
+        self._scanned[ip_int] = self._scanned.get(ip_int, 0) + 1
+        if is_open:
+            bitmap = self._open_ports.get(ip_int)
+            if bitmap is None:
+                bitmap = self._open_ports[ip_int] = bytearray((self.port_count + 7) // 8)
+            offset = port - self.start_port
+            bitmap[offset >> 3] |= 1 << (offset & 7)
+
+    def _progress_callback(self, progress: Optional[Progress], task_id, on_result: Callable = None) -> Callable:
+        """
+        Returns a result handler that also advances the progress bar every ``batch_size`` results.
+        """
+        step = max(1, min(self.batch_size or 1, 1000))
+        counter = [0]
+
+        def handler(ip_int, port, status):
+            if on_result:
+                on_result(ip_int, port, status)
+            if progress is not None:
+                counter[0] += 1
+                if counter[0] >= step:
+                    progress.advance(task_id, counter[0])
+                    counter[0] = 0
+
+        def flush():
+            if progress is not None and counter[0]:
+                progress.advance(task_id, counter[0])
+                counter[0] = 0
+
+        handler.flush = flush
+        return handler
+
+    async def _discover_hosts(self, ip_ints: Iterable[int], progress: Progress = None, timeout: float = None) -> List[int]:
+        """
+        Returns the hosts with at least one of ``fast_scan_ports`` open, in ascending order.
+        """
+        alive = set()
+
+        def targets():
+            for ip_int in ip_ints:
+                for port in self.fast_scan_ports:
+                    if ip_int in alive:
+                        break
+                    yield ip_int, port
+
+        task_id = None
+        if progress is not None:
+            total = (self.end_ip_int - self.start_ip_int + 1) * len(self.fast_scan_ports)
+            task_id = progress.add_task("Checking IPs...", total=total)
+
+        def on_alive(ip_int, port, status):
+            if status == self.OPEN:
+                alive.add(ip_int)
+
+        handler = self._progress_callback(progress, task_id, on_alive)
+        await self._run_pool(targets(), handler, timeout)
+        handler.flush()
+        return sorted(alive)
 
     async def ping_host(self, ip: str) -> bool:
-        common_ports = [22, 80, 443]
-        for port in common_ports:
-            try:
-                await asyncio.wait_for(asyncio.open_connection(ip, port), timeout=self.ping_timeout)
+        for port in self.fast_scan_ports:
+            if await self._probe(ip, port, self.ping_timeout) == self.OPEN:
                 return ip  # 연결 성공, 호스트가 살아 있음
-            except Exception:
-                continue  # 해당 포트에 대한 연결 실패, 다음 포트 시도
         return False  # 모든 시도 실패, 호스트가 닫혀 있음
 
     async def try_ping_host(self, ip: str, progress: Progress, task_id: int):
-        progress.advance(task_id)
+        if progress is not None and task_id is not None:
+            progress.advance(task_id)
         for port in self.fast_scan_ports:
-            try:
-                await asyncio.wait_for(asyncio.open_connection(ip, port), timeout=self.timeout)
-                if progress is not None and task_id is not None:
-                    progress.advance(task_id)  # 성공적으로 핑을 완료하면 진행 상황을 업데이트합니다.
+            if await self._probe(ip, port) == self.OPEN:
                 return ip
-            except (asyncio.TimeoutError, Exception):
-                continue  # 해당 포트에서 연결 실패, 다음 포트로 계속 시도합니다.
         return False
 
     async def scan_all(self, fast_scan: bool = False):
-        if fast_scan:
-            tasks = [self.check_and_scan_host(ip) for ip in self._generate_ips()]
-        else:
-            tasks = [
-                self.wrap_scan(ip, port)
-                for ip in self._generate_ips()
-                for port in range(self.start_port, self.end_port + 1)
-            ]
-        await asyncio.gather(*tasks)
+        await self.scan(fast_scan=fast_scan)
 
     async def check_and_scan_host(self, ip):
         if await self.ping_host(ip):
             print(f"{ip} is up, scanning ports...")
-            tasks = [self.wrap_scan(ip, port) for port in range(self.start_port, self.end_port + 1)]
-            await asyncio.gather(*tasks)
+            await self._probe_targets(self._iter_targets([self.ip_to_int(ip)]), self._store_result)
         else:
             print(f"{ip} is down, skipping...")
 
-    async def scan_port(self, ip: str, port: int) ->(str, int, bool):
-        async with (self.semaphore):
+    async def scan_port(self, ip: str, port: int) -> (str, int, bool):
+        async with self.semaphore:
             pawn.console.debug(f"Scanning {ip}:{port} - Acquired semaphore, timeout={self.timeout}")
-            try:
-                await asyncio.wait_for(asyncio.open_connection(ip, port), timeout=self.timeout)
-                pawn.console.debug(f"Connection successful: {ip}:{port}")
-                return ip, port, True
-            except asyncio.TimeoutError:
-                pawn.console.debug(f"Timeout: {ip}:{port}")
-                return ip, port, False
-            except Exception as e:
-                if "Too many" in str(e):
-                    pawn.console.log(f"Error scanning -> [red]{e}[/red]")
-                else:
-                    pawn.console.debug(f"Error scanning {ip}:{port} - {e}")
-                return ip, port, False
-            # finally:
-            #     pawn.console.log(f"Releasing semaphore: {ip}:{port}")
+            status = await self._probe(ip, port)
+            pawn.console.debug(f"{status}: {ip}:{port}")
+            return ip, port, status == self.OPEN
 
     def calculate_scan_range(self):
-        start_ip_int = self.ip_to_int(self.start_ip)
-        end_ip_int = self.ip_to_int(self.end_ip)
-        total_ips = end_ip_int - start_ip_int + 1
-        total_ports = self.end_port - self.start_port + 1
-        total_tasks = total_ips * total_ports
-        return start_ip_int, end_ip_int, total_tasks
+        total_ips = self.end_ip_int - self.start_ip_int + 1
+        total_tasks = total_ips * self.port_count
+        return self.start_ip_int, self.end_ip_int, total_tasks
+
+    def _store_result(self, ip_int: int, port: int, status: str):
+        self._store(ip_int, port, status == self.OPEN)
 
     async def scan(self, fast_scan: bool = False, progress: Progress = None):
-        tasks = []
-        ips_to_scan = await self.get_ips_to_scan(fast_scan, progress)
+        ip_ints = range(self.start_ip_int, self.end_ip_int + 1)
         if fast_scan:
-            if ips_to_scan:
-                pawn.console.log(f"<FAST SCAN> Alive IPs: {ips_to_scan}")
+            ip_ints = await self._discover_hosts(ip_ints, progress)
+            if ip_ints:
+                pawn.console.log(f"<FAST SCAN> Alive IPs: {[self.int_to_ip(ip_int) for ip_int in ip_ints]}")
             else:
                 pawn.console.log(f"<FAST SCAN> [red]No open servers found on ports {self.fast_scan_ports}.[/red]")
 
-        total_ports = self.end_port - self.start_port + 1
-        total_tasks = len(ips_to_scan) * total_ports
-        fast_scan_string = "FastScan" if fast_scan else ""
-        task_id = progress.add_task(f"[cyan]Scanning {fast_scan_string}...", total=total_tasks)
-        if fast_scan:
-            pawn.console.log(f"Alive IP: {ips_to_scan}")
-
-        for ip in ips_to_scan:
-            for port in range(self.start_port, self.end_port + 1):
-                task = self.wrap_scan(ip, port, progress, task_id)
-                tasks.append(task)
-                if len(tasks) >= self.batch_size:
-                    await asyncio.gather(*tasks)
-                    tasks.clear()
+        task_id = None
+        if progress is not None:
+            fast_scan_string = "FastScan" if fast_scan else ""
+            task_id = progress.add_task(f"[cyan]Scanning {fast_scan_string}...", total=len(ip_ints) * self.port_count)
 
-        if tasks:
-            await asyncio.gather(*tasks)
+        handler = self._progress_callback(progress, task_id, self._store_result)
+        await self._probe_targets(self._iter_targets(ip_ints), handler)
+        handler.flush()
 
-    async def get_ips_to_scan(self, fast_scan: bool, progress: Progress) -> List[str]:
-        ips = self._generate_ips()
+    async def get_ips_to_scan(self, fast_scan: bool, progress: Progress) -> Iterable[str]:
         if not fast_scan:
-            return ips
-
-        task_id = progress.add_task("Checking IPs...", total=len(ips))
-        ping_tasks = [self.try_ping_host(ip, progress, task_id) for ip in ips]
-
-        results = await asyncio.gather(*ping_tasks)
-        alive_ips = [result for result in results if result]
-        return alive_ips
+            return self._generate_ips()
+        return [self.int_to_ip(ip_int) for ip_int in await self._discover_hosts(range(self.start_ip_int, self.end_ip_int + 1), progress)]
 
-    async def wrap_scan(self, ip, port, progress, task_id):
-        async with self.semaphore:
-            result = await self.scan_port(ip, port)
+    async def wrap_scan(self, ip, port, progress=None, task_id=None):
+        result = await self.scan_port(ip, port)
+        if progress is not None:
             progress.update(task_id, advance=1)
-            self._process_results(result)
-            return result
+        self._process_results(result)
+        return result
 
-    def _generate_ips(self) -> List[str]:
-        start_int = self.ip_to_int(self.start_ip)
-        end_int = self.ip_to_int(self.end_ip)
-        return [self.int_to_ip(ip_int) for ip_int in range(start_int, end_int + 1)]
+    def _generate_ips(self) -> Iterator[str]:
+        return map(self.int_to_ip, range(self.start_ip_int, self.end_ip_int + 1))
 
     @staticmethod
     def ip_to_int(ip: str) -> int:
-        return sum([int(octet) << (8 * i) for i, octet in enumerate(reversed(ip.split('.')))])
+        return int.from_bytes(socket.inet_aton(ip), "big")
 
     @staticmethod
     def int_to_ip(ip_int: int) -> str:
-        return '.'.join(str((ip_int >> (8 * i)) & 0xFF) for i in reversed(range(4)))
+        return socket.inet_ntoa(ip_int.to_bytes(4, "big"))
 
     def _process_results(self, results: List[Tuple[str, int, bool]]):
         if isinstance(results, tuple):
             results = [results]
         for ip, port, is_open in results:
-            if ip not in self.scan_results:
-                self.scan_results[ip] = {"open": [], "closed": []}
+            self._store(self.ip_to_int(ip), port, is_open)
 
-            if is_open:
-                self.scan_results[ip]["open"].append(port)
-            else:
-                self.scan_results[ip]["closed"].append(port)
+    def open_ports(self, ip: str) -> List[int]:
+        """
+        Returns the open ports of ``ip`` from its bitmap.
+        """
+        bitmap = self._open_ports.get(self.ip_to_int(ip))
+        if not bitmap:
+            return []
+        return [
+            self.start_port + (index << 3) + bit
+            for index, byte in enumerate(bitmap) if byte
+            for bit in range(8) if byte >> bit & 1
+        ]
+
+    def get_results(self, include_closed: bool = True) -> Dict[str, Dict[str, List[int]]]:
+        """
+        Returns the open and closed ports of every scanned host.
 
-    def get_results(self):
-        return self.scan_results
+        The closed ports are only listed for hosts that were completely scanned. They can be the whole
+        port range, so pass ``include_closed=False`` for large scans.
+        """
+        results = {}
+        for ip_int in sorted(self._scanned):
+            ip = self.int_to_ip(ip_int)
+            open_ports = self.open_ports(ip)
+            results[ip] = {"open": open_ports}
+            if include_closed:
+                if self._scanned[ip_int] >= self.port_count:
+                    open_set = set(open_ports)
+                    results[ip]["closed"] = [port for port in range(self.start_port, self.end_port + 1) if port not in open_set]
+                else:
+                    results[ip]["closed"] = []
+        return results
+
+    @property
+    def scan_results(self):
+        return self.get_results()
+
+    @staticmethod
+    def _format_ranges(ports: List[int]) -> str:
+        ranges = []
+        for port in ports:
+            if ranges and ranges[-1][1] == port - 1:
+                ranges[-1][1] = port
+            else:
+                ranges.append([port, port])
+        return ", ".join(str(start) if start == end else f"{start}-{end}" for start, end in ranges)
 
     def print_scan_results(self, view="all"):
-        for ipaddr, result in self.scan_results.items():
+        for ipaddr, result in self.get_results(include_closed=view in ("all", "closed")).items():
             parsed_data = ""
-            for is_open, port in result.items():
-                if view == "all" or view == is_open and port:
-                    # pawn.console.print(f"\t \[{is_open}] {port}")
-                    parsed_data = f"\t \[{is_open}] {port}"
-                    # is_data = True
+            for is_open, ports in result.items():
+                if ports and (view == "all" or view == is_open):
+                    parsed_data += f"\t \\[{is_open}] {self._format_ranges(ports)}\n"
 
             if parsed_data:
                 pawn.console.print(ipaddr)
-                pawn.console.print(parsed_data)
+                pawn.console.print(parsed_data.rstrip())
 
     def run_scan(self, fast_scan: bool = False):
         with Progress(
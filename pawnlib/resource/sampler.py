@@ -0,0 +1,724 @@
+import os
+import time
+import heapq
+import threading
+import operator
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Optional, Union
+from pawnlib.config.globalconfig import pawnlib_config as pawn
+
+CPU_COLUMNS = ("user", "nice", "system", "idle", "iowait", "irq", "softirq", "steal", "guest", "guest_nice")
+NET_COLUMNS = ("recv", "packets_recv", "sent", "packets_sent")
+DISK_COLUMNS = ("read_ios", "read_bytes", "write_ios", "write_bytes")
+TCP_STATES = {
+    b'01': 'ESTAB',
+    b'02': 'SYN_SENT',
+    b'03': 'SYN_RECV',
+    b'04': 'FIN_WAIT1',
+    b'05': 'FIN_WAIT2',
+    b'06': 'TIME_WAIT',
+    b'07': 'CLOSE',
+    b'08': 'CLOSE_WAIT',
+    b'09': 'LAST_ACK',
+    b'0A': 'LISTEN',
+    b'0B': 'CLOSING'
+}
+
+
+class ProcFile:
+    """
+    A /proc file that stays open and is re-read from offset 0 with positional reads into a reusable buffer.
+    seq_file entries such as /proc/net/tcp return about one page per read, so the reads continue at the
+    next offset until one returns nothing, and the buffer doubles whenever it is full.
+
+    :param path: Path of the file.
+    :param buffer_size: Initial size of the read buffer.
+
+    Example:
+
+        .. code-block:: python
+
+            from pawnlib.resource.sampler import ProcFile
+
+            stat = ProcFile("/proc/stat")
+            data = stat.read()  # >> b'cpu  62588 0 5011 ...'
+            stat.close()
+
+    """
+
+    def __init__(self, path: str, buffer_size: int = 16384):
+        self.path = path
+        self.fd = os.open(path, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+        self.buffer = bytearray(buffer_size)
+
+    def read(self) -> bytes:
+        offset = 0
+        while True:
+            if offset == len(self.buffer):
+                self.buffer.extend(bytes(len(self.buffer)))
+            if hasattr(os, "preadv"):
+                size = os.preadv(self.fd, [memoryview(self.buffer)[offset:]], offset)
+            else:
+                data = os.pread(self.fd, len(self.buffer) - offset, offset)
+                size = len(data)
+                self.buffer[offset:offset + size] = data
+            if size == 0:
+                return bytes(memoryview(self.buffer)[:offset])
+            offset += size
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class CounterSet:
+    """
+    Counters of several devices (CPUs, interfaces or disks) stored row by row in one flat array.
+
+    :param names: Device names, one per row.
+    :param columns: Column names, one per counter of a row.
+    :param values: Flat array of ``len(names) * len(columns)`` counters.
+    :param deltas: Flat array with the difference to the previous sample, or None for the first sample.
+    """
+    __slots__ = ("names", "columns", "values", "deltas")
+
+    def __init__(self, names: tuple, columns: tuple, values: array, deltas: Optional[array] = None):
+        self.names = names
+        self.columns = columns
+        self.values = values
+        self.deltas = deltas
+
+    def diff(self, previous: "CounterSet") -> array:
+        """
+        Returns the element-wise difference to a previous sample. Rows are aligned by name only when
+        devices were added or removed, the common case is one ``map`` over both arrays.
+        Counters that went backwards (device reset) count as zero.
+        """
+        if previous is None:
+            return None
+        if self.names == previous.names:
+            deltas = array("q", map(operator.sub, self.values, previous.values))
+        else:
+            width = len(self.columns)
+            deltas = array("q", bytes(len(self.values) * 8))
+            previous_index = {name: index for index, name in enumerate(previous.names)}
+            for row, name in enumerate(self.names):
+                index = previous_index.get(name)
+                if index is None:
+                    continue
+                for column in range(width):
+                    deltas[row * width + column] = self.values[row * width + column] - previous.values[index * width + column]
+        if min(deltas, default=0) < 0:
+            deltas = array("q", (value if value > 0 else 0 for value in deltas))
+        return deltas
+
+    def column(self, name: str, deltas: bool = True) -> array:
+        """
+        Returns one column of every row, the raw counters while there are no deltas yet.
+        """
+        source = self.deltas if deltas and self.deltas is not None else self.values
+        return source[self.columns.index(name)::len(self.columns)]
+
+    def row(self, name: str, deltas: bool = True) -> Dict[str, int]:
+        """
+        Returns the counters of one device as a dict.
+        """
+        width = len(self.columns)
+        start = self.names.index(name) * width
+        source = self.deltas if deltas and self.deltas is not None else self.values
+        return dict(zip(self.columns, source[start:start + width]))
+
+    def row_totals(self, deltas: bool = True) -> List[int]:
+        """
+        Returns the sum of the counters of each row.
+        """
+        width = len(self.columns)
+        source = self.deltas if deltas and self.deltas is not None else self.values
+        return [sum(source[start:start + width]) for start in range(0, len(source), width)]
+
+
+class ProcSnapshot:
+    """
+    One sample of the system counters with the deltas to the previous sample.
+
+    :param seq: Sequence number of the sample, starting at 1.
+    :param timestamp: ``time.monotonic()`` of the sample.
+    :param elapsed: Seconds since the previous sample, 0 for the first one.
+    """
+    __slots__ = ("seq", "timestamp", "elapsed", "cpu", "net", "disk", "memory", "load")
+
+    def __init__(self, seq: int, timestamp: float, elapsed: float,
+                 cpu: CounterSet = None, net: CounterSet = None, disk: CounterSet = None,
+                 memory: Dict[str, int] = None, load: Dict[str, float] = None):
+        self.seq = seq
+        self.timestamp = timestamp
+        self.elapsed = elapsed
+        self.cpu = cpu
+        self.net = net
+        self.disk = disk
+        self.memory = memory or {}
+        self.load = load or {}
+
+    @property
+    def has_deltas(self) -> bool:
+        return self.elapsed > 0
+
+    def since(self, previous: Optional["ProcSnapshot"]) -> "ProcSnapshot":
+        """
+        Returns this sample with the deltas to an older sample ``previous`` instead of the one just before it,
+        for callers that keep their own previous sample.
+        """
+        if previous is None or previous.seq >= self.seq:
+            return ProcSnapshot(self.seq, self.timestamp, 0.0,
+                                *(CounterSet(c.names, c.columns, c.values) for c in (self.cpu, self.net, self.disk)),
+                                memory=self.memory, load=self.load)
+        if previous.seq == self.seq - 1:
+            return self
+        counters = (CounterSet(c.names, c.columns, c.values, c.diff(p))
+                    for c, p in ((self.cpu, previous.cpu), (self.net, previous.net), (self.disk, previous.disk)))
+        return ProcSnapshot(self.seq, self.timestamp, self.timestamp - previous.timestamp, *counters,
+                            memory=self.memory, load=self.load)
+
+    def cpu_status(self, decimal: int = 1, per_core: bool = False):
+        """
+        Returns the CPU usage in percent for all CPUs, or a dict per core with ``per_core``.
+
+        :param decimal: Number of decimal places.
+        :param per_core: Return ``{"cpu0": {...}, "cpu1": {...}}`` instead of the total.
+        :return: ``{'usr': 1.0, 'sys': 0.5, 'idle': 98.5, 'io_wait': 0.0}``
+        """
+        if not per_core:
+            total = self.cpu.row("cpu")
+            total_sum = sum(total.values())
+            return {
+                key: round(100 * total[column] / total_sum, decimal) if total_sum else 0.0
+                for key, column in (("usr", "user"), ("sys", "system"), ("idle", "idle"), ("io_wait", "iowait"))
+            }
+
+        totals = self.cpu.row_totals()
+        percents = [
+            [round(100 * value / total, decimal) if total else 0.0 for value, total in zip(self.cpu.column(column), totals)]
+            for column in ("user", "system", "idle", "iowait")
+        ]
+        return {
+            name: {"usr": usr, "sys": sys, "idle": idle, "io_wait": io_wait}
+            for name, usr, sys, idle, io_wait in zip(self.cpu.names, *percents)
+            if name != "cpu"
+        }
+
+    def network_status(self) -> "OrderedDict[str, Dict[str, float]]":
+        """
+        Returns the traffic of each interface in Mbit/s and the packets since the previous sample,
+        with the sum of all interfaces in ``Total``.
+        """
+        status = OrderedDict()
+        if not self.has_deltas:
+            status["Total"] = dict.fromkeys(NET_COLUMNS, 0)
+            return status
+        recv = self.net.column("recv")
+        sent = self.net.column("sent")
+        packets_recv = self.net.column("packets_recv")
+        packets_sent = self.net.column("packets_sent")
+        factor = 8 / 1_000_000 / self.elapsed
+        for row, iface in enumerate(self.net.names):
+            status[iface] = {
+                "recv": recv[row] * factor,
+                "sent": sent[row] * factor,
+                "packets_recv": packets_recv[row],
+                "packets_sent": packets_sent[row],
+            }
+        status["Total"] = {
+            "recv": sum(recv) * factor,
+            "sent": sum(sent) * factor,
+            "packets_recv": sum(packets_recv),
+            "packets_sent": sum(packets_sent),
+        }
+        return status
+
+    def disk_status(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns the I/O of each disk since the previous sample, with the sum of all disks in ``Total``.
+        """
+        status = {}
+        columns = {name: self.disk.column(name) for name in DISK_COLUMNS}
+        rows = [(disk, row) for row, disk in enumerate(self.disk.names)] if self.has_deltas else []
+        for disk, row in rows:
+            status[disk] = self._disk_entry(*(columns[name][row] for name in DISK_COLUMNS))
+        totals = (sum(columns[name]) for name in DISK_COLUMNS) if self.has_deltas else (0, 0, 0, 0)
+        status["Total"] = self._disk_entry(*totals)
+        return status
+
+    @staticmethod
+    def _disk_entry(read_ios, read_bytes, write_ios, write_bytes):
+        return {
+            'read_ios': read_ios,
+            'read_bytes': read_bytes,
+            'write_ios': write_ios,
+            'write_bytes': write_bytes,
+            'read_mb': round(read_bytes / (1024 * 1024), 2),
+            'write_mb': round(write_bytes / (1024 * 1024), 2)
+        }
+
+    @property
+    def memory_percent(self) -> float:
+        total = self.memory.get("MemTotal")
+        if not total:
+            return 0.0
+        return 100 * (total - self.memory.get("MemAvailable", self.memory.get("MemFree", 0))) / total
+
+
+class ProcSampler:
+    """
+    Samples CPU, network, disk, memory and load counters from /proc.
+
+    The files are kept open and re-read with positional reads, the counters are parsed into flat arrays
+    and the deltas of all CPUs, interfaces and disks are computed at once. With :meth:`start` the sampler
+    runs on its own thread, so callers read :attr:`latest` without sleeping, or block on :meth:`wait`
+    until the next sample.
+
+    :param proc_path: Path of procfs.
+    :param interval: Seconds between samples of the background thread.
+    :param ignore_interfaces: Interface names that are skipped.
+    :param ignore_interface_prefixes: Interface name prefixes that are skipped.
+    :param disk_prefixes: Disk name prefixes that are sampled.
+    :param per_core: Sample every core, otherwise only the total ``cpu`` line of /proc/stat is parsed.
+
+    Example:
+
+        .. code-block:: python
+
+            from pawnlib.resource.sampler import ProcSampler
+
+            sampler = ProcSampler(interval=1)
+            sampler.start()
+            snapshot = sampler.wait()
+            snapshot.cpu_status()
+            # >> {'usr': 1.0, 'sys': 0.5, 'idle': 98.5, 'io_wait': 0.0}
+            snapshot.cpu_status(per_core=True)["cpu0"]
+            snapshot.network_status()["Total"]
+            sampler.stop()
+
+    """
+
+    def __init__(self, proc_path: str = "/proc", interval: float = 1,
+                 ignore_interfaces: tuple = ("lo",), disk_prefixes: tuple = ("sd", "vd", "nvme"),
+                 per_core: bool = True, ignore_interface_prefixes: tuple = ("sit",)):
+        if interval <= 0:
+            raise ValueError("Interval must be a positive number greater than 0")
+        self.proc_path = proc_path
+        self.interval = interval
+        self.ignore_interfaces = frozenset(ignore_interfaces)
+        self.ignore_interface_prefixes = tuple(ignore_interface_prefixes)
+        self.disk_prefixes = tuple(disk_prefixes)
+        self.per_core = per_core
+
+        self._files = {}
+        self._seq = 0
+        self._latest = None
+        self._condition = threading.Condition()
+        self._sample_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._running = None
+
+    def _file(self, name: str) -> Optional[ProcFile]:
+        if name not in self._files:
+            try:
+                self._files[name] = ProcFile(os.path.join(self.proc_path, name))
+            except OSError:
+                self._files[name] = None
+        return self._files[name]
+
+    def _read(self, name: str) -> bytes:
+        proc_file = self._file(name)
+        return proc_file.read() if proc_file else b""
+
+    def read_cpu(self) -> CounterSet:
+        """
+        Parses the ``cpu`` lines of /proc/stat, the total row ``cpu`` first and then one row per core.
+        The parsing stops at the first other line, so the long ``intr`` line is never split.
+        """
+        data = self._read("stat")
+        width = len(CPU_COLUMNS)
+        if not self.per_core:
+            fields = data[:data.find(b"\n")].split()
+            values = array("Q", map(int, fields[1:width + 1]))
+            values.extend([0] * (width - len(values)))
+            return CounterSet(("cpu",), CPU_COLUMNS, values)
+
+        end = data.find(b"\nintr")
+        section = data[:end if end >= 0 else len(data)]
+
+        # Fast path: one split of all cpu lines when every line has the full set of columns
+        tokens = section.split()
+        if len(tokens) % (width + 1) == 0 and tokens[-width - 1].startswith(b"cpu") \
+                and section.count(b"\n") + 1 == len(tokens) // (width + 1):
+            names = tuple(name.decode() for name in tokens[::width + 1])
+            del tokens[::width + 1]
+            return CounterSet(names, CPU_COLUMNS, array("Q", map(int, tokens)))
+
+        names = []
+        values = array("Q")
+        for line in section.splitlines():
+            if not line.startswith(b"cpu"):
+                break
+            fields = line.split()
+            names.append(fields[0].decode())
+            counters = fields[1:width + 1]
+            values.extend(map(int, counters))
+            if len(counters) < width:
+                values.extend([0] * (width - len(counters)))
+        return CounterSet(tuple(names), CPU_COLUMNS, values)
+
+    def read_net(self) -> CounterSet:
+        names = []
+        values = array("Q")
+        for line in self._read("net/dev").splitlines()[2:]:
+            iface, _, counters = line.partition(b":")
+            iface = iface.strip().decode()
+            if iface in self.ignore_interfaces or iface.startswith(self.ignore_interface_prefixes):
+                continue
+            fields = counters.split()
+            names.append(iface)
+            values.extend((int(fields[0]), int(fields[1]), int(fields[8]), int(fields[9])))
+        return CounterSet(tuple(names), NET_COLUMNS, values)
+
+    def read_disk(self) -> CounterSet:
+        names = []
+        values = array("Q")
+        for line in self._read("diskstats").splitlines():
+            fields = line.split()
+            if len(fields) < 10:
+                continue
+            disk = fields[2].decode()
+            if not disk.startswith(self.disk_prefixes):
+                continue
+            names.append(disk)
+            values.extend((int(fields[3]), int(fields[5]) * 512, int(fields[7]), int(fields[9]) * 512))
+        return CounterSet(tuple(names), DISK_COLUMNS, values)
+
+    def read_memory(self) -> Dict[str, int]:
+        """
+        Returns /proc/meminfo in kB, HugePages_* entries are counts.
+        """
+        memory = {}
+        for line in self._read("meminfo").splitlines():
+            key, _, value = line.partition(b":")
+            fields = value.split()
+            if fields:
+                memory[key.decode()] = int(fields[0])
+        return memory
+
+    def read_load(self) -> Dict[str, float]:
+        fields = self._read("loadavg").split()
+        if len(fields) < 3:
+            return {}
+        return {"1min": float(fields[0]), "5min": float(fields[1]), "15min": float(fields[2])}
+
+    def read_tcp_states(self) -> Dict[str, int]:
+        """
+        Counts the IPv4 TCP sockets of /proc/net/tcp by state, the same as ``get_netstat_count()['COUNT']``.
+        """
+        count = dict.fromkeys(TCP_STATES.values(), 0)
+        for line in self._read("net/tcp").splitlines()[1:]:
+            fields = line.split(None, 4)
+            if len(fields) > 3:
+                state = TCP_STATES.get(fields[3])
+                if state:
+                    count[state] += 1
+        return count
+
+    def sample(self) -> ProcSnapshot:
+        """
+        Takes a sample, computes the deltas to the previous one and makes it the latest snapshot.
+        """
+        with self._sample_lock:
+            timestamp = time.monotonic()
+            cpu, net, disk = self.read_cpu(), self.read_net(), self.read_disk()
+            previous = self._latest
+            if previous is not None:
+                cpu.deltas = cpu.diff(previous.cpu)
+                net.deltas = net.diff(previous.net)
+                disk.deltas = disk.diff(previous.disk)
+            elapsed = timestamp - previous.timestamp if previous is not None else 0.0
+            snapshot = ProcSnapshot(
+                seq=self._seq + 1, timestamp=timestamp, elapsed=elapsed, cpu=cpu, net=net, disk=disk,
+                memory=self.read_memory(), load=self.read_load(),
+            )
+            with self._condition:
+                self._seq = snapshot.seq
+                self._latest = snapshot
+                self._condition.notify_all()
+            return snapshot
+
+    @property
+    def latest(self) -> Optional[ProcSnapshot]:
+        return self._latest
+
+    def wait(self, after_seq: Optional[int] = None, timeout: Optional[float] = None) -> Optional[ProcSnapshot]:
+        """
+        Blocks until there is a snapshot with deltas that is newer than ``after_seq`` and returns it.
+
+        :param after_seq: Sequence number of the last snapshot the caller has seen.
+        :param timeout: Maximum seconds to wait, None waits forever.
+        :return: The snapshot, or None on timeout.
+        :raises RuntimeError: If the background thread has stopped before the snapshot arrived.
+        """
+        after_seq = after_seq or 0
+
+        def is_ready():
+            return self._latest is not None and self._latest.seq > after_seq and self._latest.has_deltas
+
+        with self._condition:
+            if not self._condition.wait_for(lambda: is_ready() or self._running is False, timeout=timeout):
+                return None
+            if not is_ready():
+                raise RuntimeError("ProcSampler thread is not running")
+            return self._latest
+
+    def start(self):
+        """
+        Starts sampling every ``interval`` seconds on a daemon thread.
+        """
+        if self._thread and self._thread.is_alive():
+            return self
+        self._stop_event.clear()
+        self.sample()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="ProcSampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        next_time = time.monotonic() + self.interval
+        try:
+            while not self._stop_event.wait(max(0.0, next_time - time.monotonic())):
+                try:
+                    self.sample()
+                except Exception as e:
+                    # A device that disappears mid-read only costs this sample
+                    pawn.error_logger.error(f"ProcSampler failed to take a sample - {e}")
+                    pawn.console.debug(f"ProcSampler failed to take a sample - {e}")
+                next_time += self.interval
+                now = time.monotonic()
+                if next_time < now:
+                    next_time = now + self.interval
+        finally:
+            with self._condition:
+                self._running = False
+                self._condition.notify_all()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def close(self):
+        self.stop()
+        for proc_file in self._files.values():
+            if proc_file:
+                proc_file.close()
+        self._files = {}
+
+
+class _ProcessEntry:
+    __slots__ = ("pid", "name", "starttime", "stat_file", "io_file", "io_denied", "jiffies", "cpu_percent", "rss",
+                 "io_read_bytes", "io_write_bytes")
+
+    def __init__(self, pid: int):
+        self.pid = pid
+        self.name = ""
+        self.starttime = None
+        self.stat_file = None
+        self.io_file = None
+        self.io_denied = False
+        self.jiffies = None
+        self.cpu_percent = 0.0
+        self.rss = 0
+        self.io_read_bytes = 0
+        self.io_write_bytes = 0
+
+    def close(self):
+        for proc_file in (self.stat_file, self.io_file):
+            if proc_file:
+                proc_file.close()
+        self.stat_file = self.io_file = None
+
+
+class ProcessTable:
+    """
+    Incremental table of the processes in /proc for top-N CPU, memory and I/O consumers.
+
+    Each scan lists the pids once, opens only the pids that are new, drops the dead ones and re-reads
+    ``/proc/<pid>/stat`` (and ``/proc/<pid>/io`` with ``track_io``) through cached file descriptors.
+    The CPU usage is the delta of the utime and stime jiffies since the previous scan, the same
+    as ``psutil.Process.cpu_percent()``, and the top-N are selected with a heap.
+
+    ``/proc/<pid>/stat`` already carries the resident set size of ``statm``, so one read per process is enough.
+    Descriptors are only cached up to ``max_open_files``, the remaining processes are opened and closed on each scan.
+    A pid that was reused by a new process is detected by its start time.
+
+    :param proc_path: Path of procfs.
+    :param track_io: Also read the I/O counters of ``/proc/<pid>/io``, which needs the permission of the process owner.
+    :param max_open_files: Maximum number of cached descriptors, defaults to a quarter of ``RLIMIT_NOFILE``.
+
+    Example:
+
+        .. code-block:: python
+
+            from pawnlib.resource.sampler import ProcessTable
+
+            table = ProcessTable()
+            table.scan()
+            table.top(5, resource="memory")
+            # >> [{'pid': 1234, 'name': 'java', 'memory_percent': 12.3}, ...]
+            time.sleep(1)
+            table.scan()
+            table.top(5, resource="cpu")
+            # >> [{'pid': 1234, 'name': 'java', 'cpu_percent': 150.2}, ...]
+
+    """
+
+    RESOURCES = ("cpu", "memory", "io")
+
+    def __init__(self, proc_path: str = "/proc", track_io: bool = False, max_open_files: int = None):
+        self.proc_path = proc_path
+        self.track_io = track_io
+        if max_open_files is None:
+            try:
+                import resource
+                max_open_files = resource.getrlimit(resource.RLIMIT_NOFILE)[0] // 4
+            except (ImportError, ValueError):
+                max_open_files = 256
+        self.max_open_files = max_open_files
+        self.open_files = 0
+        self.processes: Dict[int, _ProcessEntry] = {}
+        self.page_size = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+        self.clock_ticks = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+        self.mem_total = self._read_mem_total()
+        self.last_scan = None
+        self.elapsed = 0.0
+
+    @staticmethod
+    def is_supported(proc_path: str = "/proc") -> bool:
+        return os.path.exists(os.path.join(proc_path, "self", "stat"))
+
+    def _read_mem_total(self) -> int:
+        try:
+            with open(os.path.join(self.proc_path, "meminfo"), "rb") as f:
+                for line in f:
+                    if line.startswith(b"MemTotal:"):
+                        return int(line.split()[1]) * 1024
+        except OSError:
+            pass
+        return 0
+
+    @property
+    def has_deltas(self) -> bool:
+        return self.elapsed > 0
+
+    def _read(self, entry: _ProcessEntry, name: str) -> bytes:
+        attribute = f"{name}_file"
+        proc_file = getattr(entry, attribute)
+        if proc_file:
+            return proc_file.read()
+        path = os.path.join(self.proc_path, str(entry.pid), name)
+        if self.open_files < self.max_open_files:
+            proc_file = ProcFile(path, buffer_size=1024 if name == "stat" else 256)
+            setattr(entry, attribute, proc_file)
+            self.open_files += 1
+            return proc_file.read()
+        with open(path, "rb") as f:
+            return f.read()
+
+    def _drop(self, pid: int):
+        entry = self.processes.pop(pid)
+        self.open_files -= (entry.stat_file is not None) + (entry.io_file is not None)
+        entry.close()
+
+    def _update(self, entry: _ProcessEntry, interval_ticks: float) -> bool:
+        data = self._read(entry, "stat")
+        name_start = data.find(b"(")
+        name_end = data.rfind(b")")
+        fields = data[name_end + 2:].split()
+        starttime = int(fields[19])
+        if entry.starttime is not None and entry.starttime != starttime:
+            return False
+        jiffies = int(fields[11]) + int(fields[12])
+        if entry.starttime is None:
+            entry.starttime = starttime
+            entry.name = data[name_start + 1:name_end].decode(errors="replace")
+        elif interval_ticks:
+            entry.cpu_percent = 100 * (jiffies - entry.jiffies) / interval_ticks
+        entry.jiffies = jiffies
+        entry.rss = int(fields[21]) * self.page_size
+
+        if self.track_io and not entry.io_denied:
+            try:
+                io = self._read(entry, "io")
+            except PermissionError:
+                entry.io_denied = True
+            else:
+                for line in io.splitlines():
+                    if line.startswith(b"read_bytes:"):
+                        entry.io_read_bytes = int(line[11:])
+                    elif line.startswith(b"write_bytes:"):
+                        entry.io_write_bytes = int(line[12:])
+        return True
+
+    def scan(self) -> int:
+        """
+        Refreshes the table and returns the number of processes.
+        """
+        now = time.monotonic()
+        self.elapsed = now - self.last_scan if self.last_scan is not None else 0.0
+        self.last_scan = now
+        interval_ticks = self.elapsed * self.clock_ticks
+
+        pids = {int(name) for name in os.listdir(self.proc_path) if name.isdigit()}
+        for pid in self.processes.keys() - pids:
+            self._drop(pid)
+
+        for pid in pids:
+            entry = self.processes.get(pid)
+            if entry is not None:
+                try:
+                    if self._update(entry, interval_ticks):
+                        continue
+                except (OSError, ValueError, IndexError):
+                    pass
+                # The process exited, or the pid was reused by a new process
+                self._drop(pid)
+            entry = self.processes[pid] = _ProcessEntry(pid)
+            try:
+                self._update(entry, interval_ticks)
+            except (OSError, ValueError, IndexError):
+                self._drop(pid)
+        return len(self.processes)
+
+    def top(self, n: int = 5, resource: str = "memory") -> List[Dict[str, Union[str, float]]]:
+        """
+        Returns the top ``n`` processes of the last scan by ``cpu``, ``memory`` or ``io``,
+        with the same keys as :meth:`ProcessMonitor.get_top_processes`.
+        """
+        if resource == "memory":
+            mem_total = self.mem_total or 1
+            entries = heapq.nlargest(n, self.processes.values(), key=operator.attrgetter("rss"))
+            return [{"pid": entry.pid, "name": entry.name, "memory_percent": 100 * entry.rss / mem_total} for entry in entries]
+        if resource == "cpu":
+            entries = heapq.nlargest(n, self.processes.values(), key=operator.attrgetter("cpu_percent"))
+            return [{"pid": entry.pid, "name": entry.name, "cpu_percent": entry.cpu_percent} for entry in entries]
+        if resource == "io":
+            entries = heapq.nlargest(n, self.processes.values(), key=lambda entry: entry.io_read_bytes + entry.io_write_bytes)
+            return [
+                {"pid": entry.pid, "name": entry.name, "io_read_bytes": entry.io_read_bytes, "io_write_bytes": entry.io_write_bytes}
+                for entry in entries
+            ]
+        raise ValueError(f"Invalid resource: {resource}. Choose from {', '.join(self.RESOURCES)}.")
+
+    def close(self):
+        for pid in list(self.processes):
+            self._drop(pid)
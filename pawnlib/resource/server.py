@@ -5,12 +5,14 @@ import os
 import subprocess
 import re
 from typing import Callable, Union, Dict, List
-from collections import OrderedDict, defaultdict
+from collections import defaultdict
 from pawnlib.utils import http
 from pawnlib.typing import is_valid_ipv4, split_every_n, format_size
 from pawnlib.config import pawn
 from pawnlib.typing.converter import PrettyOrderedDict, dict_to_line, format_network_traffic
 from pawnlib.resource.net import ProcNetMonitor
+from pawnlib.resource.sampler import ProcSampler, ProcessTable
+from pawnlib.resource.diskio import DiskIOJob
 
 import shutil
 import random
@@ -44,6 +46,9 @@ import aiohttp
 import asyncio
 logger = logging.getLogger(__name__)
 
+_memory_process_tables = {}
+_memory_process_tables_lock = threading.Lock()
+
 
 def hex_mask_to_cidr(hex_mask):
     """
@@ -409,6 +414,7 @@ class ProcessMonitor:
         self.console = console if console else Console()
         self.process_number = n
         self.previous_usage = {}
+        self.process_table = ProcessTable(track_io=True) if ProcessTable.is_supported() else None
         self.stop_event = threading.Event()
         self.proc_net_monitor =  ProcNetMonitor(
                                                         top_n=5,
@@ -455,7 +461,26 @@ class ProcessMonitor:
         self.console.print("ProcessMonitor stopped.", style="bold green")
 
 
-    def get_top_processes(self, n: int = 5, resource: str = "memory") -> List[Dict[str, Union[str, float]]]:
+    def get_top_processes(self, n: int = 5, resource: str = "memory", refresh: bool = True) -> List[Dict[str, Union[str, float]]]:
+        """
+        Returns the top ``n`` processes by ``memory``, ``cpu`` or ``io``.
+
+        On Linux the processes come from an incremental :class:`ProcessTable`, the CPU usage is measured
+        since the previous scan and only the very first ``cpu`` call waits a second for it.
+        Elsewhere every call iterates all processes with psutil.
+
+        :param n: Number of processes.
+        :param resource: ``memory``, ``cpu`` or ``io``.
+        :param refresh: Scan the processes first. :meth:`create_dashboard` scans once for all tables.
+        """
+        if self.process_table is not None and resource in ProcessTable.RESOURCES:
+            if refresh:
+                self.process_table.scan()
+            if resource == "cpu" and not self.process_table.has_deltas:
+                time.sleep(1)
+                self.process_table.scan()
+            return self.process_table.top(n, resource=resource)
+
         processes = []
         all_processes = list(psutil.process_iter(['pid', 'name']))
 
@@ -599,9 +624,11 @@ class ProcessMonitor:
 
     def create_dashboard(self) -> Layout:
         try:
-            memory_processes = self.get_top_processes(n=self.process_number, resource="memory")
-            cpu_processes = self.get_top_processes(n=self.process_number, resource="cpu")
-            io_processes = self.get_top_processes(n=self.process_number, resource="io")
+            if self.process_table is not None:
+                self.process_table.scan()
+            memory_processes = self.get_top_processes(n=self.process_number, resource="memory", refresh=False)
+            cpu_processes = self.get_top_processes(n=self.process_number, resource="cpu", refresh=False)
+            io_processes = self.get_top_processes(n=self.process_number, resource="io", refresh=False)
 
             # Fetch network data from ProcNetMonitor
             network_processes = self.get_network_usage_from_monitor()
@@ -700,7 +727,16 @@ class MemoryStatus:
             return {}
 
     @staticmethod
-    def get_top_memory_processes(n: int = 5) -> List[Dict[str, Union[str, float]]]:
+    def get_top_memory_processes(n: int = 5, proc_path: str = "/proc") -> List[Dict[str, Union[str, float]]]:
+        if ProcessTable.is_supported(proc_path):
+            # One shared table per proc path, so repeated calls only re-read the changed pids
+            with _memory_process_tables_lock:
+                process_table = _memory_process_tables.get(proc_path)
+                if process_table is None:
+                    process_table = _memory_process_tables[proc_path] = ProcessTable(proc_path=proc_path)
+                process_table.scan()
+                return process_table.top(n, resource="memory")
+
         processes = []
         for proc in psutil.process_iter(['pid', 'name', 'memory_percent']):
             try:
@@ -713,8 +749,9 @@ class MemoryStatus:
                 pass
         return sorted(processes, key=lambda x: x['memory_percent'], reverse=True)[:n]
 
-    def get_huge_pages_info(self) -> Dict[str, int]:
-        meminfo = self.parse_meminfo(self.read_stats_file(f"{self.proc_path}/meminfo"))
+    def get_huge_pages_info(self, meminfo: Dict[str, int] = None) -> Dict[str, int]:
+        if meminfo is None:
+            meminfo = self.parse_meminfo(self.read_stats_file(f"{self.proc_path}/meminfo"))
         return {
             "HugePages_Total": meminfo.get("HugePages_Total", 0),
             "HugePages_Free": meminfo.get("HugePages_Free", 0),
@@ -723,7 +760,7 @@ class MemoryStatus:
             "Hugepagesize": meminfo.get("Hugepagesize", 0)
         }
 
-    def get_memory_status(self, unit: str = "GB", output_format: str = "dict") -> Union[Dict, str]:
+    def get_memory_status(self, unit: str = "GB", output_format: str = "dict", include_top_processes: bool = True) -> Union[Dict, str]:
         current_time = time.time()
         if current_time - self.last_check_time < self.cache_duration and self.cached_result:
             return self.cached_result
@@ -766,8 +803,8 @@ class MemoryStatus:
             "swap_percent": round(swap_percent, 2),
             "unit": unit,
             "pressure": self.get_memory_pressure(),
-            "top_processes": self.get_top_memory_processes(),
-            "huge_pages": self.get_huge_pages_info()
+            "top_processes": self.get_top_memory_processes(proc_path=self.proc_path) if include_top_processes else [],
+            "huge_pages": self.get_huge_pages_info(meminfo_dict)
         }
 
         self.memory_history.append((current_time, percent_used))
@@ -795,15 +832,43 @@ class MemoryStatus:
 
 
 class SystemMonitor:
-    def __init__(self, interval=1, proc_path="/proc"):
+    """
+    CPU, network, disk and memory status of the host, sampled from /proc by a :class:`ProcSampler`.
+
+    :param interval: Seconds between samples.
+    :param proc_path: Path of procfs.
+    :param background: Sample on a background thread. :meth:`collect_system_status` then waits for the
+                       next sample instead of sleeping, and the getters return the latest sample at once.
+                       Otherwise every getter takes a sample and reports the deltas since its own previous call.
+    :param per_core: Also sample every core, needed for :meth:`get_cpu_core_status`.
+
+    Example:
+
+        .. code-block:: python
+
+            from pawnlib.resource import SystemMonitor
+
+            system_monitor = SystemMonitor(interval=1, background=True, per_core=True)
+            network, cpu, disk = system_monitor.collect_system_status()
+            system_monitor.last_snapshot.cpu_status(per_core=True)
+            system_monitor.stop()
+
+    """
+    def __init__(self, interval=1, proc_path="/proc", background=False, per_core=False):
         if interval <= 0:
             raise ValueError("Interval must be a positive number greater than 0")
 
         self.interval = interval
         self.proc_path = proc_path
-        self.prev_net_data = self.parse_net_dev()
-        self.prev_cpu_data = self.parse_cpu_stat()
-        self.prev_disk_stats = self.read_disk_stats()
+        self.background = background
+        self.sampler = ProcSampler(proc_path=self.proc_path, interval=self.interval, per_core=per_core)
+        if self.background:
+            self.sampler.start()
+        else:
+            self.sampler.sample()
+        self.last_snapshot = self.sampler.latest
+        self._first_snapshot = self.sampler.latest
+        self._previous_snapshots = {}
 
         self.mem_status = MemoryStatus(proc_path=self.proc_path)
         self.cached_result = None
@@ -815,156 +880,67 @@ class SystemMonitor:
             return f.readlines()
 
     def parse_net_dev(self):
-        lines = self.read_stats_file(f"{self.proc_path}/net/dev")
-        data = {}
-        for line in lines[2:]:
-            parts = line.split()
-            iface = parts[0].strip(':')
-            if iface == "lo" or iface.startswith("sit"):
-                continue
-            data[iface] = {
-                'recv': int(parts[1]),
-                'sent': int(parts[9]),
-                'packets_recv': int(parts[2]),
-                'packets_sent': int(parts[10]),
-            }
-        return data
+        net = self.sampler.read_net()
+        return {iface: net.row(iface, deltas=False) for iface in net.names}
 
     def parse_cpu_stat(self):
-        for line in self.read_stats_file(f"{self.proc_path}/stat"):
-            if line.startswith("cpu "):
-                values = line.split()[1:]
-                return list(map(int, values))
+        cpu = self.sampler.read_cpu()
+        return list(cpu.values[:len(cpu.columns)])
 
-    def get_cpu_status(self, decimal=1):
-        end_values = self.parse_cpu_stat()
-        start_values = self.prev_cpu_data
-        self.prev_cpu_data = end_values
-
-        diff = [end - start for start, end in zip(start_values, end_values)]
-        total_diff = sum(diff)
+    def read_disk_stats(self):
+        disk = self.sampler.read_disk()
+        return {name: disk.row(name, deltas=False) for name in disk.names}
+
+    def _current_snapshot(self, consumer):
+        if self.background:
+            self.last_snapshot = self.sampler.latest
+            return self.last_snapshot
+        # Each consumer keeps its own previous sample, like the per-metric previous values of the getters
+        previous = self._previous_snapshots.get(consumer, self._first_snapshot)
+        snapshot = self.sampler.sample()
+        self._previous_snapshots[consumer] = snapshot
+        self.last_snapshot = snapshot
+        return snapshot.since(previous)
+
+    def _next_snapshot(self):
+        if self.background:
+            snapshot = self.sampler.wait(after_seq=self.last_snapshot.seq if self.last_snapshot else 0)
+            self.last_snapshot = snapshot
+            return snapshot
+        time.sleep(self.interval)
+        return self._current_snapshot("system")
 
-        us_percent = 100 * diff[0] / total_diff
-        sy_percent = 100 * diff[2] / total_diff
-        id_percent = 100 * diff[3] / total_diff
-        io_wait = 100 * diff[4] / total_diff
+    def get_cpu_status(self, decimal=1):
+        return self._current_snapshot("cpu").cpu_status(decimal=decimal)
 
-        return {
-            'usr': round(us_percent, decimal),
-            'sys': round(sy_percent, decimal),
-            'idle': round(id_percent, decimal),
-            'io_wait': round(io_wait, decimal)
-        }
+    def get_cpu_core_status(self, decimal=1):
+        return self._current_snapshot("cpu_core").cpu_status(decimal=decimal, per_core=True)
 
     def collect_system_status(self):
-        time.sleep(self.interval)
-        cpu_status = self.get_cpu_status()
-        network_status = self.get_network_status()
-        disk_stats = self.get_disk_usage()
-        return network_status, cpu_status, disk_stats
+        snapshot = self._next_snapshot()
+        return snapshot.network_status(), snapshot.cpu_status(), snapshot.disk_status()
 
     def get_network_status(self):
-        curr_net_data = self.parse_net_dev()
-        interface_data = OrderedDict()
-        total_received = total_sent = total_packets_recv = total_packets_sent = 0
-
-        for iface, curr in curr_net_data.items():
-            prev = self.prev_net_data.get(iface)
-            if prev:
-                diff_recv = (curr['recv'] - prev['recv']) * 8 / 1_000_000 / self.interval  # Bytes to Mb
-                diff_sent = (curr['sent'] - prev['sent']) * 8 / 1_000_000 / self.interval  # Bytes to Mb
-                diff_packets_recv = curr['packets_recv'] - prev['packets_recv']
-                diff_packets_sent = curr['packets_sent'] - prev['packets_sent']
-
-                total_received += diff_recv
-                total_sent += diff_sent
-                total_packets_recv += diff_packets_recv
-                total_packets_sent += diff_packets_sent
-
-                interface_data[iface] = {
-                    "recv": diff_recv,
-                    "sent": diff_sent,
-                    "packets_recv": diff_packets_recv,
-                    "packets_sent": diff_packets_sent,
-                }
-
-        interface_data["Total"] = {
-            "recv": total_received,
-            "sent": total_sent,
-            "packets_recv": total_packets_recv,
-            "packets_sent": total_packets_sent,
-        }
-        self.prev_net_data = curr_net_data
-        return interface_data
-
-    def read_disk_stats(self):
-        disk_stats = {}
-        lines = self.read_stats_file(f"{self.proc_path}/diskstats")
-        for line in lines:
-            parts = line.split()
-            disk_name = parts[2]
-            if any(disk_name.startswith(prefix) for prefix in ["sd", "vd", "nvme"]):
-                disk_stats[disk_name] = {
-                    'read_ios': int(parts[3]),
-                    'read_bytes': int(parts[5]) * 512,
-                    'write_ios': int(parts[7]),
-                    'write_bytes': int(parts[9]) * 512,
-                }
-        return disk_stats
+        return self._current_snapshot("network").network_status()
 
     def get_disk_usage(self):
-        curr_disk_stats = self.read_disk_stats()
-        disk_usage = {}
-        total_read_ios = total_write_ios = total_read_bytes = total_write_bytes = 0
-
-        for disk, curr in curr_disk_stats.items():
-            if disk in self.prev_disk_stats:
-                prev = self.prev_disk_stats[disk]
-                read_ios = curr['read_ios'] - prev['read_ios']
-                read_bytes = curr['read_bytes'] - prev['read_bytes']
-                write_ios = curr['write_ios'] - prev['write_ios']
-                write_bytes = curr['write_bytes'] - prev['write_bytes']
-
-                disk_usage[disk] = {
-                    'read_ios': read_ios,
-                    'read_bytes': read_bytes,
-                    'write_ios': write_ios,
-                    'write_bytes': write_bytes,
-                    'read_mb': round(read_bytes / (1024 * 1024), 2),
-                    'write_mb': round(write_bytes / (1024 * 1024), 2)
-                }
-
-                total_read_ios += read_ios
-                total_write_ios += write_ios
-                total_read_bytes += read_bytes
-                total_write_bytes += write_bytes
-
-        disk_usage['Total'] = {
-            'read_ios': total_read_ios,
-            'read_bytes': total_read_bytes,
-            'write_ios': total_write_ios,
-            'write_bytes': total_write_bytes,
-            'read_mb': round(total_read_bytes / (1024 * 1024), 2),
-            'write_mb': round(total_write_bytes / (1024 * 1024), 2)
-        }
-        self.prev_disk_stats = curr_disk_stats
-        return disk_usage
+        return self._current_snapshot("disk").disk_status()
 
-    def get_memory_status(self, unit="GB"):
-        result = self.mem_status.get_memory_status(unit=unit)
+    def get_memory_status(self, unit="GB", include_top_processes=True):
+        result = self.mem_status.get_memory_status(unit=unit, include_top_processes=include_top_processes)
         return result
 
     def get_system_status(self):
-        time.sleep(self.interval)
-        network_status = self.get_network_status()
-        cpu_status = self.get_cpu_status()
-        disk_stats = self.get_disk_usage()
+        network_status, cpu_status, disk_stats = self.collect_system_status()
         return network_status, cpu_status, disk_stats
 
     def print_memory_status(self):
         mem_status = self.get_memory_status()
         print(f"Memory Usage --> {mem_status['percent']:.2f}% ({mem_status['used']:.2f} {mem_status['unit']} Used / {mem_status['total']:.2f} {mem_status['unit']} Total)")
 
+    def stop(self):
+        self.sampler.close()
+
 
 def get_netstat_count(proc_path="/proc", detail=False):
     netstate_kind = {
@@ -1962,6 +1938,10 @@ class DiskPerformanceTester:
             tester.measure_write_speed("/tmp/testfile", task_id, progress)
             tester.measure_read_speed("/tmp/testfile", task_id, progress)
             tester.cleanup_and_exit()
+
+            # fio-style jobs with O_DIRECT, random offsets and latency percentiles
+            tester = DiskPerformanceTester("/data/testfile", 4096, block_size_kb=4, num_threads=16)
+            tester.run_io_jobs(["randread", "randwrite"], runtime=30)
     """
 
     def __init__(self, file_path, file_size_mb, iterations=5, block_size_kb=1024, num_threads=1, io_pattern="sequential", decimal_places=2, console=None, verbose=False, additional_info=None):
@@ -2204,6 +2184,46 @@ class DiskPerformanceTester:
             results["additional_info"] = self.additional_info
         return results
 
+    def run_io_jobs(self, rw_modes=("randread", "randwrite"), queue_depth=None, rwmixread=70, runtime=10, direct=True, sync=False):
+        """
+        Run fio-style jobs with :class:`DiskIOJob` one after another on the same preallocated file.
+
+        :param rw_modes: List of modes, see ``pawnlib.resource.diskio.IO_MODES``.
+        :param queue_depth: Number of I/Os in flight. Default is ``num_threads``.
+        :param rwmixread: Percentage of reads for the rw and randrw modes.
+        :param runtime: Duration of each job in seconds.
+        :param direct: Use O_DIRECT.
+        :param sync: Open the file with O_DSYNC.
+        :return: Dict with the results of each job under ``jobs``.
+        """
+        file_path = f"{self.base_file_path}_io"
+        self.test_files.append(file_path)
+        jobs = []
+        try:
+            for rw in rw_modes:
+                job = DiskIOJob(
+                    file_path,
+                    file_size_mb=self.file_size_mb,
+                    rw=rw,
+                    block_size_kb=self.block_size_kb,
+                    queue_depth=queue_depth or self.num_threads,
+                    rwmixread=rwmixread,
+                    runtime=runtime,
+                    direct=direct,
+                    sync=sync,
+                    console=self.console,
+                )
+                self.console.log(f"Running {rw} job for {runtime}s on {file_path} ({self.file_size_mb}MB)")
+                jobs.append(job.run())
+                self.console.log(job.summary())
+        finally:
+            self.cleanup_files()
+
+        results = {"jobs": jobs}
+        if self.additional_info:
+            results["additional_info"] = self.additional_info
+        return results
+
     def save_results(self):
         results = self.create_results_dict()
 
@@ -736,6 +736,27 @@ class SecretPatternConstants:
         "env_style_key": "Environment Variable Style Key (e.g., API_KEY=xxx)"
     }
 
+    # Prefilters for SecretScanner. Keep them in sync with SECRET_PATTERNS.
+    # Every match of these patterns starts with one of the literals.
+    SECRET_PREFIXES = {
+        "slack_token": ("xoxb-", "xoxp-"),
+        "aws_access_key": ("AKIA",),
+        "generic_key": ("key", "token", "secret"),
+        "github_pat": ("ghp_",),
+        "google_api_key": ("AIza",),
+        "stripe_api_key": ("sk_", "pk_", "rk_"),
+        "jwt_token": ("eyJ",),
+        "ssh_private_key": ("-----BEGIN ",),
+        "db_connection_string": ("mysql://", "postgres://", "mongodb://", "redis://"),
+        "twilio_api_key": ("SK",),
+    }
+    # Every match of these patterns contains one of the literals and no line break.
+    SECRET_LITERALS = {
+        "env_style_key": ("_KEY=",),
+    }
+    # These patterns only match in (or right after) a run of at least 24 characters of [A-Za-z0-9+/].
+    SECRET_TOKEN_RUN_PATTERNS = ("aws_secret_key", "discord_bot_token", "general_api_key")
+
     @classmethod
     def get_pattern(cls, secret_type: str) -> str:
         """
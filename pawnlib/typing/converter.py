@@ -17,7 +17,10 @@ from collections import OrderedDict, UserDict
 from pawnlib import logger
 from pawnlib.typing.constants import const
 from pawnlib.config.__fix_import import Null
+from pawnlib.metrics.window import RollingWindow, WindowMinMax
 import statistics
+from bisect import bisect_left, insort
+from collections import deque
 from datetime import datetime, timedelta, timezone
 from urllib.parse import urlparse, urlunparse
 from decimal import Decimal, getcontext, ROUND_DOWN
@@ -262,6 +265,10 @@ class StackList:
     """
     Stack List
 
+    Pushing is O(1). Once a numeric statistic is asked for, the sum, min and max (and the sorted window for the
+    median) are kept up to date on every push, so reading them does not scan the list again.
+    If a non-numeric item is pushed, the statistics are computed from the items as before.
+
     :param max_length: max length size for list
 
     Example:
@@ -284,12 +291,44 @@ class StackList:
 
     def __init__(self, max_length=1000):
         self.max_length = max_length
-        self.data = []
+        self.data = deque(maxlen=max_length)
+        self._reset_stats()
+
+    def _reset_stats(self):
+        self._numeric = None
+        self._window = None
+        self._min_max = None
+        self._sorted = None
+
+    def _numeric_stats(self):
+        if self._numeric is None and self.data:
+            window = RollingWindow(self.max_length)
+            min_max = WindowMinMax(self.max_length)
+            try:
+                for item in self.data:
+                    window.append(item)
+                    min_max.append(item)
+            except TypeError:
+                self._numeric = False
+            else:
+                self._numeric = True
+                self._window, self._min_max = window, min_max
+        return self._numeric and bool(self.data)
 
     def push(self, item):
-        if len(self.data) == self.max_length:
-            self.data.pop(0)
+        evicted = self.data[0] if len(self.data) == self.max_length else None
         self.data.append(item)
+        if self._numeric:
+            try:
+                self._window.append(item)
+                self._min_max.append(item)
+                if self._sorted is not None:
+                    insort(self._sorted, item)
+                    if evicted is not None:
+                        del self._sorted[bisect_left(self._sorted, evicted)]
+            except TypeError:
+                self._reset_stats()
+                self._numeric = False
 
     def check_and_push(self, item):
         if self.data and self.data[-1] == item:
@@ -299,31 +338,50 @@ class StackList:
         return True
 
     def sum(self):
+        if self._numeric_stats():
+            return self._window.sum()
         return sum(self.data)
 
     def median(self):
+        if self._numeric_stats():
+            if self._sorted is None:
+                self._sorted = sorted(self.data)
+            middle = len(self._sorted) // 2
+            if len(self._sorted) % 2:
+                return self._sorted[middle]
+            return (self._sorted[middle - 1] + self._sorted[middle]) / 2
         return statistics.median(self.data)
 
     def mean(self):
+        if self._numeric_stats():
+            return self._window.mean()
         return statistics.mean(self.data)
 
     def max(self):
+        if self._numeric_stats():
+            return self._min_max.max()
         return max(self.data)
 
     def min(self):
+        if self._numeric_stats():
+            return self._min_max.min()
         return min(self.data)
 
     def get_list(self):
-        return self.data
+        return list(self.data)
+
+    def __len__(self):
+        return len(self.data)
 
     def __repr__(self):
-        return str(f"<StackList> {self.data}")
+        return str(f"<StackList> {list(self.data)}")
 
     def __str__(self):
-        return str(f"<StackList> {self.data}")
+        return str(f"<StackList> {list(self.data)}")
 
     def reset(self):
-        self.data = []
+        self.data = deque(maxlen=self.max_length)
+        self._reset_stats()
 
 
 class ErrorCounter:
@@ -531,7 +589,8 @@ class MedianFinder:
         """
         self.max_heap = []
         self.min_heap = []
-        self.num_list = []
+        self.count = 0
+        self.total = 0
 
     def add_number(self, num):
         """
@@ -551,7 +610,8 @@ class MedianFinder:
                 mf.add_number(3)
 
         """
-        self.num_list.append(num)
+        self.count += 1
+        self.total += num
         if not self.max_heap and not self.min_heap:
             heapq.heappush(self.min_heap, num)
             return
@@ -625,8 +685,7 @@ class MedianFinder:
                 mf.mean() # 2.0
 
         """
-        count = len(self.num_list)
-        return sum(self.num_list) / count
+        return self.total / self.count
 
 
 class FlatDict(MutableMapping):
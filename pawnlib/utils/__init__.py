@@ -20,6 +20,7 @@ from .http import (
     remove_http,
     append_ws,
     jequest,
+    HttpSessionPool,
     CallHttp,
     CheckSSL,
     HttpInspect,
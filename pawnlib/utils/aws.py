@@ -2,6 +2,7 @@ import os
 import re
 import time
 import json
+import hashlib
 import boto3
 import asyncio
 import aioboto3
@@ -29,6 +30,9 @@ logger = logging.getLogger(__name__)
 
 debug_console = Console(stderr=True)
 
+_shared_s3_clients = {}
+_shared_s3_clients_lock = threading.Lock()
+
 def get_transfer_config(file_size):
     if file_size == 0:
         return None
@@ -286,6 +290,32 @@ class S3ClientBase(LoggerMixinVerbose):
         #     multipart_chunksize=1024# 8MB
         # )
 
+    def get_pooled_client(self, max_pool_connections=20):
+        """
+        Return a boto3 S3 client shared by every instance with the same credentials in this process.
+
+        boto3 clients are thread-safe, so worker threads share one client and one urllib3
+        connection pool. The pool is recreated only when a caller needs more connections.
+
+        :param max_pool_connections: Minimum size of the connection pool.
+        :return: A boto3 S3 client.
+        """
+        key = (os.getpid(), self.profile_name, self.access_key, self.endpoint_url, self.is_cloudflare)
+        with _shared_s3_clients_lock:
+            pool_size, client = _shared_s3_clients.get(key, (0, None))
+            if client is None or pool_size < max_pool_connections:
+                config = Config(
+                    signature_version='s3v4',
+                    max_pool_connections=max_pool_connections,
+                    retries={'max_attempts': 10, 'mode': 'standard'}
+                )
+                client_kwargs = dict(endpoint_url=self.endpoint_url, config=config)
+                if self.is_cloudflare:
+                    client_kwargs['region_name'] = 'auto'
+                client = self.session.client('s3', **client_kwargs)
+                _shared_s3_clients[key] = (max_pool_connections, client)
+            return client
+
     def bucket_exists(self):
         """Check if the bucket exists."""
         try:
@@ -362,6 +392,8 @@ class S3ClientBase(LoggerMixinVerbose):
 
 
 class Uploader(S3ClientBase):
+    MANIFEST_NAME = ".pawns_s3_manifest.json"
+
     def __init__(self, bucket_name, profile_name=None, access_key=None, secret_key=None,
                  endpoint_url=None, overwrite=False, info_file="", confirm_upload=False, keep_path=False,
                  use_dynamic_config=False, dry_run=False, verbose=0):
@@ -440,7 +472,7 @@ class Uploader(S3ClientBase):
                 keys.update(obj['Key'] for obj in page['Contents'])
         return keys
 
-    def upload_file(self, file_path, s3_prefix="", s3_key="", file_pbar=None, append_suffix="", confirm_upload=None, keep_path=None):
+    def upload_file(self, file_path, s3_prefix="", s3_key="", file_pbar=None, append_suffix="", confirm_upload=None, keep_path=None, overwrite=None):
         if not s3_key:
             s3_key = os.path.join(s3_prefix, file_path).replace("\\", "/")
 
@@ -456,8 +488,10 @@ class Uploader(S3ClientBase):
 
         file_size = os.path.getsize(file_path)
 
+        overwrite = self.overwrite if overwrite is None else overwrite
+
         try:
-            if not self.overwrite:
+            if not overwrite:
                 try:
                     self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
                     debug_console.log(f"\nFile already exists in S3: {s3_key}")
@@ -501,53 +535,97 @@ class Uploader(S3ClientBase):
             with self.lock:
                 self.total_uploaded_size += file_info["size"]
                 self.uploaded_files_info.append(file_info)
+            return True
 
         except Exception as e:
             if file_pbar:
                 with self.pbar_lock:
                     file_pbar.write(f"Error uploading {file_path}: {str(e)}")
             debug_console.log(f"Error uploading {file_path}: {str(e)}")
+            return False
+
+
+    def upload_directory(self, source_dir="", s3_prefix="", append_suffix="", info_file="", unit="B/s", max_workers=None,
+                         sync=False, delete=False, manifest_file=None):
+        """
+        Upload a local directory to S3.
 
+        :param source_dir: Local directory or file to upload.
+        :param s3_prefix: Prefix prepended to the S3 keys.
+        :param max_workers: Number of upload threads.
+        :param sync: Upload only files whose content differs from S3. Local size/mtime are compared
+                     with a manifest of previously computed ETags and only new or modified files are hashed.
+        :param delete: With ``sync``, delete remote objects under the directory that no longer exist locally.
+                       Refused when ``s3_prefix`` and the source directory are both empty, which would cover the whole bucket.
+        :param manifest_file: Path of the sync manifest. Defaults to ``<source_dir>/.pawns_s3_manifest.json``.
 
-    def upload_directory(self, source_dir="", s3_prefix="", append_suffix="", info_file="", unit="B/s", max_workers=None):
+        Example:
+
+            .. code-block:: python
+
+                uploader = Uploader(bucket_name="snapshots")
+                uploader.upload_directory("./data", s3_prefix="mainnet", sync=True, delete=True)
+        """
         if not self.is_exist_bucket():
             raise ValueError(f"The specified bucket does not exist - '{self.bucket_name}'")
 
         directory_path = source_dir.replace("./", "")
+        if sync and delete and not os.path.join(s3_prefix, directory_path).strip("/"):
+            # Every key of the bucket would be listed and deleted as an orphan
+            raise ValueError("delete requires a non-empty s3_prefix or source directory")
 
         # Get file list
         if os.path.isfile(directory_path):
             file_list = [{'name': os.path.basename(directory_path), 'size': os.path.getsize(directory_path)}]
             directory_path = os.path.dirname(directory_path)
+            delete = False
         elif os.path.isdir(directory_path):
-            file_list = self.get_file_list(directory_path)
+            file_list = [file_info for file_info in self.get_file_list(directory_path) if file_info['name'] != self.MANIFEST_NAME]
         else:
             raise ValueError(f"The path {directory_path} does not exist.")
 
-        total_files = len(file_list)
-        total_size = sum(file_info['size'] for file_info in file_list)
-        print(f"Total files to upload: {total_files}, Total size: {self.format_size(total_size)}")
-
         # Optimize max_workers
         if max_workers is None:
             max_workers = min(32, max(1, os.cpu_count() * 2))
 
+        def make_s3_key(name):
+            s3_key = os.path.join(s3_prefix, directory_path, name).replace("\\", "/")
+            # Sync compares with the listed keys, which have no leading "/" as upload_file strips it
+            return s3_key.lstrip("/") if sync else s3_key
+
         # Fetch existing keys with batch processing
-        existing_keys = set()
+        existing_objects = {}
         for page in self.s3_client.get_paginator('list_objects_v2').paginate(Bucket=self.bucket_name, Prefix=s3_prefix):
-            if 'Contents' in page:
-                existing_keys.update(obj['Key'] for obj in page['Contents'])
+            for obj in page.get('Contents', []):
+                existing_objects[obj['Key']] = obj
 
         success_files, failed_files, skipped_files = [], [], []
+        manifest, manifest_path = {}, None
+        if sync:
+            manifest_path = manifest_file or os.path.join(directory_path or ".", self.MANIFEST_NAME)
+            manifest = self.load_sync_manifest(manifest_path)
+            file_list, skipped_files = self.plan_sync(directory_path, file_list, make_s3_key, existing_objects, manifest, max_workers)
+
+        total_files = len(file_list)
+        total_size = sum(file_info['size'] for file_info in file_list)
+        print(f"Total files to upload: {total_files}, Total size: {self.format_size(total_size)}")
+
+        orphan_keys = []
+        if sync and delete:
+            directory_prefix = make_s3_key("")
+            local_keys = {make_s3_key(file_info['name']) for file_info in file_list + skipped_files}
+            orphan_keys = [key for key in existing_objects if key.startswith(directory_prefix) and key not in local_keys]
 
         if self.dry_run:
             for file_info in file_list:
                 file_path = os.path.join(directory_path, file_info['name'])
-                s3_key = os.path.join(s3_prefix, file_path).replace("\\", "/")
-                if s3_key in existing_keys:
+                s3_key = make_s3_key(file_info['name'])
+                if not sync and s3_key in existing_objects:
                     print(f"[DRY RUN] File already exists: '{file_path}' -> 's3://{self.bucket_name}/{s3_key}' (skipped)")
                 else:
                     print(f"[DRY RUN] Would upload: '{file_path}' -> 's3://{self.bucket_name}/{s3_key}'")
+            for s3_key in orphan_keys:
+                print(f"[DRY RUN] Would delete: 's3://{self.bucket_name}/{s3_key}'")
         else:
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
                 future_to_file = {}
@@ -555,9 +633,9 @@ class Uploader(S3ClientBase):
 
                 for file_info in file_list:
                     file_path = os.path.join(directory_path, file_info['name'])
-                    s3_key = os.path.join(s3_prefix, file_path).replace("\\", "/")
+                    s3_key = make_s3_key(file_info['name'])
 
-                    if not self.overwrite and s3_key in existing_keys:
+                    if not sync and not self.overwrite and s3_key in existing_objects:
                         debug_console.log(f"File already exists in S3: {s3_key}")
                         skipped_files.append(file_info)
                         continue
@@ -570,33 +648,141 @@ class Uploader(S3ClientBase):
                         s3_key=s3_key,
                         append_suffix=append_suffix,
                         file_pbar=file_pbar,
-                        overall_pbar=overall_pbar
+                        overall_pbar=overall_pbar,
+                        overwrite=True if sync else None,
                     )
                     future_to_file[future] = file_info
 
                 for future in as_completed(future_to_file):
                     file_info = future_to_file[future]
                     try:
-                        future.result()
+                        if future.result() is False:
+                            raise RuntimeError("upload failed")
                         success_files.append(file_info)
                     except Exception as e:
                         failed_files.append(file_info)
                         print(f"Error uploading {file_info['name']}: {str(e)}")
                 overall_pbar.close()
+
+            if orphan_keys:
+                logger.info(f"Deleting {len(orphan_keys)} orphaned objects under '{make_s3_key('')}'")
+                for i in range(0, len(orphan_keys), 1000):
+                    self._delete_batch([{'Key': key} for key in orphan_keys[i:i + 1000]])
+            if sync:
+                self.update_sync_manifest(manifest, success_files, make_s3_key)
+                self.save_sync_manifest(manifest_path, manifest)
         self.print_upload_summary(success_files, failed_files, skipped_files)
 
-    def upload_file_safe(self, file_path, directory_path, s3_key="", append_suffix="", file_pbar=None, overall_pbar=None):
+    def get_upload_config(self, file_size):
+        """Return the TransferConfig that ``upload_file`` uses for a file of this size."""
+        return get_transfer_config(file_size) if self.use_dynamic_config else self.config
+
+    def calculate_local_etag(self, file_path, file_size=None):
+        """
+        Calculate the ETag S3 will report for this file once uploaded by ``upload_file``.
+
+        :param file_path: Path of the local file.
+        :param file_size: Size of the file. Read from disk if omitted.
+        :return: The expected ETag without quotes.
+        """
+        if file_size is None:
+            file_size = os.path.getsize(file_path)
+        config = self.get_upload_config(file_size)
+        if config is None or file_size < config.multipart_threshold:
+            return calculate_s3_etag(file_path)
+        return calculate_s3_etag(file_path, part_size=config.multipart_chunksize)
+
+    @staticmethod
+    def load_sync_manifest(manifest_path):
+        if not manifest_path or not os.path.exists(manifest_path):
+            return {}
+        try:
+            with open(manifest_path, 'r') as f:
+                return json.load(f).get("files", {})
+        except (ValueError, OSError) as e:
+            logger.warning(f"Ignoring unreadable sync manifest '{manifest_path}': {e}")
+            return {}
+
+    @staticmethod
+    def save_sync_manifest(manifest_path, manifest):
+        temp_path = f"{manifest_path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump({"updated": datetime.now().isoformat(), "files": manifest}, f)
+        os.replace(temp_path, manifest_path)
+
+    def update_sync_manifest(self, manifest, uploaded_files, make_s3_key):
+        """
+        Record the ETags S3 reports for the uploaded files together with their size and mtime.
+
+        The managed transfer of ``upload_file`` does not return the ETag, so the ETags are taken
+        from one listing of the directory instead of a ``head_object`` call per file.
+        """
+        uploaded = {make_s3_key(file_info['name']): file_info for file_info in uploaded_files}
+        if not uploaded:
+            return
+        for page in self.s3_client.get_paginator('list_objects_v2').paginate(Bucket=self.bucket_name, Prefix=make_s3_key("")):
+            for obj in page.get('Contents', []):
+                file_info = uploaded.get(obj['Key'])
+                if file_info:
+                    manifest[file_info['name']] = {
+                        "size": file_info['size'],
+                        "mtime_ns": file_info['mtime_ns'],
+                        "etag": obj.get('ETag', '').strip('"'),
+                    }
+
+    def plan_sync(self, directory_path, file_list, make_s3_key, existing_objects, manifest, max_workers=None):
+        """
+        Split the local files into files that must be uploaded and files identical to S3.
+
+        A file is unchanged when the remote object has the same size and the same ETag. The local
+        ETag comes from the manifest when size and mtime did not change since it was recorded,
+        otherwise the file is hashed (in parallel) and the manifest entry is refreshed.
+
+        :return: ``(files_to_upload, unchanged_files)``
+        """
+        to_upload, unchanged, to_hash = [], [], []
+        for file_info in file_list:
+            file_path = os.path.join(directory_path, file_info['name'])
+            file_info['mtime_ns'] = os.stat(file_path).st_mtime_ns
+            remote = existing_objects.get(make_s3_key(file_info['name']))
+            if not remote or remote['Size'] != file_info['size']:
+                to_upload.append(file_info)
+                continue
+            remote_etag = remote.get('ETag', '').strip('"')
+            cached = manifest.get(file_info['name'], {})
+            if cached.get('size') == file_info['size'] and cached.get('mtime_ns') == file_info['mtime_ns'] and cached.get('etag'):
+                (unchanged if cached['etag'] == remote_etag else to_upload).append(file_info)
+            else:
+                to_hash.append((file_info, file_path, remote_etag))
+
+        if to_hash:
+            with ThreadPoolExecutor(max_workers=max_workers or min(32, (os.cpu_count() or 1) * 2)) as executor:
+                etags = executor.map(lambda item: self.calculate_local_etag(item[1], item[0]['size']), to_hash)
+                for (file_info, file_path, remote_etag), etag in zip(to_hash, etags):
+                    manifest[file_info['name']] = {"size": file_info['size'], "mtime_ns": file_info['mtime_ns'], "etag": etag}
+                    (unchanged if etag == remote_etag else to_upload).append(file_info)
+
+        local_names = {file_info['name'] for file_info in file_list}
+        for name in [name for name in manifest if name not in local_names]:
+            del manifest[name]
+
+        logger.info(f"Sync plan: {len(to_upload)} to upload, {len(unchanged)} unchanged ({len(to_hash)} hashed)")
+        return to_upload, unchanged
+
+    def upload_file_safe(self, file_path, directory_path, s3_key="", append_suffix="", file_pbar=None, overall_pbar=None, overwrite=None):
         """Uploads a single file and updates the overall progress."""
         file_size = os.path.getsize(file_path)
+        result = None
 
         try:
             # Pass the file_pbar and overall_pbar to the upload_file method
-            self.upload_file(
+            result = self.upload_file(
                 file_path,
                 directory_path,
                 s3_key=s3_key,
                 append_suffix=append_suffix,
-                file_pbar=file_pbar
+                file_pbar=file_pbar,
+                overwrite=overwrite,
             )
             if overall_pbar:
                 with self.pbar_lock:
@@ -612,6 +798,8 @@ class Uploader(S3ClientBase):
             if file_pbar:
                 with self.pbar_lock:
                     file_pbar.set_postfix({"File": f"Error: {str(e)}"})  # Display error on file p
+            result = False
+        return result
 
     def delete_all_files(self, max_workers=10):
         logger.info("Deleting all files in the bucket.")
@@ -752,10 +940,152 @@ class Uploader(S3ClientBase):
         print(f"Uploaded latest_info.json to s3://{self.bucket_name}/{self.info_file}")
 
 
+def calculate_s3_etag(file_path, part_size=None):
+    """
+    Calculate the S3 ETag of a local file.
+
+    A single-part object's ETag is the MD5 of its content. A multipart object's ETag is the MD5
+    of the concatenated part digests followed by ``-<part count>``, so ``part_size`` must match
+    the chunk size that was used for the upload.
+
+    :param file_path: Path of the local file.
+    :param part_size: Multipart chunk size in bytes. If None, the single-part ETag is returned.
+    :return: The ETag without surrounding quotes.
+
+    Example:
+
+        .. code-block:: python
+
+            calculate_s3_etag("snapshot.tar")
+            # >> '9e107d9d372bb6826bd81d3542a419d6'
+
+            calculate_s3_etag("snapshot.tar", part_size=8 * 1024 * 1024)
+            # >> '2c7a9f0c3b1a6e0c5b0f3e3f0c8d1f2e-12'
+    """
+    with open(file_path, 'rb') as f:
+        if not part_size:
+            hasher = hashlib.md5()
+            for chunk in iter(lambda: f.read(8 * 1024 * 1024), b''):
+                hasher.update(chunk)
+            return hasher.hexdigest()
+        digests = [hashlib.md5(chunk).digest() for chunk in iter(lambda: f.read(part_size), b'')]
+    return f"{hashlib.md5(b''.join(digests)).hexdigest()}-{len(digests)}"
+
+
+class S3DownloadJournal:
+    """
+    Append-only JSON lines journal of finished objects and byte ranges.
+
+    A restarted download reads the journal back, skips finished objects and fetches only the
+    ranges that are missing from the ``.part`` file. Entries are bound to the object's ETag,
+    so ranges of an object that changed in the meantime are discarded. Finished objects also keep
+    the size and mtime of the local file, so a file that was changed afterwards is verified again.
+
+    :param path: Path of the journal file. If None, the journal is kept in memory only.
+
+    Example:
+
+        .. code-block:: python
+
+            journal = S3DownloadJournal("./data/.pawns_s3_download.journal")
+            journal.record_part("data/big.tar", "abc-3", 0)
+            journal.get_parts("data/big.tar", "abc-3")
+            # >> {0}
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.lock = threading.Lock()
+        self.completed = {}
+        self.parts = {}
+        self._fp = None
+        self.load()
+
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        with open(self.path, 'r') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A torn line from an interrupted write
+                    continue
+                self._apply(entry)
+
+    def _apply(self, entry):
+        key, etag = entry.get('key'), entry.get('etag')
+        if entry.get('done'):
+            self.completed[key] = (etag, entry.get('size'), entry.get('mtime'))
+            self.parts.pop(key, None)
+        elif 'part' in entry:
+            part_etag, parts = self.parts.get(key, (etag, set()))
+            if part_etag != etag:
+                parts = set()
+            parts.add(entry['part'])
+            self.parts[key] = (etag, parts)
+
+    def _write(self, entry):
+        with self.lock:
+            self._apply(entry)
+            if not self.path:
+                return
+            if self._fp is None:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                self._fp = open(self.path, 'a')
+            self._fp.write(json.dumps(entry) + "\n")
+            self._fp.flush()
+
+    def is_completed(self, key, etag, size, mtime=None):
+        """
+        Check whether the object was finished, and with ``mtime`` that the local file is still the one recorded.
+        """
+        completed = self.completed.get(key)
+        if not completed or completed[:2] != (etag, size):
+            return False
+        return mtime is None or completed[2] == mtime
+
+    def get_parts(self, key, etag):
+        part_etag, parts = self.parts.get(key, (None, set()))
+        return set(parts) if part_etag == etag else set()
+
+    def record_part(self, key, etag, part):
+        self._write({'key': key, 'etag': etag, 'part': part})
+
+    def record_done(self, key, etag, size, mtime=None):
+        self._write({'key': key, 'etag': etag, 'size': size, 'mtime': mtime, 'done': True})
+
+    def compact(self):
+        """Rewrite the journal with finished objects only."""
+        with self.lock:
+            self.close()
+            if not self.path:
+                return
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w') as f:
+                for key, (etag, size, mtime) in self.completed.items():
+                    f.write(json.dumps({'key': key, 'etag': etag, 'size': size, 'mtime': mtime, 'done': True}) + "\n")
+            os.replace(temp_path, self.path)
+
+    def close(self):
+        if self._fp:
+            self._fp.close()
+            self._fp = None
+
+
 class Downloader(S3ClientBase):
-    def __init__(self, bucket_name, profile_name=None, access_key=None, secret_key=None, endpoint_url=None, overwrite=False, dry_run=False):
+    JOURNAL_NAME = ".pawns_s3_download.journal"
+    # Chunk sizes tried when verifying a multipart ETag (boto3/aws-cli default first)
+    MULTIPART_PART_SIZES = [8 * 1024 * 1024, 16 * 1024 * 1024, 5 * 1024 * 1024, 50 * 1024 * 1024, 64 * 1024 * 1024, 100 * 1024 * 1024]
+
+    def __init__(self, bucket_name, profile_name=None, access_key=None, secret_key=None, endpoint_url=None, overwrite=False, dry_run=False,
+                 max_workers=None, range_threshold=64 * 1024 * 1024, part_size=16 * 1024 * 1024, verbose=0):
         # self.logger = self.get_logger()
-        super().__init__(bucket_name, profile_name, access_key, secret_key, endpoint_url, overwrite, dry_run=dry_run)
+        super().__init__(bucket_name, profile_name, access_key, secret_key, endpoint_url, overwrite, dry_run=dry_run, verbose=verbose)
+        self.max_workers = max_workers
+        self.range_threshold = range_threshold
+        self.part_size = part_size
+        self.lock = threading.Lock()
 
     def is_s3_file(self,  key):
         try:
@@ -849,33 +1179,239 @@ class Downloader(S3ClientBase):
                 Callback=progress_callback
             )
 
-    def download_directory(self, s3_directory, local_path=None, overwrite=False, keep_path=False):
+    def list_objects(self, prefix=""):
+        """Yield every object under the prefix."""
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+            for obj in page.get('Contents', []):
+                yield obj
+
+    def calculate_workers(self, object_count, total_bytes, max_workers=None):
+        """
+        Size the worker pool from the number of objects and the number of ranged parts.
+
+        :param object_count: Number of objects to download.
+        :param total_bytes: Total bytes to download.
+        :param max_workers: Upper bound. Defaults to ``self.max_workers`` or 32.
+        :return: Number of worker threads.
+        """
+        work_units = object_count + total_bytes // self.part_size
+        return max(1, min(max_workers or self.max_workers or 32, work_units))
+
+    def is_identical(self, local_path, obj, journal=None):
+        """
+        Check whether a local file already matches an S3 object by size and ETag.
+
+        :param local_path: Path of the local file.
+        :param obj: Object dict from ``list_objects_v2`` (``Key``, ``Size``, ``ETag``).
+        :param journal: Optional :class:`S3DownloadJournal` that remembers verified ETags.
+            It is trusted only while the local file keeps the recorded size and mtime.
+        :return: True if the file does not need to be downloaded again.
+        """
+        size = obj['Size']
+        if not os.path.isfile(local_path):
+            return False
+        stat = os.stat(local_path)
+        if stat.st_size != size:
+            return False
+        etag = obj.get('ETag', '').strip('"')
+        if journal and journal.is_completed(obj['Key'], etag, size, stat.st_mtime_ns):
+            return True
+        if not etag:
+            return False
+        if '-' not in etag:
+            return calculate_s3_etag(local_path) == etag
+
+        part_count = int(etag.rsplit('-', 1)[1])
+        for part_size in self.MULTIPART_PART_SIZES:
+            if -(-size // part_size) == part_count and calculate_s3_etag(local_path, part_size) == etag:
+                return True
+        return False
+
+    def download_objects(self, objects, journal_path=None, overwrite=None, max_workers=None):
+        """
+        Download S3 objects concurrently.
+
+        Objects at or above ``range_threshold`` are split into ``part_size`` ranged GETs that are
+        written into ``<local_path>.part`` and renamed once every range has arrived. Finished
+        objects and ranges are recorded in the journal, so running the same download again
+        resumes where it stopped.
+
+        :param objects: Iterable of ``(obj, local_path)`` tuples, where ``obj`` is an object dict from ``list_objects_v2``.
+        :param journal_path: Path of the resume journal. If None, progress is not persisted.
+        :param overwrite: Re-download existing files that differ from S3. Defaults to ``self.overwrite``.
+        :param max_workers: Upper bound of the worker pool.
+        :return: A summary dict with ``downloaded``, ``skipped`` and ``failed`` keys and the downloaded ``bytes``.
+
+        Example:
+
+            .. code-block:: python
+
+                downloader = Downloader(bucket_name="snapshots")
+                objects = [(obj, f"./restore/{obj['Key']}") for obj in downloader.list_objects("mainnet/")]
+                summary = downloader.download_objects(objects, journal_path="./restore/.pawns_s3_download.journal")
+        """
+        overwrite = self.overwrite if overwrite is None else overwrite
+        journal = S3DownloadJournal(None if self.dry_run else journal_path)
+        summary = {"downloaded": [], "skipped": [], "failed": [], "bytes": 0}
+        states = []
+        work_units = []
+        total_bytes = 0
+
+        for obj, local_path in objects:
+            key, size = obj['Key'], obj['Size']
+            etag = obj.get('ETag', '').strip('"')
+            if os.path.exists(local_path) and not overwrite:
+                # Kept as it is, but not journaled because its content was never checked
+                self.logger.debug(f"Skipping {local_path}, already exists.")
+                summary["skipped"].append(key)
+                continue
+            if self.is_identical(local_path, obj, journal):
+                self.logger.debug(f"Skipping {local_path}, identical to S3.")
+                mtime = os.stat(local_path).st_mtime_ns
+                if not journal.is_completed(key, etag, size, mtime):
+                    journal.record_done(key, etag, size, mtime)
+                summary["skipped"].append(key)
+                continue
+
+            if self.dry_run:
+                pawn.console.log(f"[DRY RUN] Would download 's3://{self.bucket_name}/{key}' to '{local_path}'")
+                continue
+
+            part_path = f"{local_path}.part"
+            os.makedirs(os.path.dirname(local_path) or ".", exist_ok=True)
+            if size >= self.range_threshold:
+                done_parts = journal.get_parts(key, etag) if os.path.exists(part_path) else set()
+                ranges = [
+                    (part, start, min(start + self.part_size, size) - 1)
+                    for part, start in enumerate(range(0, size, self.part_size))
+                    if part not in done_parts
+                ]
+                with open(part_path, 'ab') as f:
+                    f.truncate(size)
+            else:
+                ranges = [None]
+
+            state = {"obj": obj, "etag": etag, "local_path": local_path, "part_path": part_path, "remaining": len(ranges), "failed": False}
+            states.append(state)
+            for byte_range in ranges:
+                work_units.append((state, byte_range))
+                total_bytes += byte_range[2] - byte_range[1] + 1 if byte_range else size
+
+        if not work_units:
+            journal.close()
+            self._print_download_summary(summary)
+            return summary
+
+        workers = self.calculate_workers(len(states), total_bytes, max_workers)
+        client = self.get_pooled_client(max(workers, 10))
+        self.logger.info(f"Downloading {len(states)} objects ({convert_bytes(total_bytes)}) with {workers} workers")
+
+        with Progress(
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                DownloadColumn(),
+                "[progress.percentage]{task.percentage:>3.1f}%",
+                TimeElapsedColumn(),
+                TimeRemainingColumn(),
+                " • ",
+                SpeedColumn(unit="B/s"),
+        ) as progress:
+            task = progress.add_task(f"Downloading {len(states)} objects", total=total_bytes, speed="0 B/s")
+
+            def advance(bytes_amount):
+                progress.update(task, advance=bytes_amount)
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(self._download_unit, client, state, byte_range, journal, advance): state
+                    for state, byte_range in work_units
+                }
+                for future in as_completed(futures):
+                    state = futures[future]
+                    try:
+                        if future.result():
+                            summary["downloaded"].append(state["obj"]["Key"])
+                            summary["bytes"] += state["obj"]["Size"]
+                    except Exception as e:
+                        with self.lock:
+                            already_failed, state["failed"] = state["failed"], True
+                        if not already_failed:
+                            summary["failed"].append(state["obj"]["Key"])
+                            self.logger.error(f"Error downloading {state['obj']['Key']}: {e}")
+
+        if summary["failed"]:
+            journal.close()
+        else:
+            journal.compact()
+        self._print_download_summary(summary)
+        return summary
+
+    def _download_unit(self, client, state, byte_range, journal, advance):
+        """
+        Fetch a whole object or one byte range of it.
+
+        :return: True when this unit completed the object.
+        """
+        key, etag = state["obj"]["Key"], state["etag"]
+        request = dict(Bucket=self.bucket_name, Key=key)
+        if etag:
+            # Fail instead of mixing ranges of two different versions of the object
+            request['IfMatch'] = etag
+        if byte_range:
+            part, start, end = byte_range
+            request['Range'] = f"bytes={start}-{end}"
+
+        body = client.get_object(**request)['Body']
+        with open(state["part_path"], 'r+b' if byte_range else 'wb') as f:
+            if byte_range:
+                f.seek(start)
+            for chunk in body.iter_chunks(chunk_size=1024 * 1024):
+                f.write(chunk)
+                advance(len(chunk))
+
+        if byte_range:
+            journal.record_part(key, etag, part)
+        with self.lock:
+            state["remaining"] -= 1
+            finished = state["remaining"] == 0 and not state["failed"]
+        if finished:
+            os.replace(state["part_path"], state["local_path"])
+            journal.record_done(key, etag, state["obj"]["Size"], os.stat(state["local_path"]).st_mtime_ns)
+        return finished
+
+    def _print_download_summary(self, summary):
+        pawn.console.log(
+            f"Downloaded {len(summary['downloaded'])} files ({convert_bytes(summary['bytes'])}), "
+            f"skipped {len(summary['skipped'])}, failed {len(summary['failed'])}"
+        )
+        for key in summary["failed"]:
+            pawn.console.log(f"[red]- Failed: {key}")
+
+    def download_directory(self, s3_directory, local_path=None, overwrite=False, keep_path=False, max_workers=None):
         """Download an entire directory from S3."""
         if local_path is None:
             local_path = os.path.basename(s3_directory)  # Set default local path to the base name of s3_directory
 
-        paginator = self.s3_client.get_paginator('list_objects_v2')
-        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=s3_directory):
-            for obj in page.get('Contents', []):
-                s3_key = obj['Key']
-                base_name = os.path.basename(s3_key)
-                relative_path = os.path.relpath(s3_key, start=s3_directory)
-                if relative_path.startswith("."):
-                    relative_path = relative_path[2:]  # Remove leading "./"
-                elif relative_path == "":
-                    continue  # Skip if relative path is empty
-                if keep_path:
-                    local_file_path = os.path.join(local_path, relative_path)
-                else:
-                    local_file_path = os.path.join(local_path, base_name)
-                local_file_path = os.path.normpath(local_file_path)
-
+        objects = []
+        for obj in self.list_objects(s3_directory):
+            s3_key = obj['Key']
+            base_name = os.path.basename(s3_key)
+            relative_path = os.path.relpath(s3_key, start=s3_directory)
+            if relative_path.startswith("."):
+                relative_path = relative_path[2:]  # Remove leading "./"
+            elif relative_path == "":
+                continue  # Skip if relative path is empty
+            if keep_path:
+                local_file_path = os.path.join(local_path, relative_path)
+            else:
+                local_file_path = os.path.join(local_path, base_name)
+            objects.append((obj, os.path.normpath(local_file_path)))
 
-                if local_file_path and base_name != local_file_path :
-                    os.makedirs(os.path.dirname(local_file_path), exist_ok=True)
-                self.download_file(s3_key, local_file_path, overwrite=overwrite)
+        journal_path = os.path.join(local_path, self.JOURNAL_NAME)
+        return self.download_objects(objects, journal_path=journal_path, overwrite=overwrite, max_workers=max_workers)
 
-    def download_from_info(self, s3_info_key, local_path=None, overwrite=False):
+    def download_from_info(self, s3_info_key, local_path=None, overwrite=False, max_workers=None):
         """Download files as specified in the info.json file from S3."""
         # 먼저 info.json 파일을 S3에서 다운로드하여 로컬에 저장합니다.
         local_info_path = os.path.join("/tmp", os.path.basename(s3_info_key))
@@ -900,15 +1436,24 @@ class Downloader(S3ClientBase):
         else:
             local_directory = directory
 
-        # info.json에 정의된 파일들을 다운로드합니다.
-        for file_info in files:
-            file_name = file_info.get("file_name")
-            if file_name:
-                # 로컬 경로 설정 (디렉토리 경로와 파일 이름을 합침)
-                file_local_path = os.path.join(local_directory, os.path.relpath(file_name, directory))
-                self.download_file(file_name, file_local_path, overwrite=overwrite)
-
+        # info.json의 파일 목록은 한 번의 listing으로 크기와 ETag를 가져옵니다.
+        file_names = [file_info.get("file_name") for file_info in files if file_info.get("file_name")]
+        listing = {obj['Key']: obj for obj in self.list_objects(os.path.commonprefix(file_names))}
+
+        objects = []
+        for file_name in file_names:
+            if file_name not in listing:
+                self.logger.error(f"Object '{file_name}' listed in info.json does not exist in bucket '{self.bucket_name}'.")
+                continue
+            # 로컬 경로 설정 (디렉토리 경로와 파일 이름을 합침)
+            file_local_path = os.path.join(local_directory, os.path.relpath(file_name, directory))
+            objects.append((listing[file_name], file_local_path))
+
+        summary = self.download_objects(
+            objects, journal_path=os.path.join(local_directory, self.JOURNAL_NAME), overwrite=overwrite, max_workers=max_workers
+        )
         pawn.console.log(f"Download completed for directory {directory}")
+        return summary
 
 
 class S3Lister(S3ClientBase):
@@ -19,15 +19,15 @@ from pawnlib.output import (
     print_json,
     pretty_json, align_text, get_file_extension, is_directory, is_file, print_var, print_var2, print_grid
     )
-from pawnlib.resource import net
 from pawnlib.typing import (
-    append_suffix, append_prefix, hex_to_number, FlatDict, Flattener, shorten_text, StackList,
+    append_suffix, append_prefix, hex_to_number, FlatDict, shorten_text, StackList,
     replace_path_with_suffix, format_text, format_link, list_to_dict_by_key,
     get_shortened_tx_hash, date_utils, HexConverter, json_rpc, random_token_address, generate_json_rpc,
     keys_exists, is_int, is_float, list_depth, is_valid_token_address, sys_exit, is_hex, is_valid_tx_hash, check_key_and_type,
-    convert_bytes, const,
+    convert_bytes, const, get_if_keys_exist,
 )
 from pawnlib.utils.operate_handler import WaitStateLoop
+from pawnlib.metrics.limiter import RateLimiter
 from pawnlib.utils.in_memory_zip import gen_deploy_data_content
 from websocket import create_connection, WebSocket, enableTrace
 from websocket._exceptions import WebSocketConnectionClosedException
@@ -38,6 +38,11 @@ try:
 except ImportError:
     pass
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from typing import Any, Dict, Iterator, Tuple, Union, Callable, Type, Optional, List, Awaitable, TypeVar
 try:
     from typing import Literal  # Python 3.8+
@@ -47,7 +52,10 @@ except ImportError:
 from enum import Enum, auto
 import copy
 import operator as _operator
+import math
 import time
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, InitVar, field
 import requests
 from rich.prompt import Prompt, Confirm
@@ -61,8 +69,9 @@ from urllib.parse import urlparse
 from decimal import Decimal
 import atexit
 import warnings
-from random import uniform
 from requests.auth import HTTPBasicAuth
+from requests.adapters import HTTPAdapter
+from urllib3 import PoolManager
 from requests.exceptions import SSLError, RequestException
 import dns.resolver
 import json
@@ -95,6 +104,175 @@ def _force_close_sessions():
 atexit.register(_force_close_sessions)
 
 
+def fast_json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Decode JSON with ``orjson`` when it is installed, otherwise with :func:`json.loads`.
+
+    ``orjson`` rejects integers larger than 64 bits, so such documents are decoded again with the standard library.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def fast_json_dumps(data: Any) -> Union[bytes, str]:
+    """
+    Encode JSON with ``orjson`` when it is installed, otherwise with :func:`json.dumps`.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            pass
+    return json.dumps(data)
+
+
+class _ResolvingPoolManager(PoolManager):
+    """
+    A ``urllib3`` pool manager that connects to a fixed IP address for the host names in ``resolve``.
+    TLS still uses the original host name for SNI and certificate validation.
+    """
+
+    def __init__(self, *args, resolve: Optional[Dict[str, str]] = None, **kwargs):
+        self.resolve = resolve if resolve is not None else {}
+        super().__init__(*args, **kwargs)
+
+    def connection_from_host(self, host=None, port=None, scheme="http", pool_kwargs=None):
+        ipaddr = self.resolve.get((host or "").lower())
+        if ipaddr:
+            if scheme == "https":
+                pool_kwargs = {"server_hostname": host, "assert_hostname": host, **(pool_kwargs or {})}
+            host = ipaddr
+        return super().connection_from_host(host, port=port, scheme=scheme, pool_kwargs=pool_kwargs)
+
+
+class DNSOverrideAdapter(HTTPAdapter):
+    """
+    A ``requests`` transport adapter that overrides DNS resolution for some host names.
+
+    Unlike :class:`pawnlib.resource.net.OverrideDNS`, it does not replace ``socket.getaddrinfo``,
+    so the override only applies to the session the adapter is mounted on.
+
+    :param resolve: Mapping of host name to IP address, e.g. ``{"example.com": "10.0.0.1"}``.
+
+    Example:
+
+        .. code-block:: python
+
+            session = requests.Session()
+            session.mount("https://", DNSOverrideAdapter(resolve={"example.com": "10.0.0.1"}))
+            session.get("https://example.com/api/v3")
+    """
+
+    def __init__(self, resolve: Optional[Dict[str, str]] = None, **kwargs):
+        self.resolve = {host.lower(): ipaddr for host, ipaddr in (resolve or {}).items()}
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = _ResolvingPoolManager(num_pools=connections, maxsize=maxsize, block=block, resolve=self.resolve, **pool_kwargs)
+
+    __attrs__ = HTTPAdapter.__attrs__ + ["resolve"]
+
+    def send(self, request, **kwargs):
+        parsed_url = urlparse(request.url)
+        if (parsed_url.hostname or "").lower() in self.resolve and "Host" not in request.headers:
+            request.headers["Host"] = parsed_url.netloc
+        return super().send(request, **kwargs)
+
+
+class HttpSessionPool:
+    """
+    A thread-safe set of keep-alive ``requests.Session`` objects, one per host (and DNS override).
+
+    Calling ``requests.get``/``requests.post`` builds a new connection pool for every request, so each
+    call pays for a TCP (and TLS) handshake. Requests sent through this pool reuse connections to
+    the same host instead.
+
+    :param pool_connections: Number of host pools cached by each session.
+    :param pool_maxsize: Maximum number of connections kept per host.
+    :param max_retries: Retries per request, an ``int`` or a ``urllib3.Retry``.
+    :param pool_block: Block when no free connection is available instead of opening a new one.
+
+    Example:
+
+        .. code-block:: python
+
+            from pawnlib.utils.http import HttpSessionPool
+
+            pool = HttpSessionPool(pool_maxsize=20)
+            response = pool.request("get", "https://example.com/api/v3", timeout=3)
+            response = pool.request("get", "https://example.com/api/v3", ipaddr="10.0.0.1")
+            print(pool.stats)
+    """
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10, max_retries=0, pool_block: bool = False):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.pool_block = pool_block
+
+        self.requests = 0
+        self._sessions: Dict[tuple, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(url: str, ipaddr: Optional[str] = None) -> tuple:
+        parsed_url = urlparse(append_http(url))
+        return parsed_url.scheme, (parsed_url.hostname or "").lower(), parsed_url.port, ipaddr or None
+
+    def _create_session(self, hostname: str, ipaddr: Optional[str] = None) -> requests.Session:
+        session = requests.Session()
+        adapter = DNSOverrideAdapter(
+            resolve={hostname: ipaddr} if ipaddr else None,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=self.max_retries,
+            pool_block=self.pool_block,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def get_session(self, url: str, ipaddr: Optional[str] = None) -> requests.Session:
+        key = self.get_key(url, ipaddr)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = self._sessions[key] = self._create_session(key[1], ipaddr)
+            self.requests += 1
+        return session
+
+    def request(self, method: str, url: str, ipaddr: Optional[str] = None, **kwargs) -> requests.Response:
+        url = append_http(url)
+        return self.get_session(url, ipaddr).request(method.upper(), url, **kwargs)
+
+    def close(self):
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    @property
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "requests": self.requests,
+                "pool_maxsize": self.pool_maxsize,
+            }
+
+
+default_http_session_pool = HttpSessionPool()
+atexit.register(default_http_session_pool.close)
+
+
 class StrEnum(str, Enum):
     @staticmethod
     def _generate_next_value_(name, start, count, last_values):
@@ -538,10 +716,238 @@ class IconRpcTemplates:
         return self._params_hint
 
 
+class RpcResponseCache:
+    """
+    An LRU cache with per-method TTLs for read-only JSON-RPC responses.
+
+    Entries are keyed by URL, method and params (the request ``id`` is ignored). For ``icx_call``
+    requests, the TTL is looked up by the SCORE method in ``data.method``, so ``getPReps`` and
+    ``getStepCosts`` can have their own lifetimes. Methods without a TTL are never cached.
+
+    Concurrent identical requests are de-duplicated: while one caller fetches a response, the others
+    wait for the same result instead of sending their own request (single-flight).
+
+    :param method_ttls: Seconds each method's response stays fresh. Merged over :attr:`DEFAULT_METHOD_TTLS`.
+    :param maxsize: Maximum number of cached responses. The least recently used entry is evicted first.
+    :param copy_on_hit: Return a deep copy of the cached response, so callers can modify it safely.
+
+    Example:
+
+        .. code-block:: python
+
+            cache = RpcResponseCache(method_ttls={"getPReps": 30})
+            async with AsyncIconRpcHelper(url="https://ctz.solidwallet.io", cache=cache) as rpc:
+                await rpc.get_preps()
+                await rpc.get_preps()  # served from the cache
+            print(cache.stats)
+    """
+    DEFAULT_METHOD_TTLS = {
+        "icx_getNetworkInfo": 30,
+        "icx_getScoreApi": 300,
+        "getPReps": 60,
+        "getValidatorsInfo": 60,
+        "getNetworkInfo": 30,
+        "getStepCosts": 300,
+        "getStepPrice": 300,
+        "getMaxStepLimit": 300,
+        "getRevision": 300,
+    }
+
+    def __init__(self, method_ttls: Optional[Dict[str, float]] = None, maxsize: int = 1024, copy_on_hit: bool = True):
+        self.method_ttls = {**self.DEFAULT_METHOD_TTLS, **(method_ttls or {})}
+        self.maxsize = max(maxsize, 1)
+        self.copy_on_hit = copy_on_hit
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+        self._entries: "OrderedDict[tuple, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        self._sync_inflight: Dict[tuple, threading.Event] = {}
+
+    @staticmethod
+    def get_method(payload: dict) -> Optional[str]:
+        if not isinstance(payload, dict):
+            return None
+        method = payload.get("method")
+        if method == "icx_call":
+            return get_if_keys_exist(payload, "params", "data", "method")
+        return method
+
+    def get_ttl(self, payload: dict) -> Optional[float]:
+        ttl = self.method_ttls.get(self.get_method(payload))
+        return ttl if ttl and ttl > 0 else None
+
+    @staticmethod
+    def make_key(url: str, payload: dict) -> tuple:
+        return url, payload.get("method"), json.dumps(payload.get("params"), sort_keys=True, default=str)
+
+    def get(self, key: tuple) -> Tuple[bool, Any]:
+        """Return ``(found, value)``. Expired entries are dropped."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+        return True, copy.deepcopy(value) if self.copy_on_hit else value
+
+    def set(self, key: tuple, value: Any, ttl: float):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, method: Optional[str] = None, url: Optional[str] = None):
+        """Drop cached responses, optionally only those of one ``method`` and/or ``url``."""
+        with self._lock:
+            for key in list(self._entries):
+                if (url is None or key[0] == url) and (method is None or method in (key[1], self._get_call_method(key))):
+                    del self._entries[key]
+
+    def clear(self):
+        self.invalidate()
+
+    @staticmethod
+    def _get_call_method(key: tuple) -> Optional[str]:
+        if key[1] != "icx_call":
+            return None
+        return get_if_keys_exist(json.loads(key[2]), "data", "method")
+
+    def _record_hit(self, coalesced=False):
+        with self._lock:
+            self.hits += 1
+            if coalesced:
+                self.coalesced += 1
+
+    def _record_miss(self):
+        with self._lock:
+            self.misses += 1
+
+    async def get_or_fetch(self, url: str, payload: dict, fetch: Callable[[], Awaitable[Any]], is_cacheable: Callable[[Any], bool] = None) -> Any:
+        """
+        Return the cached response for ``payload`` or await ``fetch()`` once, however many callers ask concurrently.
+
+        :param url: Endpoint the request is sent to.
+        :param payload: JSON-RPC request.
+        :param fetch: Coroutine function that performs the request.
+        :param is_cacheable: Predicate deciding whether a fetched response is stored, e.g. to skip errors.
+        """
+        ttl = self.get_ttl(payload)
+        if ttl is None:
+            return await fetch()
+
+        key = self.make_key(url, payload)
+        found, value = self.get(key)
+        if found:
+            self._record_hit()
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                value = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The leading request was cancelled, not this caller; fetch on our own.
+                return await fetch()
+            self._record_hit(coalesced=True)
+            return copy.deepcopy(value) if self.copy_on_hit else value
+
+        self._record_miss()
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved so that a future without waiters does not log a warning.
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        future.set_result(value)
+        if is_cacheable is None or is_cacheable(value):
+            self.set(key, value, ttl)
+            return copy.deepcopy(value) if self.copy_on_hit else value
+        return value
+
+    def get_or_call(self, url: str, payload: dict, call: Callable[[], Any], is_cacheable: Callable[[Any], bool] = None) -> Any:
+        """
+        Synchronous version of :meth:`get_or_fetch`. Threads asking for the same request wait for the first one.
+        """
+        ttl = self.get_ttl(payload)
+        if ttl is None:
+            return call()
+
+        key = self.make_key(url, payload)
+        while True:
+            found, value = self.get(key)
+            if found:
+                self._record_hit()
+                return value
+            with self._lock:
+                event = self._sync_inflight.get(key)
+                if event is None:
+                    event = self._sync_inflight[key] = threading.Event()
+                    break
+            event.wait()
+            found, value = self.get(key)
+            if found:
+                self._record_hit(coalesced=True)
+                return value
+            # The leader failed or its response was not cacheable; retry as a leader.
+
+        self._record_miss()
+        try:
+            value = call()
+            if is_cacheable is None or is_cacheable(value):
+                self.set(key, value, ttl)
+                return copy.deepcopy(value) if self.copy_on_hit else value
+            return value
+        finally:
+            with self._lock:
+                self._sync_inflight.pop(key, None)
+            event.set()
+
+    @property
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            }
+
+
+def is_cacheable_rpc_response(response: Any) -> bool:
+    """Only successful JSON-RPC responses are cached."""
+    return isinstance(response, dict) and "result" in response and not response.get("error")
+
+
 class IconRpcHelper(LoggerMixinVerbose):
     def __init__(self, url="", wallet=None, network_info: NetworkInfo = None, raise_on_failure=True, debug=False,
                  required_sign_methods=None, wait_sleep=1, tx_method="icx_getTransactionResult", logger=None,
-                 margin_steps=0, verbose=0, use_hex_value=False, **kwargs):
+                 margin_steps=0, verbose=0, use_hex_value=False, cache=False, cache_ttls=None, cache_maxsize=1024,
+                 session_pool: Union[HttpSessionPool, bool, None] = None, **kwargs):
         self.wallet = wallet
         self.governance_address = None
         self.request_payload = None
@@ -565,6 +971,16 @@ class IconRpcHelper(LoggerMixinVerbose):
         self.use_hex_value = use_hex_value
         self.kwargs = kwargs
 
+        if isinstance(cache, RpcResponseCache):
+            self.cache = cache
+        elif cache:
+            self.cache = RpcResponseCache(method_ttls=cache_ttls, maxsize=cache_maxsize)
+        else:
+            self.cache = None
+
+        # Reuse keep-alive connections unless session_pool=False.
+        self.session_pool = default_http_session_pool if session_pool is None else session_pool or None
+
         self.logger.info("Start IconRpcHelper")
         if required_sign_methods and isinstance(required_sign_methods, list):
             self.required_sign_methods = required_sign_methods
@@ -715,23 +1131,45 @@ class IconRpcHelper(LoggerMixinVerbose):
         if store_request_payload:
             self.request_payload = copy.deepcopy(_request_payload)
 
-        self.response = CallHttp(
-            url=_url,
-            method=http_method,
-            timeout=timeout,
-            payload=_request_payload,
-            raise_on_failure=_raise_on_failure,
-        ).run().response.as_dict()
+        send = partial(self._send_rpc_call, url=_url, http_method=http_method, timeout=timeout,
+                       payload=_request_payload, raise_on_failure=_raise_on_failure)
+
+        if self.cache and http_method == "post" and self.cache.get_ttl(_request_payload):
+            self.response = self.cache.get_or_call(
+                _url,
+                _request_payload,
+                lambda: self._slim_response(send()),
+                is_cacheable=lambda response: response.get('status_code') == 200 and is_cacheable_rpc_response(response.get('json')),
+            )
+        else:
+            self.response = send()
 
         if self.response.get('status_code') != 200:
             self.on_error = True
             self.print_error_message(print_error)
 
-        # pawn.console.log(self.response.get('elapsed'), self.response.get('timing'))
-        self.elapsed_stack.push(self.response.get('elapsed'))
-        self.timing_stack.push(self.response.get('timing'))
         return self.handle_response_with_key(self.response.get('json'), return_key=return_key)
 
+    def _send_rpc_call(self, url, http_method, timeout, payload, raise_on_failure) -> dict:
+        response = CallHttp(
+            url=url,
+            method=http_method,
+            timeout=timeout,
+            payload=payload,
+            raise_on_failure=raise_on_failure,
+            session_pool=self.session_pool,
+        ).run().response.as_dict()
+
+        # pawn.console.log(response.get('elapsed'), response.get('timing'))
+        self.elapsed_stack.push(response.get('elapsed'))
+        self.timing_stack.push(response.get('timing'))
+        return response
+
+    @staticmethod
+    def _slim_response(response: dict) -> dict:
+        """Keep only the fields that are read back from ``self.response``, so the response can be cached."""
+        return {key: response.get(key) for key in ("status_code", "json", "text", "error", "url", "elapsed", "timing")}
+
     def get_elapsed(self, mode='elapsed'):
         if mode == "elapsed":
             return self.elapsed_stack
@@ -1535,6 +1973,44 @@ class IconRpcHelper(LoggerMixinVerbose):
         else:
             self.exit_on_failure(f"Required signed transaction")
 
+    def sign_send_batch(self, payloads: List[dict], concurrency: int = 10, is_wait: bool = True, step_limit=None,
+                        check_balance: bool = True, max_attempts: Optional[int] = 60, **kwargs) -> list:
+        """
+        Sign and send many transactions concurrently with :class:`AsyncTransactionPipeline`.
+
+        This runs its own event loop, so it must not be called from a running loop. Use the pipeline directly there.
+
+        :param payloads: ``icx_sendTransaction`` payloads.
+        :param concurrency: Maximum number of transactions being submitted at once.
+        :param is_wait: Wait for the transaction results.
+        :param step_limit: Fixed step limit. When omitted, steps are estimated.
+        :param check_balance: Check the balance for all values and fees before sending.
+        :param max_attempts: Polling ticks before a transaction is given up.
+        :return: A list of :class:`PipelineTransaction`, in the order of ``payloads``.
+        """
+        if not self.wallet or not isinstance(self.wallet, dict):
+            return self.exit_on_failure(f"[red] Not defined wallet => {self.wallet}")
+
+        async def _run():
+            async with AsyncIconRpcHelper(url=self.url, pooled=True, pool_idle_timeout=0, verbose=0, max_concurrency=concurrency) as rpc:
+                pipeline = AsyncTransactionPipeline(
+                    rpc,
+                    wallet=self.wallet,
+                    nid=getattr(self.network_info, "nid", None),
+                    concurrency=concurrency,
+                    step_limit=step_limit,
+                    margin_steps=self.margin_steps,
+                    check_balance=check_balance,
+                    poll_interval=self.wait_sleep,
+                    max_attempts=max_attempts,
+                    **kwargs
+                )
+                return await pipeline.run(payloads, wait=is_wait)
+
+        results = asyncio.run(_run())
+        self.on_error = any(result.error for result in results)
+        return results
+
     @staticmethod
     def _check_tx_result(result):
         if result:
@@ -2265,11 +2741,13 @@ class CallHttp:
             raise_on_failure: bool = False,
 
             auto_run: bool = True,
+            session_pool: Optional[HttpSessionPool] = None,
             **kwargs
         ):
 
         self.url = url
         self.method = method.lower()
+        self.session_pool = session_pool
         self.payload = payload
         self.timeout = timeout / 1000
         self.ignore_ssl = ignore_ssl
@@ -2389,7 +2867,10 @@ class CallHttp:
             if pawn.get("PAWN_DEBUG") and self.payload:
                 print_json(_payload_string)
 
-            func = getattr(requests, self.method)
+            if self.session_pool:
+                func = partial(self.session_pool.request, self.method)
+            else:
+                func = getattr(requests, self.method)
             if self.method == "get":
                 self.response = func(self.url, verify=self.verify, timeout=self.timeout, **self.kwargs)
             else:
@@ -3995,6 +4476,165 @@ class AsyncCallWebsocket(LoggerMixinVerbose):
             sys.exit(exit_code)
 
 
+class BlockHeightCheckpoint(LoggerMixinVerbose):
+    """
+    Buffered store for the last processed block heights.
+
+    Heights are kept in memory and written to disk only every ``flush_every`` updates
+    or ``flush_interval`` seconds, whichever comes first. Each file is replaced with an
+    atomic rename so a crash never leaves a truncated checkpoint behind, and the disk
+    I/O of :meth:`flush` runs in the default executor instead of on the event loop.
+
+    :param base_dir: Directory where the checkpoint files are stored.
+    :param flush_interval: Maximum number of seconds a pending height stays in memory.
+    :param flush_every: Maximum number of pending updates before a flush is due.
+    :param fsync: If True, fsync the temporary file before it is renamed.
+    :param logger: Logger instance.
+    :param verbose: Verbosity level.
+
+    Example:
+
+        .. code-block:: python
+
+            checkpoint = BlockHeightCheckpoint(base_dir="./", flush_interval=1, flush_every=100)
+            checkpoint.set("last_blockheight.txt", 1000)
+            await checkpoint.flush_if_due()
+
+            # at shutdown
+            await checkpoint.flush()
+    """
+
+    def __init__(
+            self,
+            base_dir: str = "./",
+            flush_interval: float = 1.0,
+            flush_every: int = 100,
+            fsync: bool = False,
+            logger=None,
+            verbose: int = 0,
+    ):
+        self.base_dir = base_dir or ""
+        if self.base_dir and not self.base_dir.endswith("/"):
+            self.base_dir += "/"
+        self.flush_interval = flush_interval
+        self.flush_every = max(int(flush_every), 1)
+        self.fsync = fsync
+        self.init_logger(logger, verbose)
+
+        self._heights: Dict[str, Optional[int]] = {}
+        self._dirty: Dict[str, int] = {}
+        self._pending_updates = 0
+        self._last_flush_time = time.monotonic()
+        self._flush_future = None
+
+    def get_path(self, filename: str) -> str:
+        return f"{self.base_dir}{filename}"
+
+    def get(self, filename: str, skip_log: bool = False) -> Optional[int]:
+        """
+        Return the block height stored for ``filename``.
+        The file is read only once; subsequent calls are served from memory.
+        """
+        if filename not in self._heights:
+            self._heights[filename] = self._read(filename, skip_log=skip_log)
+        return self._heights[filename]
+
+    def set(self, filename: str, blockheight: int) -> bool:
+        """
+        Record ``blockheight`` for ``filename`` in memory.
+
+        :return: True if a flush is due.
+        """
+        self._heights[filename] = blockheight
+        self._dirty[filename] = blockheight
+        self._pending_updates += 1
+        return self.is_flush_due()
+
+    def is_flush_due(self) -> bool:
+        if not self._dirty:
+            return False
+        if self._pending_updates >= self.flush_every:
+            return True
+        return time.monotonic() - self._last_flush_time >= self.flush_interval
+
+    async def flush_if_due(self):
+        """
+        Flush if a flush is due and none is in progress, and wait for it to finish.
+
+        The file is written in the default executor, so other tasks keep running meanwhile.
+        """
+        if self._flush_future and not self._flush_future.done():
+            return
+        if self.is_flush_due():
+            await self.flush()
+
+    async def flush(self):
+        """Write all pending heights to disk without blocking the event loop."""
+        if self._flush_future and not self._flush_future.done():
+            await self._flush_future
+        pending = self._take_pending()
+        if not pending:
+            return
+        loop = asyncio.get_running_loop()
+        self._flush_future = loop.run_in_executor(None, self._write_pending, pending)
+        self._requeue(await self._flush_future)
+
+    def flush_sync(self):
+        """Write all pending heights to disk on the calling thread."""
+        pending = self._take_pending()
+        if pending:
+            self._requeue(self._write_pending(pending))
+
+    def _take_pending(self) -> Dict[str, int]:
+        pending = self._dirty
+        self._dirty = {}
+        self._pending_updates = 0
+        self._last_flush_time = time.monotonic()
+        return pending
+
+    def _requeue(self, failed: Dict[str, int]):
+        # Keep failed heights pending unless a newer one has been recorded in the meantime.
+        for filename, blockheight in failed.items():
+            self._dirty.setdefault(filename, blockheight)
+            self._pending_updates += 1
+
+    def _write_pending(self, pending: Dict[str, int]) -> Dict[str, int]:
+        failed = {}
+        for filename, blockheight in pending.items():
+            try:
+                self._write_atomic(self.get_path(filename), blockheight)
+            except Exception as e:
+                self.logger.error(f"Error writing block height to file: {e} on '{self.get_path(filename)}'")
+                failed[filename] = blockheight
+        return failed
+
+    def _write_atomic(self, path: str, blockheight: int):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as file:
+            file.write(f"{blockheight}")
+            if self.fsync:
+                file.flush()
+                os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+        self.logger.debug(f"Block height {blockheight} recorded on '{path}'.")
+
+    def _read(self, filename: str, skip_log: bool = False) -> Optional[int]:
+        path = self.get_path(filename)
+        if os.path.exists(path):
+            try:
+                with open(path, "r") as file:
+                    blockheight = int(file.read().strip())
+                    if not skip_log:
+                        self.logger.info(f"🫡 Read last processed blockheight : {blockheight} on '{path}'")
+                    return blockheight
+            except (ValueError, IOError) as e:
+                self.logger.error(f"Error reading block height file: {e} on '{path}'")
+        else:
+            if not skip_log:
+                self.logger.info(f"Block recorded file not found - '{path}'")
+        return None
+
+
 class AsyncGoloopWebsocket(AsyncCallWebsocket):
     BLOCKHEIGHT_FILE = "last_blockheight.txt"
     SLACK_BLOCKHEIGHT_FILE = "last_slack_blockheight.txt"
@@ -4026,6 +4666,12 @@ class AsyncGoloopWebsocket(AsyncCallWebsocket):
             bps_interval: int = 0,
             skip_until: int = 0,
             base_dir: str = "./",
+            checkpoint_flush_interval: float = 1.0,
+            checkpoint_flush_every: int = 100,
+            checkpoint_fsync: bool = False,
+            catchup_threshold: int = 1000,
+            catchup_concurrency: int = 10,
+            catchup_window: int = 200,
     ):
         self.url = url
         self.verbose = verbose
@@ -4065,6 +4711,19 @@ class AsyncGoloopWebsocket(AsyncCallWebsocket):
         if self.base_dir and not self.base_dir.endswith("/"):
             self.base_dir += "/"
 
+        self.checkpoint = BlockHeightCheckpoint(
+            base_dir=self.base_dir,
+            flush_interval=checkpoint_flush_interval,
+            flush_every=checkpoint_flush_every,
+            fsync=checkpoint_fsync,
+            logger=logger,
+            verbose=verbose,
+        )
+
+        self.catchup_threshold = catchup_threshold
+        self.catchup_concurrency = max(catchup_concurrency, 1)
+        self.catchup_window = max(catchup_window, self.catchup_concurrency)
+
         self.status_info = {}
 
         self.metrics_start_time = 0
@@ -4104,42 +4763,37 @@ class AsyncGoloopWebsocket(AsyncCallWebsocket):
         )
 
     def read_last_processed_blockheight(self, filename, skip_log=False):
-        """Read the last processed block height from a file."""
-        filename = f"{self.base_dir}{filename}"
-        if os.path.exists(filename):
-            try:
-                with open(filename, "r") as file:
-                    blockheight = int(file.read().strip())
-                    if not skip_log:
-                        self.logger.info(f"🫡 Read last processed blockheight : {blockheight} on '{filename}'")
-                    return blockheight  # Assuming block height is stored in hex
-            except (ValueError, IOError) as e:
-                self.logger.error(f"Error reading block height file: {e} on '{filename}'")
-        else:
-            if not skip_log:
-                self.logger.info(f"Block recorded file not found - '{filename}'")
-        return None
+        """Read the last processed block height. The file is read once and then served from memory."""
+        return self.checkpoint.get(filename, skip_log=skip_log)
 
     def write_last_processed_blockheight(self, filename, blockheight):
-        """Write the last successfully processed block height to a file."""
-        filename = f"{self.base_dir}{filename}"
-        try:
-            file_exists = os.path.exists(filename)
-
-            with open(filename, "w") as file:
-                file.write(f"{blockheight}")
-
-            if not file_exists:
-                self.logger.info(f"Block height file '{filename}' not found. Creating new file.")
-
-            self.logger.debug(f"Successfully processed block {blockheight}. Block height recorded on '{filename}'.")
+        """
+        Record the last successfully processed block height.
+        The height is buffered in memory and written by :meth:`flush_checkpoint`.
+        """
+        self.checkpoint.set(filename, blockheight)
 
-        except IOError as e:
-            self.logger.error(f"Error writing block height to file: {e} on '{filename}'")
+    async def flush_checkpoint(self, force=False):
+        """
+        Write the buffered block heights to disk.
 
+        :param force: If True, flush immediately; otherwise only when the flush interval or count is reached.
+        """
+        try:
+            if force:
+                await self.checkpoint.flush()
+            else:
+                await self.checkpoint.flush_if_due()
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred while writing block height: {e} on '{filename}'")
+            self.logger.error(f"Unexpected error occurred while writing block height: {e}")
 
+    async def close(self, exit_on_close=True, exit_code=0):
+        await self.flush_checkpoint(force=True)
+        await super().close(exit_on_close=exit_on_close, exit_code=exit_code)
+
+    async def graceful_close(self, exit_code=0):
+        await self.flush_checkpoint(force=True)
+        await super().graceful_close(exit_code=exit_code)
 
     async def run_from_blockheight(self, blockheight=None, api_path: str = "/api/v3/icon_dex/block"):
         """
@@ -4176,6 +4830,7 @@ class AsyncGoloopWebsocket(AsyncCallWebsocket):
             self.blockheight = latest_blockheight
             self.logger.info(f"Starting from the most recent block height: {self.blockheight}")
             self.write_last_processed_blockheight(self.SLACK_BLOCKHEIGHT_FILE, latest_blockheight)
+            await self.flush_checkpoint(force=True)
         else:
             self.blockheight = self.read_last_processed_blockheight(self.BLOCKHEIGHT_FILE)
 
@@ -4204,6 +4859,9 @@ class AsyncGoloopWebsocket(AsyncCallWebsocket):
                 self.blockheight = latest_blockheight
                 self.logger.info(f"No previous block height found. Starting from the latest block: {self.blockheight}")
 
+        if self.is_catchup_required(latest_blockheight):
+            self.blockheight = await self.catch_up(self.blockheight, latest_blockheight)
+
         # Connect to WebSocket and start running tasks
         if self.enable_status_console:
             with pawn.console.status("[bold green]Connecting to WebSocket...") as status:
@@ -4214,6 +4872,17 @@ class AsyncGoloopWebsocket(AsyncCallWebsocket):
 
         await self.run_tasks()
 
+    def is_catchup_required(self, latest_blockheight) -> bool:
+        """
+        Check whether the gap to the chain tip is large enough to replay blocks with :meth:`catch_up`.
+        Catch-up is disabled when ``catchup_threshold`` is 0 or a custom ``on_receive`` handler is used.
+        """
+        if self.catchup_threshold <= 0 or self.on_receive != self.handle_confirmed_transaction_list:
+            return False
+        if not isinstance(self.blockheight, int) or not isinstance(latest_blockheight, int):
+            return False
+        return latest_blockheight - self.blockheight >= self.catchup_threshold
+
     async def initialize(self, session=None):
         if session:
             self.session = session
@@ -4341,34 +5010,10 @@ class AsyncGoloopWebsocket(AsyncCallWebsocket):
         self.blockheight_now = response_json.get("height")
         readable_block_height = hex_to_number(self.blockheight_now, debug=True)
 
-        if self.bps_interval > 0:
-            await self.calculate_tps_bps(block_height, 0)
-
-        if self.skip_until:
-           last_slack_blockheight = self.skip_until
-        else:
-            last_slack_blockheight = self.read_last_processed_blockheight(self.SLACK_BLOCKHEIGHT_FILE, skip_log=True)
-
-        if block_height and last_slack_blockheight and block_height <  last_slack_blockheight + 1:
-            if not self.status_info.get('skip_start_block'):
-                self.logger.info(f"⏩ [Skipping Started] Block {block_height}  👉 {last_slack_blockheight} - Preventing duplicate processing.")
-                self.status_info['skip_start_block'] = block_height
-
-            self.write_last_processed_blockheight(self.BLOCKHEIGHT_FILE, block_height)
-            self.logger.debug(f"⏩ Block {block_height} skipped to prevent duplicate processing, until last_slack_blockheight={last_slack_blockheight}")
+        if await self.skip_processed_block(block_height):
             return  # Slack 전송 스킵
 
         if tx_hash:
-            if self.status_info.get('skip_start_block'):
-                self.status_info['skip_start_block'] = 0
-                self.status_info['current_start_block'] = block_height
-                self.logger.info(f"✅ [Skipping Stopped] Resuming at Block {block_height} - {self.status_info}")
-
-            def is_success(result):
-                if not result:
-                    return False
-                return check_key_and_type(result, "confirmed_transaction_list", list)
-
             block_data = {}
             try:
                 block_data = await retry_operation(
@@ -4376,7 +5021,7 @@ class AsyncGoloopWebsocket(AsyncCallWebsocket):
                     max_attempts=self.max_transaction_attempts,
                     delay=2,
                     tx_hash=tx_hash,
-                    success_criteria=is_success,
+                    success_criteria=is_valid_block_data,
                     logger=self.logger
                 )
             except (TimeoutError, ConnectionError) as e:
@@ -4399,47 +5044,160 @@ class AsyncGoloopWebsocket(AsyncCallWebsocket):
                 # await shutdown_async_tasks(1)
                 return
 
-            try:
-                validator_info = self.get_prep_info(block_data.get('peer_id'), apply_format=False)
-                time_stamp = date_utils.timestamp_to_string(block_data.get('time_stamp', 0))
-            except Exception as e:
-                validator_info, time_stamp =  "",""
-                self.logger.error(f"{e} - {block_data}")
-
-            confirmed_transactions = block_data.get('confirmed_transaction_list', [])
-            confirmed_transactions_length = len(confirmed_transactions)
-            self.write_last_processed_blockheight(self.BLOCKHEIGHT_FILE, block_height)
-            self.status_info['block_height'] = block_height
-
-            if self.blockheight_now:
-                # self.logger.info(f"Block height parsed: {hex_to_number(self.blockheight_now, debug=True)}, TX: {confirmed_transactions_length}, Validator={validator_info}, "
-                #                  f" 📅 {time_stamp}")
-                if self.verbose > 1:
-                    self.logger.info(
-                        f"🔗 Block: {hex_to_number(self.blockheight_now, debug=False)}, "
-                        f"TXs: {confirmed_transactions_length}, "
-                        f"📅 {time_stamp}, "
-                        f"Validator: {validator_info} "
-                    )
-                # self.logger.info(f"Block height parsed: {hex_to_number(self.blockheight_now, debug=True)}, TX: {confirmed_transactions_length}")
-            if confirmed_transactions:
-                if self.verbose > 4:
-                    self.logger.debug(f"block_data={block_data}")
-                tasks = [self.process_transaction_callback(tx, block_height) for tx in confirmed_transactions]
-                # await asyncio.gather(*tasks, return_exceptions=True)
-                await asyncio.gather(*tasks)
+            await self.process_block_data(block_height, block_data)
 
-            else:
-                if isinstance(confirmed_transactions, list) and len(confirmed_transactions) == 0:
-                    return
-                self.logger.error(f"confirmed_transaction_list not found - {block_data}")
+    async def skip_processed_block(self, block_height):
+        """
+        Skip blocks that were already reported to Slack (or are below ``skip_until``).
 
-    def validate_address_filter(self, address_filter: Union[str, list, None]):
-        valid_addresses = []
-        invalid_addresses = []
+        :return: True if the block was skipped.
+        """
+        if self.bps_interval > 0:
+            await self.calculate_tps_bps(block_height, 0)
 
-        if isinstance(address_filter, str) and "," in address_filter:
-            address_filter_list = address_filter.split(',')
+        if self.skip_until:
+            last_slack_blockheight = self.skip_until
+        else:
+            last_slack_blockheight = self.read_last_processed_blockheight(self.SLACK_BLOCKHEIGHT_FILE, skip_log=True)
+
+        if block_height and last_slack_blockheight and block_height < last_slack_blockheight + 1:
+            if not self.status_info.get('skip_start_block'):
+                self.logger.info(f"⏩ [Skipping Started] Block {block_height}  👉 {last_slack_blockheight} - Preventing duplicate processing.")
+                self.status_info['skip_start_block'] = block_height
+
+            self.write_last_processed_blockheight(self.BLOCKHEIGHT_FILE, block_height)
+            await self.flush_checkpoint()
+            self.logger.debug(f"⏩ Block {block_height} skipped to prevent duplicate processing, until last_slack_blockheight={last_slack_blockheight}")
+            return True
+        return False
+
+    async def process_block_data(self, block_height, block_data):
+        """
+        Hand the confirmed transactions of a fetched block to ``process_transaction_callback``
+        and record the block height as processed.
+
+        :param block_height: The block height as an integer.
+        :param block_data: The block returned by ``icx_getBlockByHash`` or ``icx_getBlockByHeight``.
+        """
+        if self.status_info.get('skip_start_block'):
+            self.status_info['skip_start_block'] = 0
+            self.status_info['current_start_block'] = block_height
+            self.logger.info(f"✅ [Skipping Stopped] Resuming at Block {block_height} - {self.status_info}")
+
+        try:
+            validator_info = self.get_prep_info(block_data.get('peer_id'), apply_format=False)
+            time_stamp = date_utils.timestamp_to_string(block_data.get('time_stamp', 0))
+        except Exception as e:
+            validator_info, time_stamp =  "",""
+            self.logger.error(f"{e} - {block_data}")
+
+        confirmed_transactions = block_data.get('confirmed_transaction_list', [])
+        confirmed_transactions_length = len(confirmed_transactions) if confirmed_transactions else 0
+        self.write_last_processed_blockheight(self.BLOCKHEIGHT_FILE, block_height)
+        self.status_info['block_height'] = block_height
+
+        if self.blockheight_now:
+            # self.logger.info(f"Block height parsed: {hex_to_number(self.blockheight_now, debug=True)}, TX: {confirmed_transactions_length}, Validator={validator_info}, "
+            #                  f" 📅 {time_stamp}")
+            if self.verbose > 1:
+                self.logger.info(
+                    f"🔗 Block: {block_height}, "
+                    f"TXs: {confirmed_transactions_length}, "
+                    f"📅 {time_stamp}, "
+                    f"Validator: {validator_info} "
+                )
+            # self.logger.info(f"Block height parsed: {hex_to_number(self.blockheight_now, debug=True)}, TX: {confirmed_transactions_length}")
+        if confirmed_transactions:
+            if self.verbose > 4:
+                self.logger.debug(f"block_data={block_data}")
+            tasks = [self.process_transaction_callback(tx, block_height) for tx in confirmed_transactions]
+            # await asyncio.gather(*tasks, return_exceptions=True)
+            await asyncio.gather(*tasks)
+
+        elif not isinstance(confirmed_transactions, list):
+            self.logger.error(f"confirmed_transaction_list not found - {block_data}")
+
+        await self.flush_checkpoint()
+
+    async def fetch_block_by_height(self, block_height):
+        """Fetch a block by height, retrying until it contains a confirmed transaction list."""
+        return await retry_operation(
+            self.api_client.get_block_by_height,
+            max_attempts=self.max_transaction_attempts,
+            delay=2,
+            height=block_height,
+            success_criteria=is_valid_block_data,
+            logger=self.logger
+        )
+
+    async def catch_up(self, start_height: int, end_height: Optional[int] = None) -> int:
+        """
+        Replay blocks from ``start_height`` towards the chain tip using pipelined RPC fetches.
+
+        Block bodies for a sliding window of ``catchup_window`` heights are prefetched with at most
+        ``catchup_concurrency`` requests in flight, and handed to ``process_transaction_callback``
+        strictly in height order. When the window reaches ``end_height``, the tip is re-read and the
+        replay continues until the remaining gap drops below ``catchup_threshold``.
+
+        :param start_height: The first block height to process.
+        :param end_height: The last block height to process. Defaults to the latest block height.
+        :return: The next block height to process, which is where the websocket stream should resume.
+        """
+        if end_height is None:
+            end_height = await self.api_client.get_last_blockheight()
+
+        semaphore = asyncio.Semaphore(self.catchup_concurrency)
+
+        async def _fetch(height):
+            async with semaphore:
+                return await self.fetch_block_by_height(height)
+
+        pending: Dict[int, asyncio.Future] = {}
+        next_fetch = next_process = start_height
+        started_at = time.time()
+        self.logger.info(
+            f"🏃 [Catch-up Started] Block {start_height:,} → {end_height:,} "
+            f"(gap={end_height - start_height + 1:,}, concurrency={self.catchup_concurrency}, window={self.catchup_window})"
+        )
+        try:
+            while next_process <= end_height:
+                while next_fetch <= end_height and next_fetch - next_process < self.catchup_window:
+                    pending[next_fetch] = asyncio.ensure_future(_fetch(next_fetch))
+                    next_fetch += 1
+
+                try:
+                    block_data = await pending.pop(next_process)
+                except Exception as e:
+                    self.logger.error(f"Catch-up stopped at block {next_process:,}, falling back to websocket: {e}")
+                    break
+
+                self.blockheight_now = hex(next_process)
+                if not await self.skip_processed_block(next_process):
+                    await self.process_block_data(next_process, block_data)
+                next_process += 1
+
+                if next_process > end_height:
+                    latest_blockheight = await self.api_client.get_last_blockheight()
+                    if latest_blockheight and latest_blockheight - next_process >= self.catchup_threshold:
+                        end_height = latest_blockheight
+        finally:
+            for task in pending.values():
+                task.cancel()
+
+        elapsed = time.time() - started_at
+        processed = next_process - start_height
+        self.logger.info(
+            f"🏁 [Catch-up Finished] Processed {processed:,} blocks in {elapsed:.2f}s "
+            f"({processed / elapsed if elapsed > 0 else 0:.2f} Blocks/s), resuming websocket at {next_process:,}"
+        )
+        return next_process
+
+    def validate_address_filter(self, address_filter: Union[str, list, None]):
+        valid_addresses = []
+        invalid_addresses = []
+
+        if isinstance(address_filter, str) and "," in address_filter:
+            address_filter_list = address_filter.split(',')
         else:
             address_filter_list = address_filter
 
@@ -4710,6 +5468,195 @@ class AsyncGoloopWebsocket(AsyncCallWebsocket):
                 self.logger.error(f"Error sending Slack message: {e}")
 
 
+class AsyncConnectionPool:
+    """
+    A keep-alive ``aiohttp`` session/connector shared by pooled :class:`AsyncIconRpcHelper` instances.
+
+    Connections are kept alive for ``keepalive_timeout`` seconds and limited per host, so repeated
+    RPC calls reuse an established TCP (and TLS) connection instead of paying a fresh handshake.
+    Connection creation and reuse are counted through an ``aiohttp.TraceConfig``.
+
+    Pools are normally obtained from :class:`AsyncConnectionPoolRegistry` rather than created directly.
+
+    :param limit: Total number of simultaneous connections.
+    :param limit_per_host: Number of simultaneous connections to the same endpoint.
+    :param keepalive_timeout: Seconds an idle connection is kept open for reuse.
+    :param idle_timeout: Seconds the pool stays open after its last user released it.
+    :param timeout: Total request timeout of the shared session in seconds.
+    :param ssl: SSL validation mode passed to ``aiohttp.TCPConnector``.
+    :param ttl_dns_cache: Seconds DNS lookups are cached.
+    """
+
+    def __init__(
+            self,
+            limit: int = 100,
+            limit_per_host: int = 0,
+            keepalive_timeout: float = 30,
+            idle_timeout: float = 60,
+            timeout: float = 10,
+            ssl=False,
+            ttl_dns_cache: int = 300,
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.ssl = ssl
+        self.ttl_dns_cache = ttl_dns_cache
+
+        self.ref_count = 0
+        self.created_connections = 0
+        self.reused_connections = 0
+        self.requests = 0
+
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._evict_handle = None
+
+    @property
+    def closed(self) -> bool:
+        return self.session is None or self.session.closed
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use."""
+        if self.closed:
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_request_start.append(self._on_request_start)
+            trace_config.on_connection_create_end.append(self._on_connection_create_end)
+            trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ssl=self.ssl,
+                ttl_dns_cache=self.ttl_dns_cache,
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                trace_configs=[trace_config],
+            )
+            _ACTIVE_SESSIONS.add(self.session)
+        return self.session
+
+    async def _on_request_start(self, session, context, params):
+        self.requests += 1
+
+    async def _on_connection_create_end(self, session, context, params):
+        self.created_connections += 1
+
+    async def _on_connection_reuseconn(self, session, context, params):
+        self.reused_connections += 1
+
+    def cancel_eviction(self):
+        if self._evict_handle:
+            self._evict_handle.cancel()
+            self._evict_handle = None
+
+    def schedule_eviction(self, callback: Callable[[], None]):
+        """Call ``callback`` after ``idle_timeout`` seconds unless the pool is acquired again."""
+        self.cancel_eviction()
+        self._evict_handle = asyncio.get_running_loop().call_later(self.idle_timeout, callback)
+
+    async def close(self):
+        self.cancel_eviction()
+        if self.session is not None:
+            if not self.session.closed:
+                await self.session.close()
+            _ACTIVE_SESSIONS.discard(self.session)
+            self.session = None
+
+    @property
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: Pool metrics:
+                - in_use (int): Connections currently acquired by requests
+                - idle (int): Keep-alive connections waiting for reuse
+                - created (int): Connections opened (TCP/TLS handshakes) so far
+                - reused (int): Requests served from an existing connection
+                - requests (int): Requests sent through the pool
+                - limit (int), limit_per_host (int): Connector limits
+                - refs (int): Helper instances sharing the pool
+        """
+        connector = self.session.connector if self.session and not self.session.closed else None
+        return {
+            "in_use": len(getattr(connector, "_acquired", ())) if connector else 0,
+            "idle": sum(len(conns) for conns in getattr(connector, "_conns", {}).values()) if connector else 0,
+            "created": self.created_connections,
+            "reused": self.reused_connections,
+            "requests": self.requests,
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+            "refs": self.ref_count,
+        }
+
+
+class AsyncConnectionPoolRegistry:
+    """
+    Process-wide registry of :class:`AsyncConnectionPool` objects.
+
+    Helpers that ask for a pool with the same name and options on the same event loop share a
+    single session/connector. A pool whose last user released it is closed after its ``idle_timeout``.
+
+    Example:
+
+        .. code-block:: python
+
+            pool = AsyncConnectionPoolRegistry.acquire(limit_per_host=10)
+            session = pool.get_session()
+            ...
+            await AsyncConnectionPoolRegistry.release(pool)
+    """
+    _pools: Dict[tuple, AsyncConnectionPool] = {}
+
+    @classmethod
+    def get_key(cls, name: str = "default", **options) -> tuple:
+        return (id(asyncio.get_running_loop()), name, tuple(sorted((k, repr(v)) for k, v in options.items())))
+
+    @classmethod
+    def acquire(cls, name: str = "default", **options) -> AsyncConnectionPool:
+        key = cls.get_key(name, **options)
+        pool = cls._pools.get(key)
+        if pool is None or (pool.closed and pool.ref_count == 0):
+            pool = cls._pools[key] = AsyncConnectionPool(**options)
+        pool.cancel_eviction()
+        pool.ref_count += 1
+        pool.get_session()
+        return pool
+
+    @classmethod
+    async def release(cls, pool: AsyncConnectionPool):
+        pool.ref_count = max(pool.ref_count - 1, 0)
+        if pool.ref_count > 0:
+            return
+        if pool.idle_timeout <= 0:
+            await cls._evict(pool)
+        else:
+            pool.schedule_eviction(lambda: asyncio.ensure_future(cls._evict(pool)))
+
+    @classmethod
+    async def _evict(cls, pool: AsyncConnectionPool):
+        if pool.ref_count > 0:
+            return
+        for key, registered in list(cls._pools.items()):
+            if registered is pool:
+                del cls._pools[key]
+        await pool.close()
+
+    @classmethod
+    async def close_all(cls):
+        pools = list(cls._pools.values())
+        cls._pools.clear()
+        for pool in pools:
+            await pool.close()
+
+    @classmethod
+    def stats(cls) -> List[dict]:
+        return [{"name": key[1], **pool.stats} for key, pool in cls._pools.items()]
+
+
 class AsyncIconRpcHelper(LoggerMixinVerbose):
     """
     A helper class for making asynchronous RPC calls to the ICON network.
@@ -4725,11 +5672,30 @@ class AsyncIconRpcHelper(LoggerMixinVerbose):
         retries (int): Number of retry attempts for failed requests.
         return_with_time (bool): Whether to return elapsed time with responses.
         max_concurrency (int) : Number of max concurrency
+        pooled (bool): Use a keep-alive session shared through :class:`AsyncConnectionPoolRegistry`.
+        limit_per_host (int): Per-host connection limit of the shared pool.
+        keepalive_timeout (float): Seconds an idle pooled connection is kept open.
+        pool_idle_timeout (float): Seconds the shared pool stays open after its last user is closed.
+        batch_requests (bool): Coalesce concurrent ``execute_rpc_call`` invocations into JSON-RPC batch arrays.
+        batch_size (int): Maximum number of requests in one JSON-RPC batch.
+        batch_delay (float): Seconds to wait for more calls before a partial batch is sent.
+        batch_retry_interval (float): Seconds to send single calls to an endpoint after a batch failed without
+            a JSON-RPC "Invalid Request" or "Parse error" answer, e.g. on a 502 of a gateway. Endpoints that
+            answer with one of those errors do not support batches and are never sent one again.
+        json_loads (Callable): JSON decoder for response bodies. Defaults to :func:`fast_json_loads`.
+        json_dumps (Callable): JSON encoder for request payloads. Defaults to :func:`fast_json_dumps`.
+        cache (bool or RpcResponseCache): Cache read-only RPC responses such as ``getPReps`` or ``icx_getNetworkInfo``.
+            Pass an :class:`RpcResponseCache` to share it between helpers.
+        cache_ttls (dict): Per-method TTLs in seconds, merged over :attr:`RpcResponseCache.DEFAULT_METHOD_TTLS`.
+        cache_maxsize (int): Maximum number of cached responses.
+        rate_limiter (RateLimiter): Limit the requests per host. The limiter can be shared with other helpers and
+            :class:`SlackNotifier` instances.
 
     Methods:
         initialize(): Initializes the aiohttp session if not already initialized.
         close(): Closes the aiohttp session.
         execute_rpc_call(): Executes an RPC call to the ICON network.
+        execute_rpc_batch(): Executes many RPC calls as JSON-RPC batch requests.
         fetch(): Makes a generic HTTP request (GET or POST).
         get_block_hash(): Fetches block information by hash.
         get_last_blockheight(): Retrieves the height of the last block on the blockchain.
@@ -4772,6 +5738,20 @@ class AsyncIconRpcHelper(LoggerMixinVerbose):
             retries=3,
             return_with_time: bool = False,
             max_concurrency: int = 20,
+            pooled: bool = False,
+            limit_per_host: int = 0,
+            keepalive_timeout: float = 30,
+            pool_idle_timeout: float = 60,
+            batch_requests: bool = False,
+            batch_size: int = 100,
+            batch_delay: float = 0.01,
+            batch_retry_interval: float = 60,
+            json_loads: Callable[[Union[bytes, str]], Any] = fast_json_loads,
+            json_dumps: Callable[[Any], Union[bytes, str]] = fast_json_dumps,
+            cache: Union[bool, RpcResponseCache] = False,
+            cache_ttls: Optional[Dict[str, float]] = None,
+            cache_maxsize: int = 1024,
+            rate_limiter: Optional[RateLimiter] = None,
             # loop=None,
             **kwargs
     ):
@@ -4798,14 +5778,50 @@ class AsyncIconRpcHelper(LoggerMixinVerbose):
             self.session = session
             self._own_session = False
             
-        self.logger.info(f"Start AsyncIconRpcHelper with max_concurrency={self.max_concurrency}")
-        
-        self.connector = aiohttp.TCPConnector(
+        self.pooled = pooled
+        self.pool: Optional[AsyncConnectionPool] = None
+        self.pool_options = dict(
             limit=max_concurrency,
+            limit_per_host=limit_per_host,
+            keepalive_timeout=keepalive_timeout,
+            idle_timeout=pool_idle_timeout,
+            timeout=timeout,
             ssl=kwargs.get('ssl', False),
-            force_close=kwargs.get('force_close', True),
-            ttl_dns_cache=kwargs.get('ttl_dns_cache', 300)
-        )    
+            ttl_dns_cache=kwargs.get('ttl_dns_cache', 300),
+        )
+
+        self.batch_requests = batch_requests
+        self.batch_size = max(batch_size, 1)
+        self.batch_delay = batch_delay
+        self._batch_queue: Dict[str, List[Tuple[dict, asyncio.Future]]] = {}
+        self._batch_flush_handles: Dict[str, asyncio.Handle] = {}
+        self.batch_retry_interval = batch_retry_interval
+        self._batch_unsupported: Dict[str, float] = {}
+        """Endpoint to the monotonic time batches are sent again, ``math.inf`` if they are not supported."""
+
+        self.json_loads = json_loads
+        self.json_dumps = json_dumps
+
+        if isinstance(cache, RpcResponseCache):
+            self.cache = cache
+        elif cache:
+            self.cache = RpcResponseCache(method_ttls=cache_ttls, maxsize=cache_maxsize)
+        else:
+            self.cache = None
+
+        self.rate_limiter = rate_limiter
+
+        self.logger.info(f"Start AsyncIconRpcHelper with max_concurrency={self.max_concurrency}, pooled={self.pooled}")
+
+        if self.pooled:
+            self.connector = None
+        else:
+            self.connector = aiohttp.TCPConnector(
+                limit=max_concurrency,
+                ssl=kwargs.get('ssl', False),
+                force_close=kwargs.get('force_close', True),
+                ttl_dns_cache=kwargs.get('ttl_dns_cache', 300)
+            )
 
     async def adjust_concurrency(self, new_max: int):
         """
@@ -4821,7 +5837,8 @@ class AsyncIconRpcHelper(LoggerMixinVerbose):
             ValueError: If new_max is less than 1
         """
         self.max_concurrency = new_max
-        self.connector._limit = new_max
+        if self.connector:
+            self.connector._limit = new_max
         old_sem = self.semaphore
         self.semaphore = asyncio.Semaphore(new_max)
         for _ in range(min(new_max, old_sem._value)):
@@ -4837,12 +5854,20 @@ class AsyncIconRpcHelper(LoggerMixinVerbose):
                 - active (int): Number of currently used connections
                 - available (int): Number of available connections
                 - max (int): Maximum allowed concurrent connections
+                - pool (dict): Shared connection pool metrics (only in pooled mode),
+                  see :attr:`AsyncConnectionPool.stats`
+                - cache (dict): Response cache metrics (only with ``cache``), see :attr:`RpcResponseCache.stats`
         """
-        return {
+        usage = {
             "active": self.max_concurrency - self.semaphore._value,
             "available": self.semaphore._value,
             "max": self.max_concurrency
         }
+        if self.pool:
+            usage["pool"] = self.pool.stats
+        if self.cache:
+            usage["cache"] = self.cache.stats
+        return usage
 
     async def __aenter__(self):
         await self.initialize()
@@ -4852,6 +5877,13 @@ class AsyncIconRpcHelper(LoggerMixinVerbose):
         await self.close()
 
     async def close(self):
+        if self.pool:
+            pool, self.pool = self.pool, None
+            self.session = None
+            await AsyncConnectionPoolRegistry.release(pool)
+            self.logger.debug("Released shared connection pool")
+            return
+
         if self._own_session and hasattr(self, 'session') and self.session:
             if not self.session.closed:
                 await self.session.close()
@@ -4866,7 +5898,13 @@ class AsyncIconRpcHelper(LoggerMixinVerbose):
 
     async def initialize(self):
         self.logger.debug(f"[INIT START] Session={self.session}, closed={self.session.closed if self.session else 'None'}")
-        if not self.session or self.session.closed:
+        if self.pooled and (not self.session or self.session.closed):
+            if not self.pool:
+                self.pool = AsyncConnectionPoolRegistry.acquire(**self.pool_options)
+            self.session = self.pool.get_session()
+            self._own_session = False
+            self.logger.debug(f"[INIT] Using shared connection pool {self.pool.stats}")
+        elif not self.session or self.session.closed:
             self.session = aiohttp.ClientSession(
                 connector=self.connector,
                 timeout=aiohttp.ClientTimeout(total=self.timeout),
@@ -4897,6 +5935,10 @@ class AsyncIconRpcHelper(LoggerMixinVerbose):
     async def execute_rpc_call(self, method=None, params: dict = {}, url=None, return_key=None, governance_address=None, return_on_error=True, keep_lists=True):
         """
         Execute an RPC call to the ICON network.
+
+        When ``batch_requests`` is enabled, concurrent calls to the same endpoint are
+        coalesced into a single JSON-RPC batch request. When ``cache`` is enabled, responses of
+        read-only methods are served from :class:`RpcResponseCache` until their TTL expires.
         """
         await self.initialize()
 
@@ -4905,8 +5947,49 @@ class AsyncIconRpcHelper(LoggerMixinVerbose):
         else:
             _url = self.url
         endpoint = append_api_v3(_url)
+        request_data = self.build_rpc_request(method=method, params=params, governance_address=governance_address)
+
+        if self.cache and not self.return_with_time and self.cache.get_ttl(request_data):
+            response = await self.cache.get_or_fetch(
+                endpoint,
+                request_data,
+                partial(self._send_rpc_request, endpoint, request_data, return_on_error, keep_lists),
+                is_cacheable=is_cacheable_rpc_response,
+            )
+            return self._process_batch_item(response, return_key=return_key, return_on_error=return_on_error, keep_lists=keep_lists)
+
+        if self.batch_requests and self._batch_supported(endpoint):
+            response = await self._enqueue_batch_request(endpoint, request_data)
+            return self._process_batch_item(response, return_key=return_key, return_on_error=return_on_error, keep_lists=keep_lists)
+
+        return await self._make_request(
+            http_method="post",
+            endpoint=endpoint,
+            data=request_data,
+            return_key=return_key,
+            return_on_error=return_on_error,
+            keep_lists=keep_lists,
+        )
+
+    async def _send_rpc_request(self, endpoint: str, request_data: dict, return_on_error=True, keep_lists=True) -> Any:
+        """Send one JSON-RPC request, batched if enabled, and return the whole decoded response."""
+        if self.batch_requests and self._batch_supported(endpoint):
+            return await self._enqueue_batch_request(endpoint, request_data)
+        return await self._make_request(
+            http_method="post",
+            endpoint=endpoint,
+            data=request_data,
+            return_on_error=return_on_error,
+            keep_lists=keep_lists,
+        )
+
+    @staticmethod
+    def build_rpc_request(method=None, params: dict = {}, governance_address=None, request_id=1) -> dict:
+        """
+        Build a JSON-RPC 2.0 request. With ``governance_address``, the method is wrapped in an ``icx_call``.
+        """
         if governance_address:
-            request_data = {
+            return {
                 "jsonrpc": "2.0",
                 "method": "icx_call",
                 "params": {
@@ -4917,23 +6000,153 @@ class AsyncIconRpcHelper(LoggerMixinVerbose):
                         "params": params
                     }
                 },
-                "id": 1
+                "id": request_id
             }
-        else:
-            request_data = {
-                "jsonrpc": "2.0",
-                "method": method,
-                "params": params,
-                "id": 1
-            }
-        return await self._make_request(
-            http_method="post",
-            endpoint=endpoint,
-            data=request_data,
-            return_key=return_key,
-            return_on_error=return_on_error,
-            keep_lists=keep_lists,
-        )
+        return {
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params,
+            "id": request_id
+        }
+
+    async def execute_rpc_batch(self, calls: List[dict], url=None, return_on_error=True, keep_lists=True) -> List[Any]:
+        """
+        Execute many RPC calls as JSON-RPC 2.0 batch requests.
+
+        Calls are split into chunks of ``batch_size`` and each chunk is sent as one POST.
+        Results are returned in the order of ``calls``. If the endpoint rejects batches,
+        the calls are sent individually.
+
+        :param calls: A list of dicts with the arguments of :meth:`execute_rpc_call`
+                      (``method``, ``params``, ``governance_address``, ``return_key``).
+        :param url: The endpoint URL. Defaults to ``self.url``.
+        :param return_on_error: Return the JSON-RPC error object for failed items instead of ``{}``.
+        :param keep_lists: Whether to keep lists in flattened data.
+        :return: A list of results, one per call.
+
+        Example:
+
+            .. code-block:: python
+
+                results = await rpc.execute_rpc_batch([
+                    dict(method="icx_getBalance", params={"address": address}, return_key="result"),
+                    dict(method="getStake", params={"address": address}, governance_address=const.CHAIN_SCORE_ADDRESS),
+                ])
+        """
+        await self.initialize()
+        endpoint = append_api_v3(url or self.url)
+        requests_data = [
+            self.build_rpc_request(
+                method=call.get("method"),
+                params=call.get("params", {}),
+                governance_address=call.get("governance_address"),
+            )
+            for call in calls
+        ]
+        chunks = [requests_data[i:i + self.batch_size] for i in range(0, len(requests_data), self.batch_size)]
+        chunk_responses = await asyncio.gather(*[self._send_batch(endpoint, chunk) for chunk in chunks])
+        responses = [response for chunk_response in chunk_responses for response in chunk_response]
+        return [
+            self._process_batch_item(response, return_key=call.get("return_key"), return_on_error=return_on_error, keep_lists=keep_lists)
+            for call, response in zip(calls, responses)
+        ]
+
+    def _process_batch_item(self, response, return_key=None, return_on_error=True, keep_lists=True):
+        if isinstance(response, dict) and response.get("error"):
+            return response if return_on_error else {}
+        return self.handle_response_with_key(response, return_key=return_key, keep_lists=keep_lists)
+
+    def _enqueue_batch_request(self, endpoint: str, request_data: dict) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        queue = self._batch_queue.setdefault(endpoint, [])
+        queue.append((request_data, future))
+
+        if len(queue) >= self.batch_size:
+            self._flush_batch_queue(endpoint)
+        elif endpoint not in self._batch_flush_handles:
+            self._batch_flush_handles[endpoint] = loop.call_later(self.batch_delay, self._flush_batch_queue, endpoint)
+        return future
+
+    def _flush_batch_queue(self, endpoint: str):
+        handle = self._batch_flush_handles.pop(endpoint, None)
+        if handle:
+            handle.cancel()
+        items = self._batch_queue.pop(endpoint, [])
+        for i in range(0, len(items), self.batch_size):
+            asyncio.ensure_future(self._resolve_batch(endpoint, items[i:i + self.batch_size]))
+
+    async def _resolve_batch(self, endpoint: str, items: List[Tuple[dict, asyncio.Future]]):
+        try:
+            responses = await self._send_batch(endpoint, [request_data for request_data, _ in items])
+            for (_, future), response in zip(items, responses):
+                if not future.done():
+                    future.set_result(response)
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+
+    def _batch_supported(self, endpoint: str) -> bool:
+        retry_at = self._batch_unsupported.get(endpoint)
+        if retry_at is None:
+            return True
+        if time.monotonic() >= retry_at:
+            del self._batch_unsupported[endpoint]
+            return True
+        return False
+
+    @staticmethod
+    def _is_batch_rejected(response_json: Any) -> bool:
+        """Whether the answer to a batch is a JSON-RPC "Invalid Request" or "Parse error", i.e. batches are not supported."""
+        error = response_json.get("error") if isinstance(response_json, dict) else None
+        return isinstance(error, dict) and error.get("code") in (-32600, -32700)
+
+    async def _send_batch(self, endpoint: str, requests_data: List[dict]) -> List[Any]:
+        """
+        POST ``requests_data`` as one JSON-RPC batch and demultiplex the responses by id.
+        Items missing from the batch response, or all items if the endpoint rejects batches,
+        are sent individually. Other failures only turn batches off for ``batch_retry_interval`` seconds.
+        """
+        if not requests_data:
+            return []
+
+        batch = [{**request_data, "id": index} for index, request_data in enumerate(requests_data, start=1)]
+        responses_by_id = {}
+
+        if self._batch_supported(endpoint) and len(batch) > 1:
+            try:
+                async with self.semaphore:
+                    response = await self._execute_http_request("post", endpoint, batch, {'Content-Type': 'application/json'})
+                response_json = response.get("json")
+                self.last_response = {
+                    "data": None,
+                    "status": response["status"],
+                    "error": None,
+                    "elapsed_time_ms": response["elapsed_time_ms"]
+                }
+                if response["status"] == 200 and isinstance(response_json, list):
+                    responses_by_id = {item.get("id"): item for item in response_json if isinstance(item, dict)}
+                elif response["status"] < 500 and self._is_batch_rejected(response_json):
+                    self._batch_unsupported[endpoint] = math.inf
+                    self.logger.warning(f"Endpoint rejected JSON-RPC batch request, falling back to single calls. "
+                                        f"status={response['status']}, URL: {endpoint}")
+                else:
+                    self._batch_unsupported[endpoint] = time.monotonic() + self.batch_retry_interval
+                    self.logger.warning(f"JSON-RPC batch request failed, sending single calls for {self.batch_retry_interval}s. "
+                                        f"status={response['status']}, URL: {endpoint}")
+            except (aiohttp.ClientError, asyncio.TimeoutError, json.JSONDecodeError) as e:
+                self.logger.warning(f"JSON-RPC batch request failed: {e}, falling back to single calls. URL: {endpoint}")
+
+        missing = [request_data for request_data in batch if request_data["id"] not in responses_by_id]
+        if missing:
+            single_responses = await asyncio.gather(*[
+                self._make_request(http_method="post", endpoint=endpoint, data=request_data, return_on_error=True)
+                for request_data in missing
+            ])
+            for request_data, response in zip(missing, single_responses):
+                responses_by_id[request_data["id"]] = response
+        return [responses_by_id[request_data["id"]] for request_data in batch]
 
     async def fetch(self, path="", data="", http_method="get", url="", headers=None, return_key=None, return_on_error=True, return_first=False, list_index=None, retries=None):
     # async with self.semaphore:
@@ -4943,6 +6156,9 @@ class AsyncIconRpcHelper(LoggerMixinVerbose):
             endpoint = f"{remove_path_from_url(self.url)}{path}"
         self.logger.debug(f"[FETCH START] {endpoint}, Session={self.session}")
 
+        if self.pooled and (not self.session or self.session.closed):
+            await self.initialize()
+
         if not retries:
             retries = self.retries
 
@@ -4975,152 +6191,6 @@ class AsyncIconRpcHelper(LoggerMixinVerbose):
             else:
                 raise Exception(self.last_response['error'])
 
-    async def _make_request(
-            self,
-            http_method: str,
-            endpoint: str,
-            data: Optional[Union[Dict, str]] = None,
-            headers: Optional[Dict[str, str]] = None,
-            return_key: Optional[str] = None,
-            return_on_error: bool = True,
-            return_first: bool = False,
-            list_index: Optional[int] = None,
-            retries: int = 3,
-            backoff_factor: float = 0.5,
-            keep_lists: bool = False,
-            log_exception: bool = False,
-            return_with_time: Optional[bool] = None
-    ) -> Any:
-        """
-        Helper method to make HTTP requests with retry and timeout support.
-
-        Args:
-            http_method (str): HTTP method ('GET', 'POST', etc.).
-            endpoint (str): API endpoint or full URL.
-            data (dict or str, optional): Payload for POST requests or query parameters for GET.
-            headers (dict, optional): HTTP headers.
-            return_key (str, optional): Key to extract from the JSON response.
-            return_on_error (bool, optional): Whether to return data on error responses.
-            return_first (bool, optional): If True and response is a list, return the first item.
-            list_index (int, optional): If provided and response is a list, return the item at this index.
-            retries (int, optional): Number of retry attempts. Defaults to 3.
-            backoff_factor (float, optional): Backoff factor for exponential delay. Defaults to 0.5.
-            keep_lists (bool, optional): Whether to keep lists in flattened data.
-            log_exception (bool, optional): Whether to log exceptions.
-            return_with_time (bool, optional): If True, return response data along with the elapsed time.
-
-        Returns:
-            Any: Processed response data, or a tuple of response data and elapsed time.
-        """
-        # Use class-level default for return_with_time if not explicitly provided
-        if return_with_time is None:
-            return_with_time = getattr(self, "return_with_time", False)
-
-        if headers is None:
-            headers = {'Content-Type': 'application/json'}
-
-        self._check_session()
-        self.logger.debug(f"Making {http_method.upper()} request to {endpoint} with data: {data}")
-
-        # Ensure session is valid
-        self.check_aio_session(log_exception, return_on_error=False)
-        self.last_response = {}
-
-        for attempt in range(1, retries + 1):
-            start_time = time.time()  # Start timer for elapsed time
-            try:
-                response_text = ""
-
-                timeout = aiohttp.ClientTimeout(total=self.timeout)
-                if http_method.upper() == 'GET':
-                    async with self.session.get(endpoint, params=data, headers=headers, timeout=timeout) as resp:                        
-                        response_text = await resp.text()
-                elif http_method.upper() == 'POST':
-                    payload = json.dumps(data) if isinstance(data, dict) else data
-                    async with self.session.post(endpoint, data=payload, headers=headers, timeout=timeout) as resp:
-                        response_text = await resp.text()
-                else:
-                    self.logger.error(f"Unsupported HTTP method: {http_method}")
-                    return ({}, 0.0) if return_with_time else {}
-
-                elapsed_time = int((time.time() - start_time) * 1000)
-
-                self.last_response = {
-                    "data": response_text,
-                    "status": resp.status,
-                    "error": None,
-                    "elapsed_time_ms": elapsed_time
-                }
-
-                # Handle successful response
-                if resp.status == 200:
-                    try:
-                        response_json = await resp.json()
-                        processed_response = self.handle_response_with_key(response_json, return_key=return_key, keep_lists=keep_lists)
-                        if isinstance(processed_response, list):
-                            if return_first:
-                                processed_response = processed_response[0] if processed_response else None
-                            elif list_index is not None:
-                                processed_response = processed_response[list_index] if len(processed_response) > list_index else None
-
-                        return (processed_response, elapsed_time) if return_with_time else processed_response
-                    except json.JSONDecodeError:
-                        self.logger.error(f"Failed to decode JSON response: {response_text}")
-                        return (response_text, elapsed_time) if return_with_time else response_text if return_on_error else {}
-                elif resp.status == 400:
-                    try:
-                        response_json = await resp.json()
-                        processed_response = self.handle_response_with_key(response_json, return_key="error.message")
-
-                        if isinstance(processed_response, str):
-                            processed_response = processed_response.replace("Executing: ", "")
-
-                        self.logger.info(f" ▶️ {get_shortened_tx_hash(data)} status={resp.status}, response={processed_response}")
-                    except json.JSONDecodeError:
-                        self.logger.error(f"▶️ Failed to decode JSON response: {response_text}")
-
-                else:
-                    self.logger.warning(f"Request failed with status {resp.status}: {response_text}")
-                    if return_on_error:
-                        try:
-                            response_json = await resp.json()
-                            processed_response = self.handle_response_with_key(response_json, return_key=return_key, keep_lists=keep_lists)
-                            return (processed_response, elapsed_time) if return_with_time else processed_response
-                        except json.JSONDecodeError:
-                            return (response_text, elapsed_time) if return_with_time else response_text
-                    return ({}, elapsed_time) if return_with_time else {}
-            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                elapsed_time = time.time() - start_time
-                self.logger.warning(
-                    f"Attempt {attempt}/{retries} failed: {e}. Method: {http_method.upper()}, URL: {endpoint}"
-                )
-                self.last_response['error'] = f"Attempt {attempt}/{retries} failed: {e}. Method: {http_method.upper()}, URL: {endpoint}"
-                if attempt == retries and return_with_time:
-                    return ({}, elapsed_time)
-            except Exception as e:
-                elapsed_time = time.time() - start_time
-                self.logger.error(
-                    f"Unexpected error: {e}. Method: {http_method.upper()}, URL: {endpoint}",
-                    exc_info=log_exception
-                )
-                if attempt == retries:
-                    if return_with_time:
-                        return ({}, elapsed_time)
-                    raise
-            finally:
-                if attempt < retries:
-                    # Adding jitter to introduce randomness in the backoff time, preventing thundering herd problem.
-                    jitter = uniform(0, 1)
-                    sleep_time = backoff_factor * (2 ** (attempt - 1)) + jitter
-                    if sleep_time > 1:
-                        self.logger.debug(f"Retrying after {sleep_time:.2f} seconds..., URL: {endpoint}, data: {data}")
-                    await asyncio.sleep(sleep_time)
-
-        # Final fallback in case all retries fail
-        self.logger.error(f"All {retries} attempts failed for {http_method.upper()} request to {endpoint}")
-        return ({}, 0.0) if return_with_time else {}
-
-
     async def _make_request(
             self,
             http_method: str,
@@ -5166,18 +6236,18 @@ class AsyncIconRpcHelper(LoggerMixinVerbose):
             headers = {'Content-Type': 'application/json'}
 
         self._check_session()
-        self.logger.debug(f"Making {http_method.upper()} request to {endpoint} with data: {data}")
+        if self._is_debug_enabled():
+            self.logger.debug(f"Making {http_method.upper()} request to {endpoint} with data: {data}")
 
         for attempt in range(1, retries + 1):
             start_time = time.time()
             try:
                 response = await self._execute_http_request(http_method, endpoint, data, headers)
                 status = response["status"]
-                response_text = response["response_text"]
                 elapsed_time_ms = response["elapsed_time_ms"]
 
                 if status == 200:
-                    processed_response = self._process_success_response(response_text, return_key, keep_lists, return_first, list_index)
+                    processed_response = self._process_success_response(response, return_key, keep_lists, return_first, list_index)
                     self.last_response = {
                         "data": processed_response,
                         "status": status,
@@ -5186,7 +6256,7 @@ class AsyncIconRpcHelper(LoggerMixinVerbose):
                     }
                     return (processed_response, elapsed_time_ms) if return_with_time else processed_response
                 elif status == 400:
-                    error_message = self._process_error_response(response_text, return_on_error)
+                    error_message = self._process_error_response(response, return_on_error)
                     self.last_response = {
                         "data": error_message if return_on_error else {},
                         "status": status,
@@ -5199,11 +6269,11 @@ class AsyncIconRpcHelper(LoggerMixinVerbose):
                     self.last_response = {
                         "data": {} if return_on_error else {},
                         "status": status,
-                        "error": f"Request failed with status {status}: {response_text}",
+                        "error": f"Request failed with status {status}: {self._get_response_text(response)}",
                         "elapsed_time_ms": elapsed_time_ms
                     }
                     self.logger.warning(self.last_response["error"])
-                    processed_response = self._process_error_response(response_text, return_on_error, return_key, keep_lists)
+                    processed_response = self._process_error_response(response, return_on_error, return_key, keep_lists)
                     self.last_response["data"] = processed_response
                     return (processed_response, elapsed_time_ms) if return_with_time else processed_response
             except (aiohttp.ClientError, asyncio.TimeoutError) as e:
@@ -5228,12 +6298,13 @@ class AsyncIconRpcHelper(LoggerMixinVerbose):
                 self.logger.error(f"{self.last_response['error']}. Method: {http_method.upper()}, URL: {endpoint}", exc_info=log_exception)
                 if attempt == retries:
                     return (self.last_response["data"], elapsed_time_ms) if return_with_time else self.last_response["data"]
-            finally:
-                if attempt < retries:
-                    sleep_time = backoff_factor * (2 ** (attempt - 1))
-                    if sleep_time > 1:
-                        self.logger.debug(f"Retrying after {sleep_time:.2f} seconds..., URL: {endpoint}, data: {data}")
-                    await asyncio.sleep(sleep_time)
+
+            # Back off only before the next attempt, never after a completed request.
+            if attempt < retries:
+                sleep_time = backoff_factor * (2 ** (attempt - 1))
+                if sleep_time > 1:
+                    self.logger.debug(f"Retrying after {sleep_time:.2f} seconds..., URL: {endpoint}, data: {data}")
+                await asyncio.sleep(sleep_time)
 
         self.last_response = {
             "data": {} if return_on_error else {},
@@ -5244,67 +6315,94 @@ class AsyncIconRpcHelper(LoggerMixinVerbose):
         self.logger.error(self.last_response["error"])
         return (self.last_response["data"], 0.0) if return_with_time else self.last_response["data"]
 
+    def _is_debug_enabled(self) -> bool:
+        is_enabled_for = getattr(self.logger, "isEnabledFor", None)
+        if is_enabled_for is None:
+            return bool(getattr(self, "verbose", 0))
+        return is_enabled_for(logging.DEBUG)
+
     async def _execute_http_request(self, http_method: str, endpoint: str, data: Optional[Union[Dict, str]], headers: Dict[str, str]) -> Dict[str, Any]:
         """
         Executes the HTTP request and returns response details.
+
+        The body is read once as bytes and decoded with ``json_loads``. The raw text is only kept
+        (``response_text``) when debug logging is enabled or the body is not JSON.
         """
+        if self.rate_limiter:
+            await self.rate_limiter.acquire_async(key=urlparse(endpoint).netloc)
         start_time = time.time()
         timeout = aiohttp.ClientTimeout(total=self.timeout)
         if http_method.upper() == 'GET':
             async with self.session.get(endpoint, params=data, headers=headers, timeout=timeout) as resp:
                 status = resp.status
-                response_text = await resp.text()
+                body = await resp.read()
+                charset = resp.charset
         elif http_method.upper() == 'POST':
-            payload = json.dumps(data) if isinstance(data, dict) else data
+            payload = self.json_dumps(data) if isinstance(data, (dict, list)) else data
             async with self.session.post(endpoint, data=payload, headers=headers, timeout=timeout) as resp:
                 status = resp.status
-                response_text = await resp.text()
+                body = await resp.read()
+                charset = resp.charset
         else:
             raise ValueError(f"Unsupported HTTP method: {http_method}")
         elapsed_time_ms = int((time.time() - start_time) * 1000)
-        return {
+        response = {
             "status": status,
-            "response_text": response_text,
+            "body": body,
+            "charset": charset,
             "elapsed_time_ms": elapsed_time_ms
         }
+        try:
+            response["json"] = self.json_loads(body)
+        except (ValueError, TypeError):
+            self._get_response_text(response)
+
+        if self._is_debug_enabled():
+            self.logger.debug(f"Response status={status}, elapsed={elapsed_time_ms}ms, body={shorten_text(self._get_response_text(response), 500)}")
+        return response
 
-    def _process_success_response(self, response_text: str, return_key: Optional[str], keep_lists: bool, return_first: bool, list_index: Optional[int]) -> Any:
+    @staticmethod
+    def _get_response_text(response: Dict[str, Any]) -> str:
+        if "response_text" not in response:
+            response["response_text"] = response.get("body", b"").decode(response.get("charset") or "utf-8", errors="replace")
+        return response["response_text"]
+
+    def _process_success_response(self, response: Dict[str, Any], return_key: Optional[str], keep_lists: bool, return_first: bool, list_index: Optional[int]) -> Any:
         """
         Processes successful (200) response.
         """
-        try:
-            response_json = json.loads(response_text)
-            processed_response = self.handle_response_with_key(response_json, return_key=return_key, keep_lists=keep_lists)
-            if isinstance(processed_response, list):
-                if return_first:
-                    return processed_response[0] if processed_response else None
-                elif list_index is not None:
-                    return processed_response[list_index] if len(processed_response) > list_index else None
-            return processed_response
-        except json.JSONDecodeError:
+        if "json" not in response:
+            response_text = self._get_response_text(response)
             self.logger.error(f"Failed to decode JSON response: {response_text}")
             return response_text
 
-    def _process_error_response(self, response_text: str, return_on_error: bool, return_key: Optional[str] = None, keep_lists: bool = False) -> Any:
+        processed_response = self.handle_response_with_key(response["json"], return_key=return_key, keep_lists=keep_lists)
+        if isinstance(processed_response, list):
+            if return_first:
+                return processed_response[0] if processed_response else None
+            elif list_index is not None:
+                return processed_response[list_index] if len(processed_response) > list_index else None
+        return processed_response
+
+    def _process_error_response(self, response: Dict[str, Any], return_on_error: bool, return_key: Optional[str] = None, keep_lists: bool = False) -> Any:
         """
         Processes error response.
         """
-        try:
-            response_json = json.loads(response_text)
-            if return_key:
-                return self.handle_response_with_key(response_json, return_key=return_key, keep_lists=keep_lists)
-            return response_json if return_on_error else {}
-        except json.JSONDecodeError:
-            return response_text if return_on_error else {}
-        
+        if "json" not in response:
+            return self._get_response_text(response) if return_on_error else {}
+        if return_key:
+            return self.handle_response_with_key(response["json"], return_key=return_key, keep_lists=keep_lists)
+        return response["json"] if return_on_error else {}
 
     @staticmethod
     def handle_response_with_key(response=None, return_key=None, keep_lists=True):
+        """
+        Return the value at ``return_key`` (a dotted path such as ``result.stake``) by walking
+        the decoded response directly. List items are addressed by index, e.g. ``result.preps.0``.
+        """
         if isinstance(response, (dict, list)):
             if return_key and response:
-                flat = Flattener(response, keep_lists=keep_lists)
-                # return Flattener(response, keep_lists=keep_lists).get(return_key)
-                return FlatDict(response).get(return_key)
+                return get_if_keys_exist(response, *return_key.split("."))
             return response
         return response.get('text')
 
@@ -5317,6 +6415,15 @@ class AsyncIconRpcHelper(LoggerMixinVerbose):
             self.logger.error(f"Error during operation get_block_hash(): {str(e)}", exc_info=False)
         return hash_info
 
+    async def get_block_by_height(self, height: int = 0, url: Optional[str] = None) -> dict:
+        target_url = url or self.url
+        block_info = {}
+        try:
+            block_info = await self.execute_rpc_call(url=target_url, method='icx_getBlockByHeight', params={"height": hex(height)}, return_key="result")
+        except Exception as e:
+            self.logger.error(f"Error during operation get_block_by_height(): {str(e)}", exc_info=False)
+        return block_info
+
     async def get_last_blockheight(self, url: Optional[str] = None) -> int:
         target_url = url or self.url
         response = await self.execute_rpc_call(url=target_url, method='icx_getLastBlock', return_key="result.height")        
@@ -5484,7 +6591,7 @@ class AsyncIconRpcHelper(LoggerMixinVerbose):
         target_url = url or self.url
         tx_result = await self._get_tx_result(tx_hash, url=target_url)
         if not is_wait:
-            return self.handle_response_with_key(tx_result, return_key=tx_result)
+            return self.handle_response_with_key(tx_result, return_key=return_key)
 
         attempt = 0
         while attempt < max_attempts:
@@ -5509,6 +6616,311 @@ class AsyncIconRpcHelper(LoggerMixinVerbose):
         return "Failed to get transaction result"
 
 
+class AsyncTxResultPoller(LoggerMixinVerbose):
+    """
+    Waits for many transaction results with one shared polling loop.
+
+    Every ``interval`` seconds, the results of all pending transactions are requested in a single
+    JSON-RPC batch (see :meth:`AsyncIconRpcHelper.execute_rpc_batch`) instead of running one
+    polling loop per transaction.
+
+    :param rpc: The helper used to send the requests.
+    :param interval: Seconds between polling ticks.
+    :param max_attempts: Ticks a transaction may stay pending before it resolves with an error. ``None`` waits forever.
+    :param method: JSON-RPC method returning the transaction result.
+    :param url: Endpoint URL. Defaults to ``rpc.url``.
+
+    Example:
+
+        .. code-block:: python
+
+            poller = AsyncTxResultPoller(rpc, interval=1)
+            results = await asyncio.gather(*[poller.wait(tx_hash) for tx_hash in tx_hashes])
+            await poller.close()
+    """
+    EXIT_ERROR_MESSAGES = ("InvalidParams", "NotFound: E1005:not found tx id")
+
+    def __init__(self, rpc: "AsyncIconRpcHelper", interval: float = 1.0, max_attempts: Optional[int] = 60,
+                 method: str = "icx_getTransactionResult", url: Optional[str] = None, logger=None, verbose=0):
+        self.init_logger(logger, verbose)
+        self.rpc = rpc
+        self.interval = interval
+        self.max_attempts = max_attempts
+        self.method = method
+        self.url = url
+        self.ticks = 0
+        self._pending: Dict[str, Tuple[asyncio.Future, int]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def wait(self, tx_hash: str) -> asyncio.Future:
+        """Return a future resolved with the JSON-RPC response of ``tx_hash`` once it is no longer pending."""
+        if tx_hash in self._pending:
+            return self._pending[tx_hash][0]
+        future = asyncio.get_running_loop().create_future()
+        self._pending[tx_hash] = (future, 0)
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+        return future
+
+    def is_pending(self, response: Any) -> bool:
+        if not isinstance(response, dict) or not response:
+            return True
+        if response.get("result"):
+            return False
+        message = get_if_keys_exist(response, "error", "message", default="") or ""
+        return not any(exit_message in message for exit_message in self.EXIT_ERROR_MESSAGES)
+
+    async def poll_once(self):
+        """Request the results of all pending transactions and resolve the finished ones."""
+        self.ticks += 1
+        tx_hashes = [tx_hash for tx_hash, (future, _) in self._pending.items() if not future.done()]
+        if not tx_hashes:
+            return
+        responses = await self.rpc.execute_rpc_batch(
+            [dict(method=self.method, params={"txHash": tx_hash}) for tx_hash in tx_hashes],
+            url=self.url,
+        )
+        for tx_hash, response in zip(tx_hashes, responses):
+            future, attempts = self._pending[tx_hash]
+            attempts += 1
+            if not self.is_pending(response):
+                future.set_result(response)
+            elif self.max_attempts is not None and attempts >= self.max_attempts:
+                message = get_if_keys_exist(response, "error", "message", default="Pending") if isinstance(response, dict) else "Pending"
+                future.set_result({"error": {"code": -1, "message": f"{message}, Reason: Reached maximum attempts ({self.max_attempts})"}})
+            else:
+                self._pending[tx_hash] = (future, attempts)
+                continue
+            del self._pending[tx_hash]
+
+    async def _run(self):
+        while self._pending:
+            await asyncio.sleep(self.interval)
+            for tx_hash, (future, _) in list(self._pending.items()):
+                if future.done():
+                    del self._pending[tx_hash]
+            try:
+                await self.poll_once()
+            except Exception as e:
+                self.logger.warning(f"Failed to poll {len(self._pending)} transaction results: {e}")
+
+    async def close(self):
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        for future, _ in self._pending.values():
+            if not future.done():
+                future.cancel()
+        self._pending.clear()
+
+
+@dataclass
+class PipelineTransaction:
+    index: int
+    payload: dict
+    step_limit: Optional[str] = None
+    signed_tx: Optional[dict] = None
+    tx_hash: Optional[str] = None
+    response: Optional[dict] = None
+    error: Optional[str] = None
+
+    @property
+    def is_success(self) -> bool:
+        return bool(not self.error and isinstance(self.response, dict) and keys_exists(self.response, "result", "status")
+                    and self.response["result"]["status"] == "0x1")
+
+
+class AsyncTransactionPipeline(LoggerMixinVerbose):
+    """
+    Signs and sends many transactions concurrently.
+
+    Stages:
+        1. ``prepare``: fill ``from``, ``version``, ``nid``, and a unique ``nonce``/``timestamp`` locally.
+        2. ``estimate_steps``: request ``debug_estimateStep`` for every transaction in batches.
+        3. ``sign``: sign in a thread pool, so hashing does not block the event loop.
+        4. ``submit``: send ``icx_sendTransaction`` with at most ``concurrency`` requests in flight.
+        5. ``wait``: resolve results with one shared :class:`AsyncTxResultPoller`.
+
+    Stages 3-5 run per transaction, so the first transactions are already being confirmed while
+    the rest are signed and sent.
+
+    :param rpc: An :class:`AsyncIconRpcHelper` for the target network.
+    :param wallet: Wallet dict with ``private_key`` and ``address``, or anything :func:`icx_signer.load_wallet_key` accepts.
+    :param nid: Network ID. Fetched with ``icx_getNetworkInfo`` when omitted.
+    :param concurrency: Maximum number of transactions being submitted at once.
+    :param step_limit: Fixed step limit. When omitted, steps are estimated per transaction.
+    :param margin_steps: Steps added to every estimated step limit.
+    :param check_balance: Check that the wallet can pay for all values and fees before sending.
+    :param poll_interval: Seconds between result polling ticks.
+    :param max_attempts: Polling ticks before a transaction is given up.
+    :param executor: Executor used for signing. Defaults to the event loop's default executor.
+
+    Example:
+
+        .. code-block:: python
+
+            async with AsyncIconRpcHelper(url="http://localhost:9000", pooled=True) as rpc:
+                pipeline = AsyncTransactionPipeline(rpc, wallet=wallet, concurrency=20)
+                results = await pipeline.run([
+                    {"method": "icx_sendTransaction", "params": {"to": address, "value": hex(10**18)}}
+                    for address in addresses
+                ])
+                print(pipeline.stats)
+    """
+
+    def __init__(self, rpc: "AsyncIconRpcHelper", wallet=None, nid: Optional[str] = None, concurrency: int = 10,
+                 step_limit: Optional[Union[str, int]] = None, margin_steps: int = 0, check_balance: bool = True,
+                 poll_interval: float = 1.0, max_attempts: Optional[int] = 60, executor=None, logger=None, verbose=0):
+        self.init_logger(logger, verbose)
+        self.rpc = rpc
+        self.wallet = wallet if isinstance(wallet, dict) else icx_signer.load_wallet_key(wallet)
+        self.nid = nid
+        self.concurrency = max(concurrency, 1)
+        self.step_limit = hex(int(step_limit)) if isinstance(step_limit, int) else step_limit
+        self.margin_steps = margin_steps
+        self.check_balance = check_balance
+        self.executor = executor
+        self.poller = AsyncTxResultPoller(rpc, interval=poll_interval, max_attempts=max_attempts, logger=self.logger)
+
+        self._signer = icx_signer.IcxSigner(data=self.wallet.get("private_key"))
+        if self._signer.get_hx_address() != self.wallet.get("address"):
+            raise ValueError(f"Invalid address {self.wallet.get('address')} != {self._signer.get_hx_address()}")
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._last_timestamp = 0
+        self._nonce = 0
+        self.stats = {"prepared": 0, "signed": 0, "submitted": 0, "confirmed": 0, "failed": 0}
+
+    def _next_timestamp(self) -> int:
+        # Transactions prepared within the same microsecond would otherwise get the same hash.
+        self._last_timestamp = max(icx_signer.get_timestamp_us(), self._last_timestamp + 1)
+        return self._last_timestamp
+
+    async def _get_nid(self) -> str:
+        if not self.nid:
+            network_info = await self.rpc.get_network_info()
+            self.nid = network_info.get("nid") if isinstance(network_info, dict) else None
+            if not self.nid:
+                raise ValueError(f"Failed to get the network ID from {self.rpc.url}")
+        return self.nid
+
+    async def prepare(self, payloads: List[dict]) -> List[PipelineTransaction]:
+        nid = await self._get_nid()
+        transactions = []
+        for index, payload in enumerate(payloads):
+            tx = copy.deepcopy(payload)
+            tx.setdefault("jsonrpc", "2.0")
+            tx["method"] = "icx_sendTransaction"
+            params = tx.setdefault("params", {})
+            params["from"] = self.wallet.get("address")
+            params.setdefault("version", "0x3")
+            params.setdefault("nid", nid)
+            params.setdefault("nonce", hex(self._nonce))
+            params.setdefault("timestamp", hex(self._next_timestamp()))
+            params.pop("signature", None)
+            self._nonce += 1
+            transactions.append(PipelineTransaction(index=index, payload=tx))
+        self.stats["prepared"] += len(transactions)
+        return transactions
+
+    async def estimate_steps(self, transactions: List[PipelineTransaction]):
+        if self.step_limit:
+            for transaction in transactions:
+                transaction.payload["params"].setdefault("stepLimit", self.step_limit)
+            return
+
+        targets = [transaction for transaction in transactions if not transaction.payload["params"].get("stepLimit")]
+        if not targets:
+            return
+        debug_url = replace_path_with_suffix(self.rpc.url, "/api/v3d")
+        estimates = await self.rpc.execute_rpc_batch(
+            [dict(method="debug_estimateStep", params=transaction.payload["params"], return_key="result") for transaction in targets],
+            url=debug_url,
+        )
+        for transaction, estimate in zip(targets, estimates):
+            if is_hex(estimate):
+                transaction.payload["params"]["stepLimit"] = hex(int(estimate, 16) + self.margin_steps)
+            else:
+                transaction.error = f"Failed to estimate steps: {get_if_keys_exist(estimate, 'error', 'message', default=estimate)}"
+
+    async def verify_balance(self, transactions: List[PipelineTransaction]):
+        balance = await self.rpc.get_balance(self.wallet.get("address"), return_as_hex=True)
+        step_price = await self.rpc.execute_rpc_call(
+            governance_address=const.CHAIN_SCORE_ADDRESS, method="getStepPrice", return_key="result"
+        )
+        # int(..., 16) keeps loop amounts exact; hex_to_number() scales large values.
+        step_price = int(step_price, 16) if is_hex(step_price) else 0
+        balance = int(balance, 16) if is_hex(balance) else 0
+        required = sum(
+            int(transaction.payload["params"].get("value", "0x0"), 16)
+            + int(transaction.payload["params"].get("stepLimit", "0x0"), 16) * step_price
+            for transaction in transactions if not transaction.error
+        )
+        if balance < required:
+            raise ValueError(f"<{self.wallet.get('address')}> Out of balance: balance={balance}, required={required}")
+
+    async def sign(self, transaction: PipelineTransaction) -> dict:
+        loop = asyncio.get_running_loop()
+        transaction.signed_tx = await loop.run_in_executor(self.executor, self._signer.sign_tx, transaction.payload)
+        self.stats["signed"] += 1
+        return transaction.signed_tx
+
+    async def submit(self, transaction: PipelineTransaction) -> Optional[str]:
+        async with self._semaphore:
+            response = await self.rpc.execute_rpc_call(method="icx_sendTransaction", params=transaction.signed_tx["params"])
+        tx_hash = response.get("result") if isinstance(response, dict) else None
+        if not is_valid_tx_hash(tx_hash):
+            transaction.error = f"Failed to send transaction: {get_if_keys_exist(response, 'error', 'message', default=response)}"
+            return None
+        transaction.tx_hash = tx_hash
+        self.stats["submitted"] += 1
+        return tx_hash
+
+    async def _process(self, transaction: PipelineTransaction, wait: bool) -> PipelineTransaction:
+        try:
+            if transaction.error:
+                return transaction
+            await self.sign(transaction)
+            if not await self.submit(transaction) or not wait:
+                return transaction
+            transaction.response = await self.poller.wait(transaction.tx_hash)
+            if not transaction.is_success:
+                transaction.error = get_if_keys_exist(transaction.response, "error", "message") \
+                    or get_if_keys_exist(transaction.response, "result", "failure", "message", default="Transaction failed")
+            return transaction
+        except Exception as e:
+            transaction.error = f"{type(e).__name__}: {e}"
+            return transaction
+        finally:
+            if transaction.error:
+                self.stats["failed"] += 1
+            elif wait:
+                self.stats["confirmed"] += 1
+
+    async def run(self, payloads: List[dict], wait: bool = True) -> List[PipelineTransaction]:
+        """
+        Sign, send and (optionally) wait for all ``payloads``.
+
+        :param payloads: JSON-RPC ``icx_sendTransaction`` payloads. ``params`` must contain at least ``to``.
+        :param wait: Wait for the transaction results.
+        :return: One :class:`PipelineTransaction` per payload, in the same order.
+        """
+        transactions = await self.prepare(payloads)
+        await self.estimate_steps(transactions)
+        if self.check_balance:
+            await self.verify_balance(transactions)
+        try:
+            return list(await asyncio.gather(*[self._process(transaction, wait) for transaction in transactions]))
+        finally:
+            await self.poller.close()
+
+
 def gen_rpc_params(method=None, params=None):
     default_rpc = {
         "jsonrpc": "2.0",
@@ -5550,7 +6962,8 @@ def getLastBlock(nodeHost):
     return 0
 
 
-def jequest(url, method="get", payload={}, elapsed=False, print_error=False, timeout=None, ipaddr=None, verify=True, **kwargs) -> dict:
+def jequest(url, method="get", payload={}, elapsed=False, print_error=False, timeout=None, ipaddr=None, verify=True,
+             session_pool: Union[HttpSessionPool, bool, None] = None, **kwargs) -> dict:
     """
     This functions will be called the http requests.
 
@@ -5560,22 +6973,15 @@ def jequest(url, method="get", payload={}, elapsed=False, print_error=False, tim
     :param elapsed:
     :param print_error:
     :param timeout: Timeout seconds
-    :param ipaddr: Change the request IP address in http request
+    :param ipaddr: Send the request to this IP address instead of resolving the host name. Only this request is affected.
     :param verify: verify SSL
+    :param session_pool: :class:`HttpSessionPool` used to reuse connections. Defaults to ``default_http_session_pool``.
+                         Pass ``False`` to send the request without connection reuse.
     :param \*\*kwargs: Optional arguments that ``request`` takes.
 
     :return:
     """
-    if ipaddr:
-        if url.startswith('http') or url.startswith('http://'):
-            domain = re.sub(r'https?://', '', url)
-            # net.override_dns(domain, ipaddr)
-            # net.override_dns(domain=domain, ipaddr=ipaddr)
-            net.OverrideDNS(domain=domain, ipaddr=ipaddr).set()
-    else:
-        net.OverrideDNS().unset()
-
-    pawnlib_timeout = pawn.to_dict().get('PAWN_TIMEOUT', 10)
+    pawnlib_timeout = pawn.get('PAWN_TIMEOUT', 10)
     if pawnlib_timeout > 0:
         pawnlib_timeout = pawnlib_timeout / 1000
 
@@ -5589,8 +6995,17 @@ def jequest(url, method="get", payload={}, elapsed=False, print_error=False, tim
         # cprint(f"[ERROR] unsupported method={method}, url={url} ", color="red")
         pawn.error_logger.error(f"unsupported method={method}, url={url} ") if pawn.error_logger else False
         return {"error": "unsupported method"}
+    temporary_pool = None
+    if session_pool is None:
+        session_pool = default_http_session_pool
+    elif not session_pool and ipaddr:
+        session_pool = temporary_pool = HttpSessionPool(pool_connections=1, pool_maxsize=1)
+
     try:
-        func = getattr(requests, method)
+        if session_pool:
+            func = partial(session_pool.request, method, ipaddr=ipaddr)
+        else:
+            func = getattr(requests, method)
         if method == "get":
             response = func(url, verify=verify, timeout=timeout, **kwargs)
         else:
@@ -5626,6 +7041,10 @@ def jequest(url, method="get", payload={}, elapsed=False, print_error=False, tim
             kvPrint("OOps: Something Else", err, "FAIL")
         pawn.error_logger.error(f"OOps: Something Else:{err}, {url}") if pawn.error_logger else False
 
+    finally:
+        if temporary_pool:
+            temporary_pool.close()
+
     # cprint(f"----> {url}, {method}, {payload} , {response.status_code}", "green")
 
     try:
@@ -5685,6 +7104,15 @@ async def get_blockheight(response=None):
     return blockheight
 
 
+def is_valid_block_data(result):
+    """
+    Check that a block returned by the node contains a confirmed transaction list.
+    """
+    if not result:
+        return False
+    return check_key_and_type(result, "confirmed_transaction_list", list)
+
+
 async def retry_operation(operation, max_attempts=3, delay=2, success_criteria=None, logger=None, verbose=0, *args, **kwargs):
     """
     Retry the given operation multiple times in case of failure or based on the success criteria.
@@ -14,7 +14,6 @@ import json
 import glob
 
 from eth_keyfile import create_keyfile_json, extract_key_from_keyfile, decode_keyfile_json
-from copy import deepcopy
 from typing import Optional
 from InquirerPy import inquirer
 from InquirerPy.validator import PathValidator
@@ -737,6 +736,8 @@ def sha3_256(data):
 def get_tx_hash(params=None):
     """Create tx_hash from params object.
 
+    The serialized params are streamed into the hash object instead of being built as one string.
+
     Args:
         params(dict): the value of 'params' key in jsonrpc
 
@@ -744,9 +745,11 @@ def get_tx_hash(params=None):
         bytes: sha3_256 hash value
         :param params:
     """
-    tx_phrase = serialize(params)
-    pawn.console.debug(f"serialize tx={tx_phrase}")
-    return sha3_256(tx_phrase)
+    if pawn.get('PAWN_DEBUG'):
+        pawn.console.debug(f"serialize tx={serialize(params)}")
+    hasher = hashlib.sha3_256()
+    write_serialized(params, hasher.update)
+    return hasher.digest()
 
 
 def get_tx_phrase(method, params):
@@ -789,41 +792,101 @@ def sign_recoverable(privkey_bytes, tx_hash_bytes):
     return bytes(bytearray(signature_bytes) + recovery_id.to_bytes(1, 'big'))
 
 
-def __make_params_serialized(json_data: dict) -> str:
+# Strings longer than this (e.g. deploy content) are passed to the writer on their own
+# instead of being buffered, and buffered parts are flushed once they reach the chunk size.
+_STREAM_CHUNK_SIZE = 65536
+
 
-    def encode(data) -> str:
-        if isinstance(data, dict):
-            return encode_dict(data)
-        elif isinstance(data, list):
-            return encode_list(data)
+def _append_serialized_value(data, append):
+    if isinstance(data, dict):
+        append("{")
+        _append_serialized_dict(data, append)
+        append("}")
+    elif isinstance(data, list):
+        append("[")
+        is_first = True
+        for item in data:
+            if is_first:
+                is_first = False
+            else:
+                append(".")
+            _append_serialized_value(item, append)
+        append("]")
+    elif data is None:
+        append("\\0")
+    elif isinstance(data, str):
+        # Most values are short hex strings; alphanumeric strings have nothing to escape, so skip the copy
+        # made by translate(). For long strings (deploy content), translate() itself is faster than the check.
+        append(data if len(data) < 1024 and data.isalnum() else data.translate(translator))
+    else:
+        append(str(data).translate(translator))
+
+
+def _append_serialized_dict(data: dict, append, exclude_keys=()):
+    is_first = True
+    for key in sorted(data):
+        if key in exclude_keys:
+            continue
+        if is_first:
+            is_first = False
         else:
-            return escape(data)
+            append(".")
+        append(key)
+        append(".")
+        _append_serialized_value(data[key], append)
 
-    def encode_dict(data: dict) -> str:
-        result = ".".join(_encode_dict(data))
-        return "{" + result + "}"
 
-    def _encode_dict(data: dict) -> list:
-        for key in sorted(data.keys()):
-            yield key
-            yield encode(data[key])
+def _get_excluded_keys(params: dict) -> tuple:
+    key_name_for_tx_hash = __get_key_name_for_tx_hash(params)
+    if key_name_for_tx_hash:
+        return "signature", key_name_for_tx_hash
+    return ("signature",)
 
-    def encode_list(data: list) -> str:
-        result = ".".join(_encode_list(data))
-        return f"[" + result + "]"
 
-    def _encode_list(data: list) -> list:
-        for item in data:
-            yield encode(item)
+def _make_serialized_parts(params: dict) -> list:
+    parts = ["icx_sendTransaction."]
+    _append_serialized_dict(params, parts.append, exclude_keys=_get_excluded_keys(params))
+    return parts
 
-    def escape(data) -> str:
-        if data is None:
-            return "\\0"
 
-        data = str(data)
-        return data.translate(translator)
+def write_serialized(params: dict, write) -> None:
+    """
+    Stream the serialized ``params`` (see :func:`serialize`) into ``write``, e.g. ``hashlib.sha3_256().update``.
 
-    return ".".join(_encode_dict(json_data))
+    The params are not copied, and the output is passed on in chunks of encoded bytes.
+
+    :param params: params in a original JSON request for transaction.
+    :param write: A callable that takes ``bytes``.
+    """
+    parts = _make_serialized_parts(params)
+    if sum(map(len, parts)) < _STREAM_CHUNK_SIZE:
+        write("".join(parts).encode())
+        return
+
+    buffer = []
+    buffered_size = 0
+    for part in parts:
+        if len(part) >= _STREAM_CHUNK_SIZE:
+            if buffer:
+                write("".join(buffer).encode())
+                buffer.clear()
+                buffered_size = 0
+            write(part.encode())
+            continue
+        buffer.append(part)
+        buffered_size += len(part)
+        if buffered_size >= _STREAM_CHUNK_SIZE:
+            write("".join(buffer).encode())
+            buffer.clear()
+            buffered_size = 0
+    if buffer:
+        write("".join(buffer).encode())
+
+
+def __make_params_serialized(json_data: dict) -> str:
+    parts = []
+    _append_serialized_dict(json_data, parts.append)
+    return "".join(parts)
 
 
 def serialize(params: dict) -> bytes:
@@ -834,17 +897,7 @@ def serialize(params: dict) -> bytes:
     :return: serialized params.
     For example, data like `icx_sendTransaction.<key1>.<value1>.<key2>.<value2>` is converted to bytes.
     """
-    copy_tx = deepcopy(params)
-    key_name_for_tx_hash = __get_key_name_for_tx_hash(params)
-
-    if key_name_for_tx_hash in copy_tx:
-        del copy_tx[key_name_for_tx_hash]
-
-    if 'signature' in copy_tx:
-        del copy_tx['signature']
-
-    partial_serialized_params = __make_params_serialized(copy_tx)
-    return f"icx_sendTransaction.{partial_serialized_params}".encode()
+    return "".join(_make_serialized_parts(params)).encode()
 
 
 def generate_message(params: dict) -> str:
@@ -853,8 +906,9 @@ def generate_message(params: dict) -> str:
     :param params: params in request for transaction.
     :return: the 256 bit hash digest of a message. Hexadecimal encoded.
     """
-    bytes_message_hash = serialize(params)
-    return sha3_256(bytes_message_hash).hexdigest()
+    hasher = hashlib.sha3_256()
+    write_serialized(params, hasher.update)
+    return hasher.hexdigest()
 
 
 def __get_key_name_for_tx_hash(params: dict) -> Optional[str]:
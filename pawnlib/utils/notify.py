@@ -8,6 +8,7 @@ from pawnlib.resource import net
 from pawnlib.typing import date_utils, shorten_text, escape_markdown, escape_non_markdown
 from pawnlib.utils import http
 from pawnlib.utils.network import disable_requests_ssl_warnings
+from pawnlib.metrics.limiter import RateLimiter
 
 import json
 import aiohttp
@@ -364,6 +365,7 @@ class SlackNotifier(LoggerMixinVerbose):
     :param icon_emoji: Emoji to use as the icon for the message.
     :param retries: Number of retry attempts in case of failure.
     :param retry_delay: Time to wait between retries (in seconds).
+    :param rate_limiter: RateLimiter for the posts to the webhook, e.g. ``RateLimiter(1, 1, burst=5, algorithm="token_bucket")``.
     """
 
     def __init__(
@@ -375,12 +377,14 @@ class SlackNotifier(LoggerMixinVerbose):
         retry_delay: int = 2,
         verbose: int = 1,
         logger: logging.Logger = None,
+        rate_limiter: Optional[RateLimiter] = None,
     ):
         self.webhook_url = webhook_url or os.getenv('SLACK_WEBHOOK_URL', '')
         self.username = username
         self.icon_emoji = icon_emoji
         self.retries = retries
         self.retry_delay = retry_delay
+        self.rate_limiter = rate_limiter
         self.init_logger(logger, verbose)
 
         if not self.webhook_url:
@@ -551,6 +555,8 @@ class SlackNotifier(LoggerMixinVerbose):
         # Retry logic
         for attempt in range(self.retries):
             try:
+                if self.rate_limiter:
+                    self.rate_limiter.acquire(key=self.webhook_url)
                 response = requests.post(self.webhook_url, json=payload, timeout=10)
                 if response.status_code == 200 and response.text == "ok":
                     pawn.app_logger.info("SlackNotifier: Message sent successfully")
@@ -608,6 +614,8 @@ class SlackNotifier(LoggerMixinVerbose):
         # Asynchronous retry logic
         for attempt in range(self.retries):
             try:
+                if self.rate_limiter:
+                    await self.rate_limiter.acquire_async(key=self.webhook_url)
                 async with aiohttp.ClientSession() as session:
                     async with session.post(self.webhook_url, json=payload, timeout=aiohttp.ClientTimeout(total=10)) as response:
                         if response.status == 200:
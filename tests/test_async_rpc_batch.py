@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+import unittest
+try:
+    import common
+except:
+    pass
+
+import math
+import asyncio
+from aiohttp import web
+
+from pawnlib.typing import const
+from pawnlib.utils.http import AsyncIconRpcHelper
+
+
+class LocalBatchRpcServer:
+    def __init__(self, support_batch=True):
+        self.support_batch = support_batch
+        self.gateway_errors = 0
+        self.http_requests = 0
+        self.rpc_calls = 0
+        self.runner = None
+        self.url = ""
+
+    def handle_item(self, item):
+        self.rpc_calls += 1
+        method = item.get("method")
+        params = item.get("params", {})
+        if method == "icx_getBalance":
+            return {"jsonrpc": "2.0", "id": item["id"], "result": hex(len(params["address"]))}
+        if method == "icx_call":
+            call_method = params["data"]["method"]
+            return {"jsonrpc": "2.0", "id": item["id"], "result": {"method": call_method, "stake": "0x1"}}
+        return {"jsonrpc": "2.0", "id": item["id"], "error": {"code": -32601, "message": "Method not found"}}
+
+    async def handle(self, request):
+        self.http_requests += 1
+        body = await request.json()
+        if isinstance(body, list):
+            if self.gateway_errors:
+                self.gateway_errors -= 1
+                return web.Response(text="Bad Gateway", status=502)
+            if not self.support_batch:
+                return web.json_response({"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid Request"}}, status=400)
+            return web.json_response([self.handle_item(item) for item in body])
+        response = self.handle_item(body)
+        return web.json_response(response, status=400 if "error" in response else 200)
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/api/v3", self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+
+class TestAsyncRpcBatch(unittest.IsolatedAsyncioTestCase):
+
+    async def start_server(self, support_batch=True):
+        self.server = LocalBatchRpcServer(support_batch=support_batch)
+        await self.server.start()
+        return self.server
+
+    async def asyncTearDown(self):
+        await self.server.stop()
+
+    async def test_01_execute_rpc_batch_chunks_and_demultiplexes(self):
+        server = await self.start_server()
+        calls = [dict(method="icx_getBalance", params={"address": "hx" + "1" * i}, return_key="result") for i in range(25)]
+        calls.append(dict(method="unknownMethod"))
+        calls.append(dict(method="getStake", params={"address": "hx1"}, governance_address=const.CHAIN_SCORE_ADDRESS, return_key="result.stake"))
+
+        async with AsyncIconRpcHelper(url=server.url, retries=1, batch_size=10) as rpc:
+            results = await rpc.execute_rpc_batch(calls)
+
+        self.assertEqual(server.http_requests, 3)
+        self.assertEqual(results[:25], [hex(i + 2) for i in range(25)])
+        self.assertEqual(results[25]["error"]["code"], -32601)
+        self.assertEqual(results[26], "0x1")
+
+    async def test_02_coalesce_concurrent_calls(self):
+        server = await self.start_server()
+        addresses = [f"hx{i:040x}" for i in range(50)]
+
+        async with AsyncIconRpcHelper(url=server.url, retries=1, batch_requests=True, batch_size=100) as rpc:
+            results = await asyncio.gather(*[
+                coroutine
+                for address in addresses
+                for coroutine in (
+                    rpc.get_balance(address),
+                    rpc.get_stake(address, return_key="result.stake", return_as_hex=True),
+                )
+            ])
+
+        self.assertEqual(server.rpc_calls, 100)
+        self.assertEqual(server.http_requests, 1)
+        self.assertEqual(results[0], hex(42))
+        self.assertEqual(results[1], "0x1")
+
+    async def test_03_fallback_when_batch_rejected(self):
+        server = await self.start_server(support_batch=False)
+        calls = [dict(method="icx_getBalance", params={"address": "hx" + "1" * i}, return_key="result") for i in range(5)]
+
+        async with AsyncIconRpcHelper(url=server.url, retries=1) as rpc:
+            results = await rpc.execute_rpc_batch(calls)
+            self.assertEqual(results, [hex(i + 2) for i in range(5)])
+            self.assertEqual(server.http_requests, 6)
+
+            await rpc.execute_rpc_batch(calls)
+            self.assertEqual(server.http_requests, 11)
+            self.assertEqual(list(rpc._batch_unsupported.values()), [math.inf])
+
+    async def test_04_transient_batch_failure_expires(self):
+        server = await self.start_server()
+        server.gateway_errors = 1
+        calls = [dict(method="icx_getBalance", params={"address": "hx" + "1" * i}, return_key="result") for i in range(5)]
+
+        async with AsyncIconRpcHelper(url=server.url, retries=1, batch_retry_interval=0.1) as rpc:
+            self.assertEqual(await rpc.execute_rpc_batch(calls), [hex(i + 2) for i in range(5)])
+            self.assertEqual(server.http_requests, 6)
+            await rpc.execute_rpc_batch(calls)
+            self.assertEqual(server.http_requests, 11)
+
+            await asyncio.sleep(0.15)
+            await rpc.execute_rpc_batch(calls)
+            self.assertEqual(server.http_requests, 12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+import unittest
+try:
+    import common
+except:
+    pass
+
+import json
+import time
+from aiohttp import web
+
+from pawnlib.utils.http import AsyncIconRpcHelper, fast_json_loads
+
+
+class LocalRpcServer:
+    def __init__(self):
+        self.runner = None
+        self.url = ""
+
+    async def handle(self, request):
+        body = await request.json()
+        method = body.get("method")
+        if method == "plain_text":
+            return web.Response(text="not a json body")
+        if method == "bad_request":
+            return web.json_response({"jsonrpc": "2.0", "id": body["id"], "error": {"code": -32602, "message": "Invalid params"}}, status=400)
+        result = {
+            "preps": [{"name": "node0", "stake": "0x1"}, {"name": "node1", "stake": "0x2"}],
+            "big": 2 ** 80,
+        }
+        return web.Response(text=json.dumps({"jsonrpc": "2.0", "id": body["id"], "result": result}), content_type="application/json")
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/api/v3", self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+
+class TestAsyncRpcDecode(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.server = LocalRpcServer()
+        await self.server.start()
+        self.decode_count = 0
+
+        def counting_loads(data):
+            self.decode_count += 1
+            return fast_json_loads(data)
+
+        self.rpc = await AsyncIconRpcHelper(url=self.server.url, verbose=0, json_loads=counting_loads).initialize()
+
+    async def asyncTearDown(self):
+        await self.rpc.close()
+        await self.server.stop()
+
+    async def test_01_return_key_path(self):
+        self.assertEqual(await self.rpc.execute_rpc_call(method="getPReps", return_key="result.preps.1.stake"), "0x2")
+        self.assertEqual(await self.rpc.execute_rpc_call(method="getPReps", return_key="result.big"), 2 ** 80)
+        self.assertIsNone(await self.rpc.execute_rpc_call(method="getPReps", return_key="result.missing.key"))
+        self.assertEqual(self.decode_count, 3)
+
+    async def test_02_no_text_kept_without_debug(self):
+        response = await self.rpc._execute_http_request("post", f"{self.server.url}/api/v3", {"id": 1, "method": "getPReps"}, {})
+        self.assertNotIn("response_text", response)
+        self.assertEqual(response["json"]["result"]["preps"][0]["name"], "node0")
+
+    async def test_03_non_json_and_error_responses(self):
+        self.assertEqual(await self.rpc.execute_rpc_call(method="plain_text"), "not a json body")
+        error = await self.rpc.execute_rpc_call(method="bad_request")
+        self.assertEqual(error["error"]["code"], -32602)
+
+    async def test_04_no_backoff_after_success(self):
+        start = time.time()
+        await self.rpc.execute_rpc_call(method="getPReps", return_key="result")
+        self.assertLess(time.time() - start, 0.4)
+
+
+if __name__ == "__main__":
+    unittest.main()
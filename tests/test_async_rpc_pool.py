@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+import unittest
+try:
+    import common
+except:
+    pass
+
+from aiohttp import web
+
+from pawnlib.utils.http import AsyncIconRpcHelper, AsyncConnectionPoolRegistry
+
+
+class LocalRpcServer:
+    def __init__(self):
+        self.client_ports = set()
+        self.requests = 0
+        self.runner = None
+        self.url = ""
+
+    async def handle(self, request):
+        self.requests += 1
+        self.client_ports.add(request.transport.get_extra_info("peername")[1])
+        body = await request.json()
+        return web.json_response({"jsonrpc": "2.0", "id": body.get("id"), "result": {"height": self.requests}})
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/api/v3", self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+
+class TestAsyncRpcConnectionPool(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.server = LocalRpcServer()
+        await self.server.start()
+
+    async def asyncTearDown(self):
+        await AsyncConnectionPoolRegistry.close_all()
+        await self.server.stop()
+
+    async def test_01_force_close_opens_connection_per_request(self):
+        async with AsyncIconRpcHelper(url=self.server.url, retries=1) as rpc:
+            for _ in range(10):
+                self.assertTrue(await rpc.get_last_blockheight())
+        self.assertEqual(len(self.server.client_ports), 10)
+
+    async def test_02_pooled_reuses_connection(self):
+        async with AsyncIconRpcHelper(url=self.server.url, retries=1, pooled=True) as rpc:
+            for _ in range(10):
+                self.assertTrue(await rpc.get_last_blockheight())
+            pool_stats = rpc.concurrency_usage["pool"]
+
+        self.assertEqual(len(self.server.client_ports), 1)
+        self.assertEqual(pool_stats["created"], 1)
+        self.assertEqual(pool_stats["reused"], 9)
+        self.assertEqual(pool_stats["requests"], 10)
+        self.assertEqual(pool_stats["idle"], 1)
+
+    async def test_03_pool_shared_across_helpers(self):
+        first = await AsyncIconRpcHelper(url=self.server.url, retries=1, pooled=True).initialize()
+        second = await AsyncIconRpcHelper(url=self.server.url, retries=1, pooled=True).initialize()
+        self.assertIs(first.session, second.session)
+        self.assertEqual(first.pool.ref_count, 2)
+
+        await first.get_last_blockheight()
+        await second.get_last_blockheight()
+        self.assertEqual(len(self.server.client_ports), 1)
+
+        pool = first.pool
+        await first.close()
+        self.assertFalse(pool.closed)
+        await second.close()
+        self.assertEqual(pool.ref_count, 0)
+
+    async def test_04_idle_pool_is_evicted(self):
+        rpc = await AsyncIconRpcHelper(url=self.server.url, retries=1, pooled=True, pool_idle_timeout=0).initialize()
+        pool = rpc.pool
+        await rpc.get_last_blockheight()
+        await rpc.close()
+        self.assertTrue(pool.closed)
+        self.assertEqual(AsyncConnectionPoolRegistry.stats(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+import unittest
+try:
+    import common
+except:
+    pass
+
+import asyncio
+from aiohttp import web
+
+from pawnlib.utils import icx_signer
+from pawnlib.utils.http import AsyncIconRpcHelper, AsyncTransactionPipeline, AsyncTxResultPoller, AsyncConnectionPoolRegistry
+
+PRIVATE_KEY = "a" * 64
+FAIL_ADDRESS = "hx" + "f" * 40
+
+
+class MockChainServer:
+    def __init__(self, pending_ticks=1):
+        self.pending_ticks = pending_ticks
+        self.transactions = {}
+        self.result_queries = {}
+        self.result_http_requests = 0
+        self.runner = None
+        self.url = ""
+
+    def handle_item(self, item):
+        method = item.get("method")
+        params = item.get("params", {})
+        response = {"jsonrpc": "2.0", "id": item.get("id")}
+        if method == "icx_getNetworkInfo":
+            response["result"] = {"nid": "0x3", "platform": "icon"}
+        elif method == "icx_getBalance":
+            response["result"] = hex(10 ** 30)
+        elif method == "icx_call" and params["data"]["method"] == "getStepPrice":
+            response["result"] = hex(12_500_000_000)
+        elif method == "debug_estimateStep":
+            response["result"] = hex(100_000)
+        elif method == "icx_sendTransaction":
+            assert params.get("signature") and params.get("stepLimit") == hex(100_010)
+            tx_hash = "0x" + icx_signer.get_tx_hash(params).hex()
+            self.transactions[tx_hash] = params
+            response["result"] = tx_hash
+        elif method == "icx_getTransactionResult":
+            tx_hash = params["txHash"]
+            count = self.result_queries[tx_hash] = self.result_queries.get(tx_hash, 0) + 1
+            if tx_hash not in self.transactions:
+                response["error"] = {"code": -31004, "message": "NotFound: E1005:not found tx id"}
+            elif count <= self.pending_ticks:
+                response["error"] = {"code": -31002, "message": "Pending: E1002:pending"}
+            else:
+                failed = self.transactions[tx_hash]["to"] == FAIL_ADDRESS
+                response["result"] = {"txHash": tx_hash, "status": "0x0" if failed else "0x1",
+                                      **({"failure": {"code": "0x7d00", "message": "Reverted"}} if failed else {})}
+        else:
+            response["error"] = {"code": -32601, "message": "Method not found"}
+        return response
+
+    async def handle(self, request):
+        body = await request.json()
+        if isinstance(body, list):
+            if any(item.get("method") == "icx_getTransactionResult" for item in body):
+                self.result_http_requests += 1
+            return web.json_response([self.handle_item(item) for item in body])
+        if body.get("method") == "icx_getTransactionResult":
+            self.result_http_requests += 1
+        response = self.handle_item(body)
+        return web.json_response(response, status=400 if "error" in response else 200)
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/api/v3", self.handle)
+        app.router.add_post("/api/v3d", self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+
+class TestAsyncTransactionPipeline(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.server = MockChainServer()
+        await self.server.start()
+        signer = icx_signer.IcxSigner(data=PRIVATE_KEY)
+        self.wallet = {"private_key": PRIVATE_KEY, "address": signer.get_hx_address()}
+
+    async def asyncTearDown(self):
+        await AsyncConnectionPoolRegistry.close_all()
+        await self.server.stop()
+
+    async def test_01_run_many_transactions(self):
+        payloads = [{"params": {"to": f"hx{i:040x}", "value": hex(i)}} for i in range(40)]
+        payloads.append({"params": {"to": FAIL_ADDRESS, "value": "0x0"}})
+
+        async with AsyncIconRpcHelper(url=self.server.url, retries=1, verbose=0, pooled=True) as rpc:
+            pipeline = AsyncTransactionPipeline(rpc, wallet=self.wallet, concurrency=8, margin_steps=10, poll_interval=0.05)
+            results = await pipeline.run(payloads)
+
+        self.assertEqual([result.index for result in results], list(range(41)))
+        self.assertEqual(len(self.server.transactions), 41)
+        self.assertTrue(all(result.is_success for result in results[:40]))
+        self.assertEqual(results[40].error, "Reverted")
+        self.assertEqual(pipeline.stats["confirmed"], 40)
+        self.assertEqual(pipeline.stats["failed"], 1)
+
+        timestamps = {params["timestamp"] for params in self.server.transactions.values()}
+        self.assertEqual(len(timestamps), 41)
+        self.assertTrue(all(params["nid"] == "0x3" for params in self.server.transactions.values()))
+        # One batched request per polling tick instead of one request per transaction and tick.
+        self.assertLess(self.server.result_http_requests, 41)
+
+    async def test_02_poller_gives_up_after_max_attempts(self):
+        self.server.pending_ticks = 100
+        self.server.transactions["0x" + "1" * 64] = {"to": "hx0"}
+        async with AsyncIconRpcHelper(url=self.server.url, retries=1, verbose=0) as rpc:
+            poller = AsyncTxResultPoller(rpc, interval=0.01, max_attempts=3)
+            pending, not_found = await asyncio.gather(poller.wait("0x" + "1" * 64), poller.wait("0x" + "2" * 64))
+            await poller.close()
+
+        self.assertIn("Reached maximum attempts (3)", pending["error"]["message"])
+        self.assertIn("not found tx id", not_found["error"]["message"])
+        self.assertEqual(self.server.result_queries["0x" + "1" * 64], 3)
+
+    async def test_03_wrong_wallet_address(self):
+        async with AsyncIconRpcHelper(url=self.server.url, verbose=0) as rpc:
+            with self.assertRaises(ValueError):
+                AsyncTransactionPipeline(rpc, wallet={"private_key": PRIVATE_KEY, "address": "hx" + "0" * 40})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+import unittest
+try:
+    import common
+except:
+    pass
+
+import os
+import tempfile
+
+from pawnlib.utils.http import BlockHeightCheckpoint
+
+
+class TestBlockHeightCheckpoint(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base_dir = self.temp_dir.name
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def read_file(self, filename):
+        with open(os.path.join(self.base_dir, filename)) as f:
+            return f.read()
+
+    async def test_01_buffer_until_flush_every(self):
+        checkpoint = BlockHeightCheckpoint(base_dir=self.base_dir, flush_interval=3600, flush_every=3)
+        self.assertFalse(checkpoint.set("height.txt", 1))
+        self.assertFalse(checkpoint.set("height.txt", 2))
+        await checkpoint.flush_if_due()
+        self.assertFalse(os.path.exists(os.path.join(self.base_dir, "height.txt")))
+
+        self.assertTrue(checkpoint.set("height.txt", 3))
+        await checkpoint.flush_if_due()
+        self.assertEqual(self.read_file("height.txt"), "3")
+        self.assertFalse(checkpoint.is_flush_due())
+
+    async def test_02_flush_interval(self):
+        checkpoint = BlockHeightCheckpoint(base_dir=self.base_dir, flush_interval=0, flush_every=1000)
+        checkpoint.set("height.txt", 10)
+        await checkpoint.flush_if_due()
+        self.assertEqual(self.read_file("height.txt"), "10")
+
+    async def test_03_forced_flush_is_atomic(self):
+        checkpoint = BlockHeightCheckpoint(base_dir=self.base_dir, flush_interval=3600, flush_every=1000, fsync=True)
+        checkpoint.set("height.txt", 100)
+        checkpoint.set("slack.txt", 99)
+        await checkpoint.flush()
+        self.assertEqual(self.read_file("height.txt"), "100")
+        self.assertEqual(self.read_file("slack.txt"), "99")
+        self.assertEqual(sorted(os.listdir(self.base_dir)), ["height.txt", "slack.txt"])
+
+    def test_04_read_once(self):
+        with open(os.path.join(self.base_dir, "height.txt"), "w") as f:
+            f.write("42")
+        checkpoint = BlockHeightCheckpoint(base_dir=self.base_dir)
+        self.assertEqual(checkpoint.get("height.txt"), 42)
+
+        os.remove(os.path.join(self.base_dir, "height.txt"))
+        self.assertEqual(checkpoint.get("height.txt"), 42)
+        self.assertIsNone(checkpoint.get("missing.txt"))
+
+    def test_05_flush_sync(self):
+        checkpoint = BlockHeightCheckpoint(base_dir=self.base_dir, flush_interval=3600, flush_every=1000)
+        checkpoint.set("height.txt", 7)
+        checkpoint.flush_sync()
+        self.assertEqual(self.read_file("height.txt"), "7")
+        self.assertEqual(BlockHeightCheckpoint(base_dir=self.base_dir).get("height.txt"), 7)
+
+    async def test_06_failed_write_stays_pending(self):
+        checkpoint = BlockHeightCheckpoint(base_dir=os.path.join(self.base_dir, "missing_dir"), flush_every=1)
+        checkpoint.set("height.txt", 5)
+        await checkpoint.flush()
+        self.assertTrue(checkpoint.is_flush_due())
+
+
+if __name__ == "__main__":
+    unittest.main()
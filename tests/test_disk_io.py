@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+import unittest
+try:
+    import common
+except:
+    pass
+
+import os
+import json
+import random
+import tempfile
+
+from pawnlib.resource.diskio import DiskIOJob, LatencyHistogram
+
+
+class TestLatencyHistogram(unittest.TestCase):
+
+    def test_01_percentiles_within_bucket_precision(self):
+        rng = random.Random(7)
+        values = sorted(int(rng.lognormvariate(11, 1.2)) for _ in range(20000))
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+
+        self.assertEqual(histogram.count, len(values))
+        self.assertEqual(histogram.min, values[0])
+        self.assertEqual(histogram.max, values[-1])
+        for percentile in (50, 95, 99, 99.9):
+            exact = values[max(int(percentile / 100 * len(values) + 0.5) - 1, 0)]
+            self.assertLessEqual(abs(histogram.percentile(percentile) - exact), exact / 64, percentile)
+
+    def test_02_small_values_are_exact_and_merge_adds_up(self):
+        first, second = LatencyHistogram(), LatencyHistogram()
+        for value in range(1, 101):
+            (first if value % 2 else second).record(value)
+        first.merge(second)
+        self.assertEqual(first.count, 100)
+        self.assertEqual(first.percentile(50), 50)
+        self.assertEqual(first.percentile(100), 100)
+        self.assertEqual(first.to_dict()["mean"], 50.5)
+        with self.assertRaises(ValueError):
+            first.merge(LatencyHistogram(sub_bucket_bits=5))
+
+
+class TestDiskIOJob(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(__file__)))
+        self.file_path = os.path.join(self.temp_dir.name, "iotest")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_01_random_mixed_job_reports_both_directions(self):
+        job = DiskIOJob(self.file_path, file_size_mb=4, rw="randrw", block_size_kb=4, queue_depth=2, rwmixread=50, runtime=5, io_limit_mb=2, seed=1)
+        result = job.run()
+        self.assertEqual(os.path.getsize(self.file_path), 4 * 1024 * 1024)
+        self.assertEqual(result["read"]["ios"] + result["write"]["ios"], 512)
+        self.assertGreater(result["read"]["ios"], 100)
+        self.assertGreater(result["write"]["ios"], 100)
+        for direction in ("read", "write"):
+            latency = result[direction]["latency_us"]
+            self.assertLessEqual(latency["p50"], latency["p99"])
+            self.assertLessEqual(latency["p99.9"], latency["max"])
+        self.assertEqual(json.loads(job.to_json())["rw"], "randrw")
+
+    def test_02_sequential_read_only_job(self):
+        job = DiskIOJob(self.file_path, file_size_mb=2, rw="read", block_size_kb=8, queue_depth=1, rwmixread=10, io_limit_mb=1, seed=1)
+        result = job.run()
+        self.assertEqual(result["rwmixread"], 100)
+        self.assertEqual(result["read"]["ios"], 128)
+        self.assertEqual(result["write"]["ios"], 0)
+        self.assertEqual(result["write"]["latency_us"]["p99"], 0)
+
+    def test_03_invalid_settings(self):
+        with self.assertRaises(ValueError):
+            DiskIOJob(self.file_path, rw="random")
+        with self.assertRaises(ValueError):
+            DiskIOJob(self.file_path, block_size_kb=6)
+        with self.assertRaises(ValueError):
+            DiskIOJob(self.file_path, file_size_mb=1, block_size_kb=1024, queue_depth=2)
+        DiskIOJob(self.file_path, block_size_kb=6, direct=False)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+import unittest
+try:
+    import common
+except:
+    pass
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import time
+from unittest import mock
+
+import xxhash
+
+from pawnlib.output import file_indexing
+from pawnlib.output.file_indexing import FileIndexer, calculate_file_checksum
+
+
+class TestCalculateFileChecksum(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "data.bin")
+        self.data = os.urandom(100000)
+        with open(self.path, "wb") as f:
+            f.write(self.data)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_01_modes(self):
+        self.assertEqual(calculate_file_checksum(self.path), xxhash.xxh3_64_hexdigest(self.data[-10240:]))
+        self.assertEqual(calculate_file_checksum(self.path, "full", "sha256", buffer_size=4096), hashlib.sha256(self.data).hexdigest())
+        self.assertEqual(calculate_file_checksum(self.path, "full", "xxh3_128"), xxhash.xxh3_128_hexdigest(self.data))
+
+    def test_02_sampled_detects_corruption_outside_tail(self):
+        tail = calculate_file_checksum(self.path, "tail")
+        sampled = calculate_file_checksum(self.path, "sampled", read_size=1024, sample_count=4)
+        with open(self.path, "r+b") as f:
+            f.seek(0)
+            f.write(bytes([self.data[0] ^ 0xff]))
+        self.assertEqual(calculate_file_checksum(self.path, "tail"), tail)
+        self.assertNotEqual(calculate_file_checksum(self.path, "sampled", read_size=1024, sample_count=4), sampled)
+
+    def test_03_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            calculate_file_checksum(self.path, "middle")
+        with self.assertRaises(ValueError):
+            calculate_file_checksum(self.path, "sampled", sample_count=0)
+
+    def test_04_sampled_single_chunk(self):
+        expected = xxhash.xxh3_64()
+        expected.update(str(len(self.data)).encode())
+        expected.update(self.data[:1024])
+        self.assertEqual(calculate_file_checksum(self.path, "sampled", read_size=1024, sample_count=1), expected.hexdigest())
+
+
+class TestFileIndexer(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base_dir = os.path.join(self.temp_dir.name, "data")
+        self.output_dir = os.path.join(self.temp_dir.name, "out")
+        os.makedirs(os.path.join(self.base_dir, "db"))
+        for i in range(5):
+            with open(os.path.join(self.base_dir, "db", f"{i:06d}.sst"), "wb") as f:
+                f.write(os.urandom(30000))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def make_indexer(self, **kwargs):
+        return FileIndexer(base_dir=self.base_dir, output_dir=self.output_dir, worker=2, **kwargs)
+
+    def test_01_full_mode_index_and_check(self):
+        asyncio.run(self.make_indexer(hash_mode="full").run())
+        with open(os.path.join(self.output_dir, "checksum.json")) as f:
+            checksums = json.load(f)
+        self.assertEqual(len(checksums), 5)
+        self.assertEqual(checksums["db/000000.sst"]["hash_mode"], "full")
+
+        self.assertEqual(asyncio.run(self.make_indexer(use_cache=False).check())["status"], "OK")
+
+        # Corrupt the head of a file but keep its size and mtime
+        path = os.path.join(self.base_dir, "db", "000003.sst")
+        stat = os.stat(path)
+        with open(path, "r+b") as f:
+            f.write(b"\0" * 16)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        # The checksum cache still has the old digest for the unchanged stat key, check must not use it
+        result = asyncio.run(self.make_indexer().check())
+        self.assertEqual(result["status"], "FAIL")
+        self.assertEqual(result["errors"], {"db/000003.sst": {"error": "Checksum mismatch"}})
+
+    def test_02_cache_skips_unchanged_files(self):
+        asyncio.run(self.make_indexer(hash_mode="full").run())
+        self.assertTrue(os.path.exists(os.path.join(self.output_dir, ".checksum_cache.json")))
+
+        with open(os.path.join(self.base_dir, "db", "000001.sst"), "ab") as f:
+            f.write(b"more")
+
+        with mock.patch.object(file_indexing, "calculate_file_checksum", wraps=calculate_file_checksum) as checksum:
+            asyncio.run(self.make_indexer(hash_mode="full").run())
+        self.assertEqual(checksum.call_count, 1)
+
+    def test_03_legacy_checksum_file(self):
+        legacy = {
+            "db/000000.sst": {
+                "file_size": 30000,
+                "checksum": calculate_file_checksum(os.path.join(self.base_dir, "db", "000000.sst")),
+            }
+        }
+        os.makedirs(self.output_dir)
+        with open(os.path.join(self.output_dir, "checksum.json"), "w") as f:
+            json.dump(legacy, f)
+        self.assertEqual(asyncio.run(self.make_indexer(hash_mode="full").check())["status"], "OK")
+
+    def test_04_streaming_index_is_deterministic(self):
+        for name in ("b.log", "a.log", "ee.sock", "sub/z.txt", "sub/deeper/y.txt", "0.txt"):
+            os.makedirs(os.path.dirname(os.path.join(self.base_dir, name)), exist_ok=True)
+            with open(os.path.join(self.base_dir, name), "wb") as f:
+                f.write(name.encode())
+
+        def slow_first_file(file_path, *args):
+            if file_path.endswith("0.txt"):
+                time.sleep(0.2)
+            return calculate_file_checksum(file_path, *args)
+
+        with mock.patch.object(file_indexing, "calculate_file_checksum", slow_first_file):
+            indexer = self.make_indexer(prefix="http://snapshot", use_cache=False)
+            with mock.patch.object(indexer, "iter_files", wraps=indexer.iter_files) as iter_files:
+                asyncio.run(indexer.run())
+        # The tree is walked once and the paths are not collected
+        self.assertEqual(iter_files.call_count, 1)
+        self.assertEqual(indexer.file_list, [])
+
+        expected = ["0.txt", "a.log", "b.log"] + [f"db/{i:06d}.sst" for i in range(5)] + ["sub/z.txt", "sub/deeper/y.txt"]
+        with open(os.path.join(self.output_dir, "file_list.txt")) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(lines[0::2], [f"http://snapshot/{name}" for name in expected])
+        self.assertEqual(lines[1::2], [f"\tout={name}" for name in expected])
+
+        with open(os.path.join(self.output_dir, "checksum.json")) as f:
+            self.assertEqual(list(json.load(f)), expected)
+        self.assertEqual(indexer.indexed_count, len(expected))
+        self.assertEqual(indexer.total_file_count, len(expected))
+        self.assertEqual(indexer.count_files(), len(expected))
+        self.assertEqual(indexer.list_files_recursive(), [os.path.join(self.base_dir, name) for name in expected])
+
+    def test_05_failed_run_keeps_previous_checksum_file(self):
+        asyncio.run(self.make_indexer().run())
+        checksum_path = os.path.join(self.output_dir, "checksum.json")
+        with open(checksum_path) as f:
+            previous = f.read()
+
+        with mock.patch.object(file_indexing, "calculate_file_checksum", side_effect=RuntimeError("disk error")):
+            with self.assertRaises(RuntimeError):
+                asyncio.run(self.make_indexer(use_cache=False).run())
+        with open(checksum_path) as f:
+            self.assertEqual(f.read(), previous)
+        self.assertFalse(os.path.exists(f"{checksum_path}.tmp"))
+
+    def test_06_slow_file_bounds_the_reorder_window(self):
+        for i in range(100):
+            with open(os.path.join(self.base_dir, f"f{i:03d}.txt"), "wb") as f:
+                f.write(b"x")
+        indexer = self.make_indexer(use_cache=False)
+        window_size = indexer.worker * 4
+        started = []
+        parse_file = indexer.parse_file
+
+        async def slow_head_file(file_path):
+            started.append(os.path.basename(file_path))
+            if file_path.endswith("f000.txt"):
+                await asyncio.sleep(0.2)
+                # Files behind the slow one wait instead of piling up in the reorder buffer
+                self.assertLessEqual(len(started), window_size)
+            return await parse_file(file_path)
+
+        with mock.patch.object(indexer, "parse_file", slow_head_file):
+            asyncio.run(indexer.run())
+        self.assertEqual(indexer.indexed_count, 105)
+
+
+    def test_07_failing_file_does_not_hang_the_pipeline(self):
+        for i in range(100):
+            with open(os.path.join(self.base_dir, f"f{i:03d}.txt"), "wb") as f:
+                f.write(b"x")
+        indexer = self.make_indexer(use_cache=False)
+        parse_file = indexer.parse_file
+
+        async def failing_file(file_path):
+            if file_path.endswith("f003.txt"):
+                raise ValueError("unexpected")
+            return await parse_file(file_path)
+
+        async def run():
+            with mock.patch.object(indexer, "parse_file", failing_file):
+                await asyncio.wait_for(indexer.run(), 5)
+
+        with self.assertRaises(ValueError):
+            asyncio.run(run())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+import unittest
+try:
+    import common
+except:
+    pass
+
+import asyncio
+import tempfile
+
+from pawnlib.utils.http import AsyncGoloopWebsocket
+
+
+class FakeApiClient:
+    def __init__(self, tip, delay=0.001):
+        self.tip = tip
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fetched = []
+
+    async def get_last_blockheight(self, url=None):
+        return self.tip
+
+    async def get_block_by_height(self, height=0, url=None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # Later heights resolve first to make sure ordering is enforced by the pipeline.
+        await asyncio.sleep(self.delay * (height % 5))
+        self.in_flight -= 1
+        self.fetched.append(height)
+        return {
+            "height": height,
+            "peer_id": "hx0",
+            "time_stamp": 0,
+            "confirmed_transaction_list": [{"txHash": f"0x{height:x}"}],
+        }
+
+
+class TestGoloopCatchUp(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.processed = []
+
+        async def process_transaction(tx, block_height):
+            self.processed.append(block_height)
+
+        self.client = AsyncGoloopWebsocket(
+            url="http://localhost:9000",
+            process_transaction=process_transaction,
+            send_slack=False,
+            base_dir=self.temp_dir.name,
+            catchup_threshold=10,
+            catchup_concurrency=4,
+            catchup_window=8,
+        )
+        await self.client.api_client.connector.close()
+
+    async def asyncTearDown(self):
+        self.temp_dir.cleanup()
+
+    async def test_01_process_in_height_order(self):
+        self.client.api_client = FakeApiClient(tip=150)
+        next_height = await self.client.catch_up(100, 150)
+
+        self.assertEqual(next_height, 151)
+        self.assertEqual(self.processed, list(range(100, 151)))
+        self.assertLessEqual(self.client.api_client.max_in_flight, 4)
+        self.assertGreater(self.client.api_client.max_in_flight, 1)
+        self.assertEqual(self.client.read_last_processed_blockheight(self.client.BLOCKHEIGHT_FILE), 150)
+
+    async def test_02_follow_moving_tip(self):
+        fake_client = FakeApiClient(tip=200)
+        self.client.api_client = fake_client
+        next_height = await self.client.catch_up(100, 150)
+        self.assertEqual(next_height, 201)
+        self.assertEqual(self.processed, list(range(100, 201)))
+
+    async def test_03_skip_already_reported_blocks(self):
+        self.client.api_client = FakeApiClient(tip=120)
+        self.client.skip_until = 110
+        await self.client.catch_up(100, 120)
+        self.assertEqual(self.processed, list(range(111, 121)))
+
+    def test_04_is_catchup_required(self):
+        self.client.blockheight = 100
+        self.assertTrue(self.client.is_catchup_required(110))
+        self.assertFalse(self.client.is_catchup_required(105))
+
+        self.client.catchup_threshold = 0
+        self.assertFalse(self.client.is_catchup_required(1000))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+import unittest
+try:
+    import common
+except:
+    pass
+
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from pawnlib.utils.http import HttpSessionPool, IconRpcHelper, jequest
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    client_ports = set()
+    hosts = []
+
+    def _reply(self, body):
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self.client_ports.add(self.client_address[1])
+        self.hosts.append(self.headers.get("Host"))
+        self._reply({"path": self.path})
+
+    def do_POST(self):
+        self.client_ports.add(self.client_address[1])
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self._reply({"jsonrpc": "2.0", "id": body.get("id"), "result": {"height": len(self.client_ports)}})
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHttpSessionPool(unittest.TestCase):
+
+    def setUp(self):
+        KeepAliveHandler.client_ports = set()
+        KeepAliveHandler.hosts = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.port = self.server.server_address[1]
+        self.url = f"http://127.0.0.1:{self.port}"
+        self.pool = HttpSessionPool()
+
+    def tearDown(self):
+        self.pool.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_01_jequest_reuses_connection(self):
+        for _ in range(5):
+            self.assertEqual(jequest(f"{self.url}/status", session_pool=self.pool)["json"], {"path": "/status"})
+        self.assertEqual(len(KeepAliveHandler.client_ports), 1)
+        self.assertEqual(self.pool.stats["sessions"], 1)
+
+    def test_02_jequest_without_pool(self):
+        for _ in range(3):
+            jequest(f"{self.url}/status", session_pool=False)
+        self.assertEqual(len(KeepAliveHandler.client_ports), 3)
+
+    def test_03_dns_override_is_per_request(self):
+        getaddrinfo = socket.getaddrinfo
+        response = jequest(f"http://pawnlib.invalid:{self.port}/override", ipaddr="127.0.0.1", session_pool=self.pool)
+        self.assertIs(socket.getaddrinfo, getaddrinfo)
+        self.assertEqual(response["json"], {"path": "/override"})
+        self.assertEqual(KeepAliveHandler.hosts, [f"pawnlib.invalid:{self.port}"])
+
+        response = jequest(f"http://pawnlib.invalid:{self.port}/override", session_pool=self.pool, timeout=1)
+        self.assertEqual(response["status_code"], 999)
+
+    def test_04_icon_rpc_helper_uses_pool(self):
+        rpc = IconRpcHelper(url=self.url, session_pool=self.pool)
+        for _ in range(5):
+            self.assertEqual(rpc.rpc_call(method="icx_getLastBlock", return_key="result.height"), 1)
+        self.assertEqual(self.pool.stats["requests"], 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+import unittest
+try:
+    import common
+except:
+    pass
+
+import hashlib
+from copy import deepcopy
+
+from pawnlib.utils import icx_signer
+
+
+def legacy_serialize(params: dict) -> bytes:
+    """The implementation before the streaming serializer, kept to check byte-identical output."""
+    def encode(data):
+        if isinstance(data, dict):
+            return "{" + ".".join(encode_dict(data)) + "}"
+        elif isinstance(data, list):
+            return "[" + ".".join(encode(item) for item in data) + "]"
+        elif data is None:
+            return "\\0"
+        return str(data).translate(icx_signer.translator)
+
+    def encode_dict(data):
+        for key in sorted(data.keys()):
+            yield key
+            yield encode(data[key])
+
+    copy_tx = deepcopy(params)
+    if params.get("version", hex(2)) == hex(2):
+        copy_tx.pop("tx_hash", None)
+    copy_tx.pop("signature", None)
+    return f"icx_sendTransaction.{'.'.join(encode_dict(copy_tx))}".encode()
+
+
+PAYLOADS = [
+    {
+        "version": "0x3", "from": "hx" + "1" * 40, "to": "hx" + "2" * 40, "value": "0xde0b6b3a7640000",
+        "stepLimit": "0x186a0", "timestamp": "0x5f4b3c2d1e0f0", "nid": "0x1", "nonce": "0x1",
+        "signature": "should be excluded",
+    },
+    {
+        "version": "0x3", "from": "hx" + "1" * 40, "to": "cx0000000000000000000000000000000000000001",
+        "stepLimit": "0x3b9aca00", "timestamp": "0x5f4b3c2d1e0f0", "nid": "0x53", "dataType": "call",
+        "data": {
+            "method": "setPRepDetails",
+            "params": {
+                "name": "node.{with}[special]\\chars",
+                "details": "https://example.com/details.json",
+                "empty": {}, "none": None, "list": ["a.b", None, {"nested": []}, []],
+            },
+        },
+    },
+    {
+        "version": "0x3", "from": "hx" + "1" * 40, "to": "cx0000000000000000000000000000000000000000",
+        "stepLimit": "0x77359400", "timestamp": "0x5f4b3c2d1e0f0", "nid": "0x1", "dataType": "deploy",
+        "data": {"contentType": "application/java", "content": "0x" + "ab" * 200_000, "params": {"name": "Token", "decimals": 18}},
+    },
+    {"from": "hx" + "1" * 40, "to": "hx" + "2" * 40, "value": "0x1", "fee": "0x2386f26fc10000", "tx_hash": "0x" + "3" * 64},
+    {"version": "0x3", "tx_hash": "kept for v3", "flag": True, "amount": 10},
+]
+
+
+class TestIcxSignerSerialize(unittest.TestCase):
+
+    def test_01_byte_identical_to_legacy(self):
+        for params in PAYLOADS:
+            expected = legacy_serialize(params)
+            self.assertEqual(icx_signer.serialize(params), expected)
+            self.assertEqual(icx_signer.get_tx_hash(params), hashlib.sha3_256(expected).digest())
+            self.assertEqual(icx_signer.generate_message(params), hashlib.sha3_256(expected).hexdigest())
+
+    def test_02_params_are_not_modified(self):
+        params = deepcopy(PAYLOADS[0])
+        icx_signer.get_tx_hash(params)
+        self.assertEqual(params, PAYLOADS[0])
+
+    def test_03_stream_in_chunks(self):
+        chunks = []
+        icx_signer.write_serialized(PAYLOADS[2], chunks.append)
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(b"".join(chunks), legacy_serialize(PAYLOADS[2]))
+
+    def test_04_genesis_serializer_unchanged(self):
+        data = {"accounts": [{"name": "god", "address": "hx" + "1" * 40, "balance": "0x1"}], "message": "a.b"}
+        serialized = icx_signer.__dict__["__make_params_serialized"](data)
+        self.assertEqual(f"icx_sendTransaction.{serialized}".encode(), legacy_serialize(data))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+import unittest
+try:
+    import common
+except:
+    pass
+
+import logging
+import time
+
+from pawnlib.config.logging_config import BaseFormatter, remove_rich_tags, escape_non_tag_brackets
+
+
+class TestRemoveRichTags(unittest.TestCase):
+
+    def test_01_strip_valid_tags_only(self):
+        self.assertEqual(
+            remove_rich_tags("This is a [bold]bold[/bold] and [invalid]invalid[/invalid] tag example."),
+            "This is a bold and [invalid]invalid[/invalid] tag example."
+        )
+        self.assertEqual(remove_rich_tags("[bold red]ERR[/bold red] [id=1] done"), "ERR [id=1] done")
+        self.assertEqual(remove_rich_tags("no tags here"), "no tags here")
+
+    def test_02_escape_non_tag_brackets(self):
+        self.assertEqual(escape_non_tag_brackets("[bold]ok[/bold] [1, 2]"), "[bold]ok[/bold] \\[1, 2]")
+        self.assertEqual(escape_non_tag_brackets("plain"), "plain")
+
+    def test_03_linear_time_on_long_messages(self):
+        message = "[bold]x[/bold] " * 20000
+        start = time.perf_counter()
+        self.assertEqual(remove_rich_tags(message), "x " * 20000)
+        self.assertLess(time.perf_counter() - start, 1)
+
+
+class TestBaseFormatter(unittest.TestCase):
+
+    def make_record(self, msg, *args):
+        return logging.LogRecord("test", logging.INFO, __file__, 1, msg, args, None)
+
+    def test_01_format_leaves_record_untouched(self):
+        formatter = BaseFormatter(fmt="%(levelname)s %(message)s", log_level_short=True)
+        record = self.make_record("[green]%s[/green] done", "job")
+        self.assertEqual(formatter.format(record), "INF job done")
+        self.assertEqual(record.msg, "[green]%s[/green] done")
+        self.assertEqual(record.args, ("job",))
+        self.assertEqual(record.levelname, "INFO")
+
+    def test_02_fast_path_without_brackets(self):
+        formatter = BaseFormatter(fmt="%(levelname)s %(message)s")
+        self.assertEqual(formatter.format(self.make_record("count=%d", 3)), "INFO count=3")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+import unittest
+try:
+    import common
+except:
+    pass
+
+import math
+import random
+import statistics
+
+from pawnlib.metrics import RollingWindow, WindowMinMax, LatencyHistogram, RateCounter, LatencyTracker, ThroughputTracker
+from pawnlib.typing.converter import StackList, MedianFinder
+
+
+class TestRollingWindow(unittest.TestCase):
+
+    def test_01_matches_recomputed_statistics(self):
+        rng = random.Random(3)
+        window = RollingWindow(size=50)
+        min_max = WindowMinMax(size=50)
+        values = []
+        for _ in range(1000):
+            value = rng.uniform(-1e6, 1e6)
+            values.append(value)
+            window.append(value)
+            min_max.append(value)
+            recent = values[-50:]
+            self.assertEqual(list(window), recent)
+            self.assertAlmostEqual(window.mean(), statistics.fmean(recent), delta=1e-6)
+            self.assertEqual(min_max.min(), min(recent))
+            self.assertEqual(min_max.max(), max(recent))
+        self.assertAlmostEqual(window.stdev(), statistics.pstdev(values[-50:]), delta=1e-3)
+        self.assertEqual((window.first, window.last, window[-2]), (values[-50], values[-1], values[-2]))
+
+    def test_02_integers_stay_exact_and_eviction(self):
+        window = RollingWindow(size=3)
+        self.assertEqual(window.mean(), 0)
+        self.assertIsNone(window.last)
+        self.assertEqual([window.append(value) for value in (10, 20, 30, 40)], [None, None, None, 10])
+        self.assertEqual((window.sum(), window.mean()), (90, 30.0))
+        window.clear()
+        self.assertEqual(len(window), 0)
+        with self.assertRaises(ValueError):
+            RollingWindow(size=0)
+
+
+class TestLatencyHistogram(unittest.TestCase):
+
+    def test_01_percentiles_within_bucket_precision(self):
+        rng = random.Random(7)
+        values = sorted(int(rng.lognormvariate(11, 1.2)) for _ in range(20000))
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+
+        self.assertEqual(histogram.count, len(values))
+        self.assertEqual(histogram.min, values[0])
+        self.assertEqual(histogram.max, values[-1])
+        for percentile in (50, 95, 99, 99.9):
+            exact = values[max(int(percentile / 100 * len(values) + 0.5) - 1, 0)]
+            self.assertLessEqual(abs(histogram.percentile(percentile) - exact), exact / 64, percentile)
+
+    def test_02_small_values_are_exact_and_merge_adds_up(self):
+        first, second = LatencyHistogram(), LatencyHistogram()
+        for value in range(1, 101):
+            (first if value % 2 else second).record(value)
+        first.merge(second)
+        self.assertEqual(first.count, 100)
+        self.assertEqual(first.percentile(50), 50)
+        self.assertEqual(first.percentile(100), 100)
+        self.assertEqual(first.to_dict()["mean"], 50.5)
+        with self.assertRaises(ValueError):
+            first.merge(LatencyHistogram(sub_bucket_bits=5))
+
+    def test_03_remove_makes_a_windowed_sketch(self):
+        histogram = LatencyHistogram(unit=0.001)
+        for value in (1.5, 2.25, 300.0, 4.0):
+            histogram.record(value)
+        histogram.remove(300.0)
+        self.assertEqual(histogram.count, 3)
+        self.assertAlmostEqual(histogram.percentile(100), 4.0, delta=4.0 / 128)
+        self.assertAlmostEqual(histogram.min, 1.5, delta=1.5 / 128)
+        self.assertAlmostEqual(histogram.mean, 7.75 / 3)
+        with self.assertRaises(ValueError):
+            histogram.remove(300.0)
+
+    def test_04_percentile_matches_sorted_values_from_both_ends(self):
+        rng = random.Random(11)
+        histogram = LatencyHistogram()
+        values = []
+        for _ in range(2000):
+            value = rng.randrange(0, 200)
+            histogram.record(value)
+            values.append(value)
+            if rng.random() < 0.3:
+                removed = values.pop(rng.randrange(len(values)))
+                histogram.remove(removed)
+            ordered = sorted(values)
+            for percentile in (0, 1, 25, 49.9, 50, 50.1, 75, 99, 100):
+                target = max(math.ceil(percentile / 100 * len(ordered)), 1)
+                self.assertEqual(histogram.percentile(percentile), ordered[target - 1], percentile)
+
+
+class TestRateCounter(unittest.TestCase):
+
+    def test_01_buckets_expire(self):
+        counter = RateCounter(window=10, buckets=10)
+        self.assertEqual(counter.rate(now=0.0), 0.0)
+        counter.add(5, now=100.0)
+        counter.add(5, now=104.0)
+        self.assertEqual(counter.rate(now=105.0), 2.0)
+        self.assertEqual(counter.count(now=112.0), 5)
+        self.assertEqual(counter.rate(now=112.0), 0.5)
+        self.assertEqual(counter.count(now=1000.0), 0)
+
+
+class TestTrackers(unittest.TestCase):
+
+    def test_01_latency_tracker_window(self):
+        tracker = LatencyTracker(history_size=100)
+        self.assertIsNone(tracker.get_percentile_latency(99))
+        for latency in range(1, 301):
+            tracker.add_latency(latency / 10)
+        self.assertAlmostEqual(tracker.get_average_latency(), 25.05)
+        self.assertEqual((tracker.get_min_latency(), tracker.get_max_latency()), (20.1, 30.0))
+        self.assertAlmostEqual(tracker.get_percentile_latency(50), 25.0, delta=25.0 / 128)
+        self.assertEqual(tracker.histogram.count, 100)
+
+    def test_02_throughput_tracker_time_window(self):
+        tracker = ThroughputTracker(window_seconds=10)
+        for index in range(20):
+            tracker.record_request(timestamp=1000.0 + index / 2)
+        self.assertEqual(tracker.rate_counter.count(now=1009.9), 20)
+        self.assertEqual(tracker.rate_counter.rate(now=1015.0), 0.8)
+
+    def test_03_stack_list_statistics(self):
+        rng = random.Random(5)
+        stack = StackList(max_length=15)
+        self.assertEqual(stack.get_list(), [])
+        for index in range(200):
+            stack.push(rng.randrange(1000))
+            if index % 7 == 0:
+                items = stack.get_list()
+                self.assertEqual(stack.median(), statistics.median(items))
+                self.assertAlmostEqual(stack.mean(), statistics.mean(items))
+                self.assertEqual((stack.min(), stack.max(), stack.sum()), (min(items), max(items), sum(items)))
+
+        stack.push({"key": 1})
+        self.assertEqual(len(stack), 15)
+        with self.assertRaises(TypeError):
+            stack.mean()
+        stack.reset()
+        stack.push(3)
+        self.assertEqual(stack.mean(), 3)
+
+    def test_04_median_finder_mean(self):
+        finder = MedianFinder()
+        for number in (1, 2, 3, 10):
+            finder.add_number(number)
+        self.assertEqual((finder.median(), finder.mean()), (2.5, 4.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+import unittest
+try:
+    import common
+except:
+    pass
+
+import io
+import os
+import json
+import tempfile
+import asyncio
+from collections import Counter
+from urllib.parse import urlsplit
+
+from pawnlib.blockchain.goloop.p2p import P2PNetworkParser, normalize_peer_address
+
+
+class FakeRpcHelper:
+    """Answers admin/chain for a synthetic peer graph. ``graph`` maps a host to its friends."""
+
+    def __init__(self, graph, slow_hosts=(), delay=0.001):
+        self.graph = graph
+        self.slow_hosts = set(slow_hosts)
+        self.delay = delay
+        self.fetched = Counter()
+
+    async def fetch(self, url=""):
+        host = urlsplit(url).hostname
+        self.fetched[host] += 1
+        await asyncio.sleep(10 if host in self.slow_hosts else self.delay)
+        if host not in self.graph:
+            return {}
+        return {"module": {"network": {"p2p": {
+            "self": {"id": f"hx{host}", "addr": f"{host}:7100"},
+            "friends": [{"id": f"hx{peer}", "addr": address, "rtt": 0.01} for peer, address in self.graph[host]],
+        }}}}
+
+    async def get_preps(self, url="", return_dict_key=""):
+        return {"hx10.0.0.1": {"name": "first"}}
+
+    async def close(self):
+        pass
+
+
+def ring_graph(size, spellings=("{}:7100", "http://{}", "{}:7100/")):
+    graph = {}
+    for index in range(size):
+        host = f"10.0.0.{index}"
+        peers = []
+        for offset, spelling in zip((1, 2, 3), spellings):
+            peer = f"10.0.0.{(index + offset) % size}"
+            peers.append((peer, spelling.format(peer)))
+        graph[host] = peers
+    return graph
+
+
+class TestP2PCrawler(unittest.IsolatedAsyncioTestCase):
+
+    def make_parser(self, helper, **kwargs):
+        parser = P2PNetworkParser(url="http://10.0.0.0:9000", verbose=-1, **kwargs)
+        parser.rpc_helper = helper
+        return parser
+
+    def test_01_normalize_peer_address(self):
+        self.assertEqual(normalize_peer_address("HTTP://Node.Example.com"), "node.example.com:7100")
+        self.assertEqual(normalize_peer_address("10.0.0.1:9000/api"), "10.0.0.1:9000")
+        self.assertEqual(normalize_peer_address("[::1]:7100"), "[::1]:7100")
+        self.assertEqual(normalize_peer_address(""), "")
+
+    async def test_02_each_node_is_queried_once_and_streamed(self):
+        helper = FakeRpcHelper(ring_graph(40))
+        output = io.StringIO()
+        parser = self.make_parser(helper, max_concurrent=8, max_depth=50, output=output)
+        stats = await parser.collect_ips(parser.start_url)
+
+        self.assertEqual(len(helper.fetched), 40)
+        self.assertEqual(set(helper.fetched.values()), {1})
+        self.assertEqual(stats["nodes"], 40)
+        self.assertEqual(stats["edges"], 120)
+        self.assertEqual(len(parser.hx_to_ip), 40)
+        self.assertGreater(stats["nodes_per_second"], 0)
+        self.assertLessEqual(stats["fetch_latency_ms"]["p50"], stats["fetch_latency_ms"]["p99"])
+
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(Counter(record["type"] for record in records), {"node": 40, "edge": 120})
+
+    async def test_03_depth_timeout_and_frontier_limits(self):
+        helper = FakeRpcHelper(ring_graph(40), slow_hosts={"10.0.0.2"})
+        parser = self.make_parser(helper, max_concurrent=4, max_depth=1, timeout=0.2)
+        stats = await parser.collect_ips(parser.start_url)
+        # Depth 0 and 1 are explored, depth 2 is only queried for HX addresses.
+        # 10.0.0.2 is abandoned, so its peer 10.0.0.5 is only found through 10.0.0.3
+        self.assertEqual(sorted(helper.fetched), sorted(f"10.0.0.{index}" for index in range(7)))
+        self.assertEqual(stats["abandoned"], 1)
+        self.assertEqual(stats["nodes"], 6)
+        # The abandoned node counts with the time it was waited for
+        self.assertEqual(parser.fetch_latency.count, 7)
+        self.assertGreaterEqual(stats["fetch_latency_ms"]["max"], 190)
+
+        helper = FakeRpcHelper({"10.0.0.0": [(f"10.0.1.{index}", f"10.0.1.{index}") for index in range(20)]})
+        parser = self.make_parser(helper, max_concurrent=1, max_frontier=5)
+        stats = await parser.collect_ips(parser.start_url)
+        self.assertEqual(stats["frontier_dropped"], 15)
+        self.assertEqual(stats["max_frontier"], 5)
+        self.assertEqual(len(helper.fetched), 6)
+
+    async def test_04_time_budget(self):
+        chain = {f"10.0.0.{index}": [(f"10.0.0.{index + 1}", f"10.0.0.{index + 1}")] for index in range(200)}
+        helper = FakeRpcHelper(chain, delay=0.02)
+        parser = self.make_parser(helper, max_depth=500, time_budget=0.2)
+        stats = await parser.collect_ips(parser.start_url)
+        self.assertTrue(stats["budget_exhausted"])
+        self.assertLess(stats["elapsed"], 1)
+        self.assertLess(stats["nodes"], 20)
+
+    async def test_05_jsonl_file_is_written_while_crawling(self):
+        chain = {f"10.0.0.{index}": [(f"10.0.0.{index + 1}", f"10.0.0.{index + 1}")] for index in range(20)}
+        helper = FakeRpcHelper(chain, delay=0.05)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "p2p.jsonl")
+            parser = self.make_parser(helper, max_depth=50, output=path)
+            crawl = asyncio.ensure_future(parser.collect_ips(parser.start_url))
+            await asyncio.sleep(0.3)
+            with open(path) as f:
+                partial = f.read().splitlines()
+            self.assertFalse(crawl.done())
+            self.assertIn('"type": "node"', partial[-1])
+            await crawl
+            with open(path) as f:
+                self.assertGreater(len(f.read().splitlines()), len(partial))
+
+    async def test_06_run_returns_crawl_statistics(self):
+        helper = FakeRpcHelper(ring_graph(5, spellings=("{}:7100",) * 3))
+
+        class Parser(P2PNetworkParser):
+            async def initialize_resources(self):
+                self.rpc_helper = helper
+
+        parser = Parser(url="http://10.0.0.0:9000", verbose=-1)
+        result = await parser.run()
+        self.assertEqual(result["statistics"]["crawl"]["nodes"], 5)
+        self.assertEqual(result["statistics"]["validator_nodes"], ["hx10.0.0.1"])
+        self.assertEqual(len(result["ip_to_hx"]), 5)
+
+    async def test_07_deprecated_collect_hx_maps_one_node(self):
+        helper = FakeRpcHelper(ring_graph(5))
+        parser = self.make_parser(helper)
+        with self.assertWarns(DeprecationWarning):
+            await parser.collect_hx("10.0.0.1:7100")
+        self.assertEqual(dict(helper.fetched), {"10.0.0.1": 1})
+        self.assertEqual(set(parser.hx_to_ip), {"hx10.0.0.1", "hx10.0.0.2", "hx10.0.0.3", "hx10.0.0.4"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+import unittest
+try:
+    import common
+except:
+    pass
+
+import re
+import random
+import asyncio
+from unittest import mock
+
+from pawnlib.output.file import PatternMatcher
+from pawnlib.resource.monitor import SSHMonitor
+from pawnlib.typing.constants import const
+
+AUTH_LOG_LINES = [
+    "Oct 16 12:00:01 host sshd[100]: Failed password for invalid user admin from 192.168.0.7 port 4022 ssh2",
+    "Oct 16 12:00:02 host sshd[101]: Failed password for root from 10.0.0.1 port 22 ssh2",
+    "Oct 16 12:00:03 host sshd[102]: Invalid user oracle from 10.0.0.2 port 51000",
+    "Oct 16 12:00:04 host sshd[103]: pam_unix(sshd:auth): authentication failure; logname= uid=0 euid=0 tty=ssh ruser= rhost=10.0.0.3  user=root",
+    "Oct 16 12:00:05 host sshd[104]: Connection closed by authenticating user ubuntu 10.0.0.4 port 3333 [preauth]",
+    "Oct 16 12:00:06 host sshd[105]: Accepted publickey for deploy from 10.0.0.5 port 5000 ssh2: RSA SHA256:abc",
+    "Oct 16 12:00:07 host systemd-logind[1]: New session 42 of user ubuntu.",
+    "Oct 16 12:00:08 host sshd[106]: pam_unix(sshd:session): session opened for user root by (uid=0)",
+    "Oct 16 12:00:09 host CRON[107]: pam_unix(cron:session): session closed for user root",
+    "Oct 16 12:00:10 host sudo:   ubuntu : TTY=pts/0 ; PWD=/home/ubuntu ; USER=root ; COMMAND=/usr/bin/ls",
+]
+
+
+def legacy_classify(monitor, line):
+    if any(pattern in line for pattern in monitor.failed_patterns):
+        return "failed"
+    if any(pattern in line for pattern in monitor.success_patterns):
+        return "success"
+    return None
+
+
+def legacy_extract_user(monitor, line):
+    if monitor.os_type == "ubuntu":
+        user_match = re.search(r"of user (\w+)", line)
+        if user_match:
+            return user_match.group(1)
+    for pattern in [r"for (\w+) from", r"for invalid user (\w+) from", r"user=(\w+)", r"user (\w+)"]:
+        user_match = re.search(pattern, line)
+        if user_match:
+            return user_match.group(1)
+    return "unknown"
+
+
+class TestPatternMatcher(unittest.TestCase):
+
+    def test_01_list_filters(self):
+        matcher = PatternMatcher(["ERROR", r"code=\d+"])
+        self.assertTrue(matcher.search("an ERROR here"))
+        self.assertTrue(matcher.search("code=500"))
+        self.assertIsNone(matcher.search("code=abc"))
+        self.assertEqual(matcher.classify("code=500 ERROR"), "ERROR")
+        self.assertIsNone(PatternMatcher([]).search("ERROR"))
+
+    def test_02_category_priority_and_overlapping_fields(self):
+        matcher = PatternMatcher(
+            {"failed": ["Invalid user"], "success": ["Accepted"]},
+            fields={"user": [r"for invalid user (\w+) from", r"user (\w+)"], "port": r"port (\d+)"},
+            literal=True,
+        )
+        # The field starts inside the matched category pattern and the later category has a lower priority
+        self.assertEqual(matcher.match("Accepted ... Invalid user admin from x"), ("failed", {"user": "admin", "port": None}))
+        # Literal patterns are case sensitive
+        self.assertEqual(
+            matcher.match("Failed password for invalid user guest from 1.2.3.4 port 22 user other"),
+            None
+        )
+        self.assertEqual(matcher.extract("for invalid user guest from 1.2.3.4 port 22"), {"user": "guest", "port": "22"})
+
+    def test_03_overlapping_field_matches(self):
+        fields = {"user": [r"user=(\w+)", r"user (\w+)"], "word": [r"b+", r"(a)b", r"x?"]}
+        matcher = PatternMatcher(["user"], fields=fields)
+        self.assertEqual(matcher.extract("from user= user user=root for"), {"user": "root", "word": ""})
+        self.assertEqual(matcher.extract("aab"), {"user": None, "word": "b"})
+        self.assertEqual(matcher.extract("zz"), {"user": None, "word": ""})
+
+        rng = random.Random(16)
+        tokens = ["user", "user=", "=", "for", "from", "invalid", "of", "root", "ab", "b", "a", " ", "  "]
+        for _ in range(20000):
+            line = "".join(rng.choice(tokens) + rng.choice(["", " "]) for _ in range(rng.randrange(1, 12)))
+            expected = {}
+            for name, patterns in fields.items():
+                expected[name] = None
+                for pattern in patterns:
+                    match = re.search(pattern, line)
+                    if match:
+                        expected[name] = match.group(1 if match.re.groups else 0)
+                        break
+            self.assertEqual(matcher.extract(line), expected, line)
+
+    def test_04_literal_patterns_are_escaped(self):
+        matcher = PatternMatcher(["a.b", "(x)"], literal=True)
+        self.assertIsNone(matcher.search("axb"))
+        self.assertTrue(matcher.search("(x)"))
+
+
+class TestSSHMonitorMatcher(unittest.TestCase):
+
+    def test_01_same_results_as_separate_scans(self):
+        for os_type in ("ubuntu", "centos"):
+            monitor = SSHMonitor("/var/log/auth.log", os_type=os_type)
+            for line in AUTH_LOG_LINES:
+                with self.subTest(os_type=os_type, line=line):
+                    status = legacy_classify(monitor, line)
+                    result = monitor.matcher.match(line)
+                    self.assertEqual(result[0] if result else None, status)
+
+                    ip_match = re.search(const.PATTERN_IP_ADDRESS_IN_LOG, line)
+                    self.assertEqual(monitor.extract_ip(line), ip_match.group(0) if ip_match else None)
+                    self.assertEqual(monitor.extract_user(line), legacy_extract_user(monitor, line))
+                    if result:
+                        self.assertEqual(result[1]["ip"], monitor.extract_ip(line))
+                        self.assertEqual(result[1]["user"] or "unknown", monitor.extract_user(line))
+
+    def test_02_user_fuzz_against_separate_scans(self):
+        rng = random.Random(7)
+        tokens = ["from", "user", "user=", "for", "invalid", "of", "root", "admin", "10.0.0.1", "=", "x"]
+        for os_type in ("ubuntu", "centos"):
+            monitor = SSHMonitor("/var/log/auth.log", os_type=os_type)
+            for _ in range(20000):
+                line = " ".join(rng.choice(tokens) for _ in range(rng.randrange(1, 10)))
+                self.assertEqual(monitor.extract_user(line), legacy_extract_user(monitor, line), line)
+
+    def test_03_suppressed_failed_alert_falls_through_to_success(self):
+        monitor = SSHMonitor("/var/log/auth.log", os_type="ubuntu")
+        alerts = []
+
+        async def create_alert_message(line, status, fields=None):
+            alerts.append(status)
+
+        monitor.create_alert_message = create_alert_message
+        monitor.allow_duplicates = False
+        line = "sshd[1]: Failed password for root from 10.0.0.1 port 22 ... Accepted publickey for root from 10.0.0.1"
+        asyncio.run(monitor.process_line(line))
+        asyncio.run(monitor.process_line(line))
+        asyncio.run(monitor.process_line(line))
+        self.assertEqual(alerts, ["failed", "success"])
+
+    def test_04_lines_are_matched_only_by_the_monitor(self):
+        monitor = SSHMonitor(__file__, os_type="centos")
+        line = "sshd[1]: Failed password for root from 10.0.0.1 port 22"
+        self.assertEqual(monitor.matcher.match_all(line), (["failed"], {"ip": "10.0.0.1", "user": "root"}))
+        self.assertIsNone(monitor.matcher.match_all("sshd[1]: session closed"))
+
+        with mock.patch("pawnlib.resource.monitor.Tail") as tail:
+            tail.return_value.follow_async = mock.AsyncMock()
+            asyncio.run(monitor.monitor_ssh())
+        self.assertIsNone(tail.call_args[0][1])
+        self.assertTrue(tail.call_args[1]["batch"])
+
+        alerts = []
+
+        async def create_alert_message(line, status, fields=None):
+            alerts.append((status, fields["user"]))
+
+        monitor.create_alert_message = create_alert_message
+        with mock.patch.object(monitor.matcher, "search", wraps=monitor.matcher.search) as search:
+            asyncio.run(monitor.process_lines([line, "sshd[1]: session closed", "sshd[2]: Accepted publickey for deploy from 10.0.0.5"]))
+        self.assertEqual(alerts, [("failed", "root"), ("success", "deploy")])
+        self.assertEqual(search.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
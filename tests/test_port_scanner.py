@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+import unittest
+try:
+    import common
+except:
+    pass
+
+import asyncio
+import os
+import resource
+import socket
+
+from pawnlib.resource.net import AsyncPortScanner
+
+PORT_RANGE = (20400, 20463)
+
+
+class TestAsyncPortScanner(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.servers = []
+        for port in (20401, 20430, 20431):
+            server = socket.socket()
+            server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            server.bind(("127.0.0.1", port))
+            server.listen()
+            cls.servers.append(server)
+
+    @classmethod
+    def tearDownClass(cls):
+        for server in cls.servers:
+            server.close()
+
+    def test_01_connect_scan(self):
+        scanner = AsyncPortScanner(("127.0.0.1", "127.0.0.2"), PORT_RANGE, max_concurrency=32, timeout=1)
+        asyncio.run(scanner.scan())
+        results = scanner.get_results()
+        self.assertEqual(results["127.0.0.1"]["open"], [20401, 20430, 20431])
+        self.assertEqual(len(results["127.0.0.1"]["closed"]), 61)
+        self.assertEqual(results["127.0.0.2"]["open"], [])
+        self.assertEqual(scanner.stats["open"], 3)
+        self.assertEqual(sum(scanner.stats.values()), 128)
+
+    def test_02_fast_scan_skips_down_hosts(self):
+        scanner = AsyncPortScanner(("127.0.0.1", "127.0.0.3"), PORT_RANGE, fast_scan_ports=[20401])
+        asyncio.run(scanner.scan(fast_scan=True))
+        self.assertEqual(scanner.get_results(include_closed=False), {"127.0.0.1": {"open": [20401, 20430, 20431]}})
+
+    def test_03_lazy_targets_and_bitmap(self):
+        scanner = AsyncPortScanner(("10.0.0.0", "10.0.255.255"), (0, 65535))
+        self.assertEqual(next(scanner._generate_ips()), "10.0.0.0")
+        self.assertEqual(scanner.calculate_scan_range()[2], 65536 * 65536)
+        scanner._process_results([("10.0.1.2", 0, True), ("10.0.1.2", 65535, True), ("10.0.1.2", 80, False)])
+        self.assertEqual(scanner.open_ports("10.0.1.2"), [0, 65535])
+        self.assertEqual(len(scanner._open_ports[scanner.ip_to_int("10.0.1.2")]), 8192)
+        self.assertEqual(scanner._format_ranges([1, 2, 3, 5, 7, 8]), "1-3, 5, 7-8")
+
+    def test_04_adaptive_concurrency(self):
+        scanner = AsyncPortScanner(("127.0.0.1", "127.0.0.1"), PORT_RANGE, max_concurrency=100, min_concurrency=10)
+        for _ in range(scanner.ADJUST_WINDOW):
+            scanner._record(scanner.TIMEOUT)
+        self.assertEqual(scanner.concurrency, 75)
+        for _ in range(scanner.ADJUST_WINDOW * 20):
+            scanner._record(scanner.TIMEOUT)
+        self.assertEqual(scanner.concurrency, 10)
+        for _ in range(scanner.ADJUST_WINDOW * 50):
+            scanner._record(scanner.CLOSED)
+        self.assertEqual(scanner.concurrency, 100)
+
+        soft = resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+        if soft != resource.RLIM_INFINITY:
+            scanner = AsyncPortScanner(("127.0.0.1", "127.0.0.1"), PORT_RANGE, max_concurrency=soft * 2)
+            self.assertEqual(scanner.max_concurrency, soft - scanner.FD_RESERVE)
+
+    @unittest.skipUnless(hasattr(os, "geteuid") and os.geteuid() == 0, "SYN scan requires root")
+    def test_05_syn_scan(self):
+        scanner = AsyncPortScanner(("127.0.0.1", "127.0.0.2"), PORT_RANGE, max_concurrency=64, timeout=1, syn_scan=True)
+        asyncio.run(scanner.scan())
+        results = scanner.get_results(include_closed=False)
+        self.assertEqual(results["127.0.0.1"]["open"], [20401, 20430, 20431])
+        self.assertEqual(results["127.0.0.2"]["open"], [])
+        self.assertEqual(scanner.stats["timeout"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+import unittest
+try:
+    import common
+except:
+    pass
+
+from pawnlib.resource.net import ProcNetCounters, RateRing
+
+
+class TestRateRing(unittest.TestCase):
+
+    def test_01_running_average(self):
+        ring = RateRing(size=3)
+        self.assertEqual(ring.average, 0.0)
+        for value in (1, 2, 3, 4, 5, 6, 7):
+            ring.append(value)
+        self.assertEqual(len(ring), 3)
+        self.assertEqual(ring.average, 6.0)
+        with self.assertRaises(ValueError):
+            RateRing(size=0)
+
+
+class TestProcNetCounters(unittest.TestCase):
+
+    def test_01_rates_and_averages(self):
+        counters = ProcNetCounters(history_size=2)
+        counters.update([(10, "nginx", 1000, 100, 0, 0), (20, "curl", 0, 0, 50, 50)], now=0)
+        self.assertEqual(counters.process_network[10]["tcp_sent_rate"], 0.0)
+
+        counters.update([(10, "nginx", 3000, 100, 0, 0), (20, "curl", 0, 0, 50, 50)], now=2)
+        counters.update([(10, "nginx", 7000, 100, 0, 0), (20, "curl", 0, 0, 250, 50)], now=3)
+        nginx = counters.process_network[10]
+        self.assertEqual(nginx["bytes_sent"], 7000)
+        self.assertEqual(nginx["tcp_sent_rate"], 4000.0)
+        self.assertEqual(nginx["tcp_avg_sent_rate"], 2500.0)
+        self.assertEqual(nginx["send_rate"], 4000.0)
+        self.assertEqual(counters.process_network[20]["udp_sent_rate"], 200.0)
+        self.assertEqual([info["pid"] for info in counters.top(2)], [10, 20])
+
+    def test_02_group_by_name_filter_and_exited_pids(self):
+        counters = ProcNetCounters(group_by="name", proc_filter=["python"])
+        counters.update([(1, "python", 10, 20, 0, 0), (2, "python", 5, 5, 1, 1), (3, "sshd", 100, 100, 0, 0)], now=0)
+        self.assertEqual(list(counters.process_network), ["python"])
+        self.assertEqual(counters.process_network["python"]["bytes_sent"], 16)
+
+        # pid 2 exited and its counters were removed from the map, the rate never goes negative
+        counters.update([(1, "python", 10, 20, 0, 0)], now=1)
+        self.assertEqual(counters.process_network["python"]["tcp_sent_rate"], 0.0)
+        counters.update([], now=2)
+        self.assertEqual(counters.process_network, {})
+        self.assertEqual(counters.rate_history, {})
+
+    def test_03_snapshot_is_a_copy(self):
+        counters = ProcNetCounters()
+        counters.update([(10, "nginx", 1, 2, 0, 0)], now=0)
+        snapshot = counters.snapshot()
+        counters.update([(10, "nginx", 5, 2, 0, 0)], now=1)
+        self.assertEqual(snapshot[10]["tcp_sent"], 1)
+        self.assertEqual(counters.process_network[10]["tcp_sent"], 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
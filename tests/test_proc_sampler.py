@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+import unittest
+try:
+    import common
+except:
+    pass
+
+import os
+import tempfile
+import time
+
+from pawnlib.resource.sampler import ProcSampler, ProcFile
+from pawnlib.resource.server import SystemMonitor
+
+MEMINFO = """MemTotal:       16000000 kB
+MemFree:         4000000 kB
+MemAvailable:    8000000 kB
+Buffers:          100000 kB
+Cached:          2000000 kB
+SwapTotal:             0 kB
+SwapFree:              0 kB
+HugePages_Total:       0
+Hugepagesize:       2048 kB
+"""
+
+TCP = """  sl  local_address rem_address   st tx_queue rx_queue tr tm->when retrnsmt   uid  timeout inode
+   0: 00000000:0016 00000000:0000 0A 00000000:00000000 00:00000000 00000000     0        0 1 1 0 100 0 0 10 0
+   1: 0100007F:1F90 0100007F:C350 01 00000000:00000000 00:00000000 00000000     0        0 2 1 0 20 4 30 10 -1
+   2: 0100007F:C350 0100007F:1F90 06 00000000:00000000 00:00000000 00000000     0        0 0 1 0 20 4 30 10 -1
+"""
+
+
+class TestProcSampler(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.proc_path = self.temp_dir.name
+        os.makedirs(os.path.join(self.proc_path, "net"))
+        self.write("meminfo", MEMINFO)
+        self.write("loadavg", "0.50 0.40 0.30 1/100 1234\n")
+        self.write("net/tcp", TCP)
+        self.update(cpu=[(100, 0, 50, 850, 0), (50, 0, 25, 425, 0), (50, 0, 25, 425, 0)], net=(1000, 10, 2000, 20), disk=(5, 100))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write(self, name, content):
+        with open(os.path.join(self.proc_path, name), "w") as f:
+            f.write(content)
+
+    def update(self, cpu, net, disk):
+        lines = []
+        for index, (user, nice, system, idle, iowait) in enumerate(cpu):
+            name = "cpu " if index == 0 else f"cpu{index - 1}"
+            lines.append(f"{name} {user} {nice} {system} {idle} {iowait} 0 0 0 0 0")
+        lines.append("intr 1 2 3 " + " ".join("0" for _ in range(5000)))
+        lines.append("ctxt 100")
+        self.write("stat", "\n".join(lines) + "\n")
+
+        recv, packets_recv, sent, packets_sent = net
+        self.write("net/dev", (
+            "Inter-|   Receive                                                |  Transmit\n"
+            " face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs drop fifo colls carrier compressed\n"
+            "    lo: 999 9 0 0 0 0 0 0 999 9 0 0 0 0 0 0\n"
+            f"  eth0: {recv} {packets_recv} 0 0 0 0 0 0 {sent} {packets_sent} 0 0 0 0 0 0\n"
+        ))
+        read_ios, read_sectors = disk
+        self.write("diskstats", (
+            "   7       0 loop0 1 0 1 0 1 0 1 0 0 0 0\n"
+            f"   8       0 sda {read_ios} 0 {read_sectors} 0 1 0 8 0 0 0 0\n"
+        ))
+
+    def test_01_deltas_per_core_and_devices(self):
+        sampler = ProcSampler(proc_path=self.proc_path)
+        first = sampler.sample()
+        self.assertFalse(first.has_deltas)
+        self.assertEqual(first.cpu.names, ("cpu", "cpu0", "cpu1"))
+        self.assertEqual(first.net.names, ("eth0",))
+        self.assertEqual(first.disk.names, ("sda",))
+
+        self.update(cpu=[(200, 0, 100, 1700, 0), (150, 0, 25, 425, 0), (50, 0, 75, 875, 0)], net=(126000, 15, 2000, 20), disk=(7, 104))
+        second = sampler.sample()
+        self.assertTrue(second.has_deltas)
+        self.assertEqual(second.cpu_status(), {"usr": 10.0, "sys": 5.0, "idle": 85.0, "io_wait": 0.0})
+        self.assertEqual(second.cpu_status(per_core=True), {
+            "cpu0": {"usr": 100.0, "sys": 0.0, "idle": 0.0, "io_wait": 0.0},
+            "cpu1": {"usr": 0.0, "sys": 10.0, "idle": 90.0, "io_wait": 0.0},
+        })
+
+        network = second.network_status()
+        self.assertEqual(network["eth0"]["packets_recv"], 5)
+        self.assertAlmostEqual(network["Total"]["recv"], 125000 * 8 / 1_000_000 / second.elapsed)
+        self.assertEqual(second.disk_status()["sda"]["read_bytes"], 4 * 512)
+        self.assertEqual(second.disk_status()["Total"]["read_ios"], 2)
+
+        self.assertEqual(second.memory["MemTotal"], 16000000)
+        self.assertAlmostEqual(second.memory_percent, 50.0)
+        self.assertEqual(second.load, {"1min": 0.5, "5min": 0.4, "15min": 0.3})
+        self.assertEqual(sampler.read_tcp_states()["LISTEN"], 1)
+        self.assertEqual(sampler.read_tcp_states()["TIME_WAIT"], 1)
+        sampler.close()
+
+    def test_02_device_changes_and_counter_reset(self):
+        sampler = ProcSampler(proc_path=self.proc_path)
+        sampler.sample()
+        self.update(cpu=[(100, 0, 50, 850, 0)], net=(0, 0, 0, 0), disk=(5, 100))
+        self.write("diskstats", "   8       0 sda 6 0 100 0 1 0 8 0 0 0 0\n 259 0 nvme0n1 3 0 8 0 1 0 8 0 0 0 0\n")
+        snapshot = sampler.sample()
+        self.assertEqual(snapshot.network_status()["eth0"]["recv"], 0)
+        self.assertEqual(snapshot.disk_status()["sda"]["read_ios"], 1)
+        self.assertEqual(snapshot.disk_status()["nvme0n1"]["read_ios"], 0)
+        sampler.close()
+
+    def test_03_proc_file_grows_buffer(self):
+        proc_file = ProcFile(os.path.join(self.proc_path, "stat"), buffer_size=64)
+        with open(os.path.join(self.proc_path, "stat"), "rb") as f:
+            self.assertEqual(proc_file.read(), f.read())
+        proc_file.close()
+
+    def test_04_background_system_monitor(self):
+        system_monitor = SystemMonitor(interval=0.05, proc_path=self.proc_path, background=True)
+        try:
+            self.update(cpu=[(200, 0, 100, 1700, 0), (150, 0, 25, 425, 0), (50, 0, 75, 875, 0)], net=(126000, 15, 2000, 20), disk=(7, 104))
+            start = time.monotonic()
+            network, cpu, disk = system_monitor.collect_system_status()
+            self.assertLess(time.monotonic() - start, 1)
+            self.assertIn("Total", network)
+            self.assertIn("usr", cpu)
+            self.assertIn("Total", disk)
+            seq = system_monitor.last_snapshot.seq
+            system_monitor.collect_system_status()
+            self.assertGreater(system_monitor.last_snapshot.seq, seq)
+            self.assertEqual(system_monitor.parse_cpu_stat(), [200, 0, 100, 1700, 0, 0, 0, 0, 0, 0])
+        finally:
+            system_monitor.stop()
+
+    def test_05_getters_keep_their_own_previous_sample(self):
+        system_monitor = SystemMonitor(interval=0.01, proc_path=self.proc_path)
+        try:
+            self.update(cpu=[(200, 0, 100, 1700, 0), (150, 0, 25, 425, 0), (50, 0, 75, 875, 0)], net=(126000, 15, 2000, 20), disk=(7, 104))
+            self.assertEqual(system_monitor.get_cpu_status(), {"usr": 10.0, "sys": 5.0, "idle": 85.0, "io_wait": 0.0})
+            # The network and disk deltas still cover the time since the first sample
+            self.assertEqual(system_monitor.get_network_status()["eth0"]["packets_recv"], 5)
+            self.assertEqual(system_monitor.get_disk_usage()["Total"]["read_ios"], 2)
+            self.assertEqual(system_monitor.get_network_status()["eth0"]["packets_recv"], 0)
+            self.assertEqual(system_monitor.get_cpu_status()["idle"], 0.0)
+            network, cpu, disk = system_monitor.collect_system_status()
+            self.assertEqual((network["eth0"]["packets_recv"], disk["Total"]["read_ios"]), (5, 2))
+        finally:
+            system_monitor.stop()
+
+    def test_06_only_the_loopback_interface_is_ignored(self):
+        self.write("net/dev", (
+            "Inter-|   Receive\n face |bytes\n"
+            "    lo: 999 9 0 0 0 0 0 0 999 9 0 0 0 0 0 0\n"
+            " local0: 1 1 0 0 0 0 0 0 1 1 0 0 0 0 0 0\n"
+            "  sit0: 1 1 0 0 0 0 0 0 1 1 0 0 0 0 0 0\n"
+        ))
+        sampler = ProcSampler(proc_path=self.proc_path)
+        self.assertEqual(sampler.read_net().names, ("local0",))
+        sampler.close()
+
+    def test_07_proc_file_reads_past_the_first_page(self):
+        # seq_file entries of procfs return about one page per read
+        path = "/proc/self/smaps"
+        if not os.path.exists(path):
+            self.skipTest("procfs is not available")
+        proc_file = ProcFile(path, buffer_size=65536)
+        data = proc_file.read()
+        proc_file.close()
+        self.assertGreater(len(data), os.sysconf("SC_PAGE_SIZE"))
+        self.assertTrue(data.endswith(b"\n"))
+        self.assertGreater(data.count(b"\n"), 100)
+
+    def test_08_wait_does_not_hang_after_the_thread_stops(self):
+        sampler = ProcSampler(proc_path=self.proc_path, interval=0.01)
+        sampler.start()
+        os.remove(os.path.join(self.proc_path, "stat"))
+        sampler._files["stat"].close()
+        time.sleep(0.05)
+        self.assertTrue(sampler._thread.is_alive())
+        sampler.stop()
+        with self.assertRaises(RuntimeError):
+            sampler.wait(after_seq=sampler.latest.seq, timeout=1)
+        sampler.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
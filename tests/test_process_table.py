@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+import unittest
+try:
+    import common
+except:
+    pass
+
+import os
+import shutil
+import tempfile
+
+from pawnlib.resource.sampler import ProcessTable
+from pawnlib.resource import server
+
+
+class TestProcessTable(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.proc_path = self.temp_dir.name
+        with open(os.path.join(self.proc_path, "meminfo"), "w") as f:
+            f.write("MemTotal:       1000 kB\nMemFree:         500 kB\n")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_process(self, pid, name, jiffies=0, rss_pages=0, starttime=100, read_bytes=0, write_bytes=0):
+        path = os.path.join(self.proc_path, str(pid))
+        os.makedirs(path, exist_ok=True)
+        fields = ["S", "1", str(pid), str(pid), "0", "-1", "4194304", "0", "0", "0", "0",
+                  str(jiffies), "0", "0", "0", "20", "0", "1", "0", str(starttime), "1000", str(rss_pages)]
+        with open(os.path.join(path, "stat"), "w") as f:
+            f.write(f"{pid} ({name}) {' '.join(fields)} 0 0 0\n")
+        with open(os.path.join(path, "io"), "w") as f:
+            f.write(f"rchar: 1\nwchar: 1\nread_bytes: {read_bytes}\nwrite_bytes: {write_bytes}\n")
+
+    def test_01_new_dead_and_reused_pids(self):
+        self.write_process(10, "java (main)", rss_pages=100)
+        self.write_process(20, "nginx", rss_pages=50)
+        table = ProcessTable(proc_path=self.proc_path)
+        self.assertEqual(table.scan(), 2)
+        self.assertEqual(table.open_files, 2)
+        self.assertEqual(table.processes[10].name, "java (main)")
+
+        shutil.rmtree(os.path.join(self.proc_path, "20"))
+        self.write_process(30, "redis", rss_pages=10)
+        self.assertEqual(table.scan(), 2)
+        self.assertEqual(sorted(table.processes), [10, 30])
+        self.assertEqual(table.open_files, 2)
+
+        # The same pid with another start time is a new process
+        self.write_process(10, "python", jiffies=500, rss_pages=1, starttime=200)
+        table.scan()
+        self.assertEqual(table.processes[10].name, "python")
+        self.assertEqual(table.processes[10].cpu_percent, 0.0)
+        table.close()
+        self.assertEqual(table.open_files, 0)
+
+    def test_02_top_cpu_memory_io(self):
+        self.write_process(10, "idle", rss_pages=10, read_bytes=5)
+        self.write_process(20, "busy", rss_pages=20, write_bytes=1)
+        self.write_process(30, "big", rss_pages=100)
+        table = ProcessTable(proc_path=self.proc_path, track_io=True)
+        table.scan()
+        self.assertFalse(table.has_deltas)
+
+        self.write_process(20, "busy", jiffies=table.clock_ticks, rss_pages=20, write_bytes=100)
+        table.scan()
+        self.assertTrue(table.has_deltas)
+        self.assertEqual([process["name"] for process in table.top(2, resource="memory")], ["big", "busy"])
+        self.assertAlmostEqual(table.top(1, resource="memory")[0]["memory_percent"], 100 * 100 * table.page_size / 1024000)
+        cpu = table.top(1, resource="cpu")[0]
+        self.assertEqual(cpu["name"], "busy")
+        self.assertGreater(cpu["cpu_percent"], 0)
+        self.assertEqual(table.top(1, resource="io"), [{"pid": 20, "name": "busy", "io_read_bytes": 0, "io_write_bytes": 100}])
+        with self.assertRaises(ValueError):
+            table.top(1, resource="network")
+        table.close()
+
+    def test_03_open_file_limit(self):
+        for pid in range(10, 15):
+            self.write_process(pid, f"worker{pid}", rss_pages=pid)
+        table = ProcessTable(proc_path=self.proc_path, track_io=True, max_open_files=3)
+        self.assertEqual(table.scan(), 5)
+        self.assertEqual(table.open_files, 3)
+        self.write_process(14, "worker14", rss_pages=1000)
+        table.scan()
+        self.assertEqual(table.top(1)[0]["pid"], 14)
+        self.assertEqual(table.open_files, 3)
+        table.close()
+        self.assertEqual(table.open_files, 0)
+
+    def test_04_memory_status_static_top_processes(self):
+        os.makedirs(os.path.join(self.proc_path, "self"))
+        open(os.path.join(self.proc_path, "self", "stat"), "w").close()
+        self.write_process(10, "small", rss_pages=10)
+        self.write_process(20, "big", rss_pages=100)
+        top = server.MemoryStatus.get_top_memory_processes(n=1, proc_path=self.proc_path)
+        self.assertEqual([process["name"] for process in top], ["big"])
+        process_table = server._memory_process_tables[self.proc_path]
+
+        self.write_process(10, "small", rss_pages=1000)
+        top = server.MemoryStatus.get_top_memory_processes(n=1, proc_path=self.proc_path)
+        self.assertEqual([process["name"] for process in top], ["small"])
+        self.assertIs(server._memory_process_tables[self.proc_path], process_table)
+        server._memory_process_tables.pop(self.proc_path).close()
+
+
+if __name__ == "__main__":
+    unittest.main()
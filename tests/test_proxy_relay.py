@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+import unittest
+import unittest.mock
+try:
+    import common
+except:
+    pass
+
+import asyncio
+import os
+import ssl
+import shutil
+import tempfile
+import subprocess
+
+from pawnlib.cli.proxy import ProxyRelay, RelayStats, rewrite_request_head, create_client_ssl_context
+
+
+async def start_backend(ssl_context=None):
+    """Echo backend that answers each request head with the head it received."""
+    async def handle(reader, writer):
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                break
+            writer.write(data)
+            await writer.drain()
+        writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0, ssl=ssl_context)
+
+
+class TestRewriteRequestHead(unittest.TestCase):
+
+    def test_01_only_the_head_is_rewritten(self):
+        data = b"POST /a HTTP/1.1\r\nhost: localhost\r\nHOST: again\r\nContent-Length: 11\r\n\r\nHost: body!"
+        self.assertEqual(
+            rewrite_request_head(data, {"Host": "example.com", "X-Test": "1"}),
+            b"POST /a HTTP/1.1\r\nHost: example.com\r\nContent-Length: 11\r\nX-Test: 1\r\n\r\nHost: body!"
+        )
+
+    def test_02_unchanged_data(self):
+        for data in (b"HTTP/1.1 200 OK\r\nHost: a\r\n\r\n", b"GET / HTTP/1.1\r\nHost: a\r\n", b"\x16\x03\x01binary\r\n\r\n"):
+            self.assertIs(rewrite_request_head(data, {"Host": "b"}), data)
+
+
+class TestProxyRelay(unittest.TestCase):
+
+    def relay_roundtrip(self, mode, payloads, expected, use_splice=True):
+        async def run():
+            backend = await start_backend()
+            backend_port = backend.sockets[0].getsockname()[1]
+            relay = ProxyRelay(listen="127.0.0.1:0", forward=f"127.0.0.1:{backend_port}", mode=mode, report_interval=0,
+                               headers={"Host": "example.com"})
+            relay.use_splice = relay.use_splice and use_splice
+            await relay.start()
+            reader, writer = await asyncio.open_connection("127.0.0.1", relay.l_port)
+            received = []
+            for payload, response in zip(payloads, expected):
+                writer.write(payload)
+                await writer.drain()
+                received.append(await reader.readexactly(len(response)))
+            writer.write_eof()
+            self.assertEqual(await reader.read(), b"")
+            writer.close()
+            await asyncio.sleep(0.05)
+            stats = relay.stats.report()
+            await relay.stop()
+            backend.close()
+            await backend.wait_closed()
+            return received, stats, relay
+        return asyncio.run(run())
+
+    def test_01_passthrough(self):
+        payloads = [b"x" * 200000, b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n"]
+        for use_splice in (True, False):
+            with self.subTest(use_splice=use_splice):
+                received, stats, relay = self.relay_roundtrip("passthrough", payloads, payloads, use_splice)
+                self.assertEqual(received, payloads)
+                self.assertEqual(relay.use_splice, use_splice and hasattr(os, "splice"))
+                self.assertEqual(stats["total"], 1)
+                self.assertEqual(stats["active"], 0)
+                self.assertGreater(stats["p99_first_byte_ms"], 0)
+
+    def test_02_inject_first_request_head_only(self):
+        first = b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n"
+        second = b"GET /next HTTP/1.1\r\nHost: localhost\r\n\r\n"
+        expected = [b"GET / HTTP/1.1\r\nHost: example.com\r\n\r\n", second]
+        received, _, relay = self.relay_roundtrip("inject", [first, second], expected)
+        self.assertEqual(received, expected)
+        self.assertFalse(relay.use_splice)
+
+    def test_04_upstream_is_closed_when_the_client_transport_fails(self):
+        async def run():
+            closed = asyncio.Event()
+
+            async def handle(reader, writer):
+                await reader.read()
+                closed.set()
+                writer.close()
+
+            backend = await asyncio.start_server(handle, "127.0.0.1", 0)
+            relay = ProxyRelay(listen="127.0.0.1:0", forward=f"127.0.0.1:{backend.sockets[0].getsockname()[1]}",
+                               mode="passthrough", report_interval=0)
+            relay.use_splice = False
+            await relay.start()
+
+            async def connect_accepted_socket(*args, **kwargs):
+                raise OSError("client socket is gone")
+
+            relay._loop = unittest.mock.Mock(wraps=relay._loop)
+            relay._loop.connect_accepted_socket = connect_accepted_socket
+            _, writer = await asyncio.open_connection("127.0.0.1", relay.l_port)
+            await asyncio.wait_for(closed.wait(), 5)
+            writer.close()
+            await relay.stop()
+            backend.close()
+            await backend.wait_closed()
+        asyncio.run(run())
+
+    def test_03_stats_percentile(self):
+        stats = RelayStats(latency_samples=100)
+        for index in range(1, 201):
+            stats.record("up", 10)
+            stats.record_latency(index / 1000)
+        self.assertEqual(stats.bytes["up"], 2000)
+        self.assertAlmostEqual(stats.percentile(99), 0.2)
+        self.assertAlmostEqual(stats.percentile(50), 0.151)
+
+
+@unittest.skipUnless(shutil.which("openssl"), "openssl is required to create a test certificate")
+class TestProxyRelayTLS(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.cert_file = os.path.join(cls.directory.name, "cert.pem")
+        cls.key_file = os.path.join(cls.directory.name, "key.pem")
+        subprocess.run(
+            ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1", "-subj", "/CN=localhost",
+             "-addext", "subjectAltName=DNS:localhost", "-keyout", cls.key_file, "-out", cls.cert_file],
+            check=True, capture_output=True
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def relay_to_tls_backend(self, **kwargs):
+        request = b"GET / HTTP/1.1\r\nHost: 127.0.0.1\r\n\r\n"
+
+        async def run():
+            server_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+            server_context.load_cert_chain(self.cert_file, self.key_file)
+            backend = await start_backend(server_context)
+            backend_port = backend.sockets[0].getsockname()[1]
+            relay = ProxyRelay(listen="127.0.0.1:0", forward=f"https://localhost:{backend_port}", report_interval=0, **kwargs)
+            await relay.start()
+            reader, writer = await asyncio.open_connection("127.0.0.1", relay.l_port)
+            writer.write(request)
+            await writer.drain()
+            try:
+                received = await asyncio.wait_for(reader.read(65536), 5)
+            except ConnectionResetError:
+                received = b""
+            writer.close()
+            await asyncio.sleep(0.05)
+            stats = relay.stats.report()
+            await relay.stop()
+            backend.close()
+            await backend.wait_closed()
+            return received, stats
+        return asyncio.run(run())
+
+    def test_01_verified_upstream(self):
+        context = create_client_ssl_context()
+        context.load_verify_locations(self.cert_file)
+        received, stats = self.relay_to_tls_backend(ssl_context=context)
+        self.assertEqual(received, b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        self.assertEqual(stats["failed"], 0)
+
+    def test_02_unverified_upstream(self):
+        received, stats = self.relay_to_tls_backend()
+        self.assertEqual(received, b"")
+        self.assertEqual(stats["failed"], 1)
+
+        received, stats = self.relay_to_tls_backend(verify_ssl=False)
+        self.assertTrue(received.startswith(b"GET / HTTP/1.1\r\nHost: localhost"))
+        self.assertEqual(stats["failed"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
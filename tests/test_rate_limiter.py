@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+import unittest
+try:
+    import common
+except:
+    pass
+
+import os
+import time
+import fcntl
+import asyncio
+import tempfile
+import threading
+import multiprocessing
+
+from pawnlib.metrics import RateLimiter, FileLimiterBackend
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def count_allowed(directory, results):
+    limiter = RateLimiter(10, 60, backend=FileLimiterBackend(directory))
+    results.put(sum(limiter.try_acquire(key="shared") for _ in range(10)))
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def test_01_sliding_window_counter(self):
+        clock = FakeClock()
+        limiter = RateLimiter(max_calls=5, time_period=10, clock=clock)
+        self.assertEqual([limiter.is_allowed() for _ in range(6)], [True] * 5 + [False])
+        clock.now = 1015.0
+        # Half of the previous window still counts: 5 * 0.5 + 2 <= 5
+        self.assertEqual([limiter.is_allowed() for _ in range(3)], [True, True, False])
+        clock.now = 1030.0
+        self.assertTrue(limiter.is_allowed())
+        self.assertEqual(len(limiter.backend.states), 1)
+
+    def test_02_token_bucket_burst_and_keys(self):
+        clock = FakeClock()
+        limiter = RateLimiter(2, 1, burst=4, algorithm="token_bucket", clock=clock)
+        self.assertEqual([limiter.try_acquire("a") for _ in range(5)], [True] * 4 + [False])
+        self.assertTrue(limiter.try_acquire("b"))
+        clock.now += 0.5
+        self.assertEqual([limiter.try_acquire("a") for _ in range(2)], [True, False])
+        self.assertAlmostEqual(limiter._reserve("a", 1), 0.5)
+        with self.assertRaises(ValueError):
+            limiter.try_acquire("a", cost=5)
+        with self.assertRaises(ValueError):
+            RateLimiter(1, 1, algorithm="leaky")
+
+    def test_03_threads_wait_in_fifo_order(self):
+        limiter = RateLimiter(50, 1, burst=1, algorithm="token_bucket")
+        limiter.acquire()
+        order = []
+
+        def worker(index):
+            limiter.acquire()
+            order.append(index)
+
+        started = time.monotonic()
+        threads = []
+        for index in range(8):
+            thread = threading.Thread(target=worker, args=(index,))
+            thread.start()
+            threads.append(thread)
+            time.sleep(0.002)
+        for thread in threads:
+            thread.join()
+        self.assertEqual(order, list(range(8)))
+        self.assertGreaterEqual(time.monotonic() - started, 7 / 50)
+        self.assertFalse(limiter.acquire(timeout=0.001))
+        self.assertEqual(limiter._queues, {})
+
+    def test_04_coroutines_wait_in_fifo_order(self):
+        limiter = RateLimiter(100, 1, burst=2, algorithm="token_bucket")
+        order = []
+
+        async def worker(index):
+            await limiter.acquire_async(key="host")
+            order.append(index)
+
+        async def main():
+            await asyncio.gather(*[worker(index) for index in range(10)])
+            self.assertFalse(await limiter.acquire_async(key="host", timeout=0.001))
+            self.assertTrue(await limiter.acquire_async(key="other"))
+            async with limiter:
+                pass
+
+        started = time.monotonic()
+        asyncio.run(main())
+        self.assertEqual(order, list(range(10)))
+        self.assertGreaterEqual(time.monotonic() - started, 8 / 100)
+        self.assertEqual(limiter._async_locks, {})
+
+    def test_05_file_backend_shares_the_limit_between_processes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            results = multiprocessing.Queue()
+            processes = [multiprocessing.Process(target=count_allowed, args=(directory, results)) for _ in range(3)]
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join()
+            self.assertEqual(sum(results.get() for _ in processes), 10)
+
+    def test_06_file_lock_held_elsewhere_blocks_only_its_key(self):
+        with tempfile.TemporaryDirectory() as directory:
+            limiter = RateLimiter(10, 1, backend=FileLimiterBackend(directory, max_open_files=1))
+            # Another process holds the state file of "busy"
+            fd = os.open(limiter.backend._path("busy"), os.O_RDWR | os.O_CREAT)
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                thread = threading.Thread(target=limiter.acquire, args=("busy",))
+                thread.start()
+                time.sleep(0.05)
+                started = time.monotonic()
+                self.assertTrue(limiter.acquire("other", timeout=1))
+                self.assertTrue(limiter.try_acquire("third"))
+                self.assertLess(time.monotonic() - started, 0.5)
+
+                async def main():
+                    ticks = 0
+                    acquire = asyncio.ensure_future(limiter.acquire_async("busy"))
+                    while ticks < 5:
+                        await asyncio.sleep(0.01)
+                        ticks += 1
+                    self.assertFalse(acquire.done())
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                    return await asyncio.wait_for(acquire, 2)
+
+                self.assertTrue(asyncio.run(main()))
+                thread.join(2)
+                self.assertFalse(thread.is_alive())
+            finally:
+                os.close(fd)
+            self.assertEqual(limiter._async_waiters, {})
+            limiter.backend.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+import unittest
+try:
+    import common
+except:
+    pass
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from aiohttp import web
+
+from pawnlib.typing import const
+from pawnlib.utils.http import AsyncIconRpcHelper, IconRpcHelper, RpcResponseCache
+
+
+def make_response(body, calls):
+    calls.append(body)
+    method = body.get("method")
+    if method == "icx_call":
+        method = body["params"]["data"]["method"]
+    if method == "getPReps":
+        return {"jsonrpc": "2.0", "id": body.get("id"), "result": {"preps": [{"name": "node0", "nodeAddress": "hx0"}]}}
+    if method == "icx_getNetworkInfo":
+        return {"jsonrpc": "2.0", "id": body.get("id"), "result": {"platform": "icon", "calls": len(calls)}}
+    if method == "icx_getLastBlock":
+        return {"jsonrpc": "2.0", "id": body.get("id"), "result": {"height": len(calls)}}
+    return {"jsonrpc": "2.0", "id": body.get("id"), "error": {"code": -32601, "message": "Method not found"}}
+
+
+class LocalRpcServer:
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.calls = []
+        self.runner = None
+        self.url = ""
+
+    async def handle(self, request):
+        body = await request.json()
+        await asyncio.sleep(self.delay)
+        return web.json_response(make_response(body, self.calls))
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/api/v3", self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+
+class TestRpcResponseCache(unittest.TestCase):
+
+    def test_01_lru_eviction_and_ttl(self):
+        cache = RpcResponseCache(maxsize=2)
+        cache.set(("a",), 1, ttl=60)
+        cache.set(("b",), 2, ttl=60)
+        self.assertEqual(cache.get(("a",)), (True, 1))
+        cache.set(("c",), 3, ttl=60)
+        self.assertEqual(cache.get(("b",)), (False, None))
+        self.assertEqual(cache.stats["evictions"], 1)
+
+        cache.set(("d",), 4, ttl=0.01)
+        time.sleep(0.02)
+        self.assertEqual(cache.get(("d",)), (False, None))
+
+    def test_02_ttl_by_score_method(self):
+        cache = RpcResponseCache(method_ttls={"getPReps": 5, "getStepPrice": 0})
+        payload = AsyncIconRpcHelper.build_rpc_request(method="getPReps", governance_address=const.CHAIN_SCORE_ADDRESS)
+        self.assertEqual(cache.get_ttl(payload), 5)
+        self.assertIsNone(cache.get_ttl(AsyncIconRpcHelper.build_rpc_request(method="getStepPrice", governance_address=const.CHAIN_SCORE_ADDRESS)))
+        self.assertIsNone(cache.get_ttl(AsyncIconRpcHelper.build_rpc_request(method="icx_getLastBlock")))
+
+        key = cache.make_key("http://localhost", payload)
+        self.assertEqual(key, cache.make_key("http://localhost", {**payload, "id": 99}))
+        cache.set(key, {"result": {}}, ttl=60)
+        cache.invalidate(method="getPReps")
+        self.assertEqual(cache.stats["size"], 0)
+
+
+class TestAsyncRpcResponseCache(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.server = LocalRpcServer()
+        await self.server.start()
+
+    async def asyncTearDown(self):
+        await self.server.stop()
+
+    async def test_01_single_flight(self):
+        async with AsyncIconRpcHelper(url=self.server.url, retries=1, verbose=0, cache=True) as rpc:
+            results = await asyncio.gather(*[rpc.get_preps() for _ in range(20)])
+            self.assertEqual(len(self.server.calls), 1)
+            self.assertTrue(all(result == [{"name": "node0", "nodeAddress": "hx0"}] for result in results))
+
+            results[0].append("modified")
+            self.assertEqual(await rpc.get_preps(), [{"name": "node0", "nodeAddress": "hx0"}])
+            self.assertEqual(len(self.server.calls), 1)
+
+            stats = rpc.concurrency_usage["cache"]
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hits"], 20)
+        self.assertEqual(stats["coalesced"], 19)
+
+    async def test_02_uncached_methods_and_expiry(self):
+        async with AsyncIconRpcHelper(url=self.server.url, retries=1, verbose=0, cache=True, cache_ttls={"icx_getNetworkInfo": 0.1}) as rpc:
+            await rpc.get_last_blockheight()
+            await rpc.get_last_blockheight()
+            self.assertEqual(len(self.server.calls), 2)
+
+            first = await rpc.get_network_info()
+            self.assertEqual(await rpc.get_network_info(), first)
+            await asyncio.sleep(0.15)
+            self.assertNotEqual(await rpc.get_network_info(), first)
+            self.assertEqual(len(self.server.calls), 4)
+
+    async def test_03_errors_are_not_cached(self):
+        cache = RpcResponseCache(method_ttls={"unknownMethod": 60})
+        async with AsyncIconRpcHelper(url=self.server.url, retries=1, verbose=0, cache=cache) as rpc:
+            await rpc.execute_rpc_call(method="unknownMethod")
+            response = await rpc.execute_rpc_call(method="unknownMethod")
+        self.assertEqual(response["error"]["code"], -32601)
+        self.assertEqual(len(self.server.calls), 2)
+
+
+class RpcRequestHandler(BaseHTTPRequestHandler):
+    calls = []
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        time.sleep(0.05)
+        data = json.dumps(make_response(body, self.calls)).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestIconRpcHelperCache(unittest.TestCase):
+
+    def setUp(self):
+        RpcRequestHandler.calls = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), RpcRequestHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_01_concurrent_threads_share_one_request(self):
+        rpc = IconRpcHelper(url=self.url, cache=True)
+        results = []
+
+        def call():
+            results.append(rpc.rpc_call(method="icx_getNetworkInfo", return_key="result.platform"))
+
+        threads = [threading.Thread(target=call) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, ["icon"] * 8)
+        self.assertEqual(len(RpcRequestHandler.calls), 1)
+        self.assertEqual(rpc.cache.stats["hits"], 7)
+        self.assertEqual(rpc.response.get("status_code"), 200)
+
+    def test_02_cache_disabled_by_default(self):
+        rpc = IconRpcHelper(url=self.url)
+        rpc.rpc_call(method="icx_getNetworkInfo")
+        rpc.rpc_call(method="icx_getNetworkInfo")
+        self.assertIsNone(rpc.cache)
+        self.assertEqual(len(RpcRequestHandler.calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+import unittest
+try:
+    import common
+except:
+    pass
+
+import hashlib
+import os
+import tempfile
+import threading
+
+from pawnlib.utils.aws import Downloader, S3DownloadJournal, calculate_s3_etag
+
+
+class FakeBody:
+    def __init__(self, data):
+        self.data = data
+
+    def iter_chunks(self, chunk_size=1024):
+        for i in range(0, len(self.data), chunk_size):
+            yield self.data[i:i + chunk_size]
+
+
+class FakeS3Client:
+    def __init__(self, objects):
+        self.objects = objects
+        self.requests = []
+        self.fail_ranges = set()
+        self.lock = threading.Lock()
+
+    def get_paginator(self, name):
+        client = self
+
+        class Paginator:
+            def paginate(self, Bucket, Prefix=""):
+                yield {"Contents": [
+                    {"Key": key, "Size": len(data), "ETag": f'"{hashlib.md5(data).hexdigest()}"'}
+                    for key, data in sorted(client.objects.items()) if key.startswith(Prefix)
+                ]}
+        return Paginator()
+
+    def get_object(self, Bucket, Key, Range=None, IfMatch=None):
+        data = self.objects[Key]
+        with self.lock:
+            self.requests.append((Key, Range))
+        if IfMatch and IfMatch != hashlib.md5(data).hexdigest():
+            raise Exception("PreconditionFailed")
+        if Range:
+            if Range in self.fail_ranges:
+                raise Exception(f"connection reset on {Range}")
+            start, end = map(int, Range[len("bytes="):].split("-"))
+            data = data[start:end + 1]
+        return {"Body": FakeBody(data)}
+
+
+class TestS3Downloader(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.local_path = os.path.join(self.temp_dir.name, "restore")
+        self.client = FakeS3Client({
+            "snap/small.txt": b"hello",
+            "snap/sub/big.bin": os.urandom(10000),
+            "snap/empty": b"",
+        })
+        self.downloader = Downloader(bucket_name="bucket", range_threshold=4096, part_size=1024, max_workers=4)
+        self.downloader.s3_client = self.client
+        self.downloader.get_pooled_client = lambda max_pool_connections=20: self.client
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def read(self, *paths):
+        with open(os.path.join(self.local_path, *paths), "rb") as f:
+            return f.read()
+
+    def test_01_parallel_ranged_download(self):
+        summary = self.downloader.download_directory("snap", local_path=self.local_path, keep_path=True)
+        self.assertEqual(sorted(summary["downloaded"]), ["snap/empty", "snap/small.txt", "snap/sub/big.bin"])
+        self.assertEqual(self.read("sub", "big.bin"), self.client.objects["snap/sub/big.bin"])
+        self.assertEqual(self.read("small.txt"), b"hello")
+        self.assertEqual(len([r for r in self.client.requests if r[1]]), 10)
+        self.assertFalse(os.path.exists(os.path.join(self.local_path, "sub", "big.bin.part")))
+
+    def test_02_resume_after_failure(self):
+        self.client.fail_ranges = {"bytes=3072-4095"}
+        summary = self.downloader.download_directory("snap", local_path=self.local_path, keep_path=True)
+        self.assertEqual(summary["failed"], ["snap/sub/big.bin"])
+        self.assertTrue(os.path.exists(os.path.join(self.local_path, "sub", "big.bin.part")))
+
+        self.client.fail_ranges = set()
+        self.client.requests = []
+        summary = self.downloader.download_directory("snap", local_path=self.local_path, keep_path=True)
+        self.assertEqual(summary["downloaded"], ["snap/sub/big.bin"])
+        self.assertEqual(self.client.requests, [("snap/sub/big.bin", "bytes=3072-4095")])
+        self.assertEqual(self.read("sub", "big.bin"), self.client.objects["snap/sub/big.bin"])
+
+    def test_03_skip_identical_even_with_overwrite(self):
+        self.downloader.download_directory("snap", local_path=self.local_path, keep_path=True)
+        os.remove(os.path.join(self.local_path, Downloader.JOURNAL_NAME))
+        with open(os.path.join(self.local_path, "small.txt"), "wb") as f:
+            f.write(b"HELLO")
+
+        self.client.requests = []
+        summary = self.downloader.download_directory("snap", local_path=self.local_path, keep_path=True, overwrite=True)
+        self.assertEqual(summary["downloaded"], ["snap/small.txt"])
+        self.assertEqual(len(summary["skipped"]), 2)
+        self.assertEqual(self.read("small.txt"), b"hello")
+
+    def test_04_multipart_etag(self):
+        path = os.path.join(self.temp_dir.name, "data")
+        data = os.urandom(3000)
+        with open(path, "wb") as f:
+            f.write(data)
+        digests = b"".join(hashlib.md5(data[i:i + 1024]).digest() for i in range(0, 3000, 1024))
+        self.assertEqual(calculate_s3_etag(path, part_size=1024), f"{hashlib.md5(digests).hexdigest()}-3")
+        self.assertEqual(calculate_s3_etag(path), hashlib.md5(data).hexdigest())
+
+    def test_05_journal_ignores_torn_lines_and_stale_etag(self):
+        path = os.path.join(self.temp_dir.name, "journal")
+        journal = S3DownloadJournal(path)
+        journal.record_part("key", "etag1", 0)
+        journal.record_part("key", "etag2", 1)
+        journal.close()
+        with open(path, "a") as f:
+            f.write('{"key": "key", "et')
+
+        journal = S3DownloadJournal(path)
+        self.assertEqual(journal.get_parts("key", "etag2"), {1})
+        self.assertEqual(journal.get_parts("key", "etag1"), set())
+
+    def test_06_journal_is_not_trusted_for_changed_or_unverified_files(self):
+        os.makedirs(self.local_path)
+        small_path = os.path.join(self.local_path, "small.txt")
+        with open(small_path, "wb") as f:
+            f.write(b"HELLO")
+
+        # Without overwrite the existing file is kept, but it is not recorded as verified
+        summary = self.downloader.download_directory("snap", local_path=self.local_path, keep_path=True)
+        self.assertIn("snap/small.txt", summary["skipped"])
+        summary = self.downloader.download_directory("snap", local_path=self.local_path, keep_path=True, overwrite=True)
+        self.assertEqual(summary["downloaded"], ["snap/small.txt"])
+        self.assertEqual(self.read("small.txt"), b"hello")
+
+        # A journaled file that was changed in place is verified again
+        with open(small_path, "wb") as f:
+            f.write(b"HELLO")
+        stat = os.stat(small_path)
+        os.utime(small_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        summary = self.downloader.download_directory("snap", local_path=self.local_path, keep_path=True, overwrite=True)
+        self.assertEqual(summary["downloaded"], ["snap/small.txt"])
+        self.assertEqual(self.read("small.txt"), b"hello")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+import unittest
+try:
+    import common
+except:
+    pass
+
+import hashlib
+import os
+import tempfile
+import threading
+from unittest import mock
+
+from boto3.s3.transfer import TransferConfig
+from pawnlib.utils.aws import Uploader
+
+
+def s3_etag(data, config):
+    if len(data) < config.multipart_threshold:
+        return hashlib.md5(data).hexdigest()
+    chunk = config.multipart_chunksize
+    digests = b"".join(hashlib.md5(data[i:i + chunk]).digest() for i in range(0, len(data), chunk))
+    return f"{hashlib.md5(digests).hexdigest()}-{-(-len(data) // chunk)}"
+
+
+class FakeS3Client:
+    def __init__(self):
+        self.objects = {}
+        self.uploads = []
+        self.deleted = []
+        self.lock = threading.Lock()
+
+    def get_paginator(self, name):
+        client = self
+
+        class Paginator:
+            def paginate(self, Bucket, Prefix=""):
+                yield {"Contents": [
+                    {"Key": key, "Size": len(data), "ETag": f'"{etag}"'}
+                    for key, (data, etag) in sorted(client.objects.items()) if key.startswith(Prefix)
+                ]}
+        return Paginator()
+
+    def upload_file(self, file_path, bucket, key, Config=None, Callback=None):
+        with open(file_path, "rb") as f:
+            data = f.read()
+        with self.lock:
+            self.objects[key] = (data, s3_etag(data, Config))
+            self.uploads.append(key)
+
+    def put_object(self, Bucket, Key, Body=b""):
+        with self.lock:
+            self.objects[Key] = (Body, hashlib.md5(Body).hexdigest())
+            self.uploads.append(Key)
+
+    def head_object(self, Bucket, Key):
+        data, etag = self.objects[Key]
+        return {"ContentLength": len(data), "ETag": f'"{etag}"'}
+
+    def delete_objects(self, Bucket, Delete):
+        keys = [obj["Key"] for obj in Delete["Objects"]]
+        for key in keys:
+            self.objects.pop(key)
+        self.deleted.extend(keys)
+        return {"Deleted": Delete["Objects"]}
+
+
+class TestUploaderSync(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.temp_dir.name)
+        os.makedirs("data/sub")
+        self.write("data/small.txt", b"hello")
+        self.write("data/sub/big.bin", os.urandom(5000))
+        self.write("data/empty", b"")
+
+        self.client = FakeS3Client()
+        self.uploader = Uploader(bucket_name="bucket", overwrite=True)
+        self.uploader.s3_client = self.client
+        self.uploader.config = TransferConfig(multipart_threshold=4096, multipart_chunksize=1024)
+        self.uploader.is_exist_bucket = lambda: True
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.temp_dir.cleanup()
+
+    @staticmethod
+    def write(path, data):
+        with open(path, "wb") as f:
+            f.write(data)
+
+    def sync(self, **kwargs):
+        self.client.uploads = []
+        self.uploader.upload_directory("data", s3_prefix="backup", sync=True, **kwargs)
+        return sorted(self.client.uploads)
+
+    def test_01_upload_only_changed_files(self):
+        self.assertEqual(self.sync(), ["backup/data/empty", "backup/data/small.txt", "backup/data/sub/big.bin"])
+        self.assertTrue(os.path.exists(os.path.join("data", Uploader.MANIFEST_NAME)))
+        self.assertNotIn(f"backup/data/{Uploader.MANIFEST_NAME}", self.client.objects)
+
+        self.assertEqual(self.sync(), [])
+
+        self.write("data/small.txt", b"HELLO")
+        self.assertEqual(self.sync(), ["backup/data/small.txt"])
+
+    def test_02_manifest_avoids_rehashing(self):
+        self.sync()
+        with mock.patch.object(Uploader, "calculate_local_etag") as calculate_local_etag:
+            self.assertEqual(self.sync(), [])
+        calculate_local_etag.assert_not_called()
+
+        # Without the manifest every file is hashed once, but nothing is uploaded.
+        os.remove(os.path.join("data", Uploader.MANIFEST_NAME))
+        self.assertEqual(self.sync(), [])
+
+    def test_03_manifest_etags_come_from_one_listing(self):
+        with mock.patch.object(self.client, "head_object", side_effect=AssertionError("head_object")):
+            self.sync()
+        manifest = Uploader.load_sync_manifest(os.path.join("data", Uploader.MANIFEST_NAME))
+        self.assertEqual(
+            {name: entry["etag"] for name, entry in manifest.items()},
+            {name: self.client.objects[f"backup/data/{name}"][1] for name in ("empty", "small.txt", "sub/big.bin")}
+        )
+
+    def test_04_delete_remote_orphans(self):
+        self.sync()
+        self.client.objects["backup/other/keep.txt"] = (b"x", hashlib.md5(b"x").hexdigest())
+        os.remove("data/sub/big.bin")
+
+        self.sync(delete=True)
+        self.assertEqual(self.client.deleted, ["backup/data/sub/big.bin"])
+        self.assertIn("backup/other/keep.txt", self.client.objects)
+
+    def test_05_dry_run_keeps_remote(self):
+        self.sync()
+        os.remove("data/small.txt")
+        self.uploader.dry_run = True
+        self.sync(delete=True)
+        self.assertEqual(self.client.deleted, [])
+
+
+    def test_06_delete_without_prefix_is_refused(self):
+        self.client.objects["unrelated/key.txt"] = (b"x", hashlib.md5(b"x").hexdigest())
+        os.chdir("data")
+        with self.assertRaisesRegex(ValueError, "delete requires"):
+            self.uploader.upload_directory("./", sync=True, delete=True)
+        self.assertEqual((self.client.uploads, self.client.deleted), ([], []))
+        self.assertIn("unrelated/key.txt", self.client.objects)
+
+if __name__ == "__main__":
+    unittest.main()
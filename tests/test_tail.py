@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+import unittest
+try:
+    import common
+except:
+    pass
+
+import asyncio
+import os
+import tempfile
+import threading
+import time
+
+from pawnlib.output.file import Tail, InotifyWatcher
+
+
+class TestTail(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_path = os.path.join(self.temp_dir.name, "auth.log")
+        self.offset_file = os.path.join(self.temp_dir.name, "auth.offset")
+        self.write("old line ERROR\n")
+        self.batches = []
+
+    async def asyncTearDown(self):
+        self.temp_dir.cleanup()
+
+    def write(self, data, mode="a"):
+        with open(self.log_path, mode) as f:
+            f.write(data)
+
+    async def callback(self, lines):
+        self.batches.append(lines)
+
+    def make_tail(self, **kwargs):
+        options = dict(filters=["ERROR"], callback=self.callback, async_mode=True, batch=True, offset_file=self.offset_file)
+        options.update(kwargs)
+        return Tail(self.log_path, **options)
+
+    async def wait_for_lines(self, count, timeout=3):
+        deadline = time.monotonic() + timeout
+        while sum(len(batch) for batch in self.batches) < count:
+            if time.monotonic() > deadline:
+                self.fail(f"Timed out waiting for {count} lines, got {self.batches}")
+            await asyncio.sleep(0.01)
+        return [line for batch in self.batches for line in batch]
+
+    async def run_tail(self, tail):
+        task = asyncio.create_task(tail.follow_async())
+        await asyncio.sleep(0.1)
+        return task
+
+    async def stop_tail(self, tail, task):
+        tail.stop()
+        await asyncio.wait_for(task, timeout=3)
+
+    async def follow_rotation_and_truncation(self, use_inotify):
+        tail = self.make_tail(use_inotify=use_inotify, poll_interval=0.02)
+        task = await self.run_tail(tail)
+
+        self.write("".join(f"{i} ERROR\n" if i % 2 else f"{i} INFO\n" for i in range(1000)))
+        lines = await self.wait_for_lines(500)
+        self.assertEqual(lines[0], "1 ERROR")
+        self.assertEqual(lines[-1], "999 ERROR")
+        self.assertLess(len(self.batches), 500)
+
+        # Partial lines are held back until the newline arrives
+        self.write("partial ERR")
+        await asyncio.sleep(0.1)
+        self.write("OR\n")
+        self.assertEqual((await self.wait_for_lines(501))[-1], "partial ERROR")
+
+        os.rename(self.log_path, self.log_path + ".1")
+        self.write("rotated ERROR\n")
+        self.assertEqual((await self.wait_for_lines(502))[-1], "rotated ERROR")
+
+        self.write("", mode="w")
+        await asyncio.sleep(0.1)
+        self.write("truncated ERROR\n")
+        self.assertEqual((await self.wait_for_lines(503))[-1], "truncated ERROR")
+        await self.stop_tail(tail, task)
+
+    @unittest.skipUnless(InotifyWatcher.is_supported(), "inotify is not available")
+    async def test_01_inotify_batches_rotation_truncation(self):
+        await self.follow_rotation_and_truncation(use_inotify=True)
+
+    async def test_02_polling_fallback(self):
+        await self.follow_rotation_and_truncation(use_inotify=False)
+
+    async def test_03_resume_from_offset_file(self):
+        tail = self.make_tail()
+        task = await self.run_tail(tail)
+        self.write("first ERROR\n")
+        await self.wait_for_lines(1)
+        await self.stop_tail(tail, task)
+
+        # Lines written while the tail is down are delivered once after a restart
+        self.write("second ERROR\nthird ERROR\n")
+        self.batches = []
+        tail = self.make_tail()
+        task = await self.run_tail(tail)
+        self.assertEqual(await self.wait_for_lines(2), ["second ERROR", "third ERROR"])
+        await asyncio.sleep(0.1)
+        await self.stop_tail(tail, task)
+        self.assertEqual(len(self.batches), 1)
+
+    async def test_04_per_line_callback_and_formatter(self):
+        received = []
+        tail = self.make_tail(batch=False, callback=received.append, formatter=lambda line: line.upper(), offset_file=None)
+        task = await self.run_tail(tail)
+        self.write("a ERROR\nb INFO\nc ERROR\n")
+        deadline = time.monotonic() + 3
+        while len(received) < 2 and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        await self.stop_tail(tail, task)
+        self.assertEqual(received, ["A ERROR", "C ERROR"])
+
+    def test_05_sync_follow_multiple_files(self):
+        other_path = os.path.join(self.temp_dir.name, "other.log")
+        with open(other_path, "w"):
+            pass
+        received = []
+        tail = Tail([self.log_path, other_path], filters=["ERROR"], callback=received.extend, batch=True)
+        thread = threading.Thread(target=tail.follow)
+        thread.start()
+        time.sleep(0.1)
+        self.write("one ERROR\n")
+        with open(other_path, "a") as f:
+            f.write("two ERROR\n")
+
+        deadline = time.monotonic() + 3
+        while len(received) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        tail.stop()
+        thread.join(timeout=3)
+        self.assertEqual(sorted(received), ["one ERROR", "two ERROR"])
+
+    def test_06_no_filters_pass_every_line(self):
+        received = []
+        tail = Tail(self.log_path, filters=None, callback=received.extend, batch=True)
+        tail._dispatch_lines_sync(["one ERROR\n", "two INFO\n"], self.log_path)
+        self.assertEqual(received, ["one ERROR", "two INFO"])
+
+
+if __name__ == "__main__":
+    unittest.main()